@@ -5,6 +5,9 @@ from fastapi import APIRouter
 from app.db.daos.reference_dao import ReferenceDAO
 from app.db.daos.reference_event_dao import ReferenceEventDAO
 from app.db.session import async_session
+from app.http_client.http_sessions_pool import HttpSessionsPool
+from app.services.cache.cache_metrics import CacheMetrics
+from app.services.cache.third_api_cache import ThirdApiCache
 
 router = APIRouter()
 
@@ -49,3 +52,29 @@ async def references_by_day_and_type() -> dict:
             dict_tree[date_str][event_type] = {}
         dict_tree[date_str][event_type] = value
     return dict_tree
+
+
+@router.get("/http_sessions")
+async def http_sessions() -> dict:
+    """
+    Get the state of the connection pools to external APIs, by host
+
+    :return: json representation of the connection pools stats by host
+    """
+    return HttpSessionsPool().stats()
+
+
+@router.get("/third_api_cache")
+async def third_api_cache() -> dict:
+    """
+    Get the usage of the third party API cache since the start of the process:
+    hits, misses, errors, bytes read and written and Redis latency histograms
+    by namespace, and the state of the per-process cache if enabled
+
+    :return: json representation of the cache metrics
+    """
+    local_cache = ThirdApiCache.local_cache()
+    return {
+        "namespaces": CacheMetrics().stats(),
+        "local_cache": local_cache.stats() if local_cache is not None else None,
+    }
@@ -1,4 +1,7 @@
-from sqlalchemy import select
+from typing import List
+
+from sqlalchemy import select, tuple_, or_, and_
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.sql.expression import func
 
 from sqlalchemy.orm import raiseload, joinedload
@@ -53,9 +56,91 @@ class ConceptDAO(AbstractDAO):
         :param uris: uris of the concepts
         :return: the list of concepts
         """
-        query = select(Concept).where(Concept.uri.in_(uris)).options(raiseload("*"))
+        query = (
+            select(Concept)
+            .where(Concept.uri.in_(uris))
+            .options(raiseload("*"))
+            .options(joinedload(Concept.labels))
+        )
         return (await self.db_session.execute(query)).unique().scalars().all()
 
+    async def get_concepts_by_labels_and_languages(
+        self, labels: List[tuple[str, str | None]]
+    ) -> dict[tuple[str, str | None], Concept]:
+        """
+        Get concepts by their labels and languages
+
+        :param labels: (label, language) pairs, the language may be None
+        :return: the concepts found by (label, language) pair
+        """
+        with_language = [label for label in labels if label[1] is not None]
+        without_language = [value for value, language in labels if language is None]
+        query = (
+            select(Label.value, Label.language, Concept)
+            .join(Concept.labels)
+            .where(
+                or_(
+                    tuple_(Label.value, Label.language).in_(with_language),
+                    and_(
+                        Label.language.is_(None),
+                        Label.value.in_(without_language),
+                    ),
+                )
+            )
+            .options(raiseload("*"))
+            .options(joinedload(Concept.labels))
+        )
+        concepts = {}
+        for value, language, concept in (await self.db_session.execute(query)).unique():
+            concepts.setdefault((value, language), concept)
+        return concepts
+
+    async def insert_missing(self, concepts: List[Concept]) -> List[int]:
+        """
+        Insert concepts with an uri and their labels,
+        skipping the ones that already exist (e.g. created concurrently by another process)
+
+        :param concepts: transient concepts to insert
+        :return: ids of the inserted concepts
+        """
+        if not concepts:
+            return []
+        stmt = (
+            insert(Concept)
+            .values(
+                [
+                    {
+                        "uri": concept.uri,
+                        "dereferenced": bool(concept.dereferenced),
+                        "last_dereferencing_date_time": (
+                            concept.last_dereferencing_date_time
+                        ),
+                    }
+                    for concept in concepts
+                ]
+            )
+            .on_conflict_do_nothing(index_elements=[Concept.uri])
+            .returning(Concept.id, Concept.uri)
+        )
+        inserted_ids = {
+            uri: concept_id
+            for concept_id, uri in (await self.db_session.execute(stmt)).all()
+        }
+        labels = [
+            {
+                "value": label.value,
+                "language": label.language,
+                "preferred": label.preferred is not False,
+                "concept_id": inserted_ids[concept.uri],
+            }
+            for concept in concepts
+            if concept.uri in inserted_ids
+            for label in concept.labels
+        ]
+        if labels:
+            await self.db_session.execute(insert(Label).values(labels))
+        return list(inserted_ids.values())
+
     # pylint: disable=singleton-comparison
     async def get_random_concept_not_dereferenced(
         self, exclude_ids: list[int] = None
@@ -1,6 +1,7 @@
 from typing import List
 
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import joinedload
 
 from app.db.abstract_dao import AbstractDAO
@@ -13,6 +14,10 @@ class ContributorDAO(AbstractDAO):
     Data access object for contributors
     """
 
+    # maximum number of contributors inserted by a single statement,
+    # to stay below the query parameters limit of PostgreSQL
+    INSERT_BATCH_SIZE = 1000
+
     async def get_by_id(self, contributor_id: int) -> Contributor | None:
         """
         Get a contributor by its id
@@ -55,6 +60,86 @@ class ContributorDAO(AbstractDAO):
         )
         return (await self.db_session.execute(stmt)).unique().scalars().one_or_none()
 
+    async def get_by_ids(self, contributor_ids: List[int]) -> List[Contributor]:
+        """
+        Get contributors by their ids
+        :param contributor_ids: ids of the contributors
+        :return: contributors
+        """
+        if not contributor_ids:
+            return []
+        stmt = (
+            select(Contributor)
+            .options(joinedload(Contributor.identifiers))
+            .where(Contributor.id.in_(contributor_ids))
+        )
+        return list((await self.db_session.execute(stmt)).unique().scalars().all())
+
+    async def get_by_source_and_names(
+        self, source: str, names: List[str]
+    ) -> List[Contributor]:
+        """
+        Get the contributors without source identifier of a source by their names
+        :param source: source of the contributors ("hal", "idref"...)
+        :param names: names of the contributors
+        :return: contributors
+        """
+        if not names:
+            return []
+        stmt = (
+            select(Contributor)
+            .options(joinedload(Contributor.identifiers))
+            .where(Contributor.source == source)
+            .where(Contributor.name.in_(names))
+            .where(Contributor.source_identifier.is_(None))
+        )
+        return list((await self.db_session.execute(stmt)).unique().scalars().all())
+
+    async def get_by_source_and_identifiers(
+        self, source: str, source_identifiers: List[str]
+    ) -> List[Contributor]:
+        """
+        Get the contributors of a source by their source identifiers
+        :param source: source of the contributors ("hal", "idref"...)
+        :param source_identifiers: identifiers of the contributors in the source
+        :return: contributors
+        """
+        if not source_identifiers:
+            return []
+        stmt = (
+            select(Contributor)
+            .options(joinedload(Contributor.identifiers))
+            .where(Contributor.source == source)
+            .where(Contributor.source_identifier.in_(source_identifiers))
+        )
+        return list((await self.db_session.execute(stmt)).unique().scalars().all())
+
+    async def insert_missing(self, contributors: List[dict]) -> List[int]:
+        """
+        Insert contributors, skipping the ones that already exist
+        (e.g. created concurrently by another process)
+        :param contributors: column values of the contributors to insert
+        :return: ids of the inserted contributors
+        """
+        inserted_ids = []
+        for start in range(0, len(contributors), self.INSERT_BATCH_SIZE):
+            stmt = (
+                insert(Contributor)
+                .values(
+                    [
+                        {"name_variants": [], "structured_name_variants": []}
+                        | contributor
+                        for contributor in contributors[
+                            start : start + self.INSERT_BATCH_SIZE
+                        ]
+                    ]
+                )
+                .on_conflict_do_nothing()
+                .returning(Contributor.id)
+            )
+            inserted_ids.extend((await self.db_session.execute(stmt)).scalars().all())
+        return inserted_ids
+
     async def update_external_identifiers(
         self, contributor_id: int, ext_identifiers: List[dict[str, str]]
     ) -> None:
@@ -64,9 +149,19 @@ class ContributorDAO(AbstractDAO):
         :param ext_identifiers: list of external identifiers
         :return: None
         """
-        valid_types = self._get_valid_external_identifier_types()
         contributor = await self.get_by_id(contributor_id)
+        self.replace_external_identifiers(contributor, ext_identifiers)
 
+    def replace_external_identifiers(
+        self, contributor: Contributor, ext_identifiers: List[dict[str, str]]
+    ) -> None:
+        """
+        Replace the external identifiers of a contributor loaded in the session
+        :param contributor: contributor to update
+        :param ext_identifiers: list of external identifiers
+        :return: None
+        """
+        valid_types = self._get_valid_external_identifier_types()
         ext_identifiers = [
             identifier
             for identifier in (ext_identifiers or [])
@@ -85,18 +180,20 @@ class ContributorDAO(AbstractDAO):
 
         identifiers_to_add = new_identifiers - set(existing_identifiers)
 
+        # identifiers are deleted as orphans
         for identifier_type, identifier_value in identifiers_to_remove:
-            identifier = existing_identifiers[(identifier_type, identifier_value)]
-            await self.db_session.delete(identifier)
+            contributor.identifiers.remove(
+                existing_identifiers[(identifier_type, identifier_value)]
+            )
 
         for identifier_type, identifier_value in identifiers_to_add:
-            new_identifier = ContributorIdentifier(
-                type=identifier_type,
-                value=identifier_value,
-                source=contributor.source,
-                contributor_id=contributor.id,
+            contributor.identifiers.append(
+                ContributorIdentifier(
+                    type=identifier_type,
+                    value=identifier_value,
+                    source=contributor.source,
+                )
             )
-            self.db_session.add(new_identifier)
 
     def _get_valid_external_identifier_types(self):
         valid_types = {
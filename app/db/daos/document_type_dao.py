@@ -1,4 +1,7 @@
+from typing import List
+
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
 
 from app.db.abstract_dao import AbstractDAO
 from app.db.models.document_type import DocumentType
@@ -19,3 +22,28 @@ class DocumentTypeDAO(AbstractDAO):
         query = select(DocumentType).where(DocumentType.uri == uri)
 
         return await self.db_session.scalar(query)
+
+    async def get_all(self) -> List[DocumentType]:
+        """
+        Get all the document types
+
+        :return: the document types
+        """
+        return (await self.db_session.scalars(select(DocumentType))).all()
+
+    async def insert_missing(self, document_types: dict[str, str | None]) -> None:
+        """
+        Insert document types, skipping the ones that already exist
+
+        :param document_types: labels of the document types to insert, by uri
+        :return: None
+        """
+        if not document_types:
+            return
+        await self.db_session.execute(
+            insert(DocumentType)
+            .values(
+                [{"uri": uri, "label": label} for uri, label in document_types.items()]
+            )
+            .on_conflict_do_nothing(index_elements=[DocumentType.uri])
+        )
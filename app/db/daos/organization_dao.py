@@ -43,3 +43,15 @@ class OrganizationDAO(AbstractDAO):
             )
         )
         return await self.db_session.scalar(query)
+
+    async def get_existing_source_identifiers(self, identifiers: list[str]) -> set[str]:
+        """
+        Get the identifiers of the organizations already in the database
+
+        :param identifiers: source identifiers of the organizations
+        :return: the source identifiers found in the database
+        """
+        query = select(Organization.source_identifier).where(
+            Organization.source_identifier.in_(identifiers)
+        )
+        return set((await self.db_session.scalars(query)).all())
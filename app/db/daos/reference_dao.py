@@ -64,6 +64,61 @@ class ReferenceDAO(AbstractDAO):
         # return the references
         return (await self.db_session.execute(query)).unique().scalars().all() or []
 
+    async def get_last_references_for_entity_and_harvester(
+        self,
+        entity_id: int,
+        harvester: str,
+    ) -> list[Reference]:
+        """
+        Get the last version of every reference ever discovered for the given entity
+        by the given harvester, whatever the harvesting it was discovered by
+
+        :param entity_id: id of the entity
+        :param harvester: harvester name of the harvestings
+        :return: list of references with the highest version number
+                    for each source identifier
+        """
+        # source identifiers of all the references
+        # related to the entity through any harvesting of the same harvester
+        known_references = (
+            select(Reference.source_identifier, Reference.harvester)
+            .join(ReferenceEvent, onclause=Reference.id == ReferenceEvent.reference_id)
+            .join(Harvesting, onclause=ReferenceEvent.harvesting_id == Harvesting.id)
+            .join(Retrieval, onclause=Harvesting.retrieval_id == Retrieval.id)
+            .where(Retrieval.entity_id == entity_id)
+            .where(Harvesting.harvester == harvester)
+            .distinct()
+        ).subquery()
+        # highest version number for each of those source identifiers
+        last_versions = (
+            select(
+                Reference.source_identifier,
+                Reference.harvester,
+                func.max(Reference.version).label("max_version"),
+            )
+            .join(
+                known_references,
+                and_(
+                    Reference.source_identifier == known_references.c.source_identifier,
+                    Reference.harvester == known_references.c.harvester,
+                ),
+            )
+            .group_by(Reference.source_identifier, Reference.harvester)
+        ).subquery()
+        query = (
+            select(Reference)
+            .options(raiseload("*"))
+            .join(
+                last_versions,
+                and_(
+                    Reference.source_identifier == last_versions.c.source_identifier,
+                    Reference.harvester == last_versions.c.harvester,
+                    Reference.version == last_versions.c.max_version,
+                ),
+            )
+        )
+        return (await self.db_session.execute(query)).unique().scalars().all() or []
+
     async def get_references_by_source_identifier(
         self, source_identifier: str, harvester: str
     ):
@@ -1,7 +1,7 @@
 from datetime import datetime, timedelta
 
 import sqlalchemy
-from sqlalchemy import select, func
+from sqlalchemy import select, func, insert
 from sqlalchemy.orm import joinedload
 
 from app.db.abstract_dao import AbstractDAO
@@ -42,6 +42,38 @@ class ReferenceEventDAO(AbstractDAO):
         self.db_session.add(reference_event)
         return reference_event
 
+    async def create_reference_events(
+        self, reference_events: list[ReferenceEvent]
+    ) -> list[ReferenceEvent]:
+        """
+        Insert a batch of reference events related to already recorded references
+        with a single multi-row INSERT statement
+
+        :param reference_events: reference events with their reference_id set
+        :return: the same reference events, with their id set
+        """
+        if not reference_events:
+            return reference_events
+        ids = (
+            await self.db_session.scalars(
+                insert(ReferenceEvent).returning(
+                    ReferenceEvent.id, sort_by_parameter_order=True
+                ),
+                [
+                    {
+                        "type": reference_event.type,
+                        "enhanced": reference_event.enhanced,
+                        "reference_id": reference_event.reference_id,
+                        "harvesting_id": reference_event.harvesting_id,
+                    }
+                    for reference_event in reference_events
+                ],
+            )
+        ).all()
+        for reference_event, reference_event_id in zip(reference_events, ids):
+            reference_event.id = reference_event_id
+        return reference_events
+
     async def get_reference_event_by_id(
         self, reference_event_id: int
     ) -> ReferenceEvent | None:
@@ -0,0 +1,106 @@
+import asyncio
+from typing import Awaitable, Callable, List, Optional
+
+from app.db.daos.reference_event_dao import ReferenceEventDAO
+from app.db.models.reference import Reference
+from app.db.models.reference_event import ReferenceEvent
+from app.db.session import async_session
+
+
+class ReferenceEventsBatchWriter:  # pylint: disable=too-many-instance-attributes
+    """
+    Write-behind buffer for the events of already recorded references
+    (unchanged and deleted references) of a harvesting.
+    Events are accumulated and written with a multi-row insert
+    every batch_size events or every flush_interval milliseconds.
+    Once written, the events are passed to the on_flush callback
+    with their database id set.
+    """
+
+    def __init__(
+        self,
+        harvesting_id: int,
+        on_flush: Callable[[List[ReferenceEvent]], Awaitable[None]],
+        batch_size: int = 500,
+        flush_interval: int = 1000,
+    ):
+        self.harvesting_id = harvesting_id
+        self.on_flush = on_flush
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.pending_events: List[ReferenceEvent] = []
+        self._lock = asyncio.Lock()
+        self._flush_task: Optional[asyncio.Task] = None
+        self._waiting_for_interval = False
+
+    async def add(
+        self,
+        reference: Reference,
+        event_type: ReferenceEvent.Type,
+        enhanced: bool = False,
+    ) -> None:
+        """
+        Add an event related to an already recorded reference to the buffer
+
+        :param reference: reference to which the event is related
+        :param event_type: type of the event
+        :param enhanced: if the harvester version is increased
+        :return: None
+        """
+        assert reference.id is not None, "Only recorded references can be batched"
+        self.pending_events.append(
+            ReferenceEvent(
+                type=event_type.value,
+                harvesting_id=self.harvesting_id,
+                reference_id=reference.id,
+                enhanced=enhanced,
+            )
+        )
+        if len(self.pending_events) >= self.batch_size:
+            await self.flush()
+        elif self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_after_interval())
+
+    async def flush(self) -> None:
+        """
+        Write the pending events to the database and notify them
+
+        :return: None
+        """
+        async with self._lock:
+            events, self.pending_events = self.pending_events, []
+            if not events:
+                return
+            written = False
+            try:
+                async with async_session() as session:
+                    async with session.begin():
+                        await ReferenceEventDAO(session).create_reference_events(events)
+                written = True
+            finally:
+                # keep the events for the next flush if they could not be written
+                if not written:
+                    self.pending_events = events + self.pending_events
+        await self.on_flush(events)
+
+    async def close(self) -> None:
+        """
+        Stop the periodic flush and write the remaining events
+
+        :return: None
+        """
+        if self._flush_task is not None:
+            # a periodic flush that has already started is allowed to complete
+            if self._waiting_for_interval:
+                self._flush_task.cancel()
+            await asyncio.gather(self._flush_task, return_exceptions=True)
+            self._flush_task = None
+        await self.flush()
+
+    async def _flush_after_interval(self) -> None:
+        self._waiting_for_interval = True
+        try:
+            await asyncio.sleep(self.flush_interval / 1000)
+        finally:
+            self._waiting_for_interval = False
+        await self.flush()
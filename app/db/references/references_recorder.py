@@ -1,10 +1,15 @@
 from typing import List
 
+from sqlalchemy.ext.asyncio import AsyncSession
+
 from app.db.daos.reference_dao import ReferenceDAO
 from app.db.daos.reference_event_dao import ReferenceEventDAO
 from app.db.models.harvesting import Harvesting as DbHarvesting
 from app.db.models.reference import Reference
 from app.db.models.reference_event import ReferenceEvent
+from app.db.references.reference_events_batch_writer import (
+    ReferenceEventsBatchWriter,
+)
 from app.db.session import async_session
 
 
@@ -13,8 +18,38 @@ class ReferencesRecorder:
     Class to assist harvester with the recording in database of references logic
     """
 
-    def __init__(self, harvesting: DbHarvesting):
+    def __init__(
+        self,
+        harvesting: DbHarvesting,
+        events_batch_writer: ReferenceEventsBatchWriter | None = None,
+    ):
         self.harvesting: DbHarvesting = harvesting
+        # if provided, the events of unchanged and deleted references are written
+        # in batches and returned through the batch writer callback
+        self.events_batch_writer: ReferenceEventsBatchWriter | None = (
+            events_batch_writer
+        )
+        # last known version of the references, by harvester and source identifier
+        self.references_index: dict[tuple[str, str], Reference] = {}
+
+    async def load_references_index(self, entity_id: int) -> None:
+        """
+        Load in memory the last version of all the references
+        previously discovered for the entity by the same harvester,
+        so that existence checks do not require a database query for each reference
+
+        :param entity_id: id of the entity
+        :return: None
+        """
+        async with async_session() as session:
+            references = await ReferenceDAO(
+                session
+            ).get_last_references_for_entity_and_harvester(
+                entity_id=entity_id,
+                harvester=self.harvesting.harvester,
+            )
+        for reference in references:
+            self._index_reference(reference)
 
     async def register_creation(
         self,
@@ -26,14 +61,18 @@ class ReferencesRecorder:
         :param new_ref: reference to register
         :return: the reference event
         """
-        await self._create_reference(new_ref)
         async with async_session() as session:
             async with session.begin():
-                return await ReferenceEventDAO(session).create_reference_event(
+                await self._add_reference(session, new_ref)
+                reference_event = await ReferenceEventDAO(
+                    session
+                ).create_reference_event(
                     harvesting_id=self.harvesting.id,
                     reference=new_ref,
                     event_type=ReferenceEvent.Type.CREATED,
                 )
+        self._index_reference(new_ref)
+        return reference_event
 
     async def register_update(
         self, old_ref: Reference, new_ref: Reference, enhanced: bool
@@ -47,15 +86,19 @@ class ReferencesRecorder:
         :return: the reference event
         """
         new_ref.version = old_ref.version + 1
-        await self._create_reference(new_ref)
         async with async_session() as session:
             async with session.begin():
-                return await ReferenceEventDAO(session).create_reference_event(
+                await self._add_reference(session, new_ref)
+                reference_event = await ReferenceEventDAO(
+                    session
+                ).create_reference_event(
                     harvesting_id=self.harvesting.id,
                     reference=new_ref,
                     event_type=ReferenceEvent.Type.UPDATED,
                     enhanced=enhanced,
                 )
+        self._index_reference(new_ref)
+        return reference_event
 
     async def register_unchanged(
         self, old_ref: Reference, new_ref: Reference, enhanced: bool = False
@@ -66,45 +109,65 @@ class ReferencesRecorder:
         :param old_ref: old version of the reference to update
         :param new_ref: new reference to register
         :param enhanced: if the new reference is enhanced
-        :return: the reference event
+        :return: the reference event, None if it is written by the events batch writer
         """
+        if not enhanced and self.events_batch_writer is not None:
+            await self.events_batch_writer.add(
+                reference=old_ref, event_type=ReferenceEvent.Type.UNCHANGED
+            )
+            return None
+        reference_to_register = new_ref if enhanced else old_ref
         if enhanced:
             new_ref.version = old_ref.version + 1
-            reference_to_register = new_ref
-            await self._create_reference(new_ref)
-        else:
-            reference_to_register = old_ref
         async with async_session() as session:
             async with session.begin():
-                return await ReferenceEventDAO(session).create_reference_event(
+                if enhanced:
+                    await self._add_reference(session, new_ref)
+                reference_event = await ReferenceEventDAO(
+                    session
+                ).create_reference_event(
                     harvesting_id=self.harvesting.id,
                     reference=reference_to_register,
                     event_type=ReferenceEvent.Type.UNCHANGED,
                     enhanced=enhanced,
                 )
+        if enhanced:
+            self._index_reference(new_ref)
+        return reference_event
 
     async def exists(self, new_ref: Reference) -> Reference | None:
         """
-        Check if a matching reference already exists in the database
+        Check if a matching reference already exists in the database.
+        The references index is looked up first, and the database is queried
+        only for references that are not known yet.
 
         :param new_ref: the new reference to compare with
         :return: the reference if it exists, None otherwise
         """
+        ref: Reference | None = self.get_indexed_reference(new_ref)
+        if ref is not None:
+            return ref
         async with async_session() as session:
-            ref: Reference = await ReferenceDAO(
-                session
-            ).get_last_reference_by_source_identifier(
+            ref = await ReferenceDAO(session).get_last_reference_by_source_identifier(
                 new_ref.source_identifier, new_ref.harvester
             )
-            return ref
+        if ref is not None:
+            self._index_reference(ref)
+        return ref
 
-    async def register_deletion(self, old_ref: Reference) -> ReferenceEvent:
+    async def register_deletion(self, old_ref: Reference) -> ReferenceEvent | None:
         """
         Register an event for a deleted reference
 
         :param old_ref: the reference that was deleted
-        :return: the reference event related to the deletion
+        :return: the reference event related to the deletion,
+                    None if it is written by the events batch writer
         """
+        if self.events_batch_writer is not None:
+            await self.events_batch_writer.add(
+                reference=old_ref, event_type=ReferenceEvent.Type.DELETED
+            )
+            return None
         async with async_session() as session:
             async with session.begin():
                 return await ReferenceEventDAO(session).create_reference_event(
@@ -113,6 +176,15 @@ class ReferencesRecorder:
                     event_type=ReferenceEvent.Type.DELETED,
                 )
 
+    async def flush_events(self) -> None:
+        """
+        Write the events still pending in the events batch writer, if any
+
+        :return: None
+        """
+        if self.events_batch_writer is not None:
+            await self.events_batch_writer.close()
+
     async def get_matching_references_before_harvesting(
         self, entity_id: int
     ) -> List[Reference]:
@@ -132,26 +204,50 @@ class ReferencesRecorder:
                     entity_id=entity_id,
                 )
 
-    async def _create_reference(self, new_ref: Reference):
-        async with async_session() as session:
-            async with session.begin():
-                for contrib in new_ref.contributions:
-                    contrib.affiliations = [
-                        await session.merge(org) for org in contrib.affiliations
-                    ]
-                    if contrib.contributor:
-                        contrib.contributor = await session.merge(contrib.contributor)
-                        contrib.contributor.identifiers = [
-                            await session.merge(identifier)
-                            for identifier in contrib.contributor.identifiers
-                        ]
-                new_ref.document_type = [
-                    await session.merge(doc_type) for doc_type in new_ref.document_type
-                ]
-                new_ref.subjects = [
-                    await session.merge(subject) for subject in new_ref.subjects
-                ]
-                if new_ref.issue:
-                    new_ref.issue = await session.merge(new_ref.issue)
+    def get_indexed_reference(self, new_ref: Reference) -> Reference | None:
+        """
+        Get the last version of a reference known by the references index,
+        without querying the database
+
+        :param new_ref: the new reference to look for
+        :return: the last known version of the reference, None if unknown
+        """
+        return self.references_index.get(
+            (new_ref.harvester, str(new_ref.source_identifier))
+        )
+
+    def _index_reference(self, reference: Reference) -> None:
+        self.references_index[
+            (reference.harvester, str(reference.source_identifier))
+        ] = reference
 
-                session.add(new_ref)
+    @staticmethod
+    async def _add_reference(session: AsyncSession, new_ref: Reference) -> None:
+        """
+        Add a new reference and its children to the session,
+        so that the reference and its event are written in the same transaction
+
+        :param session: session of the transaction
+        :param new_ref: reference to add
+        :return: None
+        """
+        for contrib in new_ref.contributions:
+            contrib.affiliations = [
+                await session.merge(org) for org in contrib.affiliations
+            ]
+            if contrib.contributor:
+                contrib.contributor = await session.merge(contrib.contributor)
+                contrib.contributor.identifiers = [
+                    await session.merge(identifier)
+                    for identifier in contrib.contributor.identifiers
+                ]
+        new_ref.document_type = [
+            await session.merge(doc_type) for doc_type in new_ref.document_type
+        ]
+        new_ref.subjects = [
+            await session.merge(subject) for subject in new_ref.subjects
+        ]
+        if new_ref.issue:
+            new_ref.issue = await session.merge(new_ref.issue)
+
+        session.add(new_ref)
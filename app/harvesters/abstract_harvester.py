@@ -1,3 +1,4 @@
+import asyncio
 import traceback
 from abc import ABC, abstractmethod
 from asyncio import Queue
@@ -9,6 +10,7 @@ from semver import Version, VersionInfo
 from sqlalchemy.exc import TimeoutError as SqlTimeoutError
 
 from app.api.dependencies.event_types import event_types_or_default
+from app.config import get_app_settings
 from app.db.daos.entity_dao import EntityDAO
 from app.db.daos.harvesting_dao import HarvestingDAO
 from app.db.daos.harvesting_error_dao import HarvestingErrorDAO
@@ -16,6 +18,9 @@ from app.db.models.entity import Entity as DbEntity
 from app.db.models.harvesting import Harvesting
 from app.db.models.reference import Reference
 from app.db.models.reference_event import ReferenceEvent
+from app.db.references.reference_events_batch_writer import (
+    ReferenceEventsBatchWriter,
+)
 from app.db.references.references_recorder import ReferencesRecorder
 from app.db.session import async_session
 from app.harvesters.abstract_harvester_raw_result import AbstractHarvesterRawResult
@@ -44,6 +49,7 @@ class AbstractHarvester(ABC):  # pylint: disable=too-many-instance-attributes
         self.entity: Optional[DbEntity] = None
         self.event_types: list[ReferenceEvent.Type] = []
         self.fetch_enhancements: bool = True
+        self.conversion_workers: int = 1
 
     def set_result_queue(self, result_queue: Queue):
         """
@@ -85,6 +91,14 @@ class AbstractHarvester(ABC):  # pylint: disable=too-many-instance-attributes
         """
         self.fetch_enhancements = fetch_enhancements
 
+    def set_conversion_workers(self, conversion_workers: int):
+        """
+        Set the number of references converted in parallel during the harvesting
+        :param conversion_workers: The number of conversion workers
+        :return: None
+        """
+        self.conversion_workers = conversion_workers
+
     def is_relevant(self, entity: Type[DbEntity]) -> bool:  # pragma: no cover
         """
         Return True if the entity contains the required information for the harvester to do his job
@@ -111,7 +125,8 @@ class AbstractHarvester(ABC):  # pylint: disable=too-many-instance-attributes
         await self._update_harvesting_state(Harvesting.State.RUNNING)
         await self._notify_harvesting_state()
         references_recorder = ReferencesRecorder(
-            harvesting=(await self.get_harvesting())
+            harvesting=(await self.get_harvesting()),
+            events_batch_writer=self._build_events_batch_writer(),
         )
         previous_references: list[Reference] = (
             await references_recorder.get_matching_references_before_harvesting(
@@ -119,76 +134,31 @@ class AbstractHarvester(ABC):  # pylint: disable=too-many-instance-attributes
             )
             or []
         )
+        await references_recorder.load_references_index(entity_id=self.entity_id)
         existing_references: list[Reference] = []
         try:
-            raw_data: AbstractHarvesterRawResult
-            async for raw_data in self.fetch_results():
-                try:
-                    if raw_data is None or raw_data == "end":
-                        break
-                    new_ref = self.converter.build(
-                        raw_data=raw_data, harvester_version=self.get_version()
+            try:
+                if self._conversion_workers() > 1:
+                    await self._process_results_concurrently(
+                        references_recorder=references_recorder,
+                        existing_references=existing_references,
                     )
-                    if new_ref is None:
-                        continue
-                    old_ref = await references_recorder.exists(new_ref=new_ref)
-                    comparaison_hash = new_ref.hash
-                    new_ref_is_enhanced = False
-                    if old_ref is not None:
-                        existing_references.append(old_ref)
-                        new_ref_is_enhanced = VersionInfo.parse(
-                            new_ref.harvester_version
-                        ) > VersionInfo.parse(old_ref.harvester_version)
-                        if new_ref_is_enhanced:
-                            # If the version of the harvester has changed, we need to use a
-                            # comparaison hash computed with the old version of the harvester
-                            # to track changes
-                            comparaison_hash = self.converter.compute_hash(
-                                raw_data=raw_data,
-                                harvester_version=VersionInfo.parse(
-                                    old_ref.harvester_version
-                                ),
-                            )
-
-                    assert old_ref is None or comparaison_hash is not None
-                    # Compute the new reference fields only
-                    # 1. if the reference is new,
-                    # or 2. if source data have changed
-                    # or 3. if the harvester version has changed and fetch enhancements is True
-                    if (
-                        (old_ref is None)
-                        or (comparaison_hash != old_ref.hash)
-                        or (new_ref_is_enhanced and self.fetch_enhancements)
-                    ):
-                        await self.converter.convert(raw_data=raw_data, new_ref=new_ref)
-                    reference_event: Optional[
-                        ReferenceEvent
-                    ] = await self._handle_converted_result(
-                        new_ref=new_ref,
-                        old_ref=old_ref,
-                        comparaison_hash=comparaison_hash,
+                else:
+                    await self._process_results_sequentially(
                         references_recorder=references_recorder,
+                        existing_references=existing_references,
                     )
-                    if reference_event is not None:
-                        await self._put_in_queue(
-                            {
-                                "type": "ReferenceEvent",
-                                "id": reference_event.id,
-                                "change": reference_event.type,
-                            }
-                        )
-                except UnexpectedFormatException as error:
-                    # If an UnexpectedFormatException bubbles up to this point
-                    # it means that one of the references could not be converted
-                    # but the harvester can continue to deliver results
-                    # so we handle and continue
-                    await self.handle_error(error)
-                    continue
-            await self._register_deleted_references(
-                existing_references=existing_references,
-                previous_references=previous_references,
-                references_recorder=references_recorder,
-            )
+                await self._register_deleted_references(
+                    existing_references=existing_references,
+                    previous_references=previous_references,
+                    references_recorder=references_recorder,
+                )
+            except BaseException:
+                # the events of the references recorded before the failure
+                # are notified before the failure and the periodic flush is stopped
+                await self._flush_events_after_failure(references_recorder)
+                raise
+            await references_recorder.flush_events()
             await self._update_harvesting_state(Harvesting.State.COMPLETED)
             await self._notify_harvesting_state()
         # main point to handle all errors related to external endpoints unavailability
@@ -214,6 +184,212 @@ class AbstractHarvester(ABC):  # pylint: disable=too-many-instance-attributes
             logger.error(f"Unexpected exception during harvester run : {e}")
             await self.handle_error(e, with_stack=True)
 
+    @staticmethod
+    async def _flush_events_after_failure(
+        references_recorder: ReferencesRecorder,
+    ) -> None:
+        """
+        Write the pending reference events after a failure of the harvesting,
+        without hiding the failure if they cannot be written
+
+        :param references_recorder: the references recorder of the harvesting
+        :return: None
+        """
+        try:
+            await references_recorder.flush_events()
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            logger.error(
+                f"Cannot write the pending reference events after a failure : {error}"
+            )
+
+    def _conversion_workers(self) -> int:
+        """
+        Number of references converted in parallel during the harvesting.
+        Converters that keep state between build and convert
+        are always run sequentially.
+        :return: the number of conversion workers
+        """
+        if not self.converter.supports_concurrent_conversion:
+            return 1
+        return max(self.conversion_workers, 1)
+
+    async def _process_results_sequentially(
+        self,
+        references_recorder: ReferencesRecorder,
+        existing_references: List[Reference],
+    ) -> None:
+        raw_data: AbstractHarvesterRawResult
+        async for raw_data in self.fetch_results():
+            try:
+                if raw_data is None or raw_data == "end":
+                    break
+                prepared_reference = await self._prepare_reference(
+                    raw_data=raw_data, references_recorder=references_recorder
+                )
+                if prepared_reference is None:
+                    continue
+                await self._record_reference(
+                    *prepared_reference,
+                    references_recorder=references_recorder,
+                    existing_references=existing_references,
+                )
+            except UnexpectedFormatException as error:
+                # If an UnexpectedFormatException bubbles up to this point
+                # it means that one of the references could not be converted
+                # but the harvester can continue to deliver results
+                # so we handle and continue
+                await self.handle_error(error)
+                continue
+
+    async def _process_results_concurrently(
+        self,
+        references_recorder: ReferencesRecorder,
+        existing_references: List[Reference],
+    ) -> None:
+        """
+        Pipelined version of the results processing :
+        the raw results are fetched into a bounded queue, converted by several workers
+        and recorded one at a time by a single recorder
+        so that events, versions and deletion detection remain consistent.
+        """
+        workers = self._conversion_workers()
+        raw_results_queue: Queue = Queue(maxsize=2 * workers)
+        converted_results_queue: Queue = Queue(maxsize=2 * workers)
+
+        async def fetch() -> None:
+            async for raw_data in self.fetch_results():
+                if raw_data is None or raw_data == "end":
+                    break
+                await raw_results_queue.put(raw_data)
+            for _ in range(workers):
+                await raw_results_queue.put(None)
+
+        async def convert() -> None:
+            while (raw_data := await raw_results_queue.get()) is not None:
+                try:
+                    prepared_reference = await self._prepare_reference(
+                        raw_data=raw_data, references_recorder=references_recorder
+                    )
+                except UnexpectedFormatException as error:
+                    await self.handle_error(error)
+                    continue
+                if prepared_reference is not None:
+                    await converted_results_queue.put((raw_data, prepared_reference))
+
+        async def convert_all() -> None:
+            await asyncio.gather(*(convert() for _ in range(workers)))
+            await converted_results_queue.put(None)
+
+        async def record() -> None:
+            while (converted_result := await converted_results_queue.get()) is not None:
+                raw_data, prepared_reference = converted_result
+                try:
+                    new_ref, old_ref, _ = prepared_reference
+                    if old_ref is not references_recorder.get_indexed_reference(
+                        new_ref
+                    ):
+                        # a reference with the same source identifier
+                        # has been recorded since this one was converted :
+                        # it has to be compared again with the last recorded version
+                        prepared_reference = await self._prepare_reference(
+                            raw_data=raw_data, references_recorder=references_recorder
+                        )
+                    await self._record_reference(
+                        *prepared_reference,
+                        references_recorder=references_recorder,
+                        existing_references=existing_references,
+                    )
+                except UnexpectedFormatException as error:
+                    await self.handle_error(error)
+
+        tasks = [
+            asyncio.create_task(fetch()),
+            asyncio.create_task(convert_all()),
+            asyncio.create_task(record()),
+        ]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            # if one of the stages failed, the others must not outlive the harvesting
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _prepare_reference(
+        self,
+        raw_data: AbstractHarvesterRawResult,
+        references_recorder: ReferencesRecorder,
+    ) -> Optional[tuple[Reference, Optional[Reference], Optional[str]]]:
+        """
+        Build the reference from raw data, look for its previous version
+        and convert it if needed
+
+        :param raw_data: raw data from harvester source
+        :param references_recorder: references recorder of the harvesting
+        :return: the new reference, the previous version of the reference if any
+                    and the hash to compare them with, or None if the raw data
+                    could not be turned into a reference
+        """
+        new_ref = self.converter.build(
+            raw_data=raw_data, harvester_version=self.get_version()
+        )
+        if new_ref is None:
+            return None
+        old_ref = await references_recorder.exists(new_ref=new_ref)
+        comparaison_hash = new_ref.hash
+        new_ref_is_enhanced = False
+        if old_ref is not None:
+            new_ref_is_enhanced = VersionInfo.parse(
+                new_ref.harvester_version
+            ) > VersionInfo.parse(old_ref.harvester_version)
+            if new_ref_is_enhanced:
+                # If the version of the harvester has changed, we need to use a
+                # comparaison hash computed with the old version of the harvester
+                # to track changes
+                comparaison_hash = self.converter.compute_hash(
+                    raw_data=raw_data,
+                    harvester_version=VersionInfo.parse(old_ref.harvester_version),
+                )
+
+        assert old_ref is None or comparaison_hash is not None
+        # Compute the new reference fields only
+        # 1. if the reference is new,
+        # or 2. if source data have changed
+        # or 3. if the harvester version has changed and fetch enhancements is True
+        if (
+            (old_ref is None)
+            or (comparaison_hash != old_ref.hash)
+            or (new_ref_is_enhanced and self.fetch_enhancements)
+        ):
+            await self.converter.convert(raw_data=raw_data, new_ref=new_ref)
+        return new_ref, old_ref, comparaison_hash
+
+    # pylint: disable=too-many-arguments
+    async def _record_reference(
+        self,
+        new_ref: Reference,
+        old_ref: Optional[Reference],
+        comparaison_hash: Optional[str],
+        references_recorder: ReferencesRecorder,
+        existing_references: List[Reference],
+    ) -> None:
+        if old_ref is not None:
+            existing_references.append(old_ref)
+        reference_event: Optional[ReferenceEvent] = await self._handle_converted_result(
+            new_ref=new_ref,
+            old_ref=old_ref,
+            comparaison_hash=comparaison_hash,
+            references_recorder=references_recorder,
+        )
+        if reference_event is not None:
+            await self._put_in_queue(
+                {
+                    "type": "ReferenceEvent",
+                    "id": reference_event.id,
+                    "change": reference_event.type,
+                }
+            )
+
     async def _handle_converted_result(
         self,
         new_ref: Reference,
@@ -281,11 +457,35 @@ class AbstractHarvester(ABC):  # pylint: disable=too-many-instance-attributes
             reference_event = await references_recorder.register_deletion(
                 old_ref=reference,
             )
+            if reference_event is not None:
+                await self._put_in_queue(
+                    {
+                        "type": "ReferenceEvent",
+                        "id": reference_event.id,
+                        "change": ReferenceEvent.Type.DELETED.value,
+                    }
+                )
+
+    def _build_events_batch_writer(self) -> Optional[ReferenceEventsBatchWriter]:
+        settings = get_app_settings()
+        if not settings.reference_events_batching_enabled:
+            return None
+        return ReferenceEventsBatchWriter(
+            harvesting_id=self.harvesting_id,
+            on_flush=self._notify_reference_events,
+            batch_size=settings.reference_events_batch_size,
+            flush_interval=settings.reference_events_flush_interval,
+        )
+
+    async def _notify_reference_events(
+        self, reference_events: List[ReferenceEvent]
+    ) -> None:
+        for reference_event in reference_events:
             await self._put_in_queue(
                 {
                     "type": "ReferenceEvent",
                     "id": reference_event.id,
-                    "change": ReferenceEvent.Type.DELETED.value,
+                    "change": reference_event.type,
                 }
             )
 
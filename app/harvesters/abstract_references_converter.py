@@ -1,17 +1,18 @@
 import asyncio
 from abc import ABC, abstractmethod
+from contextlib import nullcontext
 from dataclasses import dataclass
 from functools import wraps
-from typing import List, AsyncGenerator
+from typing import List, AsyncGenerator, AsyncContextManager, Hashable
 
 from loguru import logger
 from semver import Version
 from sqlalchemy.exc import DBAPIError, IntegrityError
 
+from app.config import get_app_settings
 from app.db.daos.book_dao import BookDAO
 from app.db.daos.concept_dao import ConceptDAO
 from app.db.daos.contributor_dao import ContributorDAO
-from app.db.daos.document_type_dao import DocumentTypeDAO
 from app.db.daos.issue_dao import IssueDAO
 from app.db.daos.journal_dao import JournalDAO
 from app.db.daos.organization_dao import OrganizationDAO
@@ -27,7 +28,9 @@ from app.db.models.organization import Organization
 from app.db.models.reference import Reference
 from app.db.session import async_session
 from app.harvesters.abstract_harvester_raw_result import AbstractHarvesterRawResult
+from app.harvesters.document_type_registry import DocumentTypeRegistry
 from app.services.book.book_data_class import BookInformations
+from app.services.cache.entity_cache import EntityCache
 from app.services.concepts.concept_factory import ConceptFactory
 from app.services.concepts.concept_informations import ConceptInformations
 from app.services.concepts.dereferencing_error import DereferencingError
@@ -35,6 +38,7 @@ from app.services.hash.hash_key import HashKey
 from app.services.hash.hash_service import HashService
 from app.services.issue.issue_data_class import IssueInformations
 from app.services.journal.journal_data_class import JournalInformations
+from app.services.locks.keyed_locks import KeyedLocks
 from app.services.organizations.merge_organization import merge_organization
 from app.services.organizations.organization_data_class import OrganizationInformations
 from app.services.organizations.organization_factory import OrganizationFactory
@@ -56,6 +60,26 @@ class AbstractReferencesConverter(ABC):
         "contributions",
     ]
 
+    # False for converters that keep state between build and convert
+    # and thus cannot process several references at the same time
+    supports_concurrent_conversion: bool = True
+
+    _entity_cache: EntityCache | None = None
+
+    @property
+    def entity_cache(self) -> EntityCache:
+        """
+        :return: the cache of the entities resolved by the converter,
+            created on first use for the current retrieval
+        """
+        if self._entity_cache is None:
+            self._entity_cache = EntityCache.for_converter()
+        return self._entity_cache
+
+    @entity_cache.setter
+    def entity_cache(self, entity_cache: EntityCache) -> None:
+        self._entity_cache = entity_cache
+
     @dataclass
     class ContributionInformations:
         """
@@ -75,71 +99,173 @@ class AbstractReferencesConverter(ABC):
         contribution_informations: List[ContributionInformations],
         source: str,
     ) -> AsyncGenerator[Contribution, None]:
-        # if a contributor duplicate was created inside the loop, unicity rules
-        # would apply only later and the whole reference would fail to be
-        # created in database. To avoid this, we use a cache to store contributors
-        # already created and avoid duplicates.
-        # A duplicate is an identifiers duplicate for contributors with an identifier
-        # or a name duplicate for contributors without an identifier.
-        contributors_identifiers_cache = {}
-        contributors_names_cache = {}
+        contributors = await self._get_or_create_contributors(
+            contribution_informations, source
+        )
         for contribution_information in contribution_informations:
-            identifier = contribution_information.identifier
-            name = contribution_information.name
-            first_name = contribution_information.first_name
-            last_name = contribution_information.last_name
-            ext_identifiers = contribution_information.ext_identifiers
-            assert (
-                identifier is not None or name is not None
-            ), "No identifier or name provided for contributor"
-            if identifier is not None:
-                db_contributor = contributors_identifiers_cache.get(identifier)
-            else:
-                db_contributor = contributors_names_cache.get(name)
-            if db_contributor is None:
-                if identifier is not None:
-                    db_contributor = (
-                        await self._get_or_create_contributor_by_identifier(
-                            source=source,
-                            source_identifier=identifier,
-                            name=name,
-                            first_name=first_name,
-                            last_name=last_name,
-                        )
-                    )
-                    self._update_contributor_name(db_contributor, name)
-                    self._update_contributor_structured_name(
-                        db_contributor, first_name, last_name
-                    )
-                    await self._update_contributor_external_identifiers(
-                        db_contributor, ext_identifiers
-                    )
-                else:
-                    db_contributor = await self._get_or_create_contributor_by_name(
-                        source=source, name=name
-                    )
-                if identifier is not None:
-                    contributors_identifiers_cache[identifier] = db_contributor
-                else:
-                    contributors_names_cache[name] = db_contributor
-
             yield Contribution(
-                contributor=db_contributor,
+                contributor=contributors[
+                    self._contributor_key(contribution_information)
+                ],
                 role=contribution_information.role,
                 rank=contribution_information.rank,
             )
 
-    async def _update_contributor_external_identifiers(
-        self, db_contributor: Contributor, ext_identifiers: List[dict[str, str]]
-    ):
+    async def _get_or_create_contributors(
+        self,
+        contribution_informations: List[ContributionInformations],
+        source: str,
+    ) -> dict[tuple[str, str], Contributor]:
         """
-        Update the external identifiers of the contributor
+        Resolve all the contributors of a reference with a few bulk queries :
+        existing contributors are selected by identifier and by name,
+        missing ones are inserted with a single statement,
+        and the external identifiers are updated in the same transaction.
+
+        A contributor appearing several times in the reference is resolved once,
+        from its first contribution, so that no duplicate is created.
+        A duplicate is an identifiers duplicate for contributors with an identifier
+        or a name duplicate for contributors without an identifier.
+
+        :param contribution_informations: contributions of the reference
+        :param source: source of the contributors
+        :return: the contributors by key as computed by _contributor_key
         """
-        async with async_session() as session:
+        identified: dict[str, AbstractReferencesConverter.ContributionInformations] = {}
+        named: dict[str, AbstractReferencesConverter.ContributionInformations] = {}
+        for contribution_information in contribution_informations:
+            assert (
+                contribution_information.identifier is not None
+                or contribution_information.name is not None
+            ), "No identifier or name provided for contributor"
+            key_type, key = self._contributor_key(contribution_information)
+            (identified if key_type == "identifier" else named).setdefault(
+                key, contribution_information
+            )
+        if not identified and not named:
+            return {}
+        locks = KeyedLocks()
+        keys = [(source, "identifier", key) for key in identified] + [
+            (source, "name", key) for key in named
+        ]
+        async with locks.lock_all("contributor", keys), async_session() as session:
             async with session.begin():
-                await ContributorDAO(session).update_external_identifiers(
-                    db_contributor.id, ext_identifiers
+                await locks.advisory_lock(session, "contributor", keys)
+                dao = ContributorDAO(session)
+                by_identifier = {
+                    contributor.source_identifier: contributor
+                    for contributor in await dao.get_by_source_and_identifiers(
+                        source, list(identified)
+                    )
+                }
+                by_name = {
+                    contributor.name: contributor
+                    for contributor in await dao.get_by_source_and_names(
+                        source, list(named)
+                    )
+                }
+                await self._create_missing_contributors(
+                    dao, source, (identified, by_identifier), (named, by_name)
                 )
+                for identifier, contribution_information in identified.items():
+                    dao.replace_external_identifiers(
+                        by_identifier[identifier],
+                        contribution_information.ext_identifiers,
+                    )
+        # name changes are saved with the reference
+        for identifier, contribution_information in identified.items():
+            self._update_contributor_name(
+                by_identifier[identifier], contribution_information.name
+            )
+            self._update_contributor_structured_name(
+                by_identifier[identifier],
+                contribution_information.first_name,
+                contribution_information.last_name,
+            )
+        return {
+            **{("identifier", key): value for key, value in by_identifier.items()},
+            **{("name", key): value for key, value in by_name.items()},
+        }
+
+    @staticmethod
+    async def _create_missing_contributors(
+        dao: ContributorDAO,
+        source: str,
+        identified: tuple[dict[str, ContributionInformations], dict[str, Contributor]],
+        named: tuple[dict[str, ContributionInformations], dict[str, Contributor]],
+    ) -> None:
+        """
+        Insert the contributors that were not found with a single statement,
+        and add them to the resolved contributors
+
+        :param dao: contributor DAO of the current transaction
+        :param source: source of the contributors
+        :param identified: contributions and resolved contributors by identifier
+        :param named: contributions and resolved contributors by name
+        :return: None
+        """
+        informations_by_identifier, by_identifier = identified
+        informations_by_name, by_name = named
+        missing_identifiers = [
+            identifier
+            for identifier in informations_by_identifier
+            if identifier not in by_identifier
+        ]
+        missing_names = [name for name in informations_by_name if name not in by_name]
+        if not missing_identifiers and not missing_names:
+            return
+        inserted_ids = await dao.insert_missing(
+            [
+                {
+                    "source": source,
+                    "source_identifier": identifier,
+                    "name": informations_by_identifier[identifier].name,
+                    "first_name": informations_by_identifier[identifier].first_name,
+                    "last_name": informations_by_identifier[identifier].last_name,
+                }
+                for identifier in missing_identifiers
+            ]
+            + [
+                {
+                    "source": source,
+                    "source_identifier": None,
+                    "name": name,
+                    "first_name": None,
+                    "last_name": None,
+                }
+                for name in missing_names
+            ]
+        )
+        for contributor in await dao.get_by_ids(inserted_ids):
+            if contributor.source_identifier is not None:
+                by_identifier[contributor.source_identifier] = contributor
+            else:
+                by_name[contributor.name] = contributor
+        if len(inserted_ids) == len(missing_identifiers) + len(missing_names):
+            return
+        # the contributors not inserted were created by another process in the meantime
+        for contributor in await dao.get_by_source_and_identifiers(
+            source,
+            [
+                identifier
+                for identifier in missing_identifiers
+                if identifier not in by_identifier
+            ],
+        ):
+            by_identifier[contributor.source_identifier] = contributor
+        for contributor in await dao.get_by_source_and_names(
+            source, [name for name in missing_names if name not in by_name]
+        ):
+            by_name[contributor.name] = contributor
+
+    @staticmethod
+    def _contributor_key(
+        contribution_information: ContributionInformations,
+    ) -> tuple[str, str]:
+        # identifiers and names may be rdflib terms, whose hash differs from str
+        if contribution_information.identifier is not None:
+            return "identifier", str(contribution_information.identifier)
+        return "name", str(contribution_information.name)
 
     @staticmethod
     def validate_reference(func):
@@ -235,238 +361,183 @@ class AbstractReferencesConverter(ABC):
         """
         raise NotImplementedError
 
-    async def _get_or_create_contributor_by_name(
-        self, source: str, name: str, new_attempt: bool = False
-    ):
-        async with async_session() as session:
-            async with session.begin_nested():
-                contributor = await ContributorDAO(session).get_by_source_and_name(
-                    source=source, name=name
-                )
-                if contributor is None:
-                    contributor = Contributor(
-                        source=source,
-                        source_identifier=None,
-                        name=name,
-                    )
-                    session.add(contributor)
-                    try:
-                        await session.commit()
-                    except IntegrityError as error:
-                        # The concept has been created by another process,
-                        # during resolution process,
-                        # so rollback the current transaction
-                        # and get the concept from the database
-                        assert new_attempt is False, (
-                            f"Unique name {name} violation "
-                            "for contributor without uri cannot occur twice"
-                            f" during concept creation : {error}"
-                        )
-                        await session.rollback()
-                        contributor = await self._get_or_create_contributor_by_name(
-                            source=source, name=name, new_attempt=True
-                        )
-        return contributor
+    @execution_timer
+    async def _get_or_create_concepts(
+        self, concept_informations: List[ConceptInformations]
+    ) -> List[Concept]:
+        """
+        Resolve all the concepts of a reference with a few bulk queries :
+        concepts with an uri or a code are selected by uri, the other ones
+        by label and language, the missing concepts with an uri are dereferenced
+        concurrently and all the missing concepts are inserted in a single transaction.
 
-    # pylint: disable=too-many-arguments
-    async def _get_or_create_contributor_by_identifier(
-        self,
-        source: str,
-        source_identifier: str,
-        name: str,
-        first_name: str | None = None,
-        last_name: str | None = None,
-        new_attempt: bool = False,
-    ):
-        async with async_session() as session:
-            async with session.begin_nested():
-                contributor = await ContributorDAO(
-                    session
-                ).get_by_source_and_identifier(
-                    source=source, source_identifier=source_identifier
-                )
-                if contributor is None:
-                    contributor = Contributor(
-                        source=source,
-                        source_identifier=source_identifier,
-                        name=name,
-                        first_name=first_name,
-                        last_name=last_name,
-                    )
-                    session.add(contributor)
-                    try:
-                        await session.commit()
-                    except IntegrityError as error:
-                        assert new_attempt is False, (
-                            f"Unique identifier {source_identifier} violation "
-                            "for contributor cannot occur twice "
-                            f"during concept creation : {error}"
-                        )
-                        await session.rollback()
-                        contributor = (
-                            await self._get_or_create_contributor_by_identifier(
-                                source=source,
-                                source_identifier=source_identifier,
-                                name=name,
-                                first_name=first_name,
-                                last_name=last_name,
-                                new_attempt=True,
-                            )
-                        )
-        return contributor
+        Concepts whose uri cannot be inferred from their code are skipped.
 
-    async def _get_or_create_concept_by_label(
-        self, concept_informations: ConceptInformations, new_attempt: bool = False
-    ):
-        async with async_session() as session:
-            async with session.begin_nested():
-                concept = await ConceptDAO(session).get_concept_by_label_and_language(
-                    label=concept_informations.label,
-                    language=concept_informations.language,
-                )
-                if concept is None:
-                    concept = Concept(uri=concept_informations.uri)
-                    concept.labels.append(
-                        Label(
-                            value=concept_informations.label,
-                            language=concept_informations.language,
-                        )
+        :param concept_informations: concepts of the reference
+        :return: the distinct concepts, in the order of their first occurrence
+        """
+        by_uri: dict[str, ConceptInformations] = {}
+        by_label: dict[tuple[str, str | None], ConceptInformations] = {}
+        # ordered set of the keys of the concepts
+        keys: dict = {}
+        for concept_information in concept_informations:
+            if concept_information.uri is None and concept_information.code is None:
+                key = (concept_information.label, concept_information.language)
+                by_label.setdefault(key, concept_information)
+            else:
+                try:
+                    ConceptFactory.complete_information(concept_information)
+                except AssertionError as error:
+                    logger.error(
+                        f"Could not resolve concept {concept_information} because : {error}"
                     )
-                    session.add(concept)
-                    try:
-                        await session.commit()
-                    except IntegrityError as error:
-                        # The concept has been created by another process,
-                        # during resolution process,
-                        # so rollback the current transaction
-                        # and get the concept from the database
-                        assert new_attempt is False, (
-                            f"Unique label {concept_informations.label} "
-                            "for concept without uri violation cannot occur twice "
-                            f"during concept creation : {error}"
-                        )
-                        await session.rollback()
-                        concept = await self._get_or_create_concept_by_label(
-                            concept_informations=concept_informations, new_attempt=True
-                        )
-        return concept
-
-    @execution_timer
-    async def _get_or_create_concept_by_uri(
-        self,
-        concept_informations: ConceptInformations,
-        new_attempt: bool = False,
-    ):
-        concept = None
-        # Look for the concept in the database
+                    continue
+                key = concept_information.uri
+                by_uri.setdefault(key, concept_information)
+            keys[key] = None
         async with async_session() as session:
-            async with session.begin_nested():
-                # First we resolve the uri of the concept
-                ConceptFactory.complete_information(concept_informations)
-                concept = await ConceptDAO(session).get_concept_by_uri(
-                    concept_informations.uri
-                )
-                # If the concept is not in the database, try to create it by dereferencing the uri
-        if concept is not None:
-            return concept
-        try:
-            concept = await ConceptFactory.solve(concept_informations)
-        except DereferencingError as error:
-            # If the dereferencing fails, create a concept with the uri and the label
-            logger.error(
-                "Dereferencing failure for concept "
-                f"{concept_informations.uri} with error: {error}"
+            concepts = await self._select_concepts(
+                ConceptDAO(session), list(by_uri), list(by_label)
             )
-            concept = Concept(uri=concept_informations.uri)
-            if concept_informations.label is not None:
-                concept.labels.append(
-                    Label(
-                        value=concept_informations.label,
-                        language=concept_informations.language,
+        missing_uris = [uri for uri in by_uri if uri not in concepts]
+        missing_labels = [key for key in by_label if key not in concepts]
+        if missing_uris or missing_labels:
+            # concurrent resolutions of the same concepts share a single creation
+            async with KeyedLocks().lock_all("concept", missing_uris + missing_labels):
+                concepts.update(
+                    await self._create_concepts(
+                        [by_uri[uri] for uri in missing_uris],
+                        [by_label[key] for key in missing_labels],
                     )
                 )
-        async with async_session() as session:
-            async with session.begin_nested():
-                session.add(concept)
-                try:
-                    await session.commit()
-                except IntegrityError as error:
-                    # The concept has been created by another process,
-                    # during resolution process,
-                    # so rollback the current transaction
-                    # and get the concept from the database
-                    assert new_attempt is False, (
-                        f"Unique uri {concept_informations.uri} violation "
-                        "cannot occur twice "
-                        f"during concept creation : {error}"
-                    )
-                    await session.rollback()
-                    concept = await self._get_or_create_concept_by_uri(
-                        concept_informations=concept_informations, new_attempt=True
-                    )
-        return concept
+        return [concepts[key] for key in keys]
 
-    async def _get_or_create_concepts_by_uri(
+    @staticmethod
+    async def _select_concepts(
+        dao: ConceptDAO, uris: List[str], labels: List[tuple[str, str | None]]
+    ) -> dict:
+        concepts = {}
+        if uris:
+            concepts = {
+                concept.uri: concept for concept in await dao.get_concepts_by_uri(uris)
+            }
+        if labels:
+            concepts.update(await dao.get_concepts_by_labels_and_languages(labels))
+        return concepts
+
+    async def _create_concepts(
         self,
-        concept_informations: List[ConceptInformations],
-    ):
-        db_concepts = []
-        # get all the concepts from the database in one query
+        with_uri: List[ConceptInformations],
+        without_uri: List[ConceptInformations],
+    ) -> dict:
+        label_keys = [
+            (concept_information.label, concept_information.language)
+            for concept_information in without_uri
+        ]
+        # the concepts may have been created while waiting for the locks
         async with async_session() as session:
-            db_concepts = await ConceptDAO(session).get_concepts_by_uri(
-                [
-                    concept_information.uri
-                    for concept_information in concept_informations
-                ]
+            concepts = await self._select_concepts(
+                ConceptDAO(session),
+                [concept_information.uri for concept_information in with_uri],
+                [],
             )
-        concepts_dereferencing_coroutines = []
-        # for each concept information, check if the concept is in the db_concepts list
-        # if not, create a coroutine to dereference the concept
-        for concept_information in concept_informations:
-            if not any(
-                concept.uri == concept_information.uri for concept in db_concepts
-            ):
-                concepts_dereferencing_coroutines.append(
-                    self._get_or_create_concept_by_uri(
-                        concept_information, new_attempt=False
+        semaphore = asyncio.Semaphore(
+            get_app_settings().concept_dereferencing_parallelism
+        )
+        dereferenced_concepts = await asyncio.gather(
+            *[
+                self._dereference_concept(concept_information, semaphore)
+                for concept_information in with_uri
+                if concept_information.uri not in concepts
+            ]
+        )
+        async with async_session() as session:
+            async with session.begin():
+                dao = ConceptDAO(session)
+                await KeyedLocks().advisory_lock(
+                    session,
+                    "concept",
+                    [concept.uri for concept in dereferenced_concepts] + label_keys,
+                )
+                await dao.insert_missing(dereferenced_concepts)
+                # concepts created concurrently by another process are selected too
+                concepts.update(
+                    await self._select_concepts(
+                        dao,
+                        [concept.uri for concept in dereferenced_concepts],
+                        label_keys,
                     )
                 )
-        # wait for all the coroutines to finish
-        concepts_dereferencing_results = await asyncio.gather(
-            *concepts_dereferencing_coroutines
+                labelled_concepts = {
+                    key: Concept(labels=[Label(value=key[0], language=key[1])])
+                    for key in label_keys
+                    if key not in concepts
+                }
+                session.add_all(labelled_concepts.values())
+        return concepts | labelled_concepts
+
+    async def _dereference_concept(
+        self, concept_informations: ConceptInformations, semaphore: asyncio.Semaphore
+    ) -> Concept:
+        async with semaphore:
+            try:
+                return await ConceptFactory.solve(concept_informations)
+            except DereferencingError as error:
+                # If the dereferencing fails, create a concept with the uri and the label
+                logger.error(
+                    "Dereferencing failure for concept "
+                    f"{concept_informations.uri} with error: {error}"
+                )
+        concept = Concept(uri=concept_informations.uri)
+        if concept_informations.label is not None:
+            concept.labels.append(
+                Label(
+                    value=concept_informations.label,
+                    language=concept_informations.language,
+                )
+            )
+        return concept
+
+    @staticmethod
+    def _get_or_create_lock(
+        namespace: str, key: Hashable, new_attempt: bool
+    ) -> AsyncContextManager:
+        """
+        Lock held during the get-or-create of an entity, so that the concurrent
+        get-or-create of the same entity wait for its creation instead of colliding
+
+        :param namespace: kind of entity
+        :param key: natural key of the entity
+        :param new_attempt: whether this is a new attempt, that already holds the lock
+        :return: the lock as async context manager
+        """
+        if new_attempt:
+            return nullcontext()
+        return KeyedLocks().lock(namespace, key)
+
+    @staticmethod
+    def _journal_key(journal_informations: JournalInformations) -> tuple:
+        return (
+            journal_informations.source,
+            journal_informations.source_identifier,
+            journal_informations.issn_l,
+            tuple(journal_informations.issn or []),
+            tuple(journal_informations.eissn or []),
+        )
+
+    @staticmethod
+    def _book_key(book_informations: BookInformations) -> tuple:
+        return (
+            book_informations.source,
+            book_informations.isbn10,
+            book_informations.isbn13,
+            book_informations.title,
         )
-        # add the dereferenced concepts to the db_concepts list
-        db_concepts.extend(concepts_dereferencing_results)
-        return db_concepts
 
     async def _get_or_create_document_type_by_uri(
-        self, uri: str, label: str | None, new_attempt: bool = False
-    ):
-        async with async_session() as session:
-            async with session.begin_nested():
-                document_type = await DocumentTypeDAO(session).get_document_type_by_uri(
-                    uri
-                )
-                if document_type is None:
-                    document_type = DocumentType(uri=uri, label=label)
-                    session.add(document_type)
-                    try:
-                        await session.commit()
-                    except IntegrityError as error:
-                        # The document type has been created
-                        # by another process, during creation process,
-                        # so rollback the current transaction
-                        # and get the the document type from the database
-                        assert new_attempt is False, (
-                            f"Unique uri {uri} violation "
-                            "cannot occur twice "
-                            f"during document type creation : {error}"
-                        )
-                        await session.rollback()
-                        document_type = await self._get_or_create_document_type_by_uri(
-                            uri, label, new_attempt=True
-                        )
-        return document_type
+        self, uri: str, label: str | None
+    ) -> DocumentType:
+        return await DocumentTypeRegistry().get_or_create(uri, label)
 
     @staticmethod
     def _update_contributor_name(db_contributor: Contributor, name: str):
@@ -528,74 +599,89 @@ class AbstractReferencesConverter(ABC):
         self, organization_informations: List[OrganizationInformations]
     ) -> AsyncGenerator[Organization, None]:
         # Get all the organizations from the database, or create if they do not exist
-        organizations_identifiers_cache = {}
         for organization_information in organization_informations:
-            identifier = organization_information.identifier
-            assert identifier is not None, "No identifier provided for organization"
-            db_organization = organizations_identifiers_cache.get(identifier)
-            if db_organization is None:
-                db_organization = await self._get_or_create_organization_by_identifier(
-                    organization_informations=organization_information
-                )
-                organizations_identifiers_cache[identifier] = db_organization
-
-            yield db_organization
+            assert (
+                organization_information.identifier is not None
+            ), "No identifier provided for organization"
+            yield await self._get_or_create_organization_by_identifier(
+                organization_informations=organization_information
+            )
 
     async def _get_or_create_organization_by_identifier(
         self,
         organization_informations: OrganizationInformations,
         new_attempt: bool = False,
     ):
-        async with async_session() as session:
-            async with session.begin_nested():
-                organization = await OrganizationDAO(
-                    session
-                ).get_organization_by_source_identifier(
-                    identifier=organization_informations.identifier
-                )
-
-                if organization is None:
-                    try:
-                        organization = await OrganizationFactory.solve(
-                            organization_informations
-                        )
+        key = (organization_informations.source, organization_informations.identifier)
+        cached_organization = self.entity_cache.get("organization", key)
+        if cached_organization is not None:
+            return cached_organization
+        async with self._get_or_create_lock("organization", key, new_attempt):
+            async with async_session() as session:
+                async with session.begin_nested():
+                    await KeyedLocks().advisory_lock(session, "organization", [key])
+                    organization = await OrganizationDAO(
+                        session
+                    ).get_organization_by_source_identifier(
+                        identifier=organization_informations.identifier
+                    )
 
-                        same_organization = await OrganizationDAO(
-                            session
-                        ).get_organization_by_identifiers(organization.identifiers)
-                        if same_organization is not None and len(
-                            same_organization.identifiers
-                        ) != len(organization.identifiers):
-                            organization = merge_organization(
-                                same_organization, organization
+                    if organization is None:
+                        try:
+                            organization = await self._solve_organization(
+                                organization_informations
                             )
 
-                    except DereferencingError:
-                        organization = Organization(
-                            source=organization_informations.source,
-                            source_identifier=organization_informations.identifier,
-                            name=organization_informations.name,
-                        )
-                    session.add(organization)
-                    try:
-                        await session.commit()
-                    except IntegrityError as error:
-                        assert new_attempt is False, (
-                            f"Unique identifier {organization_informations.identifier} violation "
-                            "for organization cannot occur twice "
-                            f"during organization creation : {error}"
-                        )
-                        await session.rollback()
-                        organization = (
-                            await self._get_or_create_organization_by_identifier(
-                                organization_informations=organization_informations,
-                                new_attempt=True,
+                            same_organization = await OrganizationDAO(
+                                session
+                            ).get_organization_by_identifiers(organization.identifiers)
+                            if same_organization is not None and len(
+                                same_organization.identifiers
+                            ) != len(organization.identifiers):
+                                organization = merge_organization(
+                                    same_organization, organization
+                                )
+
+                        except DereferencingError:
+                            organization = Organization(
+                                source=organization_informations.source,
+                                source_identifier=organization_informations.identifier,
+                                name=organization_informations.name,
                             )
-                        )
-                else:
-                    await session.refresh(organization)
+                        session.add(organization)
+                        try:
+                            await session.commit()
+                        except IntegrityError as error:
+                            assert new_attempt is False, (
+                                "Unique identifier "
+                                f"{organization_informations.identifier} violation "
+                                "for organization cannot occur twice "
+                                f"during organization creation : {error}"
+                            )
+                            await session.rollback()
+                            organization = (
+                                await self._get_or_create_organization_by_identifier(
+                                    organization_informations=organization_informations,
+                                    new_attempt=True,
+                                )
+                            )
+                    else:
+                        await session.refresh(organization)
+        self.entity_cache.set("organization", key, organization)
         return organization
 
+    async def _solve_organization(
+        self, organization_informations: OrganizationInformations
+    ) -> Organization:
+        """
+        Dereference an organization that is not in the database yet
+
+        :param organization_informations: informations about the organization
+        :return: the organization
+        :raises DereferencingError: if the organization cannot be dereferenced
+        """
+        return await OrganizationFactory.solve(organization_informations)
+
     async def _get_or_create_issue(
         self, issue_informations: IssueInformations, new_attempt: bool = False
     ):
@@ -603,43 +689,50 @@ class AbstractReferencesConverter(ABC):
         Try to get an issue by source and source identifier.
         If not found, create it.
         """
-        async with async_session() as session:
-            async with session.begin_nested():
-                issue = await IssueDAO(
-                    session
-                ).get_issue_by_source_and_source_identifier(
-                    source=issue_informations.source,
-                    source_identifier=issue_informations.source_identifier,
-                )
-
-                if issue is None:
-                    issue = Issue(
+        key = (issue_informations.source, issue_informations.source_identifier)
+        cached_issue = self.entity_cache.get("issue", key)
+        if cached_issue is not None:
+            return cached_issue
+        async with self._get_or_create_lock("issue", key, new_attempt):
+            async with async_session() as session:
+                async with session.begin_nested():
+                    await KeyedLocks().advisory_lock(session, "issue", [key])
+                    issue = await IssueDAO(
+                        session
+                    ).get_issue_by_source_and_source_identifier(
                         source=issue_informations.source,
                         source_identifier=issue_informations.source_identifier,
-                        journal=issue_informations.journal,
-                        journal_id=issue_informations.journal.id,
-                        titles=issue_informations.titles,
-                        volume=issue_informations.volume,
-                        number=issue_informations.number,
-                        date=issue_informations.date,
-                        rights=issue_informations.rights,
                     )
-                    session.add(issue)
-                    try:
-                        await session.commit()
-                    except IntegrityError as error:
-                        assert new_attempt is False, (
-                            f"Unique source and source identifier violation "
-                            "for issue cannot occur twice "
-                            f"during issue creation : {error}"
-                        )
-                        await session.rollback()
-                        issue = await self._get_or_create_issue(
-                            issue_informations=issue_informations, new_attempt=True
+
+                    if issue is None:
+                        issue = Issue(
+                            source=issue_informations.source,
+                            source_identifier=issue_informations.source_identifier,
+                            journal=issue_informations.journal,
+                            journal_id=issue_informations.journal.id,
+                            titles=issue_informations.titles,
+                            volume=issue_informations.volume,
+                            number=issue_informations.number,
+                            date=issue_informations.date,
+                            rights=issue_informations.rights,
                         )
-                else:
-                    # journal is not set as lazy=raise
-                    issue.journal = issue_informations.journal
+                        session.add(issue)
+                        try:
+                            await session.commit()
+                        except IntegrityError as error:
+                            assert new_attempt is False, (
+                                f"Unique source and source identifier violation "
+                                "for issue cannot occur twice "
+                                f"during issue creation : {error}"
+                            )
+                            await session.rollback()
+                            issue = await self._get_or_create_issue(
+                                issue_informations=issue_informations, new_attempt=True
+                            )
+                    else:
+                        # journal is not set as lazy=raise
+                        issue.journal = issue_informations.journal
+        self.entity_cache.set("issue", key, issue)
         return issue
 
     async def _get_or_create_journal(
@@ -650,46 +743,54 @@ class AbstractReferencesConverter(ABC):
         If not found, try to get by source and source_identifier.
         If not found, create it.
         """
-        async with async_session() as session:
-            async with session.begin_nested():
-                journal = await JournalDAO(
-                    session
-                ).get_journal_by_source_issn_or_eissn_or_issn_l(
-                    source=journal_informations.source,
-                    issn=journal_informations.issn,
-                    eissn=journal_informations.eissn,
-                    issn_l=journal_informations.issn_l,
-                )
-                if journal is None:
+        key = self._journal_key(journal_informations)
+        cached_journal = self.entity_cache.get("journal", key)
+        if cached_journal is not None:
+            return cached_journal
+        async with self._get_or_create_lock("journal", key, new_attempt):
+            async with async_session() as session:
+                async with session.begin_nested():
+                    await KeyedLocks().advisory_lock(session, "journal", [key])
                     journal = await JournalDAO(
                         session
-                    ).get_journal_by_source_identifier_and_source(
+                    ).get_journal_by_source_issn_or_eissn_or_issn_l(
                         source=journal_informations.source,
-                        source_identifier=journal_informations.source_identifier,
-                    )
-                if journal is None:
-                    journal = Journal(
-                        source=journal_informations.source,
-                        source_identifier=journal_informations.source_identifier,
-                        eissn=journal_informations.eissn,
                         issn=journal_informations.issn,
+                        eissn=journal_informations.eissn,
                         issn_l=journal_informations.issn_l,
-                        publisher=journal_informations.publisher,
-                        titles=journal_informations.titles,
                     )
-                    session.add(journal)
-                    try:
-                        await session.commit()
-                    except DBAPIError as error:
-                        assert new_attempt is False, (
-                            f"Unique source and source identifier violation "
-                            "for journal cannot occur twice "
-                            f"during journal creation : {error}"
+                    if journal is None:
+                        journal = await JournalDAO(
+                            session
+                        ).get_journal_by_source_identifier_and_source(
+                            source=journal_informations.source,
+                            source_identifier=journal_informations.source_identifier,
                         )
-                        await session.rollback()
-                        journal = await self._get_or_create_journal(
-                            journal_informations=journal_informations, new_attempt=True
+                    if journal is None:
+                        journal = Journal(
+                            source=journal_informations.source,
+                            source_identifier=journal_informations.source_identifier,
+                            eissn=journal_informations.eissn,
+                            issn=journal_informations.issn,
+                            issn_l=journal_informations.issn_l,
+                            publisher=journal_informations.publisher,
+                            titles=journal_informations.titles,
                         )
+                        session.add(journal)
+                        try:
+                            await session.commit()
+                        except DBAPIError as error:
+                            assert new_attempt is False, (
+                                f"Unique source and source identifier violation "
+                                "for journal cannot occur twice "
+                                f"during journal creation : {error}"
+                            )
+                            await session.rollback()
+                            journal = await self._get_or_create_journal(
+                                journal_informations=journal_informations,
+                                new_attempt=True,
+                            )
+        self.entity_cache.set("journal", key, journal)
         return journal
 
     async def _get_or_create_book(
@@ -700,41 +801,49 @@ class AbstractReferencesConverter(ABC):
         If not found, try to get by title.
         If not found, create it.
         """
-        async with async_session() as session:
-            async with session.begin_nested():
-                book = await BookDAO(session).get_books_by_isbn(
-                    source=book_informations.source,
-                    isbn10=book_informations.isbn10,
-                    isbn13=book_informations.isbn13,
-                )
-                if book is None:
-                    book = await BookDAO(session).get_books_by_title(
-                        source=book_informations.source, title=book_informations.title
-                    )
-                if book is None:
-                    book = Book(
+        key = self._book_key(book_informations)
+        cached_book = self.entity_cache.get("book", key)
+        if cached_book is not None:
+            return cached_book
+        async with self._get_or_create_lock("book", key, new_attempt):
+            async with async_session() as session:
+                async with session.begin_nested():
+                    await KeyedLocks().advisory_lock(session, "book", [key])
+                    book = await BookDAO(session).get_books_by_isbn(
                         source=book_informations.source,
-                        title=book_informations.title,
                         isbn10=book_informations.isbn10,
                         isbn13=book_informations.isbn13,
-                        publisher=book_informations.publisher,
                     )
-                    session.add(book)
-                    try:
-                        await session.commit()
-                    except DBAPIError as error:
-                        assert new_attempt is False, (
-                            f"Unique isbn10 and isbn13 violation"
-                            "for book cannot occur twice "
-                            f"during book creation : {error}"
+                    if book is None:
+                        book = await BookDAO(session).get_books_by_title(
+                            source=book_informations.source,
+                            title=book_informations.title,
                         )
-                        await session.rollback()
-                        book = await self._get_or_create_book(
-                            book_informations=book_informations, new_attempt=True
+                    if book is None:
+                        book = Book(
+                            source=book_informations.source,
+                            title=book_informations.title,
+                            isbn10=book_informations.isbn10,
+                            isbn13=book_informations.isbn13,
+                            publisher=book_informations.publisher,
                         )
-                else:
-                    book = self._update_book(book, book_informations)
+                        session.add(book)
+                        try:
+                            await session.commit()
+                        except DBAPIError as error:
+                            assert new_attempt is False, (
+                                f"Unique isbn10 and isbn13 violation"
+                                "for book cannot occur twice "
+                                f"during book creation : {error}"
+                            )
+                            await session.rollback()
+                            book = await self._get_or_create_book(
+                                book_informations=book_informations, new_attempt=True
+                            )
+                    else:
+                        book = self._update_book(book, book_informations)
 
+        self.entity_cache.set("book", key, book)
         return book
 
     def _update_book(self, book: Book, book_informations: BookInformations):
@@ -0,0 +1,111 @@
+import asyncio
+import importlib
+import pkgutil
+
+from loguru import logger
+
+import app.harvesters
+from app.db.daos.document_type_dao import DocumentTypeDAO
+from app.db.models.document_type import DocumentType
+from app.db.session import async_session
+from app.harvesters.abstract_document_type_converter import (
+    AbstractDocumentTypeConverter,
+)
+
+
+class DocumentTypeRegistry:
+    """
+    Singleton holding all the document types of the database in memory.
+    At first use, the document types of the mapping tables of all the document type
+    converters are inserted if missing, then all the document types are loaded.
+    Unknown document types are inserted once.
+
+    The document types are detached instances,
+    merged into the session of the references that use them.
+    """
+
+    _instance = None
+
+    def __new__(cls, *args, **kwargs):
+        if not cls._instance:
+            cls._instance = super().__new__(cls, *args, **kwargs)
+        return cls._instance
+
+    def __init__(self):
+        if not hasattr(self, "document_types"):
+            self.document_types: dict[str, DocumentType] = {}
+            self.loaded = False
+            self.lock: asyncio.Lock | None = None
+
+    async def load(self) -> None:
+        """
+        Insert the document types of the converters mapping tables if missing
+        and load all the document types
+
+        :return: None
+        """
+        document_types = self._mapped_document_types()
+        async with async_session() as session:
+            async with session.begin():
+                dao = DocumentTypeDAO(session)
+                await dao.insert_missing(document_types)
+                self.document_types = {
+                    document_type.uri: document_type
+                    for document_type in await dao.get_all()
+                }
+        self.loaded = True
+        logger.info(f"{len(self.document_types)} document types loaded")
+
+    async def get_or_create(self, uri: str, label: str | None) -> DocumentType:
+        """
+        Get a document type by its uri, create it if it does not exist
+
+        :param uri: uri of the document type
+        :param label: label of the document type, if it has to be created
+        :return: the document type
+        """
+        document_type = self.document_types.get(uri)
+        if document_type is not None:
+            return document_type
+        if self.lock is None:
+            self.lock = asyncio.Lock()
+        async with self.lock:
+            if not self.loaded:
+                await self.load()
+            if uri not in self.document_types:
+                async with async_session() as session:
+                    async with session.begin():
+                        dao = DocumentTypeDAO(session)
+                        await dao.insert_missing({uri: label})
+                        self.document_types[uri] = await dao.get_document_type_by_uri(
+                            uri
+                        )
+        return self.document_types[uri]
+
+    def reset(self) -> None:
+        """
+        Forget the loaded document types, e.g. when the database is recreated
+
+        :return: None
+        """
+        self.document_types = {}
+        self.loaded = False
+        self.lock = None
+
+    @staticmethod
+    def _mapped_document_types() -> dict[str, str]:
+        # import all the document type converters so that they are registered
+        for module in pkgutil.walk_packages(
+            app.harvesters.__path__, f"{app.harvesters.__name__}."
+        ):
+            if module.name.endswith("_document_type_converter"):
+                importlib.import_module(module.name)
+        uri, label = AbstractDocumentTypeConverter.UNKNOWN_CODE
+        document_types = {uri: label}
+        converters = AbstractDocumentTypeConverter.__subclasses__()
+        while converters:
+            converter = converters.pop()
+            converters.extend(converter.__subclasses__())
+            for uri, label in getattr(converter, "TYPES_MAPPING", {}).values():
+                document_types.setdefault(uri, label)
+        return document_types
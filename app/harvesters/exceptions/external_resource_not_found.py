@@ -0,0 +1,5 @@
+from app.harvesters.exceptions.external_endpoint_failure import ExternalEndpointFailure
+
+
+class ExternalResourceNotFound(ExternalEndpointFailure):
+    """Exception raised when an external API answers that a resource does not exist."""
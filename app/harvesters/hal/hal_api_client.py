@@ -7,6 +7,9 @@ from app.harvesters.exceptions.external_endpoint_failure import ExternalEndpoint
 from app.harvesters.exceptions.unexpected_format_exception import (
     UnexpectedFormatException,
 )
+from app.http_client.http_sessions_pool import HttpSessionsPool
+from app.http_client.prefetched_pages import prefetched_pages
+from app.harvesters.hal.hal_api_query_builder import HalApiQueryBuilder
 
 
 class HalApiClient:
@@ -14,47 +17,94 @@ class HalApiClient:
 
     HAL_API_URL = "https://api.archives-ouvertes.fr/search"
 
-    async def fetch(self, query_string: str) -> AsyncGenerator[dict, None]:
+    async def fetch(
+        self, query_builder: HalApiQueryBuilder
+    ) -> AsyncGenerator[dict, None]:
         """
-        Fetch the results from the HAL API
+        Fetch the results from the HAL API, page by page with Solr cursor marks.
+        The next page is requested while the documents of the current page
+        are being processed.
 
-        :param query_string: the query string to send to the HAL API
+        :param query_builder: the query builder with the query parameters set
         :return: A generator of results
         """
+        async for docs in self.fetch_pages(query_builder):
+            for doc in docs:
+                yield doc
+
+    async def fetch_pages(
+        self, query_builder: HalApiQueryBuilder
+    ) -> AsyncGenerator[list[dict], None]:
+        """
+        Fetch the results from the HAL API, page by page with Solr cursor marks.
+        The next page is requested while the documents of the current page
+        are being processed.
+
+        :param query_builder: the query builder with the query parameters set
+        :return: A generator of the pages of results
+        """
+        query_builder.set_cursor_mark(HalApiQueryBuilder.INITIAL_CURSOR_MARK)
         try:
-            async with aiohttp.ClientSession(
-                connector=aiohttp.TCPConnector(limit=0)
-            ) as session:
-                logger.info(
-                    f"Fetching HAL API with query: {self.HAL_API_URL}/?{query_string}"
-                )
-                async with session.get(f"{self.HAL_API_URL}/?{query_string}") as resp:
-                    if resp.status == 200:
-                        json_response = await resp.json()
-                        # Hal API doesn't provide information about the error in the response body
-                        if "error" in json_response.keys():
-                            raise ExternalEndpointFailure(
-                                f"Error response from HAL API for request : {query_string}"
-                            )
-                        if (
-                            "response" not in json_response.keys()
-                            or "docs" not in json_response["response"].keys()
-                        ):
-                            raise UnexpectedFormatException(
-                                f"Unexpected format in HAL response: {json_response}"
-                                f"for request : {query_string}"
-                            )
-                        for doc in json_response["response"]["docs"]:
-                            if doc.get("halId_s") is None:
-                                logger.error(f"Missing halId_s in HAL response: {doc}")
-                                continue
-                            yield doc
-                    else:
-                        raise ExternalEndpointFailure(
-                            f"Error code from HAL API for request : {query_string} "
-                            f"with code {resp.status}"
-                        )
+            session = HttpSessionsPool().get_session(self.HAL_API_URL)
+
+            def next_page(page: tuple[list[dict], str | None]):
+                docs, next_cursor_mark = page
+                if (
+                    next_cursor_mark is None
+                    or next_cursor_mark == query_builder.cursor_mark
+                    or len(docs) < query_builder.rows
+                ):
+                    return None
+                query_builder.set_cursor_mark(next_cursor_mark)
+                return self._fetch_page(session, query_builder.build())
+
+            async for docs, _ in prefetched_pages(
+                self._fetch_page(session, query_builder.build()), next_page
+            ):
+                valid_docs = []
+                for doc in docs:
+                    if doc.get("halId_s") is None:
+                        logger.error(f"Missing halId_s in HAL response: {doc}")
+                        continue
+                    valid_docs.append(doc)
+                yield valid_docs
         except aiohttp.ClientConnectorError as error:
             raise ExternalEndpointFailure(
-                f"Cant connect to HAL API for request : {query_string} with error {error}"
+                f"Cant connect to HAL API for request : {query_builder.build()} "
+                f"with error {error}"
             ) from error
+
+    async def _fetch_page(
+        self, session: aiohttp.ClientSession, query_string: str
+    ) -> tuple[list[dict], str | None]:
+        """
+        Fetch a page of results from the HAL API
+
+        :param session: the aiohttp session
+        :param query_string: the query string to send to the HAL API
+        :return: the documents of the page and the cursor mark of the next page
+        """
+        logger.info(f"Fetching HAL API with query: {self.HAL_API_URL}/?{query_string}")
+        async with session.get(f"{self.HAL_API_URL}/?{query_string}") as resp:
+            if resp.status != 200:
+                raise ExternalEndpointFailure(
+                    f"Error code from HAL API for request : {query_string} "
+                    f"with code {resp.status}"
+                )
+            json_response = await resp.json()
+            # Hal API doesn't provide information about the error in the response body
+            if "error" in json_response.keys():
+                raise ExternalEndpointFailure(
+                    f"Error response from HAL API for request : {query_string}"
+                )
+            if (
+                "response" not in json_response.keys()
+                or "docs" not in json_response["response"].keys()
+            ):
+                raise UnexpectedFormatException(
+                    f"Unexpected format in HAL response: {json_response}"
+                    f"for request : {query_string}"
+                )
+            return json_response["response"]["docs"], json_response.get(
+                "nextCursorMark"
+            )
@@ -2,7 +2,7 @@ from enum import Enum
 from urllib.parse import urlencode
 
 
-class HalApiQueryBuilder:
+class HalApiQueryBuilder:  # pylint: disable=too-many-instance-attributes
     """
     This class provides an abstraction to build a query for the HAL API.
     """
@@ -64,6 +64,10 @@ class HalApiQueryBuilder:
     DEFAULT_SORT_DIRECTION = "asc"
     DEFAULT_ROWS = 1000
 
+    # Solr cursor pagination requires the sort to end with the unique key
+    UNIQUE_KEY = "docid"
+    INITIAL_CURSOR_MARK = "*"
+
     def __init__(self) -> None:
         self.identifier_type = None
         self.identifier_value = None
@@ -71,6 +75,8 @@ class HalApiQueryBuilder:
         self.doc_types = self.DEFAULT_DOC_TYPES
         self.sort_parameter = self.DEFAULT_SORT_PARAMETER
         self.sort_direction = self.DEFAULT_SORT_DIRECTION
+        self.rows = self.DEFAULT_ROWS
+        self.cursor_mark = self.INITIAL_CURSOR_MARK
 
     def set_query(
         self, identifier_type: QueryParameters, identifier_value: str
@@ -87,6 +93,25 @@ class HalApiQueryBuilder:
         self.identifier_type = identifier_type
         self.identifier_value = identifier_value
 
+    def set_rows(self, rows: int) -> None:
+        """
+        Set the number of documents per page of results
+
+        :param rows: the number of documents per page
+        :return: None
+        """
+        self.rows = rows
+
+    def set_cursor_mark(self, cursor_mark: str) -> None:
+        """
+        Set the cursor mark of the page of results to request,
+        as returned by the previous page in the nextCursorMark field
+
+        :param cursor_mark: the cursor mark
+        :return: None
+        """
+        self.cursor_mark = cursor_mark
+
     def build(self) -> str:
         """
         Main building method, returns a query string for the HAL API.
@@ -108,15 +133,19 @@ class HalApiQueryBuilder:
         ), "Set the query parameters before building the query. "
         # Hal will add random results if the orcid id is not quoted
         # thanks Alessandro Buccheri for the tip
+        identifier_value = self.identifier_value
         if self.identifier_type == self.QueryParameters.AUTH_ORCID_ID_EXT_ID:
-            self.identifier_value = f'"{self.identifier_value}"'
-        return {"q": f"{self.identifier_type.value}:{self.identifier_value}"}
+            identifier_value = f'"{identifier_value}"'
+        return {"q": f"{self.identifier_type.value}:{identifier_value}"}
 
     def _cursor_mark_param(self):
-        return {}
+        return {"cursorMark": self.cursor_mark}
 
     def _sort_param(self):
-        return {"sort": f"{self.sort_parameter} {self.sort_direction}"}
+        sort = f"{self.sort_parameter} {self.sort_direction}"
+        if self.sort_parameter != self.UNIQUE_KEY:
+            sort = f"{sort},{self.UNIQUE_KEY} asc"
+        return {"sort": sort}
 
     def _filter_param(self):
         return {"fq": f"docType_s:({' OR '.join(self.doc_types)})"}
@@ -125,4 +154,4 @@ class HalApiQueryBuilder:
         return {"fl": ",".join(self.fields)}
 
     def _rows_param(self):
-        return {"rows": self.DEFAULT_ROWS}
+        return {"rows": self.rows}
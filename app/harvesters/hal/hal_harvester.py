@@ -2,6 +2,7 @@ from typing import AsyncGenerator
 
 from semver import VersionInfo, Version
 
+from app.config import get_app_settings
 from app.harvesters.abstract_harvester import AbstractHarvester
 from app.harvesters.hal.hal_api_client import HalApiClient
 from app.harvesters.hal.hal_api_query_builder import HalApiQueryBuilder
@@ -63,9 +64,13 @@ class HalHarvester(AbstractHarvester):
             identifier_type=identifier_type,
             identifier_value=identifier_value,
         )
-        async for doc in HalApiClient().fetch(builder.build()):
-            yield JsonRawResult(
-                payload=doc,
-                source_identifier=doc.get("halId_s"),
-                formatter_name=HalHarvester.FORMATTER_NAME,
-            )
+        builder.set_rows(get_app_settings().hal_api_page_size)
+        async for docs in HalApiClient().fetch_pages(builder):
+            # the structures of all the documents of the page are solved in bulk
+            await self.converter.prefetch_organizations(docs)
+            for doc in docs:
+                yield JsonRawResult(
+                    payload=doc,
+                    source_identifier=doc.get("halId_s"),
+                    formatter_name=HalHarvester.FORMATTER_NAME,
+                )
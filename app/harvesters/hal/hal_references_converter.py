@@ -1,17 +1,21 @@
 import re
-from typing import Generator, Set
+from collections import defaultdict
+from typing import Dict, Generator, List, Set, Tuple
 
 from loguru import logger
 from semver import Version
 
+from app.db.daos.organization_dao import OrganizationDAO
 from app.db.models.abstract import Abstract
 from app.db.models.book import Book
 from app.db.models.journal import Journal
+from app.db.models.organization import Organization
 from app.db.models.reference import Reference
 from app.db.models.reference_identifier import ReferenceIdentifier
 from app.db.models.reference_manifestation import ReferenceManifestation
 from app.db.models.subtitle import Subtitle
 from app.db.models.title import Title
+from app.db.session import async_session
 from app.harvesters.abstract_references_converter import AbstractReferencesConverter
 from app.harvesters.exceptions.unexpected_format_exception import (
     UnexpectedFormatException,
@@ -27,6 +31,7 @@ from app.services.concepts.concept_informations import ConceptInformations
 from app.services.hash.hash_key import HashKey
 from app.services.issue.issue_data_class import IssueInformations
 from app.services.journal.journal_data_class import JournalInformations
+from app.services.organizations.hal_organization_solver import HalOrganizationSolver
 from app.services.organizations.organization_data_class import OrganizationInformations
 from app.utilities.date_utilities import check_valid_iso8601_date
 from app.utilities.isbn_utilities import get_isbns
@@ -66,6 +71,57 @@ class HalReferencesConverter(AbstractReferencesConverter):
         "wosId_s": "wos",
     }
 
+    # organizations dereferenced in bulk, not yet recorded
+    _prefetched_organizations: dict[str, Organization] | None = None
+
+    async def prefetch_organizations(self, docs: List[dict]) -> None:
+        """
+        Dereference in bulk the structures of the authors of a page of documents
+        that are neither in the entity cache nor in the database
+
+        :param docs: documents of the page of results
+        :return: None
+        """
+        identifiers = set()
+        for doc in docs:
+            for auth_org in doc.get("authIdHasStructure_fs", []):
+                try:
+                    identifiers.add(self._split_author_structure(auth_org)[1])
+                except ValueError:
+                    # reported by the conversion of the document
+                    continue
+        identifiers = {
+            identifier
+            for identifier in identifiers
+            if self.entity_cache.get("organization", ("hal", identifier)) is None
+        }
+        if not identifiers:
+            return
+        async with async_session() as session:
+            identifiers -= await OrganizationDAO(
+                session
+            ).get_existing_source_identifiers(list(identifiers))
+        if not identifiers:
+            return
+        if self._prefetched_organizations is None:
+            self._prefetched_organizations = {}
+        self._prefetched_organizations.update(
+            await HalOrganizationSolver().solve_many(sorted(identifiers))
+        )
+
+    async def _solve_organization(
+        self, organization_informations: OrganizationInformations
+    ) -> Organization:
+        if (
+            organization_informations.source == "hal"
+            and self._prefetched_organizations
+            and organization_informations.identifier in self._prefetched_organizations
+        ):
+            return self._prefetched_organizations.pop(
+                organization_informations.identifier
+            )
+        return await super()._solve_organization(organization_informations)
+
     @AbstractReferencesConverter.validate_reference
     async def convert(self, raw_data: JsonRawResult, new_ref: Reference) -> None:
         """
@@ -274,29 +330,24 @@ class HalReferencesConverter(AbstractReferencesConverter):
             yield Abstract(value=value, language=language)
 
     async def _concepts(self, raw_data):
-        fields = raw_data.get("jel_s", [])
         # If we have jel_s fields, we use them as subjects
-        for code in fields:
-            try:
-                yield await self._get_or_create_concept_by_uri(
-                    ConceptInformations(
-                        code=code,
-                        source=ConceptInformations.ConceptSources.JEL,
-                    )
-                )
-            except AssertionError as error:
-                logger.error(
-                    f"Could not create JEL concept with code {code} because : {error}"
-                )
-                continue
+        concept_informations = [
+            ConceptInformations(
+                code=code,
+                source=ConceptInformations.ConceptSources.JEL,
+            )
+            for code in raw_data.get("jel_s", [])
+        ]
         fields = self._keys_by_pattern(pattern=r".*_keyword_s", data=raw_data)
         for field in fields:
             for label in raw_data[field]:
-                yield await self._get_or_create_concept_by_label(
+                concept_informations.append(
                     ConceptInformations(
                         label=label, language=self._language_from_field_name(field)
                     )
                 )
+        for concept in await self._get_or_create_concepts(concept_informations):
+            yield concept
 
     async def _add_contributions(
         self, raw_data: dict, new_ref: Reference, tei_decoder: HalTEIDecoder = None
@@ -361,32 +412,35 @@ class HalReferencesConverter(AbstractReferencesConverter):
     async def _add_organization(self, raw_data: dict, new_ref: Reference) -> None:
         # For each contribution, get the organizations of the contributor
         # and add them to the contribution
+        organizations_by_contributor = self._organizations_by_contributor(raw_data)
         for contribution in new_ref.contributions:
-            organizations = self._organizations_from_contributor(
-                raw_data, contribution.contributor.source_identifier
+            organizations = organizations_by_contributor.get(
+                contribution.contributor.source_identifier, set()
             )
             async for org in self._organizations(organizations):
                 contribution.affiliations.append(org)
 
-    def _organizations_from_contributor(
-        self, raw_data, id_contributor
-    ) -> Set[OrganizationInformations]:
-        # Get the organizations informations of the contributor
-        organizations = set()
-
+    def _organizations_by_contributor(
+        self, raw_data
+    ) -> Dict[str, Set[OrganizationInformations]]:
+        # Index the organizations informations by idHal of the contributors
+        # in a single pass over the author-structure facets
+        organizations = defaultdict(set)
         for auth_org in raw_data.get("authIdHasStructure_fs", []):
-            auth, org = auth_org.split("_JoinSep_")
-            ids, _ = auth.split("_FacetSep_")
-            _, id_hal = ids.split("-")
-            if id_hal != id_contributor:
-                continue
-
-            org_id, org_name = org.split("_FacetSep_")
-            organizations.add(
+            id_hal, org_id, org_name = self._split_author_structure(auth_org)
+            organizations[id_hal].add(
                 OrganizationInformations(name=org_name, identifier=org_id, source="hal")
             )
         return organizations
 
+    @staticmethod
+    def _split_author_structure(auth_org: str) -> Tuple[str, str, str]:
+        auth, org = auth_org.split("_JoinSep_")
+        ids, _ = auth.split("_FacetSep_")
+        _, id_hal = ids.split("-")
+        org_id, org_name = org.split("_FacetSep_")
+        return id_hal, org_id, org_name
+
     async def _document_type(self, raw_data):
         uri, label = HalDocumentTypeConverter().convert(raw_data)
         return await self._get_or_create_document_type_by_uri(uri, label)
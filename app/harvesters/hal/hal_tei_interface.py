@@ -9,6 +9,8 @@ class HalTEIDecoder:
     Wrapper for HAL API TEI (from "base_xml" field) to extract author identifiers.
     """
 
+    TEI_NAMESPACE = "http://www.tei-c.org/ns/1.0"
+
     def __init__(self, tei_raw_data: str):
         """
         Constructor to initialize with TEI raw data.
@@ -21,6 +23,7 @@ class HalTEIDecoder:
         except etree.XMLSyntaxError as e:
             logger.error(f"TEI XML data are not usable: {e}")
             self.tree = None
+        self.identifiers_by_id_hal = self._index_authors()
 
     def get_identifiers(self, numeric_id_hal: int) -> List[Dict[str, str]]:
         """
@@ -29,32 +32,35 @@ class HalTEIDecoder:
         :param numeric_id_hal: The numeric HAL ID to search for.
         :return: A list of dictionaries with 'type' and 'value' keys.
         """
-        namespace = {"tei": "http://www.tei-c.org/ns/1.0"}
-        identifiers = []
-
-        if not self.tree:
-            return identifiers  # Return empty if the TEI XML data are not usable
-
-        # XPath to find the specific author with the given numeric HAL ID
-        xpath = (
-            f"//tei:author[.//tei:idno[@type='idhal'][@notation='numeric' "
-            f"and text()='{numeric_id_hal}']]"
-        )
-        author_elements = self.tree.xpath(xpath, namespaces=namespace)
+        return list(self.identifiers_by_id_hal.get(str(numeric_id_hal), []))
 
-        if not author_elements:
-            return identifiers  # Return empty if no matching author is found
-
-        author = author_elements[0]  # Assuming one unique author matches the ID
-        idnos = author.xpath(".//tei:idno", namespaces=namespace)
-        for idno in idnos:
-            id_type = idno.get("type")
-            id_value = idno.text
-            if id_type and id_value:
-                identifier = self._process_identifier_data(id_type, id_value)
-                identifiers.append(identifier)
+    def _index_authors(self) -> Dict[str, List[Dict[str, str]]]:
+        """
+        Index the identifiers of the authors by numeric HAL ID
+        in a single pass over the TEI document
 
-        return identifiers
+        :return: the identifiers of the first author with each numeric HAL ID
+        """
+        index = {}
+        if self.tree is None:
+            return index  # Return empty if the TEI XML data are not usable
+        idno_tag = f"{{{self.TEI_NAMESPACE}}}idno"
+        for author in self.tree.iter(f"{{{self.TEI_NAMESPACE}}}author"):
+            idnos = list(author.iter(idno_tag))
+            identifiers = [
+                self._process_identifier_data(idno.get("type"), idno.text)
+                for idno in idnos
+                if idno.get("type") and idno.text
+            ]
+            for idno in idnos:
+                if (
+                    idno.get("type") == "idhal"
+                    and idno.get("notation") == "numeric"
+                    and idno.text
+                ):
+                    # Assuming one unique author matches the ID
+                    index.setdefault(idno.text, identifiers)
+        return index
 
     def _process_identifier_data(self, id_type, id_value):
         identifier = {"type": self._normalize(id_type), "value": id_value}
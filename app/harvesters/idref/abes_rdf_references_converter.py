@@ -13,6 +13,8 @@ from app.harvesters.idref.rdf_resolver import RdfResolver
 from app.harvesters.rdf_harvester_raw_result import (
     RdfHarvesterRawResult as RdfRawResult,
 )
+from app.services.concepts.concept_informations import ConceptInformations
+from app.utilities.execution_timer_wrapper import execution_timer
 
 
 class AbesRDFReferencesConverter(AbstractReferencesConverter):
@@ -62,6 +64,19 @@ class AbesRDFReferencesConverter(AbstractReferencesConverter):
             if book:
                 new_ref.book = book
 
+    @execution_timer
+    async def _get_subjects(self, pub_graph, uri, new_ref):
+        new_ref.subjects.extend(
+            await self._get_or_create_concepts(
+                [
+                    ConceptInformations(uri=str(subject))
+                    for subject in pub_graph.objects(
+                        rdflib.term.URIRef(uri), DCTERMS.subject
+                    )
+                ]
+            )
+        )
+
     # pylint: disable=unused-argument
     async def _get_book(self, pub_graph, uri) -> Book | None:
         return None
@@ -105,6 +120,9 @@ class AbesRDFReferencesConverter(AbstractReferencesConverter):
     def _get_source(self):
         raise NotImplementedError()
 
+    async def _fetch_contributor(self, identifier):
+        return await RdfResolver().fetch(self._resolve_contributor(identifier))
+
     async def _add_contributions(self, pub_graph, uri):
         contribution_informations = []
         marcrel = Namespace("http://id.loc.gov/vocabulary/relators/")
@@ -119,7 +137,7 @@ class AbesRDFReferencesConverter(AbstractReferencesConverter):
         for role, identifier in results:
             try:
                 role = role.split("/")[-1]
-                graph = await RdfResolver().fetch(self._resolve_contributor(identifier))
+                graph = await self._fetch_contributor(identifier)
                 contributor_name = ""
                 for name in graph.objects(identifier, FOAF.name):
                     contributor_name = name
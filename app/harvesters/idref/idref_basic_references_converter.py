@@ -52,7 +52,7 @@ class IdrefBasicReferencesConverter(AbstractReferencesConverter):
             for subject in dict_payload["subject"].values()
         ]
         new_ref.subjects.extend(
-            await self._get_or_create_concepts_by_uri(concept_informations)
+            await self._get_or_create_concepts(concept_informations)
         )
 
         for document_type in dict_payload["type"]:
@@ -1,8 +1,9 @@
 import asyncio
 import re
-import urllib
+from contextlib import aclosing
 from enum import Enum
-from typing import AsyncGenerator
+from functools import partial
+from typing import Any, AsyncGenerator, Awaitable, Callable, Coroutine
 
 import uritools
 from loguru import logger
@@ -11,7 +12,11 @@ from semver import VersionInfo, Version
 
 from app.config import get_app_settings
 from app.harvesters.abstract_harvester import AbstractHarvester
+from app.harvesters.abstract_references_converter import AbstractReferencesConverter
 from app.harvesters.exceptions.external_endpoint_failure import ExternalEndpointFailure
+from app.harvesters.exceptions.external_resource_not_found import (
+    ExternalResourceNotFound,
+)
 from app.harvesters.exceptions.unexpected_format_exception import (
     UnexpectedFormatException,
 )
@@ -21,6 +26,10 @@ from app.harvesters.idref.idref_sparql_query_builder import (
 )
 from app.harvesters.idref.open_edition_resolver import OpenEditionResolver
 from app.harvesters.idref.rdf_resolver import RdfResolver
+from app.harvesters.idref.science_plus_resolver import SciencePlusResolver
+from app.harvesters.idref.secondary_queries_scheduler import (
+    SecondaryQueriesScheduler,
+)
 from app.harvesters.rdf_harvester_raw_result import (
     AbstractHarvesterRawResult as RawResult,
 )
@@ -46,15 +55,28 @@ class IdrefHarvester(AbstractHarvester):
         r"https?://(?:journals|books)\.openedition\.org/.*"
     )
     SCIENCE_PLUS_URL_SUFFIX = "http://hub.abes.fr/"
-    SCIENCE_PLUS_QUERY_SUFFIX = "https://scienceplus.abes.fr/sparql"
     PERSEE_URL_SUFFIX = "http://data.persee.fr/"
-    MAX_SUDOC_PARALLELISM = 3
     SUDOC_ENABLED = True
 
+    # chunks of publications of data.idref.fr read ahead of their processing,
+    # when the query is paginated
+    READ_AHEAD_CHUNKS = 2
+
     supported_identifier_types = ["idref", "orcid"]
 
     VERSION: Version = VersionInfo.parse("1.6.0")
 
+    def __init__(self, converter: AbstractReferencesConverter):
+        super().__init__(converter)
+        # documents of the secondary sources prefetched for the publications
+        # of the chunks being processed, by (api name, key), removed once used
+        self.documents_cache: dict[tuple[str, str], Any] = {}
+        # documents of the documents cache to refresh in the background
+        self.stale_documents: set[tuple[str, str]] = set()
+        # fetched documents to store in the cache at the end of the harvesting,
+        # by api name and key
+        self.documents_to_cache: dict[str, dict[str, Any]] = {}
+
     class Formatters(Enum):
         """
         Source identifiers for idref, including secondary sources
@@ -68,7 +90,6 @@ class IdrefHarvester(AbstractHarvester):
         PERSEE_RDF = "PERSEE_RDF"
 
     async def fetch_results(self) -> AsyncGenerator[RawResult, None]:
-        # pylint: disable=too-many-branches, too-many-statements
         settings = get_app_settings()
         builder = QueryBuilder()
         if (await self._get_entity_class_name()) == "Person":
@@ -85,79 +106,306 @@ class IdrefHarvester(AbstractHarvester):
                 builder.set_subject_type(QueryBuilder.SubjectType.PERSON).set_orcid(
                     orcid
                 )
-        pending_queries = set()
-        num_sudoc_waiting_queries = 0
-
-        if self.SUDOC_ENABLED:
-            async for doc in IdrefSparqlClient(
-                timeout=settings.idref_sparql_timeout
-            ).fetch_publications(builder.build()):
-                coro = self._secondary_query_process(doc)
-                # Temporary semi-sequential implementation
-                # Sudoc server does not support parallel querying beyond 5 parallel requests
-                # See issue #251
-                pending_queries.add(asyncio.create_task(coro))
-                if doc["secondary_source"] == "SUDOC":
-                    num_sudoc_waiting_queries += 1
-                if num_sudoc_waiting_queries >= self.MAX_SUDOC_PARALLELISM:
-                    num_sudoc_waiting_queries = 0
-                    while pending_queries:
-                        done_queries, pending_queries = await asyncio.wait(
-                            pending_queries, return_when=asyncio.ALL_COMPLETED
-                        )
-                        for query in done_queries:
-                            pub = None
-                            exception = query.exception()
-                            if isinstance(
-                                exception,
-                                (ExternalEndpointFailure, UnexpectedFormatException),
-                            ):
-                                await self.handle_error(exception)
-                            else:
-                                pub = query.result()
+        scheduler = SecondaryQueriesScheduler(
+            limits=settings.idref_secondary_sources_parallelism,
+            default_limit=settings.idref_secondary_sources_default_parallelism,
+        )
+        self.documents_cache = {}
+        self.stale_documents = set()
+        self.documents_to_cache = {}
+        client = IdrefSparqlClient(timeout=settings.idref_sparql_timeout)
+        try:
+            async with aclosing(
+                self._publications_chunks(
+                    lambda before_next_page: client.fetch_publications(
+                        builder,
+                        page_size=settings.idref_sparql_page_size,
+                        before_next_page=before_next_page,
+                    ),
+                    settings.idref_publications_chunk_size,
+                )
+            ) as chunks:
+                async for docs in chunks:
+                    # one cache round trip per secondary source and chunk
+                    # instead of one per document
+                    await self._prefetch_cached_documents(docs)
+                    await self._prefetch_science_plus_documents(docs)
+                    for doc in docs:
+                        coro = self._secondary_query_process(doc)
+                        if coro is None:
+                            continue
+                        # queries run within the concurrency window of their source
+                        scheduler.submit(doc["secondary_source"], coro)
+                        for query in scheduler.pop_done_queries():
+                            pub = await self._secondary_query_result(query)
                             if pub:
                                 yield pub
             # process remaining queries
-            while pending_queries:
-                pub = None
-                done_queries, pending_queries = await asyncio.wait(
-                    pending_queries, return_when=asyncio.FIRST_COMPLETED
-                )
-                for query in done_queries:
-                    exception = query.exception()
-                    if isinstance(
-                        exception,
-                        (ExternalEndpointFailure, UnexpectedFormatException),
-                    ):
-                        await self.handle_error(exception)
-                    else:
-                        pub = query.result()
+            while scheduler.pending:
+                for query in await scheduler.wait():
+                    pub = await self._secondary_query_result(query)
                     if pub:
                         yield pub
+        finally:
+            scheduler.cancel()
+            # documents fetched before a failure or an early stop are cached too
+            await self._cache_fetched_documents()
+
+    async def _publications_chunks(
+        self,
+        fetch_publications: Callable[
+            [Callable[[], Awaitable[None]]], AsyncGenerator[dict, None]
+        ],
+        chunk_size: int,
+    ) -> AsyncGenerator[list[dict], None]:
+        """
+        Group the publications of data.idref.fr into chunks as they are received.
+        The publications are read in the background, so that the SPARQL response
+        is not held open while the chunks are processed : each chunk gathers
+        the publications received in the meantime, up to chunk_size.
+        If the query is paginated, the next page is only queried once less than
+        READ_AHEAD_CHUNKS chunks of publications are waiting to be processed.
+
+        :param fetch_publications: function returning the publications
+            from the SPARQL endpoint, given the function to await between pages
+        :param chunk_size: maximum number of publications of a chunk
+        :return: A generator of chunks of publications
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        # set when publications are taken from the queue
+        queue_space = asyncio.Event()
+
+        async def wait_for_queue_space() -> None:
+            while queue.qsize() >= self.READ_AHEAD_CHUNKS * chunk_size:
+                queue_space.clear()
+                await queue_space.wait()
+
+        reader = asyncio.create_task(
+            self._read_publications(fetch_publications(wait_for_queue_space), queue)
+        )
+        try:
+            complete = False
+            while not complete:
+                chunk = []
+                doc = await queue.get()
+                while doc is not None:
+                    chunk.append(doc)
+                    if len(chunk) >= chunk_size or queue.empty():
+                        break
+                    doc = queue.get_nowait()
+                complete = doc is None
+                queue_space.set()
+                if chunk:
+                    yield chunk
+            # errors of the SPARQL query are raised once the publications
+            # received before them are processed
+            await reader
+        finally:
+            reader.cancel()
+
+    async def _read_publications(
+        self, publications: AsyncGenerator[dict, None], queue: asyncio.Queue
+    ) -> None:
+        try:
+            async for doc in publications:
+                if doc["secondary_source"] != "SUDOC" or self.SUDOC_ENABLED:
+                    # the response being read, it is not waited for queue space
+                    queue.put_nowait(doc)
+        finally:
+            # end of the publications, even if the query failed
+            queue.put_nowait(None)
+
+    async def _prefetch_cached_documents(self, docs: list[dict]) -> None:
+        """
+        Retrieve from the cache the documents of the secondary sources
+        that will be queried, with one bulk request per source
+
+        :param docs: the publication docs as results of the SPARQL query to data.idref.fr
+        :return: None
+        """
+        keys: dict[str, list[str]] = {}
+        for doc in docs:
+            cache_key = self._cache_key(doc)
+            if cache_key is not None:
+                api_name, key = cache_key
+                keys.setdefault(api_name, []).append(key)
+        api_names = list(keys)
+        cached_entries = await asyncio.gather(
+            *[
+                ThirdApiCache.lookup_many(api_name, keys[api_name])
+                for api_name in api_names
+            ]
+        )
+        for api_name, entries in zip(api_names, cached_entries):
+            for key in keys[api_name]:
+                # known misses are recorded too, not to query the cache again
+                value, stale = entries.get(key, (None, False))
+                self.documents_cache[(api_name, key)] = value
+                if stale:
+                    self.stale_documents.add((api_name, key))
+
+    async def _prefetch_science_plus_documents(self, docs: list[dict]) -> None:
+        """
+        Fetch the Science+ publications missing from the cache with a few DESCRIBE
+        queries instead of one per publication, then describe their journals, issues
+        and contributors the same way, to be found in the cache by the converter
+
+        :param docs: the publication docs as results of the SPARQL query to data.idref.fr
+        :return: None
+        """
+        cache_keys: dict[str, tuple[str, str]] = {}
+        for doc in docs:
+            if doc["secondary_source"] != "SCIENCE_PLUS":
+                continue
+            cache_key = self._cache_key(doc)
+            # known failures are raised again when the document is queried
+            if cache_key is not None and self.documents_cache.get(cache_key) is None:
+                cache_keys[doc["uri"]] = cache_key
+        if not cache_keys:
+            return
+        resolver = SciencePlusResolver()
+        publications = await resolver.fetch_many(list(cache_keys))
+        related_resources = []
+        for uri, publication in publications.items():
+            self.documents_cache[cache_keys[uri]] = publication
+            self._cache_document(*cache_keys[uri], publication)
+            related_resources.extend(resolver.related_resources(publication, uri))
+        await self._cache_fetched_documents(
+            min_count=get_app_settings().idref_documents_caching_batch_size
+        )
+        await resolver.describe_many(list(dict.fromkeys(related_resources)))
+
+    async def _get_document(self, doc: dict, fetch: Callable[[], Coroutine]) -> Any:
+        """
+        Get the document of a secondary source from the cache,
+        or fetch it and buffer it to store it in the cache,
+        under the key built by _cache_key for both operations
+
+        :param doc: the publication doc as result of the SPARQL query to data.idref.fr
+        :param fetch: function returning the coroutine fetching the document
+        :return: the document
+        """
+        cache_key = self._cache_key(doc)
+        if cache_key is None:
+            return await fetch()
+        api_name, key = cache_key
+        document = await self._get_cached_document(api_name, key, fetch)
+        if document is None:
+            document = await self._fetch_or_remember_failure(api_name, key, fetch)
+            self._cache_document(api_name, key, document)
+            await self._cache_fetched_documents(
+                min_count=get_app_settings().idref_documents_caching_batch_size
+            )
+        return document
+
+    async def _get_cached_document(
+        self, api_name: str, key: str, fetch: Callable[[], Coroutine]
+    ) -> Any:
+        """
+        Get a document of a secondary source from the prefetched documents,
+        which are forgotten once used, from the fetched documents not cached yet,
+        or from the cache.
+        Stale documents are returned and refreshed in the background.
+
+        :param api_name: name of the API, as for ThirdApiCache
+        :param key: key of the document in the cache
+        :param fetch: function returning the coroutine fetching the document
+        :return: the document or None if not found
+        """
+        if (api_name, key) in self.documents_cache:
+            value = self.documents_cache.pop((api_name, key))
+        elif key in self.documents_to_cache.get(api_name, {}):
+            value = self.documents_to_cache[api_name][key]
         else:
-            async for doc in IdrefSparqlClient(
-                timeout=settings.idref_sparql_timeout
-            ).fetch_publications(builder.build()):
-                if doc["secondary_source"] == "SUDOC":
-                    continue
-                coro = self._secondary_query_process(doc)
-                pending_queries.add(asyncio.create_task(coro))
-                while pending_queries:
-                    pub = None
-                    done_queries, pending_queries = await asyncio.wait(
-                        pending_queries, return_when=asyncio.FIRST_COMPLETED
-                    )
-                    for query in done_queries:
-                        exception = query.exception()
-                        if isinstance(
-                            exception,
-                            (ExternalEndpointFailure, UnexpectedFormatException),
-                        ):
-                            await self.handle_error(exception)
-                        else:
-                            pub = query.result()
-                        if pub:
-                            yield pub
+            value = await ThirdApiCache.get(api_name, key, fetch)
+        if (api_name, key) in self.stale_documents:
+            self.stale_documents.discard((api_name, key))
+            ThirdApiCache.refresh(api_name, key, fetch)
+        if isinstance(value, ThirdApiCache.CachedFailure):
+            raise value.error()
+        return value
+
+    def _cache_document(self, api_name: str, key: str, value: Any) -> None:
+        """
+        Buffer a fetched document to store it in the cache with the next batch
+
+        :param api_name: name of the API, as for ThirdApiCache
+        :param key: key of the document in the cache
+        :param value: the document
+        :return: None
+        """
+        self.documents_to_cache.setdefault(api_name, {})[key] = value
+
+    async def _cache_fetched_documents(self, min_count: int = 1) -> None:
+        """
+        Store the buffered documents in the cache, with one bulk request per source,
+        once enough documents are buffered
+
+        :param min_count: minimum number of buffered documents to store them
+        :return: None
+        """
+        if sum(len(values) for values in self.documents_to_cache.values()) < min_count:
+            return
+        documents_to_cache, self.documents_to_cache = self.documents_to_cache, {}
+        await asyncio.gather(
+            *[
+                ThirdApiCache.set_many(api_name, values)
+                for api_name, values in documents_to_cache.items()
+            ]
+        )
+
+    def _cache_key(self, doc: dict) -> tuple[str, str] | None:
+        """
+        Compute the cache key of the document of a secondary source :
+        the only builder of the cache keys of the secondary sources documents,
+        for reads and writes
+
+        :param doc: the publication doc as result of the SPARQL query to data.idref.fr
+        :return: the api name and the key, or None if the document is not cached
+        """
+        uri: str = doc.get("uri") or ""
+        if not uritools.isuri(uri):
+            return None
+        source = doc["secondary_source"]
+        if source == "SUDOC" and uri.startswith(self.SUDOC_URL_SUFFIX):
+            return "sudoc_publications", self._sudoc_document_uri(uri)
+        if source == "PERSEE" and uri.startswith(self.PERSEE_URL_SUFFIX):
+            return "persee_publications", self._persee_document_uri(uri)
+        if source == "OPEN_EDITION" and self.OPEN_EDITION_SUFFIX.match(uri):
+            return "open_edition_publications", uri
+        if source == "SCIENCE_PLUS" and uri.startswith(self.SCIENCE_PLUS_URL_SUFFIX):
+            return "science_plus_publications", self._science_plus_query_uri(uri)
+        return None
+
+    @staticmethod
+    def _sudoc_document_uri(uri: str) -> str:
+        # with regular expression, replace trailing "/id" by '.rdf' in document_uri
+        document_uri = re.sub(r"/id$", ".rdf", uri)
+        # with regular expression, replace "http://" by "https://" in document_uri
+        return re.sub(r"^http://", "https://", document_uri)
+
+    @staticmethod
+    def _persee_document_uri(uri: str) -> str:
+        document_uri = re.sub(r"#Web$", "", uri)
+        return re.sub(r"^http://", "https://", document_uri)
+
+    @staticmethod
+    def _science_plus_query_uri(uri: str) -> str:
+        return SciencePlusResolver.describe_query_uri([uri])
+
+    async def _secondary_query_result(self, query: asyncio.Task) -> RawResult | None:
+        """
+        Get the result of a completed secondary query,
+        handling the errors from the secondary sources
+
+        :param query: the completed query task
+        :return: the publication details or None if the query failed
+        """
+        exception = query.exception()
+        if isinstance(exception, (ExternalEndpointFailure, UnexpectedFormatException)):
+            await self.handle_error(exception)
+            return None
+        return query.result()
 
     def _secondary_query_process(self, doc: dict):
         coro = None
@@ -177,6 +425,27 @@ class IdrefHarvester(AbstractHarvester):
             logger.info(f"Unknown source {doc['secondary_source']}")
         return coro
 
+    @staticmethod
+    async def _fetch_or_remember_failure(
+        api_name: str, key: str, fetch: Callable[[], Coroutine]
+    ) -> Any:
+        """
+        Fetch a document from a secondary source, remembering in the cache
+        that it does not exist or is invalid, so that it is not fetched again
+        until the negative caching duration expires.
+        Concurrent fetches of the same document by other harvesters are shared.
+
+        :param api_name: name of the API, as for ThirdApiCache
+        :param key: key of the document in the cache
+        :param fetch: function returning the fetching coroutine
+        :return: the document
+        """
+        try:
+            return await ThirdApiCache.coalesce(api_name, key, fetch)
+        except (ExternalResourceNotFound, UnexpectedFormatException) as error:
+            ThirdApiCache.set_failure(api_name, key, error)
+            raise
+
     @execution_timer
     async def _query_publication_from_persee_endpoint(self, doc: dict) -> RdfResult:
         uri: str | None = doc.get("uri", "")
@@ -187,12 +456,10 @@ class IdrefHarvester(AbstractHarvester):
         assert uri.startswith(self.PERSEE_URL_SUFFIX), "Invalid Persee Id"
         assert uri.endswith("#Web"), "Provided Persee URI should end with #Web"
 
-        document_uri = re.sub(r"#Web$", "", uri)
-        document_uri = re.sub(r"^http://", "https://", document_uri)
-        pub = await ThirdApiCache.get("persee_publications", document_uri)
-        if pub is None:
-            pub = await RdfResolver().fetch(document_uri, output_format="xml")
-            await ThirdApiCache.set("persee_publications", uri, pub)
+        document_uri = self._persee_document_uri(uri)
+        pub = await self._get_document(
+            doc, partial(RdfResolver().fetch, document_uri, output_format="xml")
+        )
         return RdfResult(
             payload=pub,
             source_identifier=URIRef(uri),
@@ -213,10 +480,7 @@ class IdrefHarvester(AbstractHarvester):
                 f"Invalid OpenEdition URI from Idref SPARQL endpoint: {uri}"
             )
         assert self.OPEN_EDITION_SUFFIX.match(uri), f"Invalid OpenEdition Id {uri}"
-        pub = await ThirdApiCache.get("open_edition_publications", uri)
-        if pub is None:
-            pub = await OpenEditionResolver().fetch(uri)
-            await ThirdApiCache.set("open_edition_publications", uri, pub)
+        pub = await self._get_document(doc, partial(OpenEditionResolver().fetch, uri))
         return XmlResult(
             payload=pub,
             source_identifier=URIRef(uri),
@@ -238,17 +502,16 @@ class IdrefHarvester(AbstractHarvester):
             )
         assert uri.startswith(self.SUDOC_URL_SUFFIX), "Invalid Sudoc Id"
         assert uri.endswith("/id"), "Provided Sudoc URI should end with /id"
-        # with regular expression, replace trailing "/id" by '.rdf' in document_uri
-        document_uri = re.sub(r"/id$", ".rdf", uri)
-        # with regular expression, replace "http://" by "https://" in document_uri
-        document_uri = re.sub(r"^http://", "https://", document_uri)
+        document_uri = self._sudoc_document_uri(uri)
         settings = get_app_settings()
-        pub = await ThirdApiCache.get("sudoc_publications", document_uri)
-        if pub is None:
-            pub = await RdfResolver(timeout=settings.idref_sudoc_timeout).fetch(
-                document_uri, output_format="xml"
-            )
-            await ThirdApiCache.set("sudoc_publications", document_uri, pub)
+        pub = await self._get_document(
+            doc,
+            partial(
+                RdfResolver(timeout=settings.idref_sudoc_timeout).fetch,
+                document_uri,
+                output_format="xml",
+            ),
+        )
         return RdfResult(
             payload=pub,
             source_identifier=URIRef(uri),
@@ -297,20 +560,7 @@ class IdrefHarvester(AbstractHarvester):
             raise UnexpectedFormatException(
                 f"Invalid SUDOC URI from Idref SPARQL endpoint: {uri}"
             )
-        params = {
-            "query": f'define sql:describe-mode "CBD"  DESCRIBE <{uri}>',
-            "output": "application/rdf+xml",
-        }
-        # concatenate encoded params to query suffix
-        query_uri = f"{self.SCIENCE_PLUS_QUERY_SUFFIX}?{urllib.parse.urlencode(params)}"
-        pub = None
-        settings = get_app_settings()
-        if settings.third_api_caching_enabled:
-            pub = await ThirdApiCache.get("science_plus_publications", query_uri)
-        if pub is None:
-            client = RdfResolver(timeout=settings.idref_science_plus_timeout)
-            pub = await client.fetch(query_uri, output_format="xml")
-            await ThirdApiCache.set("science_plus_publications", query_uri, pub)
+        pub = await self._get_document(doc, partial(SciencePlusResolver().fetch, uri))
 
         doi = doc.get("doi", None)
         return RdfResult(
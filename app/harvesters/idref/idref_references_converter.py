@@ -29,6 +29,9 @@ class IdrefReferencesConverter(AbstractReferencesConverter):
     Converts raw data from IdRef to a normalised Reference object
     """
 
+    # the secondary converter is chosen by build and used by convert
+    supports_concurrent_conversion: bool = False
+
     def __init__(self):
         self.secondary_converter: AbstractReferencesConverter = None
 
@@ -61,6 +64,9 @@ class IdrefReferencesConverter(AbstractReferencesConverter):
         if raw_data.formatter_name == IdrefHarvester.Formatters.PERSEE_RDF.value:
             self.secondary_converter = PerseeReferencesConverter()
         assert self.secondary_converter, f"Unknown formatter {raw_data.formatter_name}"
+        # the secondary converters are built for each reference
+        # but share the entities resolved during the retrieval
+        self.secondary_converter.entity_cache = self.entity_cache
 
     def _harvester(self) -> str:
         return "Idref"
@@ -1,10 +1,13 @@
 from enum import Enum
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Awaitable, Callable
 
 import aiohttp
 from aiosparql.client import SPARQLClient
 
 from app.harvesters.exceptions.external_endpoint_failure import ExternalEndpointFailure
+from app.harvesters.idref.idref_sparql_query_builder import IdrefSparqlQueryBuilder
+from app.harvesters.idref.sparql_json_bindings_reader import SparqlJsonBindingsReader
+from app.http_client.http_sessions_pool import HttpSessionsPool
 from app.utilities.execution_timer_wrapper import execution_timer
 
 DATA_IDREF_FR_URL = "https://data.idref.fr/sparql"
@@ -15,6 +18,8 @@ IDREF_SPARQL_DEFAULT_TIMEOUT = 20
 class IdrefSparqlClient:
     """Async client for data.idref.fr SPARQL API, wrapper around aiosparql"""
 
+    READ_CHUNK_SIZE = 64 * 1024
+
     def __init__(self, timeout: int = IDREF_SPARQL_DEFAULT_TIMEOUT):
         self.timeout = timeout
 
@@ -58,99 +63,140 @@ class IdrefSparqlClient:
     }
 
     @execution_timer
-    async def fetch_publications(self, query: str) -> AsyncGenerator[dict, None]:
+    async def fetch_publications(
+        self,
+        query_builder: IdrefSparqlQueryBuilder,
+        page_size: int | None = None,
+        before_next_page: Callable[[], Awaitable[None]] | None = None,
+    ) -> AsyncGenerator[dict, None]:
         """
         Fetch publications list for a given author from the Idref sparql endpoint.
+        The rows of the results are ordered by publication and aggregated as they are
+        received : each publication is yielded as soon as its rows are complete.
 
-        :param query: The sparql query to send to the Idref sparql endpoint.
+        :param query_builder: the query builder of the person query
+        :param page_size: the number of rows per query, if the query is paginated
+        :param before_next_page: function awaited before querying the next page,
+            when no response is open, e.g. to wait for the consumer of the results
         :return: A generator of results.
         """
-        client: SPARQLClient = self._get_client()
-        try:
-            response = await client.query(query)
-            # Aggregate results
-            publications = {}
-            for result in response.get("results", {}).get("bindings", []):
-                if not any(
-                    result.get("role", {}).get("value", "").startswith(prefix)
-                    for prefix in self.AUTHORS_PREFIXES
-                ):
-                    continue
-                pub = result.get("pub", {}).get("value", "")
-                # Create a new publication if it does not exist
-                if pub not in publications:
-                    publications[pub] = {
-                        "uri": pub,
-                        "role": result.get("role", {}).get("value", ""),
-                        "date": result.get("date", {}).get("value", ""),
-                        "contributors": {},  # Use a dictionary for contributors
-                        "title": [],
-                        "note": [],
-                        "type": [],
-                        "altLabel": [],
-                        "subject": {},
-                        "equivalent": [],
-                        "doi": result.get("doi", {}).get("value", ""),
-                    }
-                # Add or update the contributor data
-                contributor_uri = result.get("contributor", {}).get("value", "")
-                if contributor_uri:
-                    if contributor_uri not in publications[pub]["contributors"]:
-                        publications[pub]["contributors"][contributor_uri] = {
-                            "name": result.get("contributorName", {}).get("value", ""),
-                            "familyName": result.get("contributorFamilyName", {}).get(
-                                "value", ""
-                            ),
-                            "givenName": result.get("contributorGivenName", {}).get(
-                                "value", ""
-                            ),
-                            "roles": [],  # Initialize roles as a list
-                        }
-                    # Add the role to the contributor if not already present
-                    role = result.get("contributorRole", {}).get("value", "")
-                    if (
-                        role
-                        and role
-                        not in publications[pub]["contributors"][contributor_uri][
-                            "roles"
-                        ]
-                    ):
-                        publications[pub]["contributors"][contributor_uri][
-                            "roles"
-                        ].append(role)
-
-                # Add other data to the publication
-                for key in ["type", "title", "altLabel", "note", "equivalent"]:
-                    if (
-                        result.get(key, {}).get("value", "")
-                        not in publications[pub][key]
+        publication: dict | None = None
+        offset = 0
+        while True:
+            if page_size:
+                query_builder.set_page(limit=page_size, offset=offset)
+            query = query_builder.build()
+            rows = 0
+            try:
+                async for result in self.stream_bindings(query):
+                    rows += 1
+                    if not any(
+                        result.get("role", {}).get("value", "").startswith(prefix)
+                        for prefix in self.AUTHORS_PREFIXES
                     ):
-                        publications[pub][key].append(
-                            result.get(key, {}).get("value", "")
-                        )
-                subject_uri = result.get("subject_uri", {}).get("value", "")
-                if subject_uri and subject_uri not in publications[pub]["subject"]:
-                    publications[pub]["subject"][subject_uri] = {
-                        "uri": subject_uri,
-                        "label": result.get("subject_label", {}).get("value", ""),
-                        "lang": result.get("subject_label", {}).get("xml:lang", ""),
-                    }
-
-            for publication in publications.values():
-                yield publication | {
-                    # identify the secondary source to which the publication belongs
-                    "secondary_source": self._result_source_code(
-                        publication.get("uri", "")
-                    )
+                        continue
+                    pub = result.get("pub", {}).get("value", "")
+                    # Create a new publication on its first row,
+                    # the previous one is complete
+                    if publication is None or publication.get("uri") != pub:
+                        if publication is not None:
+                            yield self._with_secondary_source(publication)
+                        publication = self._new_publication(result)
+                    self._add_binding(publication, result)
+            except Exception as error:
+                raise ExternalEndpointFailure(
+                    "Error while fetching Idref sparql endpoint for query : "
+                    f"{query} with error {error.__class__.__name__} {error if error else ''}"
+                ) from error
+            # a publication may span two pages, it is completed by the next page
+            if not page_size or rows < page_size:
+                break
+            offset += page_size
+            if before_next_page is not None:
+                await before_next_page()
+        if publication is not None:
+            yield self._with_secondary_source(publication)
+
+    async def stream_bindings(self, query: str) -> AsyncGenerator[dict, None]:
+        """
+        Send a query to the Idref sparql endpoint and read the bindings of the results
+        as the response is received
+
+        :param query: the sparql query to send to the Idref sparql endpoint
+        :return: A generator of the bindings
+        """
+        session = HttpSessionsPool().get_session(DATA_IDREF_FR_URL)
+        async with session.post(
+            DATA_IDREF_FR_URL,
+            data={"query": query},
+            headers={"Accept": "application/sparql-results+json"},
+            timeout=aiohttp.ClientTimeout(total=float(self.timeout)),
+        ) as resp:
+            if resp.status != 200:
+                raise ExternalEndpointFailure(
+                    f"Error code from Idref sparql endpoint : {resp.status}"
+                )
+            async for binding in SparqlJsonBindingsReader().read(
+                resp.content.iter_chunked(self.READ_CHUNK_SIZE)
+            ):
+                yield binding
+
+    @staticmethod
+    def _new_publication(result: dict) -> dict:
+        return {
+            "uri": result.get("pub", {}).get("value", ""),
+            "role": result.get("role", {}).get("value", ""),
+            "date": result.get("date", {}).get("value", ""),
+            "contributors": {},  # Use a dictionary for contributors
+            "title": [],
+            "note": [],
+            "type": [],
+            "altLabel": [],
+            "subject": {},
+            "equivalent": [],
+            "doi": result.get("doi", {}).get("value", ""),
+        }
+
+    @staticmethod
+    def _add_binding(publication: dict, result: dict) -> None:
+        # Add or update the contributor data
+        contributor_uri = result.get("contributor", {}).get("value", "")
+        if contributor_uri:
+            if contributor_uri not in publication["contributors"]:
+                publication["contributors"][contributor_uri] = {
+                    "name": result.get("contributorName", {}).get("value", ""),
+                    "familyName": result.get("contributorFamilyName", {}).get(
+                        "value", ""
+                    ),
+                    "givenName": result.get("contributorGivenName", {}).get(
+                        "value", ""
+                    ),
+                    "roles": [],  # Initialize roles as a list
                 }
-        except Exception as error:
-            raise ExternalEndpointFailure(
-                "Error while fetching Idref sparql endpoint for query : "
-                f"{query} with error {error.__class__.__name__} {error if error else ''}"
-            ) from error
+            # Add the role to the contributor if not already present
+            role = result.get("contributorRole", {}).get("value", "")
+            roles = publication["contributors"][contributor_uri]["roles"]
+            if role and role not in roles:
+                roles.append(role)
 
-        finally:
-            await client.close()
+        # Add other data to the publication
+        for key in ["type", "title", "altLabel", "note", "equivalent"]:
+            value = result.get(key, {}).get("value", "")
+            if value not in publication[key]:
+                publication[key].append(value)
+        subject_uri = result.get("subject_uri", {}).get("value", "")
+        if subject_uri and subject_uri not in publication["subject"]:
+            publication["subject"][subject_uri] = {
+                "uri": subject_uri,
+                "label": result.get("subject_label", {}).get("value", ""),
+                "lang": result.get("subject_label", {}).get("xml:lang", ""),
+            }
+
+    def _with_secondary_source(self, publication: dict) -> dict:
+        return publication | {
+            # identify the secondary source to which the publication belongs
+            "secondary_source": self._result_source_code(publication.get("uri", ""))
+        }
 
     @execution_timer
     async def fetch_publication(self, query: str) -> dict:
@@ -228,6 +274,7 @@ class IdrefSparqlClient:
     def _get_client(self) -> SPARQLClient:
         return SPARQLClient(
             DATA_IDREF_FR_URL,
-            connector=aiohttp.TCPConnector(limit=0),
+            connector=HttpSessionsPool().get_connector(DATA_IDREF_FR_URL),
+            connector_owner=False,
             timeout=aiohttp.ClientTimeout(total=float(self.timeout)),
         )
@@ -147,10 +147,23 @@ class IdrefSparqlQueryBuilder:
         __iri__ = IRI("http://id.loc.gov/vocabulary/relators/")
         author = PrefixedName
 
+    DEFAULT_PERSON_QUERY_LIMIT = 10000
+
+    # total order of the rows of the person query, required to paginate it :
+    # rows of the same publication are contiguous and pages do not overlap
+    PERSON_QUERY_PAGINATION_ORDER = (
+        "?pub ?role ?type ?title ?altLabel ?note ?date "
+        "?contributor ?contributorRole ?contributorName "
+        "?contributorFamilyName ?contributorGivenName "
+        "?subject_uri ?subject_label ?doi ?equivalent"
+    )
+
     def __init__(self) -> None:
         self.subject_uri: str | None = None
         self.orcid: str | None = None
         self.subject_type: IdrefSparqlQueryBuilder.SubjectType | None = None
+        self.limit: int = self.DEFAULT_PERSON_QUERY_LIMIT
+        self.offset: int | None = None
 
     def set_idref_id(self, idref_id: str):
         """
@@ -191,6 +204,18 @@ class IdrefSparqlQueryBuilder:
         self.subject_uri = subject_uri
         return self
 
+    def set_page(self, limit: int, offset: int):
+        """
+        Paginate the person query
+
+        :param limit: the maximum number of rows of the page
+        :param offset: the number of rows before the page
+        :return: the query builder
+        """
+        self.limit = limit
+        self.offset = offset
+        return self
+
     def build(self):
         """
         Build the SPARQL query
@@ -267,7 +292,16 @@ class IdrefSparqlQueryBuilder:
             "?subject_uri skos:prefLabel ?subject_label "
             "} . "
             "}\n"
-            "LIMIT 10000"
+            f"{self._person_query_pagination()}"
+        )
+
+    def _person_query_pagination(self) -> str:
+        # rows are ordered by publication so that they can be aggregated as they come
+        if self.offset is None:
+            return f"ORDER BY ?pub\nLIMIT {self.limit}"
+        return (
+            f"ORDER BY {self.PERSON_QUERY_PAGINATION_ORDER}\n"
+            f"LIMIT {self.limit}\nOFFSET {self.offset}"
         )
 
     def _build_publication_query(self) -> str:
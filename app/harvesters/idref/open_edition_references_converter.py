@@ -200,16 +200,16 @@ class OpenEditionReferencesConverter(AbstractReferencesConverter):
 
     async def _subjects(self, root: ElementTree):
         subjects = self._get_terms(root, "subject")
-        language = self._language(root)
-        for subject in subjects:
-            label, attrib = subject
-            language = attrib.get(f"{{{rdflib.XMLNS}}}lang", None)
-            yield await self._get_or_create_concept_by_label(
+        for concept in await self._get_or_create_concepts(
+            [
                 ConceptInformations(
                     label=label,
-                    language=language,
+                    language=attrib.get(f"{{{rdflib.XMLNS}}}lang", None),
                 )
-            )
+                for label, attrib in subjects
+            ]
+        ):
+            yield concept
 
     async def _document_type(self, root: ElementTree):
         document_type = self._get_term(root, "type")
@@ -5,6 +5,8 @@ from app.harvesters.exceptions.unexpected_format_exception import (
     UnexpectedFormatException,
 )
 from app.harvesters.idref.resolver_http_client import ResolverHTTPClient
+from app.services.parsing.parsing_error import ParsingError
+from app.services.parsing.parsing_service import ParsingService
 
 
 class OpenEditionResolver:
@@ -57,8 +59,8 @@ class OpenEditionResolver:
         document_url = self._create_uri(records, identifier, type_reference)
         response_text = await self.http_client.get(document_url)
         try:
-            root = ET.fromstring(response_text.strip())
-        except ET.ParseError as error:
+            root = await ParsingService().parse_xml(response_text.strip())
+        except ParsingError as error:
             raise UnexpectedFormatException(
                 f"Error while parsing the XML from {document_url} : {response_text}"
             ) from error
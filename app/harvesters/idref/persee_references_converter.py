@@ -68,10 +68,10 @@ class PerseeReferencesConverter(AbesRDFReferencesConverter):
         for subject in pub_graph.objects(rdflib.term.URIRef(uri), DCTERMS.subject):
             fields.append((subject.value, subject.language))
 
-        for field in fields:
-            yield await self._get_or_create_concept_by_label(
-                ConceptInformations(label=field[0], language=field[1])
-            )
+        for concept in await self._get_or_create_concepts(
+            [ConceptInformations(label=field[0], language=field[1]) for field in fields]
+        ):
+            yield concept
 
     async def _get_journal(self, biblio_graph, uri):
         # Check we are dealing with an issue in the first place
@@ -1,13 +1,13 @@
 import re
-from xml.sax import SAXParseException
 
 from rdflib import Graph
-from rdflib.exceptions import ParserError
 
 from app.harvesters.exceptions.unexpected_format_exception import (
     UnexpectedFormatException,
 )
 from app.harvesters.idref.resolver_http_client import ResolverHTTPClient
+from app.services.parsing.parsing_error import ParsingError
+from app.services.parsing.parsing_service import ParsingService
 
 DEFAULT_RDF_TIMEOUT = 30
 
@@ -32,9 +32,10 @@ class RdfResolver:
             cleaned_response_text = self._clean_response_text(response_text)
 
             try:
-                graph = Graph().parse(data=cleaned_response_text, format=output_format)
-                return graph
-            except (ParserError, SAXParseException) as error:
+                return await ParsingService().parse_rdf(
+                    cleaned_response_text, output_format=output_format
+                )
+            except ParsingError as error:
                 raise UnexpectedFormatException(
                     f"Error while parsing the RDF from {document_uri} : {cleaned_response_text}"
                 ) from error
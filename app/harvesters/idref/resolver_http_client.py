@@ -1,6 +1,10 @@
 import aiohttp
 
 from app.harvesters.exceptions.external_endpoint_failure import ExternalEndpointFailure
+from app.harvesters.exceptions.external_resource_not_found import (
+    ExternalResourceNotFound,
+)
+from app.http_client.http_sessions_pool import HttpSessionsPool
 
 
 class ResolverHTTPClient:
@@ -9,7 +13,6 @@ class ResolverHTTPClient:
     """
 
     def __init__(self, timeout: int = 30):
-        self.connector = aiohttp.TCPConnector(limit=0)
         self.timeout = timeout
 
     async def get(self, document_url: str) -> str:
@@ -20,17 +23,22 @@ class ResolverHTTPClient:
         :return: the document as text
         """
         try:
-            async with aiohttp.ClientSession(
-                connector=self.connector,
-                timeout=aiohttp.ClientTimeout(total=self.timeout),
-            ) as session:
-                async with session.get(document_url) as resp:
-                    if resp.status == 200:
-                        return await resp.text()
-                    raise ExternalEndpointFailure(
-                        f"Error code while resolving URI : {document_url} "
-                        f"with code {resp.status}"
+            session = HttpSessionsPool().get_session(document_url)
+            async with session.get(
+                document_url, timeout=aiohttp.ClientTimeout(total=self.timeout)
+            ) as resp:
+                if resp.status == 200:
+                    return await resp.text()
+                if resp.status == 404:
+                    raise ExternalResourceNotFound(
+                        f"Resource not found while resolving URI : {document_url}"
                     )
+                raise ExternalEndpointFailure(
+                    f"Error code while resolving URI : {document_url} "
+                    f"with code {resp.status}"
+                )
+        except ExternalEndpointFailure:
+            raise
         except aiohttp.ClientConnectorError as error:
             raise ExternalEndpointFailure(
                 f"Cant resolve URI : {document_url} with error {error}"
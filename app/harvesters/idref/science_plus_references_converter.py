@@ -1,10 +1,7 @@
-import urllib
-
 import rdflib
 from rdflib import RDF, Literal, DCTERMS, Namespace
 from semver import Version
 
-from app.config import get_app_settings
 from app.db.models.reference import Reference
 from app.db.models.reference_identifier import ReferenceIdentifier
 from app.db.models.title import Title
@@ -14,15 +11,14 @@ from app.harvesters.exceptions.unexpected_format_exception import (
 from app.harvesters.idref.abes_rdf_references_converter import (
     AbesRDFReferencesConverter,
 )
-from app.harvesters.idref.rdf_resolver import RdfResolver
 from app.harvesters.idref.science_plus_document_type_converter import (
     SciencePlusDocumentTypeConverter,
 )
+from app.harvesters.idref.science_plus_resolver import SciencePlusResolver
 from app.harvesters.idref.science_plus_roles_converter import (
     SciencePlusRolesConverter,
 )
 from app.harvesters.rdf_harvester_raw_result import RdfHarvesterRawResult
-from app.services.concepts.concept_informations import ConceptInformations
 from app.services.hash.hash_key import HashKey
 from app.services.issue.issue_data_class import IssueInformations
 from app.services.journal.journal_data_class import JournalInformations
@@ -35,7 +31,6 @@ class SciencePlusReferencesConverter(AbesRDFReferencesConverter):
 
     HUB_NAMESPACE = Namespace("http://hub.abes.fr/namespace/")
     BIBO_NAMESPACE = Namespace("http://purl.org/ontology/bibo/")
-    SCIENCE_PLUS_QUERY_SUFFIX = "https://scienceplus.abes.fr/sparql"
 
     def __init__(self):
         super().__init__()
@@ -63,13 +58,6 @@ class SciencePlusReferencesConverter(AbesRDFReferencesConverter):
         if raw_data.doi:
             new_ref.identifiers.append(self._add_doi_identifier(raw_data.doi))
 
-    async def _get_subjects(self, pub_graph, uri, new_ref):
-        for subject in pub_graph.objects(rdflib.term.URIRef(uri), DCTERMS.subject):
-            db_concept = await self._get_or_create_concept_by_uri(
-                ConceptInformations(uri=subject)
-            )
-            new_ref.subjects.append(db_concept)
-
     async def _get_bibliographic_resource(self, pub_graph, uri):
         for document in pub_graph.objects(
             rdflib.term.URIRef(uri), self.HUB_NAMESPACE.isPartOfThisJournal
@@ -196,11 +184,9 @@ class SciencePlusReferencesConverter(AbesRDFReferencesConverter):
         ]
 
     async def _query_ressource(self, uri):
-        params = {
-            "query": f'define sql:describe-mode "CBD"  DESCRIBE <{uri}>',
-            "output": "application/rdf+xml",
-        }
-        # concatenate encoded params to query suffix
-        query_uri = f"{self.SCIENCE_PLUS_QUERY_SUFFIX}?{urllib.parse.urlencode(params)}"
-        client = RdfResolver(timeout=get_app_settings().idref_science_plus_timeout)
-        return await client.fetch(query_uri, output_format="xml")
+        return await SciencePlusResolver().describe(str(uri))
+
+    async def _fetch_contributor(self, identifier):
+        if str(identifier).startswith(SciencePlusResolver.SCIENCE_PLUS_URL_SUFFIX):
+            return await SciencePlusResolver().describe(str(identifier))
+        return await super()._fetch_contributor(identifier)
@@ -0,0 +1,194 @@
+import asyncio
+import urllib
+
+from loguru import logger
+from rdflib import BNode, DCTERMS, Graph, Namespace, URIRef
+
+from app.config import get_app_settings
+from app.harvesters.exceptions.external_endpoint_failure import ExternalEndpointFailure
+from app.harvesters.exceptions.unexpected_format_exception import (
+    UnexpectedFormatException,
+)
+from app.harvesters.idref.rdf_resolver import RdfResolver
+from app.services.cache.third_api_cache import ThirdApiCache
+
+
+class SciencePlusResolver:
+    """
+    Async resolver for the Science+ SPARQL endpoint :
+    resources are described in batches with multi-resource DESCRIBE queries,
+    whose graph is split by described resource.
+    """
+
+    SCIENCE_PLUS_QUERY_SUFFIX = "https://scienceplus.abes.fr/sparql"
+    SCIENCE_PLUS_URL_SUFFIX = "http://hub.abes.fr/"
+
+    HUB_NAMESPACE = Namespace("http://hub.abes.fr/namespace/")
+    MARCREL_NAMESPACE = Namespace("http://id.loc.gov/vocabulary/relators/")
+
+    # journals, issues and contributors, described during the conversion of a publication
+    RESOURCES_API_NAME = "science_plus_resources"
+
+    def __init__(self, timeout: int | None = None):
+        self.rdf_resolver = RdfResolver(
+            timeout=timeout or get_app_settings().idref_science_plus_timeout
+        )
+
+    @classmethod
+    def describe_query_uri(cls, uris: list[str]) -> str:
+        """
+        Build the URI of the DESCRIBE query for several resources
+
+        :param uris: URIs of the resources
+        :return: the query URI
+        """
+        resources = " ".join(f"<{uri}>" for uri in uris)
+        params = {
+            "query": f'define sql:describe-mode "CBD"  DESCRIBE {resources}',
+            "output": "application/rdf+xml",
+        }
+        # concatenate encoded params to query suffix
+        return f"{cls.SCIENCE_PLUS_QUERY_SUFFIX}?{urllib.parse.urlencode(params)}"
+
+    async def fetch(self, uri: str) -> Graph:
+        """
+        Describe a resource, without cache
+
+        :param uri: URI of the resource
+        :return: the description of the resource
+        """
+        return (await self._describe_batch([uri]))[uri]
+
+    async def fetch_many(self, uris: list[str]) -> dict[str, Graph]:
+        """
+        Describe resources with a few DESCRIBE queries, without cache,
+        sent with the parallelism of the Science+ queries of the Idref harvester.
+        Resources of the failed queries are missing from the result.
+
+        :param uris: URIs of the resources
+        :return: the descriptions of the resources by URI
+        """
+        uris = list(dict.fromkeys(uris))
+        settings = get_app_settings()
+        batch_size = settings.science_plus_describe_batch_size
+        # same limit as for the queries of the publications by the Idref harvester
+        semaphore = asyncio.Semaphore(
+            settings.idref_secondary_sources_parallelism.get(
+                "SCIENCE_PLUS", settings.idref_secondary_sources_default_parallelism
+            )
+        )
+        descriptions = {}
+        for batch_descriptions in await asyncio.gather(
+            *[
+                self._fetch_batch(uris[start : start + batch_size], semaphore)
+                for start in range(0, len(uris), batch_size)
+            ]
+        ):
+            descriptions.update(batch_descriptions)
+        return descriptions
+
+    async def describe(self, uri: str) -> Graph:
+        """
+        Describe a related resource from the cache or from the Science+ endpoint
+
+        :param uri: URI of the resource
+        :return: the description of the resource
+        """
+        description = await ThirdApiCache.get(
+            self.RESOURCES_API_NAME, uri, lambda: self.fetch(uri)
+        )
+        if not isinstance(description, Graph):
+            description = await self.fetch(uri)
+            await ThirdApiCache.set(self.RESOURCES_API_NAME, uri, description)
+        return description
+
+    async def describe_many(self, uris: list[str]) -> dict[str, Graph]:
+        """
+        Describe related resources from the cache,
+        or with a few DESCRIBE queries for the resources missing from the cache,
+        which are then cached
+
+        :param uris: URIs of the resources
+        :return: the descriptions of the resources by URI,
+            resources of the failed queries being missing
+        """
+        descriptions = {
+            uri: description
+            for uri, description in (
+                await ThirdApiCache.get_many(self.RESOURCES_API_NAME, uris)
+            ).items()
+            if isinstance(description, Graph)
+        }
+        fetched_descriptions = await self.fetch_many(
+            [uri for uri in uris if uri not in descriptions]
+        )
+        await ThirdApiCache.set_many(self.RESOURCES_API_NAME, fetched_descriptions)
+        return descriptions | fetched_descriptions
+
+    @classmethod
+    def related_resources(cls, graph: Graph, uri: str) -> list[str]:
+        """
+        List the Science+ resources a publication refers to :
+        its journal, its issue and its contributors
+
+        :param graph: the description of the publication
+        :param uri: URI of the publication
+        :return: URIs of the related resources
+        """
+        related_resources = [
+            *graph.objects(URIRef(uri), cls.HUB_NAMESPACE.isPartOfThisJournal),
+            *graph.objects(URIRef(uri), DCTERMS.isPartOf),
+            *(
+                contributor
+                for predicate, contributor in graph.predicate_objects(URIRef(uri))
+                if str(predicate).startswith(str(cls.MARCREL_NAMESPACE))
+            ),
+        ]
+        return [
+            str(resource)
+            for resource in related_resources
+            if isinstance(resource, URIRef)
+            and str(resource).startswith(cls.SCIENCE_PLUS_URL_SUFFIX)
+        ]
+
+    async def _fetch_batch(
+        self, uris: list[str], semaphore: asyncio.Semaphore
+    ) -> dict[str, Graph]:
+        try:
+            async with semaphore:
+                return await self._describe_batch(uris)
+        except (ExternalEndpointFailure, UnexpectedFormatException) as error:
+            # the resources will be described individually
+            logger.warning(f"Failure of Science+ DESCRIBE query : {error}")
+            return {}
+
+    async def _describe_batch(self, uris: list[str]) -> dict[str, Graph]:
+        graph = await self.rdf_resolver.fetch(
+            self.describe_query_uri(uris), output_format="xml"
+        )
+        return {uri: self._description(graph, URIRef(uri)) for uri in uris}
+
+    @staticmethod
+    def _description(graph: Graph, resource: URIRef) -> Graph:
+        """
+        Extract the concise bounded description of a resource from the graph
+        of a DESCRIBE query : the triples of the resource and of the blank nodes
+        reachable from it
+
+        :param graph: the graph of the query
+        :param resource: the described resource
+        :return: the description of the resource
+        """
+        description = Graph()
+        subjects = [resource]
+        visited = set()
+        while subjects:
+            subject = subjects.pop()
+            if subject in visited:
+                continue
+            visited.add(subject)
+            for triple in graph.triples((subject, None, None)):
+                description.add(triple)
+                if isinstance(triple[2], BNode):
+                    subjects.append(triple[2])
+        return description
@@ -0,0 +1,86 @@
+import asyncio
+from collections import defaultdict, deque
+from typing import Coroutine
+
+
+class SecondaryQueriesScheduler:
+    """
+    Runs the secondary queries of the Idref harvester (Sudoc, Science+, Persée, etc.)
+    with a sliding concurrency window per secondary source :
+    as soon as a query completes, the next waiting query of the same source is started,
+    so that a slow source never holds back the queries to the other ones.
+    """
+
+    def __init__(self, limits: dict[str, int], default_limit: int):
+        """
+        :param limits: max number of concurrent queries by secondary source
+        :param default_limit: max number of concurrent queries for the other sources
+        """
+        self.limits = limits
+        self.default_limit = default_limit
+        self.waiting: dict[str, deque[Coroutine]] = defaultdict(deque)
+        self.running: dict[asyncio.Task, str] = {}
+        self.running_count: dict[str, int] = defaultdict(int)
+
+    @property
+    def pending(self) -> bool:
+        """
+        :return: True if some queries are still running or waiting to be started
+        """
+        return bool(self.running) or any(self.waiting.values())
+
+    def submit(self, source: str, coro: Coroutine) -> None:
+        """
+        Queue a query, that will be started as soon as the window of its source allows it
+
+        :param source: the secondary source of the query
+        :param coro: the query coroutine
+        :return: None
+        """
+        self.waiting[source].append(coro)
+        self._start_waiting_queries(source)
+
+    def pop_done_queries(self) -> list[asyncio.Task]:
+        """
+        Get the queries completed so far without waiting,
+        and start the waiting queries of their sources
+
+        :return: the completed queries tasks
+        """
+        done_queries = [task for task in self.running if task.done()]
+        for task in done_queries:
+            source = self.running.pop(task)
+            self.running_count[source] -= 1
+            self._start_waiting_queries(source)
+        return done_queries
+
+    async def wait(self) -> list[asyncio.Task]:
+        """
+        Wait for at least one of the running queries to complete
+
+        :return: the completed queries tasks
+        """
+        if self.running:
+            await asyncio.wait(self.running, return_when=asyncio.FIRST_COMPLETED)
+        return self.pop_done_queries()
+
+    def cancel(self) -> None:
+        """
+        Cancel the running queries and drop the waiting ones
+
+        :return: None
+        """
+        for task in self.running:
+            task.cancel()
+        self.running.clear()
+        self.running_count.clear()
+        for queue in self.waiting.values():
+            while queue:
+                queue.popleft().close()
+
+    def _start_waiting_queries(self, source: str) -> None:
+        limit = self.limits.get(source, self.default_limit)
+        queue = self.waiting[source]
+        while queue and self.running_count[source] < limit:
+            self.running[asyncio.create_task(queue.popleft())] = source
+            self.running_count[source] += 1
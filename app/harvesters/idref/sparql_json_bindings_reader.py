@@ -0,0 +1,95 @@
+import codecs
+import json
+import re
+from typing import AsyncGenerator, AsyncIterable
+
+from app.harvesters.exceptions.unexpected_format_exception import (
+    UnexpectedFormatException,
+)
+
+
+class SparqlJsonBindingsReader:
+    """
+    Incremental reader of the bindings of a SPARQL JSON results document :
+    the bindings are decoded one by one as the chunks of the response are received,
+    without loading the whole document.
+    """
+
+    BINDINGS_START = re.compile(r'"bindings"\s*:\s*\[')
+    SEPARATORS = " \t\n\r,"
+
+    def __init__(self) -> None:
+        self.buffer = ""
+        self.in_bindings = False
+        self.complete = False
+        self.json_decoder = json.JSONDecoder()
+        self.text_decoder = codecs.getincrementaldecoder("utf-8")()
+
+    async def read(self, chunks: AsyncIterable[bytes]) -> AsyncGenerator[dict, None]:
+        """
+        Read the bindings from the chunks of a SPARQL JSON results document
+
+        :param chunks: the chunks of the document
+        :return: A generator of the bindings, in the order of the document
+        :raises UnexpectedFormatException: if the document is truncated or invalid
+        """
+        async for chunk in chunks:
+            for binding in self.feed(chunk):
+                yield binding
+        self.close()
+
+    def feed(self, chunk: bytes) -> list[dict]:
+        """
+        Feed a chunk of the document
+
+        :param chunk: the chunk
+        :return: the bindings completed by the chunk
+        """
+        self.buffer += self.text_decoder.decode(chunk)
+        return self._read_bindings()
+
+    def close(self) -> None:
+        """
+        Check that the whole bindings array has been read
+
+        :return: None
+        :raises UnexpectedFormatException: if the document is truncated or invalid
+        """
+        self.buffer += self.text_decoder.decode(b"", final=True)
+        self._read_bindings()
+        if not self.complete:
+            raise UnexpectedFormatException(
+                "Truncated or invalid SPARQL JSON results : "
+                f"unable to read bindings from {self.buffer[:100]}"
+            )
+
+    def _read_bindings(self) -> list[dict]:
+        if self.complete:
+            return []
+        if not self.in_bindings:
+            start = self.BINDINGS_START.search(self.buffer)
+            if start is None:
+                return []
+            self.buffer = self.buffer[start.end() :]
+            self.in_bindings = True
+        bindings = []
+        position = 0
+        while True:
+            while (
+                position < len(self.buffer) and self.buffer[position] in self.SEPARATORS
+            ):
+                position += 1
+            if position == len(self.buffer):
+                break
+            if self.buffer[position] == "]":
+                self.complete = True
+                position += 1
+                break
+            try:
+                binding, position = self.json_decoder.raw_decode(self.buffer, position)
+            except json.JSONDecodeError:
+                # the binding is not complete yet, wait for the next chunk
+                break
+            bindings.append(binding)
+        self.buffer = self.buffer[position:]
+        return bindings
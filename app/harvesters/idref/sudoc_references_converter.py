@@ -26,12 +26,10 @@ from app.harvesters.idref.sudoc_document_type_converter import (
 from app.harvesters.idref.sudoc_roles_converter import SudocRolesConverter
 from app.harvesters.rdf_harvester_raw_result import RdfHarvesterRawResult
 from app.services.book.book_data_class import BookInformations
-from app.services.concepts.concept_informations import ConceptInformations
 from app.services.hash.hash_key import HashKey
 from app.services.issue.issue_data_class import IssueInformations
 from app.services.journal.journal_data_class import JournalInformations
 from app.utilities.date_utilities import check_valid_iso8601_date
-from app.utilities.execution_timer_wrapper import execution_timer
 from app.utilities.isbn_utilities import get_isbns
 from app.utilities.string_utilities import normalize_string, remove_after_separator
 
@@ -75,17 +73,6 @@ class SudocReferencesConverter(AbesRDFReferencesConverter):
                 )
                 new_ref.issue = issue
 
-    @execution_timer
-    async def _get_subjects(self, pub_graph, uri, new_ref):
-        for subject in pub_graph.objects(rdflib.term.URIRef(uri), DCTERMS.subject):
-            concept_uri = str(subject)
-            db_concept = await self._get_or_create_concept_by_uri(
-                ConceptInformations(
-                    uri=concept_uri,
-                )
-            )
-            new_ref.subjects.append(db_concept)
-
     def _harvester(self) -> str:
         return "Idref"
 
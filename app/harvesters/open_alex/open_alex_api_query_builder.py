@@ -21,10 +21,15 @@ class OpenAlexQueryBuilder:
 
         AUTH_ORCID = "orcid"
 
+    INITIAL_CURSOR = "*"
+
     def __init__(self) -> None:
         self.identifier_type = None
         self.identifier_value = None
         self.subject_type = None
+        self.cursor = None
+        self.per_page = None
+        self.select = None
 
     def set_query(
         self, identifier_type: QueryParameters, identifier_value: str
@@ -41,13 +46,41 @@ class OpenAlexQueryBuilder:
         self.identifier_type = identifier_type
         self.identifier_value = identifier_value
 
+    def set_cursor(self, cursor: str) -> None:
+        """
+        Set the cursor of the page of results to request,
+        as returned by the previous page in the meta.next_cursor field
+
+        :param cursor: the cursor
+        :return: None
+        """
+        self.cursor = cursor
+
+    def set_per_page(self, per_page: int) -> None:
+        """
+        Set the number of works per page of results
+
+        :param per_page: the number of works per page
+        :return: None
+        """
+        self.per_page = per_page
+
+    def set_select(self, fields: list[str]) -> None:
+        """
+        Set the root fields of the works to return
+
+        :param fields: the names of the fields
+        :return: None
+        """
+        self.select = fields
+
     def build(self) -> str:
         """
         Main building method, returns a query string for the OpenAlex API.
         :return: a query string
         """
 
-        params = self._query_param()
+        params = self._query_param() | self._paging_params() | self._select_param()
         return urlencode(params)
 
     def _query_param(self):
@@ -63,6 +96,19 @@ class OpenAlexQueryBuilder:
             "filter": f"author.{self.identifier_type.value}:{self.identifier_value}"
         }
 
+    def _paging_params(self):
+        params = {}
+        if self.cursor is not None:
+            params["cursor"] = self.cursor
+        if self.per_page is not None:
+            params["per_page"] = self.per_page
+        return params
+
+    def _select_param(self):
+        if self.select is None:
+            return {}
+        return {"select": ",".join(self.select)}
+
     def set_subject_type(self, subject_type: SubjectType):
         """
         Set the subject type of the query
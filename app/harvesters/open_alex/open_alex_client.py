@@ -1,11 +1,15 @@
-from typing import Generator
+from typing import AsyncGenerator
 
 import aiohttp
+from loguru import logger
 
 from app.harvesters.exceptions.external_endpoint_failure import ExternalEndpointFailure
 from app.harvesters.exceptions.unexpected_format_exception import (
     UnexpectedFormatException,
 )
+from app.harvesters.open_alex.open_alex_api_query_builder import OpenAlexQueryBuilder
+from app.http_client.http_sessions_pool import HttpSessionsPool
+from app.http_client.prefetched_pages import prefetched_pages
 
 
 class OpenAlexClient:
@@ -13,55 +17,67 @@ class OpenAlexClient:
 
     OPEN_ALEX_URL = "https://api.openalex.org/works"
 
-    PER_PAGE = 25
-
-    async def fetch(self, query_string: str) -> Generator[dict, None, None]:
+    async def fetch(
+        self, query_builder: OpenAlexQueryBuilder
+    ) -> AsyncGenerator[dict, None]:
         """
-        Fetch the results from the OpenAlex API
+        Fetch the results from the OpenAlex API, page by page with cursors.
+        The next page is requested while the works of the current page
+        are being processed.
 
-        :param query_string: the query string to send to the OpenAlex API
+        :param query_builder: the query builder with the query parameters set
         :return: A generator of results
         """
-        page_number = 1
-        while True:
-            paginated_query = (
-                f"{query_string}&page={page_number}&per_page={self.PER_PAGE}"
-            )
-            try:
-                async with aiohttp.ClientSession(
-                    connector=aiohttp.TCPConnector(limit=None)
-                ) as session:
-                    async with session.get(
-                        f"{self.OPEN_ALEX_URL}?{paginated_query}"
-                    ) as resp:
-                        if resp.status == 200:
-                            json_response = await resp.json()
-                            if "results" not in json_response.keys():
-                                raise UnexpectedFormatException(
-                                    f"Unexpected format in OpenAlex response: {json_response} "
-                                    f"for request : {query_string}"
-                                )
-                            if "error" in json_response.keys():
-                                raise ExternalEndpointFailure(
-                                    f"Error from OpenAlex API for request : {query_string} "
-                                    f"with error {json_response['error']}"
-                                )
-                            for doc in json_response["results"]:
-                                yield doc
-                            meta = json_response.get("meta", {})
-                            if (
-                                meta.get("count", 0)
-                                < meta.get("per_page", 0) * page_number
-                            ):
-                                break
-                            page_number += 1
-                        else:
-                            raise ExternalEndpointFailure(
-                                f"Error code from OpenAlex API for request : {query_string} "
-                                f"with code {resp.status}"
-                            )
+        query_builder.set_cursor(OpenAlexQueryBuilder.INITIAL_CURSOR)
+        try:
+            session = HttpSessionsPool().get_session(self.OPEN_ALEX_URL)
 
-            except aiohttp.ClientConnectorError as error:
+            def next_page(page: tuple[list[dict], str | None]):
+                works, next_cursor = page
+                if next_cursor is None or not works:
+                    return None
+                query_builder.set_cursor(next_cursor)
+                return self._fetch_page(session, query_builder.build())
+
+            async for works, _ in prefetched_pages(
+                self._fetch_page(session, query_builder.build()), next_page
+            ):
+                for work in works:
+                    yield work
+        except aiohttp.ClientConnectorError as error:
+            raise ExternalEndpointFailure(
+                f"Cant connect to OpenAlex API for request : {query_builder.build()} "
+                f"with error {error}"
+            ) from error
+
+    async def _fetch_page(
+        self, session: aiohttp.ClientSession, query_string: str
+    ) -> tuple[list[dict], str | None]:
+        """
+        Fetch a page of results from the OpenAlex API
+
+        :param session: the aiohttp session
+        :param query_string: the query string to send to the OpenAlex API
+        :return: the works of the page and the cursor of the next page
+        """
+        logger.info(f"Fetching OpenAlex API with query: {query_string}")
+        async with session.get(f"{self.OPEN_ALEX_URL}?{query_string}") as resp:
+            if resp.status != 200:
                 raise ExternalEndpointFailure(
-                    f"Cant connect to OpenAlex API for request : {query_string} with error {error}"
-                ) from error
+                    f"Error code from OpenAlex API for request : {query_string} "
+                    f"with code {resp.status}"
+                )
+            json_response = await resp.json()
+            if "error" in json_response.keys():
+                raise ExternalEndpointFailure(
+                    f"Error from OpenAlex API for request : {query_string} "
+                    f"with error {json_response['error']}"
+                )
+            if "results" not in json_response.keys():
+                raise UnexpectedFormatException(
+                    f"Unexpected format in OpenAlex response: {json_response} "
+                    f"for request : {query_string}"
+                )
+            return json_response["results"], json_response.get("meta", {}).get(
+                "next_cursor"
+            )
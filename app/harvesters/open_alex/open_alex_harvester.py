@@ -2,6 +2,7 @@ from typing import AsyncGenerator
 
 from semver import VersionInfo, Version
 
+from app.config import get_app_settings
 from app.harvesters.abstract_harvester import AbstractHarvester
 from app.harvesters.json_harvester_raw_result import JsonHarvesterRawResult
 from app.harvesters.open_alex.open_alex_api_query_builder import OpenAlexQueryBuilder
@@ -60,7 +61,10 @@ class OpenAlexHarvester(AbstractHarvester):
             identifier_type=identifier_type, identifier_value=identifier_value
         )
 
-        async for doc in OpenAlexClient().fetch(builder.build()):
+        builder.set_per_page(get_app_settings().open_alex_api_page_size)
+        builder.set_select(self.converter.selected_fields(self.VERSION))
+
+        async for doc in OpenAlexClient().fetch(builder):
             yield JsonHarvesterRawResult(
                 payload=doc,
                 source_identifier=doc.get("id"),
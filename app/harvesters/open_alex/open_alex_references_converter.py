@@ -40,6 +40,23 @@ class OpenAlexReferencesConverter(AbstractReferencesConverter):
 
     REFERENCE_IDENTIFIERS_IGNORE = ["mag"]
 
+    # root fields of the works read by the converter
+    FIELDS = [
+        "abstract_inverted_index",
+        "authorships",
+        "biblio",
+        "concepts",
+        "created_date",
+        "id",
+        "ids",
+        "language",
+        "locations",
+        "primary_location",
+        "publication_date",
+        "title",
+        "type",
+    ]
+
     @AbstractReferencesConverter.validate_reference
     async def convert(self, raw_data: JsonRawResult, new_ref: Reference) -> None:
         """
@@ -254,24 +271,17 @@ class OpenAlexReferencesConverter(AbstractReferencesConverter):
             new_ref.contributions.append(contribution)
 
     async def _concepts(self, json_payload, language) -> AsyncGenerator[Concept, None]:
-        concept_cache = {}
-
-        for concept in self._value_from_key(json_payload, "concepts", []):
-            concept_uri = concept.get("wikidata")
-            label = concept.get("display_name")
-
-            if concept_uri in concept_cache:
-                yield concept_cache[concept_uri]
-                continue
-            concept_db = await self._get_or_create_concept_by_uri(
+        for concept_db in await self._get_or_create_concepts(
+            [
                 ConceptInformations(
-                    uri=concept_uri,
-                    label=label,
+                    uri=concept.get("wikidata"),
+                    label=concept.get("display_name"),
                     language=language,
                     source=ConceptInformations.ConceptSources.WIKIDATA,
                 )
-            )
-            concept_cache[concept_uri] = concept_db
+                for concept in self._value_from_key(json_payload, "concepts", [])
+            ]
+        ):
             yield concept_db
 
     def _title(self, json_payload, language: str):
@@ -295,6 +305,19 @@ class OpenAlexReferencesConverter(AbstractReferencesConverter):
         value = json_payload.get(key, default)
         return value if value is not None else default
 
+    def selected_fields(self, harvester_version: Version) -> list[str]:
+        """
+        Root fields of the works to request from the OpenAlex API :
+        the fields read by the converter and the fields hashed for the given version
+
+        :param harvester_version: the version of the harvester
+        :return: the names of the fields
+        """
+        return sorted(
+            set(self.FIELDS)
+            | {hash_key.value for hash_key in self.hash_keys(harvester_version)}
+        )
+
     def hash_keys(self, harvester_version: Version) -> list[HashKey]:
         return [
             HashKey("id"),
@@ -1,14 +1,15 @@
 from enum import Enum
-from typing import Dict, List
+from typing import AsyncGenerator, Dict, List
 
-from elasticsearch import AsyncElasticsearch
 from elasticsearch.exceptions import AuthenticationException, ElasticsearchException
+from loguru import logger
 
 from app.config import get_app_settings
 from app.harvesters.exceptions.external_endpoint_failure import ExternalEndpointFailure
 from app.harvesters.exceptions.unexpected_format_exception import (
     UnexpectedFormatException,
 )
+from app.harvesters.scanr.scanr_elasticsearch_pool import ScanRElasticsearchPool
 
 
 class ScanRElasticClient:
@@ -22,23 +23,20 @@ class ScanRElasticClient:
         PERSONS = "scanr-persons"
         PUBLICATIONS = "scanr-publications"
 
+    # most efficient sort to page through a point in time
+    POINT_IN_TIME_DEFAULT_SORT = ["_shard_doc"]
+
     def __init__(self):
         self.settings = get_app_settings()
         self.query = None
         self.elastic = None
 
     async def __aenter__(self):
-        self.elastic = AsyncElasticsearch(
-            [self.settings.scanr_es_host],
-            http_auth=(self.settings.scanr_es_user, self.settings.scanr_es_password),
-            use_ssl=True,
-            verify_certs=True,
-            scheme="https",
-        )
+        self.elastic = ScanRElasticsearchPool().get_client()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        await self.elastic.close()
+        # the client is shared, it is closed at application shutdown
         self.elastic = None
 
     def set_query(self, elastic_query: Dict[str, any]):
@@ -50,57 +48,112 @@ class ScanRElasticClient:
         """
         self.query = elastic_query
 
-    async def perform_search(self, selected_index: Indexes, base_size: int = 200):
+    async def perform_search(
+        self,
+        selected_index: Indexes,
+        base_size: int = 200,
+        point_in_time: bool = True,
+    ) -> AsyncGenerator[Dict, None]:
         """
-        Perform a search request on Scanr index and return the results
-        :return: the result as list
+        Perform a search request on Scanr index and return the results,
+        paging through a point in time of the index with search_after.
+        Falls back to paging with offsets if the point in time cannot be opened.
+        The generator must be closed before leaving the client context,
+        for the point in time to be closed.
+
+        :param selected_index: the index to search
+        :param base_size: the number of results per page
+        :param point_in_time: whether to page through a point in time,
+            not worth opening for a lookup of the first results
+        :return: the results as an async generator
         """
-
-        async def search_and_yield(offset):
-            nonlocal total_search_hits
-            try:
-                # pylint: disable=unexpected-keyword-arg
-                resp = await self.elastic.search(
-                    # "size" belongs to method parameters
-                    # https://elasticsearch-py.readthedocs.io/en/v8.12.0/api/elasticsearch.html
-                    # "from" is listed in documentation but appears as "from_" in library code
-                    index=target_index,
-                    body=self.query,
-                    size=base_size,
-                    from_=offset,
-                )
-            except AuthenticationException as exc:
-                raise ExternalEndpointFailure(
-                    "Invalid credentials for ScanR API"
-                ) from exc
-            except ElasticsearchException as exc:
-                raise ExternalEndpointFailure("Unable to connect to ScanR API") from exc
-
-            cleaned_results = self._clean_results(resp)  # clean the results
-
-            total = resp.get("hits", {}).get("total", {}).get("value", 0)
-            if total > total_search_hits:
-                total_search_hits = total
-
-            for result in cleaned_results:
-                yield result
-
         assert selected_index in self.Indexes, "Selected index is unavailable"
         target_index = selected_index.value
 
         assert self.query, "Set a query before performing a search"
 
-        total_search_hits = 0
-        result_yielded = 0
-
-        async for result in search_and_yield(result_yielded):
-            result_yielded += 1
-            yield result
-
-        while result_yielded < total_search_hits:
-            async for result in search_and_yield(result_yielded):
-                result_yielded += 1
+        pit_id = await self._open_point_in_time(target_index) if point_in_time else None
+        if pit_id is None:
+            async for result in self._search_with_offsets(target_index, base_size):
+                yield result
+            return
+        try:
+            search_after = None
+            while True:
+                body = {
+                    "sort": self.POINT_IN_TIME_DEFAULT_SORT,
+                    **self.query,
+                    "pit": {
+                        "id": pit_id,
+                        "keep_alive": self.settings.scanr_es_pit_keep_alive,
+                    },
+                }
+                if search_after is not None:
+                    body["search_after"] = search_after
+                resp = await self._search(body=body, size=base_size)
+                # the id of the point in time may change between searches
+                pit_id = resp.get("pit_id", pit_id)
+                results = self._clean_results(resp)
+                for result in results:
+                    yield result
+                if len(results) < base_size:
+                    break
+                search_after = results[-1].get("sort")
+                if search_after is None:
+                    raise UnexpectedFormatException(
+                        "Missing sort values in ScanR search results"
+                    )
+        finally:
+            await self._close_point_in_time(pit_id)
+
+    async def _search_with_offsets(
+        self, target_index: str, base_size: int
+    ) -> AsyncGenerator[Dict, None]:
+        offset = 0
+        while True:
+            # "from" is listed in documentation but appears as "from_" in library code
+            resp = await self._search(
+                index=target_index, body=self.query, size=base_size, from_=offset
+            )
+            results = self._clean_results(resp)
+            for result in results:
                 yield result
+            offset += len(results)
+            total = resp.get("hits", {}).get("total", {}).get("value", 0)
+            if not results or offset >= total:
+                break
+
+    async def _search(self, **kwargs) -> Dict:
+        try:
+            # pylint: disable=unexpected-keyword-arg
+            return await self.elastic.search(**kwargs)
+        except AuthenticationException as exc:
+            raise ExternalEndpointFailure("Invalid credentials for ScanR API") from exc
+        except ElasticsearchException as exc:
+            raise ExternalEndpointFailure("Unable to connect to ScanR API") from exc
+
+    async def _open_point_in_time(self, target_index: str) -> str | None:
+        try:
+            # pylint: disable=unexpected-keyword-arg
+            resp = await self.elastic.open_point_in_time(
+                index=target_index, keep_alive=self.settings.scanr_es_pit_keep_alive
+            )
+        except AuthenticationException as exc:
+            raise ExternalEndpointFailure("Invalid credentials for ScanR API") from exc
+        except ElasticsearchException as exc:
+            logger.warning(
+                f"Cannot open a point in time on ScanR index {target_index}, "
+                f"will page with offsets : {exc}"
+            )
+            return None
+        return resp.get("id")
+
+    async def _close_point_in_time(self, pit_id: str) -> None:
+        try:
+            await self.elastic.close_point_in_time(body={"id": pit_id})
+        except ElasticsearchException as exc:
+            # the point in time will expire after its keep alive
+            logger.warning(f"Cannot close ScanR point in time : {exc}")
 
     def _clean_results(self, results: Dict) -> List[Dict]:
         try:
@@ -0,0 +1,72 @@
+import asyncio
+
+from elasticsearch import AsyncElasticsearch
+from loguru import logger
+
+from app.config import get_app_settings
+
+
+class ScanRElasticsearchPool:
+    """
+    Singleton for the Elasticsearch client of the ScanR API
+
+    The client, and thus its pool of connections, is shared by all the harvestings
+    so that TCP connections and TLS handshakes are reused.
+    """
+
+    _instance = None
+
+    def __new__(cls, *args, **kwargs):
+        if not cls._instance:
+            cls._instance = super().__new__(cls, *args, **kwargs)
+        return cls._instance
+
+    def __init__(self):
+        if not hasattr(self, "client"):
+            logger.info("Instanciating ScanRElasticsearchPool Singleton")
+            self.client: tuple[
+                asyncio.AbstractEventLoop, AsyncElasticsearch
+            ] | None = None
+
+    def get_client(self) -> AsyncElasticsearch:
+        """
+        Get the shared Elasticsearch client.
+        The client must not be closed by the caller.
+
+        :return: the Elasticsearch client of the ScanR API
+        """
+        loop = asyncio.get_running_loop()
+        if self.client is not None:
+            client_loop, client = self.client
+            # the connections of a client are bound to the event loop
+            # the client has been created in
+            if client_loop is loop:
+                return client
+        client = self._build_client()
+        self.client = (loop, client)
+        return client
+
+    async def close(self) -> None:
+        """
+        Close the client if it has been opened on the running event loop
+
+        :return: None
+        """
+        if self.client is None:
+            return
+        client_loop, client = self.client
+        if client_loop is asyncio.get_running_loop():
+            await client.close()
+        self.client = None
+
+    @staticmethod
+    def _build_client() -> AsyncElasticsearch:
+        settings = get_app_settings()
+        return AsyncElasticsearch(
+            [settings.scanr_es_host],
+            http_auth=(settings.scanr_es_user, settings.scanr_es_password),
+            use_ssl=True,
+            verify_certs=True,
+            scheme="https",
+            maxsize=settings.scanr_es_max_connections,
+        )
@@ -1,3 +1,4 @@
+from contextlib import aclosing
 from typing import AsyncGenerator
 
 from semver import VersionInfo, Version
@@ -8,6 +9,7 @@ from app.harvesters.scanr.scanr_api_query_builder import (
     ScanRApiQueryBuilder as QueryBuilder,
 )
 from app.harvesters.scanr.scanr_elastic_client import ScanRElasticClient
+from app.services.cache.third_api_cache import ThirdApiCache
 
 
 class ScanrHarvester(AbstractHarvester):
@@ -27,6 +29,9 @@ class ScanrHarvester(AbstractHarvester):
 
     supported_identifier_types = ["idref", "orcid", "id_hal_s"]
 
+    # name of the ScanR ids of the persons in the third party API cache
+    PERSON_IDS_API_NAME = "scanr_person_ids"
+
     VERSION: Version = VersionInfo.parse("1.6.0")
 
     async def _get_scanr_query_parameters(self, entity_class: str):
@@ -71,19 +76,41 @@ class ScanrHarvester(AbstractHarvester):
             builder.set_publication_query(scanr_id=scanr_id)
 
             client.set_query(elastic_query=builder.build())
-            async for doc in client.perform_search(client.Indexes.PUBLICATIONS):
-                yield RawResult(
-                    payload=doc,
-                    source_identifier=doc["_source"].get("id"),
-                    formatter_name=ScanrHarvester.FORMATTER_NAME,
-                )
+            # close the search before the client, if the harvesting stops early
+            async with aclosing(
+                client.perform_search(client.Indexes.PUBLICATIONS)
+            ) as docs:
+                async for doc in docs:
+                    yield RawResult(
+                        payload=doc,
+                        source_identifier=doc["_source"].get("id"),
+                        formatter_name=ScanrHarvester.FORMATTER_NAME,
+                    )
 
     @staticmethod
     async def _get_entity_scanr_id(identifier_type, identifier_value: str):
+        # the ScanR ids of the persons are cached, as they hardly ever change
+        cache_key = f"{identifier_type.value}:{identifier_value}"
+        scanr_id = await ThirdApiCache.get(
+            ScanrHarvester.PERSON_IDS_API_NAME, cache_key
+        )
+        if scanr_id is not None:
+            return scanr_id
         async with ScanRElasticClient() as client:
             builder = QueryBuilder()
             builder.set_person_query(identifier_type, identifier_value)
 
             client.set_query(elastic_query=builder.build())
-            async for doc in client.perform_search(client.Indexes.PERSONS):
-                return doc.get("_source", {}).get("id")
+            async with aclosing(
+                client.perform_search(
+                    client.Indexes.PERSONS, base_size=1, point_in_time=False
+                )
+            ) as docs:
+                async for doc in docs:
+                    scanr_id = doc.get("_source", {}).get("id")
+                    break
+        if scanr_id is not None:
+            await ThirdApiCache.set(
+                ScanrHarvester.PERSON_IDS_API_NAME, cache_key, scanr_id
+            )
+        return scanr_id
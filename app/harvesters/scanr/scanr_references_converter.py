@@ -253,28 +253,25 @@ class ScanrReferencesConverter(AbstractReferencesConverter):
                 subjects_with_source.append(subject)
             else:
                 subjects_without_source.append(subject)
-        labels_with_source = {}
+        concept_informations = []
         for subject in subjects_with_source:
-            concept_id = subject.get("code")
-
-            concept_type = subject.get("type")
-            concept_source = self._get_concept_source(concept_type)
-
             label_dict = subject.get("label", {})
             concept_label, concept_language = self._get_concept_label(label_dict)
-
-            db_concept = await self._get_or_create_concept_by_uri(
+            concept_informations.append(
                 ConceptInformations(
-                    code=concept_id,
+                    code=subject.get("code"),
                     label=concept_label,
                     language=concept_language,
-                    source=concept_source,
+                    source=self._get_concept_source(subject.get("type")),
                 )
             )
+        labels_with_source = {}
+        for db_concept in await self._get_or_create_concepts(concept_informations):
             for label in db_concept.labels:
                 labels_with_source.setdefault(label.language, []).append(label.value)
             yield db_concept
 
+        concept_informations = []
         for subject in subjects_without_source:
             label_dict = subject.get("label", {})
             concept_label, concept_language = self._get_concept_label(label_dict)
@@ -292,12 +289,13 @@ class ScanrReferencesConverter(AbstractReferencesConverter):
             ):
                 continue
             labels_with_source.setdefault(concept_language, []).append(concept_label)
-            db_concept = await self._get_or_create_concept_by_label(
+            concept_informations.append(
                 ConceptInformations(
                     label=concept_label,
                     language=concept_language,
                 )
             )
+        for db_concept in await self._get_or_create_concepts(concept_informations):
             yield db_concept
 
     @staticmethod
@@ -1,10 +1,19 @@
-from typing import Generator
+import asyncio
+import itertools
 import xml.etree.ElementTree as ET
+from collections import deque
+from typing import AsyncGenerator
+
 import aiohttp
 import rdflib
+from loguru import logger
 
 from app.config import get_app_settings
 from app.harvesters.exceptions.external_endpoint_failure import ExternalEndpointFailure
+from app.harvesters.exceptions.unexpected_format_exception import (
+    UnexpectedFormatException,
+)
+from app.http_client.http_sessions_pool import HttpSessionsPool
 
 
 class ScopusClient:
@@ -22,48 +31,164 @@ class ScopusClient:
         "atom": "http://www.w3.org/2005/Atom",
     }
 
+    # maximum number of results per page of the Scopus API with the COMPLETE view
+    PAGE_SIZE = 25
+
+    ENTRY_TAG = f"{{{NAMESPACE['atom']}}}entry"
+    TOTAL_RESULTS_TAG = f"{{{NAMESPACE['opensearch']}}}totalResults"
+
+    READ_CHUNK_SIZE = 64 * 1024
+
     def __init__(self) -> None:
         self.settings = get_app_settings()
 
-    async def fetch(self, query_string: str, start=0) -> Generator[dict, None, None]:
-        """
-        Fetch the results from Scopus API
+    async def fetch(self, query_string: str) -> AsyncGenerator[ET.Element, None]:
         """
+        Fetch the results from Scopus API.
+        Once the number of results is known from the first page,
+        the next pages are fetched concurrently and their entries are yielded in order.
+        If the API quota is too low for all the pages, only the pages allowed
+        by the quota are fetched and yielded, then an ExternalEndpointFailure is raised.
 
+        :param query_string: the query string to send to the Scopus API
+        :return: A generator of the entries
+        """
+        pending_pages: deque[asyncio.Task] = deque()
         try:
-            async with aiohttp.ClientSession(
-                connector=aiohttp.TCPConnector(limit=None),
-                headers={"Accept": "application/xml"},
-            ) as session:
-                query = (
-                    f"{self.SCOPUS_URL}?{query_string}&apiKey={self.settings.scopus_api_key}"
-                    f"&insttoken={self.settings.scopus_inst_token}&view=COMPLETE&start={start}"
-                )
-                async with session.get(query) as resp:
-                    if resp.status == 200:
-                        xml = await resp.text()
-                        root = ET.fromstring(xml)
-                        count = root.find(
-                            "opensearch:totalResults", self.NAMESPACE
-                        ).text
-                        if int(count) == 0:
-                            yield
-                        else:
-                            for doc in root.findall(".//default:entry", self.NAMESPACE):
-                                yield doc
-
-                        # If there are more than 25 results, fetch the next 25 asynchrounously
-                        # as is the limit of the Scopus API
-                        if int(count) > start + 25:
-                            async for doc in self.fetch(query_string, start=start + 25):
-                                yield doc
-                    else:
-                        raise ExternalEndpointFailure(
-                            f"Error code from Scopus API for request: {query_string} "
-                            f"With code {resp.status}"
+            session = HttpSessionsPool().get_session(self.SCOPUS_URL)
+            total_results, entries, remaining_quota = await self._fetch_page(
+                session, query_string, 0
+            )
+            starts = range(self.PAGE_SIZE, total_results, self.PAGE_SIZE)
+            allowed_pages_count = self._allowed_pages_count(
+                query_string, len(starts), remaining_quota
+            )
+            for entry in entries:
+                yield entry
+            next_starts = iter(starts[:allowed_pages_count])
+            concurrency = self.settings.scopus_api_concurrency
+            while True:
+                for start in itertools.islice(
+                    next_starts, concurrency - len(pending_pages)
+                ):
+                    pending_pages.append(
+                        asyncio.create_task(
+                            self._fetch_page(session, query_string, start)
                         )
-
+                    )
+                if not pending_pages:
+                    break
+                _, entries, _ = await pending_pages.popleft()
+                for entry in entries:
+                    yield entry
+            if allowed_pages_count < len(starts):
+                raise ExternalEndpointFailure(
+                    f"Scopus API quota exceeded for request: {query_string} "
+                    f"({len(starts) - allowed_pages_count} pages of results not fetched)"
+                )
         except aiohttp.ClientConnectionError as error:
             raise ExternalEndpointFailure(
                 f"Cant connect to Scopus API for request: {query_string} with error {error}"
             ) from error
+        finally:
+            for page in pending_pages:
+                page.cancel()
+
+    async def _fetch_page(
+        self, session: aiohttp.ClientSession, query_string: str, start: int
+    ) -> tuple[int, list[ET.Element], int | None]:
+        """
+        Fetch a page of results from the Scopus API,
+        parsing the entries as the response is received
+
+        :param session: the aiohttp session
+        :param query_string: the query string to send to the Scopus API
+        :param start: the offset of the page
+        :return: the total number of results, the entries of the page
+            and the number of requests left in the API quota, if known
+        """
+        query = (
+            f"{self.SCOPUS_URL}?{query_string}&apiKey={self.settings.scopus_api_key}"
+            f"&insttoken={self.settings.scopus_inst_token}&view=COMPLETE&start={start}"
+        )
+        async with session.get(query, headers={"Accept": "application/xml"}) as resp:
+            if resp.status != 200:
+                raise ExternalEndpointFailure(
+                    f"Error code from Scopus API for request: {query_string} "
+                    f"With code {resp.status}"
+                    f"{self._quota_reset_message(resp.headers)}"
+                )
+            remaining_quota = resp.headers.get("X-RateLimit-Remaining")
+            total_results, entries = await self._read_entries(resp, query_string)
+        return (
+            total_results,
+            entries,
+            int(remaining_quota) if remaining_quota is not None else None,
+        )
+
+    async def _read_entries(
+        self, resp: aiohttp.ClientResponse, query_string: str
+    ) -> tuple[int, list[ET.Element]]:
+        """
+        Parse the entries of a page as its chunks are received.
+        The page is parsed in the event loop rather than by the parsing service
+        processes, as the state of the pull parser cannot be sent to them :
+        the event loop is given back after each chunk, so that it is never blocked
+        for more than the parsing of READ_CHUNK_SIZE bytes.
+
+        :param resp: the response of the Scopus API
+        :param query_string: the query string sent to the Scopus API
+        :return: the total number of results and the entries of the page
+        """
+        parser = ET.XMLPullParser(events=("start", "end"))
+        page = {"depth": 0, "root": None, "total_results": 0, "entries": []}
+        try:
+            async for chunk in resp.content.iter_chunked(self.READ_CHUNK_SIZE):
+                parser.feed(chunk)
+                self._read_events(parser, page)
+                # the chunks already buffered are read without suspension
+                await asyncio.sleep(0)
+            parser.close()
+            self._read_events(parser, page)
+        except ET.ParseError as error:
+            raise UnexpectedFormatException(
+                f"Unexpected format in Scopus response for request: {query_string} "
+                f"with error {error}"
+            ) from error
+        return page["total_results"], page["entries"]
+
+    def _read_events(self, parser: ET.XMLPullParser, page: dict) -> None:
+        for event, element in parser.read_events():
+            if event == "start":
+                page["depth"] += 1
+                if page["root"] is None:
+                    page["root"] = element
+                continue
+            page["depth"] -= 1
+            if page["depth"] != 1:
+                continue
+            if element.tag == self.ENTRY_TAG:
+                page["entries"].append(element)
+                # entries are detached from the feed as soon as they are complete
+                page["root"].remove(element)
+            elif element.tag == self.TOTAL_RESULTS_TAG:
+                page["total_results"] = int(element.text or 0)
+
+    def _allowed_pages_count(
+        self, query_string: str, pages_count: int, remaining_quota: int | None
+    ) -> int:
+        if remaining_quota is None or remaining_quota >= pages_count:
+            return pages_count
+        logger.error(
+            f"Scopus API quota too low for request {query_string}: "
+            f"{pages_count} pages to fetch, {remaining_quota} requests left, "
+            "the results will be truncated"
+        )
+        return max(remaining_quota, 0)
+
+    @staticmethod
+    def _quota_reset_message(headers) -> str:
+        reset = headers.get("X-RateLimit-Reset")
+        if reset is None:
+            return ""
+        return f", quota resets at timestamp {reset}"
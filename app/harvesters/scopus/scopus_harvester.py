@@ -57,8 +57,6 @@ class ScopusHarvester(AbstractHarvester):
 
         builder.set_query(identifier_type, identifier_value)
         async for doc in ScopusClient().fetch(builder.build()):
-            if doc is None:
-                continue
             source_identifier = doc.find(
                 "dc:identifier", ScopusClient.NAMESPACE
             ).text.split(":")[-1]
@@ -155,10 +155,12 @@ class ScopusReferencesConverter(AbstractReferencesConverter):
     async def _concepts(self, entry: Element):
         concepts = self._get_element(entry, "default:authkeywords")
         if concepts is not None:
-            for concept in concepts.text.split(" | "):
-                concept_db = await self._get_or_create_concept_by_label(
+            for concept_db in await self._get_or_create_concepts(
+                [
                     ConceptInformations(label=concept)
-                )
+                    for concept in concepts.text.split(" | ")
+                ]
+            ):
                 yield concept_db
 
     def _get_affiliation(self, entry: Element):
@@ -0,0 +1,125 @@
+import asyncio
+from urllib.parse import urlparse
+
+import aiohttp
+from loguru import logger
+
+from app.config import get_app_settings
+
+
+class HttpSessionsPool:
+    """
+    Singleton for the aiohttp sessions to external APIs
+
+    One session, and thus one keep-alive connection pool, is kept per remote host,
+    so that TCP connections and TLS handshakes are reused across requests,
+    harvestings and retrievals.
+    """
+
+    _instance = None
+
+    def __new__(cls, *args, **kwargs):
+        if not cls._instance:
+            cls._instance = super().__new__(cls, *args, **kwargs)
+        return cls._instance
+
+    def __init__(self):
+        if not hasattr(self, "sessions"):
+            logger.info("Instanciating HttpSessionsPool Singleton")
+            self.sessions: dict[
+                str, tuple[asyncio.AbstractEventLoop, aiohttp.ClientSession]
+            ] = {}
+
+    @staticmethod
+    def host(url: str) -> str:
+        """
+        Get the host (with port, if any) of an URL
+
+        :param url: the URL
+        :return: the host
+        """
+        return urlparse(url).netloc
+
+    def get_session(self, url: str) -> aiohttp.ClientSession:
+        """
+        Get the shared session for the host of an URL.
+        The session must not be closed by the caller.
+
+        :param url: the URL that will be requested
+        :return: the session for the host of the URL
+        """
+        host = self.host(url)
+        loop = asyncio.get_running_loop()
+        if host in self.sessions:
+            session_loop, session = self.sessions[host]
+            # a session is bound to the event loop it has been created in
+            if session_loop is loop and not session.closed:
+                return session
+        session = self._build_session(host)
+        self.sessions[host] = (loop, session)
+        return session
+
+    def get_connector(self, url: str) -> aiohttp.BaseConnector:
+        """
+        Get the shared connector for the host of an URL,
+        for clients that build their own session (e.g. SPARQL clients).
+        Such sessions must be created with connector_owner=False.
+
+        :param url: the URL that will be requested
+        :return: the connector for the host of the URL
+        """
+        return self.get_session(url).connector
+
+    def stats(self) -> dict:
+        """
+        Get the state of the connection pool of each host
+
+        :return: dict of pool stats by host
+        """
+        # pylint: disable=protected-access
+        stats = {}
+        for host, (_, session) in self.sessions.items():
+            connector = session.connector
+            if session.closed or connector is None:
+                continue
+            stats[host] = {
+                "limit_per_host": connector.limit_per_host,
+                "acquired": len(connector._acquired),
+                "idle": sum(len(conns) for conns in connector._conns.values()),
+                "timeout": session.timeout.total,
+            }
+        return stats
+
+    async def close(self) -> None:
+        """
+        Close all the sessions opened on the running event loop
+
+        :return: None
+        """
+        loop = asyncio.get_running_loop()
+        for host, (session_loop, session) in list(self.sessions.items()):
+            if session_loop is loop:
+                await session.close()
+            del self.sessions[host]
+
+    @staticmethod
+    def _build_session(host: str) -> aiohttp.ClientSession:
+        settings = get_app_settings()
+        limit_per_host = settings.http_limits_per_host.get(
+            host, settings.http_default_limit_per_host
+        )
+        timeout = settings.http_timeouts_per_host.get(
+            host, settings.http_default_timeout
+        )
+        logger.debug(
+            f"Opening HTTP session to {host} "
+            f"with {limit_per_host} connections max and {timeout}s timeout"
+        )
+        return aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=0,
+                limit_per_host=limit_per_host,
+                keepalive_timeout=settings.http_keepalive_timeout,
+            ),
+            timeout=aiohttp.ClientTimeout(total=float(timeout)),
+        )
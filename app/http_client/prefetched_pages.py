@@ -0,0 +1,32 @@
+import asyncio
+from typing import Any, AsyncGenerator, Callable, Coroutine
+
+
+async def prefetched_pages(
+    first_page: Coroutine,
+    next_page: Callable[[Any], Coroutine | None],
+) -> AsyncGenerator[Any, None]:
+    """
+    Iterate over the pages of a paginated API,
+    the next page being requested while the current one is processed.
+    The pending request is cancelled and awaited if the iteration stops early.
+
+    :param first_page: the coroutine fetching the first page
+    :param next_page: function returning the coroutine fetching the page
+        following the given one, or None after the last page
+    :return: A generator of the pages
+    """
+    pending_page: asyncio.Task | None = asyncio.create_task(first_page)
+    try:
+        while pending_page is not None:
+            page = await pending_page
+            pending_page = None
+            following_page = next_page(page)
+            if following_page is not None:
+                pending_page = asyncio.create_task(following_page)
+            yield page
+    finally:
+        if pending_page is not None:
+            pending_page.cancel()
+            # the cancellation, or the failure of the request, is retrieved
+            await asyncio.gather(pending_page, return_exceptions=True)
@@ -0,0 +1,40 @@
+from abc import ABC, abstractmethod
+from typing import Any
+
+
+class AbstractCacheCodec(ABC):
+    """
+    Abstract class for the codecs of the values stored in the third party API cache
+    """
+
+    # one byte identifying the codec of a cache entry
+    TAG: bytes
+    # to be incremented when the encoding changes : older entries are then ignored
+    VERSION: int
+
+    @abstractmethod
+    def accepts(self, value: Any) -> bool:
+        """
+        Check if the codec can encode the value
+
+        :param value: value to store in the cache
+        :return: True if the codec can encode the value
+        """
+
+    @abstractmethod
+    def encode(self, value: Any) -> bytes:
+        """
+        Encode a value to be stored in the cache
+
+        :param value: value to store in the cache
+        :return: the encoded value
+        """
+
+    @abstractmethod
+    async def decode(self, data: bytes) -> Any:
+        """
+        Decode a value from the cache
+
+        :param data: the encoded value
+        :return: the value
+        """
@@ -0,0 +1,8 @@
+class CacheCodecError(Exception):
+    """
+    Exception raised when a value from the cache cannot be decoded
+    """
+
+    def __init__(self, message: str) -> None:
+        """Initialize the exception."""
+        super().__init__(message)
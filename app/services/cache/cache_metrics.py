@@ -0,0 +1,153 @@
+import bisect
+
+
+class CacheMetrics:
+    """
+    Singleton collecting the usage metrics of the third party API cache, by namespace
+    """
+
+    # upper bounds of the latency histograms buckets, in milliseconds
+    LATENCY_BUCKETS_MS = [1, 2, 5, 10, 25, 50, 100, 250, 500, 1000]
+
+    COUNTERS = [
+        "hits",
+        "local_hits",
+        "stale_hits",
+        "misses",
+        "errors",
+        "bytes_read",
+        "bytes_written",
+    ]
+
+    OPERATIONS = ["get", "set"]
+
+    _instance = None
+
+    def __new__(cls, *args, **kwargs):
+        if not cls._instance:
+            cls._instance = super().__new__(cls, *args, **kwargs)
+        return cls._instance
+
+    def __init__(self):
+        if not hasattr(self, "namespaces"):
+            self.namespaces: dict[str, dict] = {}
+
+    def record_hit(
+        self, api_name: str, size: int = 0, local: bool = False, stale: bool = False
+    ) -> None:
+        """
+        Record a value found in the cache
+
+        :param api_name: namespace of the value
+        :param size: size of the serialized value read from Redis, in bytes
+        :param local: whether the value was found in the per-process cache
+        :param stale: whether the value was stale
+        :return: None
+        """
+        metrics = self._namespace(api_name)
+        metrics["hits"] += 1
+        metrics["local_hits"] += int(local)
+        metrics["stale_hits"] += int(stale)
+        metrics["bytes_read"] += size
+
+    def record_miss(self, api_name: str, count: int = 1) -> None:
+        """
+        Record values not found in the cache
+
+        :param api_name: namespace of the values
+        :param count: number of values not found
+        :return: None
+        """
+        self._namespace(api_name)["misses"] += count
+
+    def record_error(self, api_name: str, count: int = 1) -> None:
+        """
+        Record cache errors : Redis unavailable, values that cannot be encoded or decoded
+
+        :param api_name: namespace of the values
+        :param count: number of errors
+        :return: None
+        """
+        self._namespace(api_name)["errors"] += count
+
+    def record_write(self, api_name: str, size: int) -> None:
+        """
+        Record a value written to Redis
+
+        :param api_name: namespace of the value
+        :param size: size of the serialized value, in bytes
+        :return: None
+        """
+        self._namespace(api_name)["bytes_written"] += size
+
+    def observe_latency(self, api_name: str, operation: str, duration: float) -> None:
+        """
+        Record the latency of a Redis operation
+
+        :param api_name: namespace of the operation
+        :param operation: "get" or "set"
+        :param duration: duration of the operation, in seconds
+        :return: None
+        """
+        histogram = self._namespace(api_name)[f"{operation}_latency"]
+        duration_ms = duration * 1000
+        histogram["buckets"][
+            bisect.bisect_left(self.LATENCY_BUCKETS_MS, duration_ms)
+        ] += 1
+        histogram["count"] += 1
+        histogram["sum_ms"] += duration_ms
+
+    def stats(self) -> dict:
+        """
+        :return: the counters and the latency histograms by namespace,
+            with cumulative buckets counts by upper bound
+        """
+        return {
+            api_name: {
+                **{counter: metrics[counter] for counter in self.COUNTERS},
+                **{
+                    f"{operation}_latency": self._histogram_stats(
+                        metrics[f"{operation}_latency"]
+                    )
+                    for operation in self.OPERATIONS
+                },
+            }
+            for api_name, metrics in self.namespaces.items()
+        }
+
+    def reset(self) -> None:
+        """
+        Reset all the metrics
+
+        :return: None
+        """
+        self.namespaces = {}
+
+    def _namespace(self, api_name: str) -> dict:
+        if api_name not in self.namespaces:
+            self.namespaces[api_name] = {
+                **{counter: 0 for counter in self.COUNTERS},
+                **{
+                    f"{operation}_latency": {
+                        "buckets": [0] * (len(self.LATENCY_BUCKETS_MS) + 1),
+                        "count": 0,
+                        "sum_ms": 0.0,
+                    }
+                    for operation in self.OPERATIONS
+                },
+            }
+        return self.namespaces[api_name]
+
+    def _histogram_stats(self, histogram: dict) -> dict:
+        buckets = {}
+        cumulative_count = 0
+        for upper_bound, count in zip(
+            [*self.LATENCY_BUCKETS_MS, "+Inf"], histogram["buckets"]
+        ):
+            cumulative_count += count
+            buckets[str(upper_bound)] = cumulative_count
+        return {
+            "count": histogram["count"],
+            "sum_ms": round(histogram["sum_ms"], 3),
+            "buckets": buckets,
+        }
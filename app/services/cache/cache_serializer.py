@@ -0,0 +1,129 @@
+import json
+import pickle
+import struct
+import zlib
+from typing import Any
+
+from loguru import logger
+
+from app.config import get_app_settings
+from app.services.cache.abstract_cache_codec import AbstractCacheCodec
+from app.services.cache.cache_codec_error import CacheCodecError
+from app.services.cache.json_cache_codec import JsonCacheCodec
+from app.services.cache.pickle_cache_codec import PickleCacheCodec
+from app.services.cache.rdf_graph_cache_codec import RdfGraphCacheCodec
+from app.services.cache.xml_cache_codec import XmlCacheCodec
+
+
+class CacheSerializer:
+    """
+    Serializer for the values of the third party API cache :
+    values are encoded with the first codec that accepts them, then compressed,
+    and prefixed with the tag and version of the codec.
+    Entries may be stamped with the time until which they are fresh.
+    """
+
+    CODECS: list[AbstractCacheCodec] = [
+        RdfGraphCacheCodec(),
+        XmlCacheCodec(),
+        JsonCacheCodec(),
+        PickleCacheCodec(),
+    ]
+
+    # first byte of the entries pickled before the introduction of the codecs
+    LEGACY_PICKLE_PREFIX = b"\x80"
+
+    # first byte of the entries stamped with their freshness limit,
+    # followed by the limit as unsigned 64 bits timestamp in seconds
+    FRESHNESS_STAMP_PREFIX = b"S"
+    FRESHNESS_STAMP_FORMAT = ">Q"
+
+    def dumps(self, value: Any, fresh_until: float | None = None) -> bytes:
+        """
+        Serialize a value to be stored in the cache
+
+        :param value: the value to store
+        :param fresh_until: timestamp until which the value is fresh, if any
+        :return: the serialized value
+        """
+        if fresh_until is not None:
+            return (
+                self.FRESHNESS_STAMP_PREFIX
+                + struct.pack(self.FRESHNESS_STAMP_FORMAT, int(fresh_until))
+                + self.dumps(value)
+            )
+        level = get_app_settings().third_api_cache_compression_level
+        for codec in self.CODECS:
+            if not codec.accepts(value):
+                continue
+            try:
+                encoded_value = codec.encode(value)
+            except (TypeError, ValueError) as error:
+                # e.g. dicts with values that are not JSON serializable,
+                # the next codec is tried
+                logger.warning(
+                    f"Cache codec {codec.__class__.__name__} cannot encode "
+                    f"{type(value)}, trying the next codec : {error}"
+                )
+                continue
+            return (
+                codec.TAG + bytes([codec.VERSION]) + zlib.compress(encoded_value, level)
+            )
+        raise CacheCodecError(f"No cache codec for {type(value)}")
+
+    async def loads(self, data: bytes) -> Any:
+        """
+        Deserialize a value from the cache
+
+        :param data: the serialized value
+        :return: the value
+        :raises CacheCodecError: if the value cannot be decoded by the current codecs
+        """
+        value, _ = await self.loads_entry(data)
+        return value
+
+    async def loads_entry(self, data: bytes) -> tuple[Any, float | None]:
+        """
+        Deserialize a value from the cache with its freshness limit
+
+        :param data: the serialized value
+        :return: the value and the timestamp until which it is fresh,
+            None if the entry is not stamped
+        :raises CacheCodecError: if the value cannot be decoded by the current codecs
+        """
+        fresh_until = None
+        if data[:1] == self.FRESHNESS_STAMP_PREFIX:
+            stamp_length = struct.calcsize(self.FRESHNESS_STAMP_FORMAT)
+            try:
+                (fresh_until,) = struct.unpack(
+                    self.FRESHNESS_STAMP_FORMAT, data[1 : 1 + stamp_length]
+                )
+            except struct.error as error:
+                raise CacheCodecError(f"Invalid cache entry : {error}") from error
+            data = data[1 + stamp_length :]
+        return await self._loads_value(data), fresh_until
+
+    async def _loads_value(self, data: bytes) -> Any:
+        try:
+            if data[:1] == self.LEGACY_PICKLE_PREFIX:
+                return pickle.loads(data)
+            codec = self._get_codec(data[:1])
+            if data[1] != codec.VERSION:
+                raise CacheCodecError(
+                    f"Cache entry encoded with version {data[1]} of codec "
+                    f"{codec.__class__.__name__}, current version is {codec.VERSION}"
+                )
+            return await codec.decode(zlib.decompress(data[2:]))
+        except (
+            zlib.error,
+            pickle.UnpicklingError,
+            json.JSONDecodeError,
+            IndexError,
+        ) as error:
+            raise CacheCodecError(f"Invalid cache entry : {error}") from error
+
+    def _get_codec(self, tag: bytes) -> AbstractCacheCodec:
+        for codec in self.CODECS:
+            if codec.TAG == tag:
+                return codec
+        raise CacheCodecError(f"Unknown cache codec tag {tag}")
@@ -0,0 +1,79 @@
+from typing import Any, Hashable
+
+from app.config import get_app_settings
+from app.services.cache.local_lru_cache import LocalLruCache
+
+
+class EntityCache:
+    """
+    Cache of the entities resolved by the references converters
+    (journals, issues, books, organizations, document types) by natural key,
+    for the duration of a retrieval or, if enabled, shared by the whole process.
+
+    The entities are detached instances whose columns are all loaded
+    (sessions do not expire them on commit) : they can be read without database access
+    and are merged into the session of the references that use them.
+    """
+
+    _process_instance = None
+
+    def __init__(self, max_entries: int, ttl: float):
+        """
+        :param max_entries: maximum number of entities kept in the cache
+        :param ttl: time to live of the entities, in seconds
+        """
+        self.ttl = ttl
+        self.entries = LocalLruCache(max_entries=max_entries)
+
+    @classmethod
+    def for_converter(cls) -> "EntityCache":
+        """
+        :return: the cache shared by the process if enabled,
+            a new cache for the converters of a retrieval otherwise
+        """
+        settings = get_app_settings()
+        if not settings.converter_entity_cache_process_wide:
+            return cls(
+                max_entries=settings.converter_entity_cache_max_entries,
+                ttl=settings.converter_entity_cache_ttl,
+            )
+        if cls._process_instance is None:
+            cls._process_instance = cls(
+                max_entries=settings.converter_entity_cache_max_entries,
+                ttl=settings.converter_entity_cache_ttl,
+            )
+        return cls._process_instance
+
+    def get(self, namespace: str, key: Hashable) -> Any | None:
+        """
+        Get an entity from the cache
+
+        :param namespace: kind of entity, e.g. "journal"
+        :param key: natural key of the entity
+        :return: the entity or None if not cached
+        """
+        _, entity = self.entries.get(self._key(namespace, key))
+        return entity
+
+    def set(self, namespace: str, key: Hashable, entity: Any) -> None:
+        """
+        Add an entity to the cache
+
+        :param namespace: kind of entity, e.g. "journal"
+        :param key: natural key of the entity
+        :param entity: the entity, with an id
+        :return: None
+        """
+        if entity is None:
+            return
+        self.entries.set(self._key(namespace, key), entity, self.ttl)
+
+    def stats(self) -> dict:
+        """
+        :return: the number of entries, hits and misses of the cache
+        """
+        return self.entries.stats()
+
+    @staticmethod
+    def _key(namespace: str, key: Hashable) -> str:
+        return f"{namespace}:{key!r}"
@@ -0,0 +1,22 @@
+import json
+from typing import Any
+
+from app.services.cache.abstract_cache_codec import AbstractCacheCodec
+
+
+class JsonCacheCodec(AbstractCacheCodec):
+    """
+    Codec for JSON-like values (dicts and lists)
+    """
+
+    TAG = b"J"
+    VERSION = 1
+
+    def accepts(self, value: Any) -> bool:
+        return isinstance(value, (dict, list))
+
+    def encode(self, value: dict | list) -> bytes:
+        return json.dumps(value, ensure_ascii=False).encode("utf-8")
+
+    async def decode(self, data: bytes) -> dict | list:
+        return json.loads(data)
@@ -0,0 +1,69 @@
+import time
+from collections import OrderedDict
+from typing import Any
+
+
+class LocalLruCache:
+    """
+    Size-bounded in-process cache with time to live,
+    evicting the least recently used entries first
+    """
+
+    def __init__(self, max_entries: int):
+        """
+        :param max_entries: maximum number of entries kept in the cache
+        """
+        self.max_entries = max_entries
+        self.entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> tuple[bool, Any]:
+        """
+        Get a value from the cache
+
+        :param key: key of the value
+        :return: a (found, value) tuple
+        """
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return False, None
+        expiration, value = entry
+        if expiration <= time.monotonic():
+            del self.entries[key]
+            self.misses += 1
+            return False, None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return True, value
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        """
+        Set a value in the cache
+
+        :param key: key of the value
+        :param value: the value
+        :param ttl: time to live of the value, in seconds
+        :return: None
+        """
+        self.entries[key] = (time.monotonic() + ttl, value)
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """
+        Remove all entries and reset the counters
+
+        :return: None
+        """
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> dict:
+        """
+        :return: the number of entries, hits and misses of the cache
+        """
+        return {"entries": len(self.entries), "hits": self.hits, "misses": self.misses}
@@ -0,0 +1,22 @@
+import pickle
+from typing import Any
+
+from app.services.cache.abstract_cache_codec import AbstractCacheCodec
+
+
+class PickleCacheCodec(AbstractCacheCodec):
+    """
+    Fallback codec for the values that no other codec can encode
+    """
+
+    TAG = b"P"
+    VERSION = 1
+
+    def accepts(self, value: Any) -> bool:
+        return True
+
+    def encode(self, value: Any) -> bytes:
+        return pickle.dumps(value)
+
+    async def decode(self, data: bytes) -> Any:
+        return pickle.loads(data)
@@ -0,0 +1,56 @@
+from typing import Any
+
+from rdflib import Graph, URIRef
+from rdflib.term import Node
+
+from app.services.cache.abstract_cache_codec import AbstractCacheCodec
+from app.services.parsing.parsing_service import ParsingService
+
+
+class RdfGraphCacheCodec(AbstractCacheCodec):
+    """
+    Codec for rdflib graphs, stored as N-Triples.
+    N-Triples cannot represent relative IRIs (e.g. rdf:resource="eng" in Sudoc RDF) :
+    they are stored under a reserved IRI scheme, and restored when decoded.
+    """
+
+    TAG = b"G"
+    VERSION = 1
+
+    RELATIVE_IRI_PREFIX = "urn:x-svp-relative-iri:"
+
+    def accepts(self, value: Any) -> bool:
+        return isinstance(value, Graph)
+
+    def encode(self, value: Graph) -> bytes:
+        if any(self._is_relative(node) for triple in value for node in triple):
+            graph = Graph()
+            for triple in value:
+                graph.add(tuple(self._absolute(node) for node in triple))
+            value = graph
+        return value.serialize(format="nt", encoding="utf-8")
+
+    async def decode(self, data: bytes) -> Graph:
+        graph = await ParsingService().parse_rdf(
+            data.decode("utf-8"), output_format="nt"
+        )
+        if self.RELATIVE_IRI_PREFIX.encode("utf-8") not in data:
+            return graph
+        restored_graph = Graph()
+        for triple in graph:
+            restored_graph.add(tuple(self._relative(node) for node in triple))
+        return restored_graph
+
+    @staticmethod
+    def _is_relative(node: Node) -> bool:
+        return isinstance(node, URIRef) and ":" not in node
+
+    def _absolute(self, node: Node) -> Node:
+        if self._is_relative(node):
+            return URIRef(self.RELATIVE_IRI_PREFIX + node)
+        return node
+
+    def _relative(self, node: Node) -> Node:
+        if isinstance(node, URIRef) and node.startswith(self.RELATIVE_IRI_PREFIX):
+            return URIRef(node[len(self.RELATIVE_IRI_PREFIX) :])
+        return node
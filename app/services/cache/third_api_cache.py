@@ -1,48 +1,105 @@
-import pickle
-from typing import Any
+import asyncio
+import time
+from typing import Any, Awaitable, Callable
 
 import aioredis
 from loguru import logger
 
 from app.config import get_app_settings
 from app.redis.redis_pool import RedisPool
+from app.services.cache.cache_codec_error import CacheCodecError
+from app.services.cache.cache_metrics import CacheMetrics
+from app.services.cache.cache_serializer import CacheSerializer
+from app.services.cache.local_lru_cache import LocalLruCache
+from app.services.parsing.parsing_error import ParsingError
 
 
 class ThirdApiCache:
     """
     Cache provider with time to live for third party API results
+
+    Values are stored in Redis and, if enabled, in a per-process LRU cache
+    that serves the hot keys without Redis round trip nor deserialization.
+
+    Values are fresh during the caching duration of their API, then stale
+    during the stale-while-revalidate duration : stale values are still served
+    to the callers that provide a way to refresh them in the background.
+    Concurrent fetches of the same value are coalesced within the process.
+
+    Failures recorded with set_failure are returned as CachedFailure values
+    by all the getters, for the caller to raise their error.
     """
 
+    class CachedFailure:
+        """
+        Negative cache entry, remembering that a value could not be fetched
+        """
+
+        def __init__(self, error: Exception):
+            self.error_class = type(error)
+            self.message = str(error)
+
+        def error(self) -> Exception:
+            """
+            :return: a new instance of the exception raised when fetching the value
+            """
+            return self.error_class(self.message)
+
+    _local_cache: LocalLruCache | None = None
+
+    # fetches in progress, by cache key
+    _in_flight: dict[str, asyncio.Task] = {}
+
+    # background refreshes of stale values, by cache key
+    _refreshes: dict[str, asyncio.Task] = {}
+
     @staticmethod
-    async def get(api_name: str, key: str) -> Any:
+    async def get(
+        api_name: str, key: str, fetch: Callable[[], Awaitable[Any]] | None = None
+    ) -> Any:
         """
         Get a value from the cache
         :param api_name: name of the API, used as a prefix for the key
             and to retrieve the caching duration from settings
         :param key: key to retrieve the value from the cache
-        :return: an unmarshalled value from the cache, or None if not found
+        :param fetch: function returning the coroutine fetching the value,
+            to refresh it in the background if it is stale.
+            Without it, stale values are not served.
+        :return: an unmarshalled value from the cache, or None if not found.
+            For the keys recorded with set_failure, the value is a CachedFailure
         """
+        local_cache = ThirdApiCache.local_cache()
+        if local_cache is not None:
+            found, value = local_cache.get(ThirdApiCache.cache_key(api_name, key))
+            if found:
+                CacheMetrics().record_hit(api_name, local=True)
+                return value
         settings = get_app_settings()
         if not settings.third_api_caching_enabled:
             return None
         try:
+            start = time.perf_counter()
             async with RedisPool().get_connection() as conn:
-                value = await conn.get(name=f"{api_name}:{key}")
-                if value:
-                    try:
-                        return pickle.loads(value)
-                    except pickle.UnpicklingError:
-                        logger.error(
-                            f"Cannot unpickle value from Redis for {api_name}:{key}, "
-                            f"will not use it"
-                        )
-                        return None
+                serialized_value = await conn.get(
+                    name=ThirdApiCache.cache_key(api_name, key)
+                )
+            CacheMetrics().observe_latency(api_name, "get", time.perf_counter() - start)
         except aioredis.exceptions.ConnectionError as e:
+            CacheMetrics().record_error(api_name)
             logger.error(
                 f"Cannot connect to Redis cache (with error {e}),"
                 f"aborting cache retrieval for {api_name}:{key}"
             )
             return None
+        if not serialized_value:
+            CacheMetrics().record_miss(api_name)
+            return None
+        value, stale = await ThirdApiCache._decode(api_name, key, serialized_value)
+        if stale:
+            if fetch is None:
+                return None
+            ThirdApiCache.refresh(api_name, key, fetch)
+        return value
 
     @staticmethod
     async def set(api_name: str, key: str, value: Any) -> None:
@@ -52,14 +109,324 @@ class ThirdApiCache:
         :param api_name: name of the API, used as a prefix for the key
             and to retrieve the caching duration from settings
         :param key: key to store the value in the cache
-        :param value: value to store in the cache (must be pickle-able)
+        :param value: value to store in the cache (rdflib graph, XML element,
+            JSON-like value or any pickle-able value)
         :return: None
         """
         settings = get_app_settings()
+        caching_duration = ThirdApiCache._caching_duration(api_name)
+        local_cache = ThirdApiCache.local_cache()
+        if local_cache is not None:
+            local_cache.set(
+                ThirdApiCache.cache_key(api_name, key), value, caching_duration
+            )
         if not settings.third_api_caching_enabled:
             return None
         try:
-            expiration_time = getattr(settings, f"{api_name}_caching_duration")
+            serialized_value = CacheSerializer().dumps(
+                value, fresh_until=time.time() + caching_duration
+            )
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            CacheMetrics().record_error(api_name)
+            logger.error(
+                f"Cannot serialize value to Redis for {api_name}:{key}, "
+                f"will not cache it : {error}"
+            )
+            return
+        try:
+            start = time.perf_counter()
+            async with RedisPool().get_connection() as conn:
+                await conn.set(
+                    name=ThirdApiCache.cache_key(api_name, key),
+                    value=serialized_value,
+                    ex=caching_duration
+                    + settings.third_api_stale_while_revalidate_duration,
+                )
+            CacheMetrics().observe_latency(api_name, "set", time.perf_counter() - start)
+        except aioredis.exceptions.ConnectionError as e:
+            CacheMetrics().record_error(api_name)
+            logger.error(
+                f"Cannot connect to Redis cache (with error {e}),"
+                f"aborting cache storage for {api_name}:{key}"
+            )
+            return
+        CacheMetrics().record_write(api_name, len(serialized_value))
+
+    @staticmethod
+    async def get_many(api_name: str, keys: list[str]) -> dict[str, Any]:
+        """
+        Get several values of the same API from the cache, in one Redis round trip
+
+        :param api_name: name of the API, used as a prefix for the keys
+        :param keys: keys to retrieve the values from the cache
+        :return: the fresh values found in the cache by key,
+            the missing or stale keys being absent.
+            For the keys recorded with set_failure, the value is a CachedFailure
+        """
+        return {
+            key: value
+            for key, (value, stale) in (
+                await ThirdApiCache.lookup_many(api_name, keys)
+            ).items()
+            if not stale
+        }
+
+    @staticmethod
+    async def lookup_many(
+        api_name: str, keys: list[str]
+    ) -> dict[str, tuple[Any, bool]]:
+        """
+        Get several values of the same API from the cache with their freshness,
+        in one Redis round trip
+
+        :param api_name: name of the API, used as a prefix for the keys
+        :param keys: keys to retrieve the values from the cache
+        :return: (value, stale) tuples found in the cache by key,
+            the missing keys being absent.
+            For the keys recorded with set_failure, the value is a CachedFailure
+        """
+        entries = {}
+        local_cache = ThirdApiCache.local_cache()
+        if local_cache is not None:
+            for key in keys:
+                found, value = local_cache.get(ThirdApiCache.cache_key(api_name, key))
+                if found:
+                    CacheMetrics().record_hit(api_name, local=True)
+                    # only fresh values are kept in the per-process cache
+                    entries[key] = (value, False)
+        remaining_keys = list(dict.fromkeys(key for key in keys if key not in entries))
+        settings = get_app_settings()
+        if not settings.third_api_caching_enabled or not remaining_keys:
+            return entries
+        try:
+            start = time.perf_counter()
+            async with RedisPool().get_connection() as conn:
+                serialized_values = await conn.mget(
+                    [ThirdApiCache.cache_key(api_name, key) for key in remaining_keys]
+                )
+            CacheMetrics().observe_latency(api_name, "get", time.perf_counter() - start)
+        except aioredis.exceptions.ConnectionError as e:
+            CacheMetrics().record_error(api_name, len(remaining_keys))
+            logger.error(
+                f"Cannot connect to Redis cache (with error {e}),"
+                f"aborting cache retrieval for {len(remaining_keys)} {api_name} keys"
+            )
+            return entries
+        for key, serialized_value in zip(remaining_keys, serialized_values):
+            if not serialized_value:
+                CacheMetrics().record_miss(api_name)
+                continue
+            value, stale = await ThirdApiCache._decode(api_name, key, serialized_value)
+            if value is not None:
+                entries[key] = (value, stale)
+        return entries
+
+    @staticmethod
+    async def set_many(api_name: str, values: dict[str, Any]) -> None:
+        """
+        Set several values of the same API in the cache, in one Redis round trip
+
+        :param api_name: name of the API, used as a prefix for the keys
+            and to retrieve the caching duration from settings
+        :param values: values to store in the cache by key
+        :return: None
+        """
+        settings = get_app_settings()
+        caching_duration = ThirdApiCache._caching_duration(api_name)
+        local_cache = ThirdApiCache.local_cache()
+        if local_cache is not None:
+            for key, value in values.items():
+                local_cache.set(
+                    ThirdApiCache.cache_key(api_name, key), value, caching_duration
+                )
+        if not settings.third_api_caching_enabled or not values:
+            return
+        fresh_until = time.time() + caching_duration
+        serialized_values = {}
+        for key, value in values.items():
+            try:
+                serialized_values[key] = CacheSerializer().dumps(
+                    value, fresh_until=fresh_until
+                )
+            except Exception as error:  # pylint: disable=broad-exception-caught
+                CacheMetrics().record_error(api_name)
+                logger.error(
+                    f"Cannot serialize value to Redis for {api_name}:{key}, "
+                    f"will not cache it : {error}"
+                )
+        try:
+            start = time.perf_counter()
+            async with RedisPool().get_connection() as conn:
+                async with conn.pipeline(transaction=False) as pipe:
+                    for key, serialized_value in serialized_values.items():
+                        pipe.set(
+                            name=ThirdApiCache.cache_key(api_name, key),
+                            value=serialized_value,
+                            ex=caching_duration
+                            + settings.third_api_stale_while_revalidate_duration,
+                        )
+                    await pipe.execute()
+            CacheMetrics().observe_latency(api_name, "set", time.perf_counter() - start)
+        except aioredis.exceptions.ConnectionError as e:
+            CacheMetrics().record_error(api_name, len(serialized_values))
+            logger.error(
+                f"Cannot connect to Redis cache (with error {e}),"
+                f"aborting cache storage for {len(serialized_values)} {api_name} keys"
+            )
+            return
+        for serialized_value in serialized_values.values():
+            CacheMetrics().record_write(api_name, len(serialized_value))
+
+    @staticmethod
+    async def coalesce(
+        api_name: str, key: str, fetch: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """
+        Fetch a value from the third party API, sharing the result
+        with the concurrent fetches of the same value within the process
+
+        :param api_name: name of the API, used as a prefix for the key
+        :param key: key of the value
+        :param fetch: function returning the fetching coroutine,
+            only called if no fetch of the same value is in progress
+        :return: the fetched value
+        """
+        cache_key = ThirdApiCache.cache_key(api_name, key)
+        task = ThirdApiCache._in_flight.get(cache_key)
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.ensure_future(fetch())
+            ThirdApiCache._in_flight[cache_key] = task
+            task.add_done_callback(
+                lambda done_task: ThirdApiCache._forget_task(
+                    ThirdApiCache._in_flight, cache_key, done_task
+                )
+            )
+        # the fetch is not cancelled if one of the waiting callers is cancelled
+        return await asyncio.shield(task)
+
+    @staticmethod
+    def refresh(api_name: str, key: str, fetch: Callable[[], Awaitable[Any]]) -> None:
+        """
+        Refresh a stale value in the background, unless it is already being refreshed.
+        If the refresh fails, the stale value is kept until it expires.
+
+        :param api_name: name of the API, used as a prefix for the key
+        :param key: key of the value
+        :param fetch: function returning the fetching coroutine
+        :return: None
+        """
+        cache_key = ThirdApiCache.cache_key(api_name, key)
+        task = ThirdApiCache._refreshes.get(cache_key)
+        if task is not None and task.get_loop() is asyncio.get_running_loop():
+            return
+        task = asyncio.create_task(ThirdApiCache._refresh(api_name, key, fetch))
+        ThirdApiCache._refreshes[cache_key] = task
+        task.add_done_callback(
+            lambda done_task: ThirdApiCache._forget_task(
+                ThirdApiCache._refreshes, cache_key, done_task
+            )
+        )
+
+    @staticmethod
+    def set_failure(api_name: str, key: str, error: Exception) -> None:
+        """
+        Remember in the local cache that a value could not be fetched
+        (not found, invalid, etc.), so that the getters return it as a CachedFailure
+        without querying the third party API until the negative caching duration expires
+
+        :param api_name: name of the API, used as a prefix for the key
+        :param key: key of the value that could not be fetched
+        :param error: the error raised when fetching the value
+        :return: None
+        """
+        local_cache = ThirdApiCache.local_cache()
+        if local_cache is not None:
+            local_cache.set(
+                ThirdApiCache.cache_key(api_name, key),
+                ThirdApiCache.CachedFailure(error),
+                get_app_settings().third_api_negative_caching_duration,
+            )
+
+    @staticmethod
+    def cache_key(api_name: str, key: str) -> str:
+        """
+        Build the key of a value in Redis and in the per-process cache
+
+        :param api_name: name of the API, used as a prefix for the key
+        :param key: key of the value within the API namespace
+        :return: the cache key
+        """
+        return f"{api_name}:{key}"
+
+    @staticmethod
+    def local_cache() -> LocalLruCache | None:
+        """
+        Get the per-process cache
+
+        :return: the per-process cache, or None if it is disabled
+        """
+        settings = get_app_settings()
+        if not settings.third_api_local_caching_enabled:
+            return None
+        if ThirdApiCache._local_cache is None:
+            ThirdApiCache._local_cache = LocalLruCache(
+                max_entries=settings.third_api_local_cache_max_entries
+            )
+        return ThirdApiCache._local_cache
+
+    @staticmethod
+    async def _refresh(
+        api_name: str, key: str, fetch: Callable[[], Awaitable[Any]]
+    ) -> None:
+        try:
+            value = await ThirdApiCache.coalesce(api_name, key, fetch)
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            logger.warning(
+                f"Cannot refresh stale value for {api_name}:{key}, "
+                f"will keep it until it expires : {error}"
+            )
+            return
+        await ThirdApiCache.set(api_name, key, value)
+
+    @staticmethod
+    def _forget_task(
+        tasks: dict[str, asyncio.Task], cache_key: str, task: asyncio.Task
+    ) -> None:
+        if tasks.get(cache_key) is task:
+            del tasks[cache_key]
+
+    @staticmethod
+    async def _decode(
+        api_name: str, key: str, serialized_value: bytes
+    ) -> tuple[Any, bool]:
+        try:
+            value, fresh_until = await CacheSerializer().loads_entry(serialized_value)
+        except (CacheCodecError, ParsingError) as error:
+            CacheMetrics().record_error(api_name)
+            logger.error(
+                f"Cannot decode value from Redis for {api_name}:{key}, "
+                f"will not use it : {error}"
+            )
+            return None, False
+        freshness = (
+            ThirdApiCache._caching_duration(api_name)
+            if fresh_until is None
+            else fresh_until - time.time()
+        )
+        stale = freshness <= 0
+        CacheMetrics().record_hit(api_name, size=len(serialized_value), stale=stale)
+        if stale:
+            return value, True
+        local_cache = ThirdApiCache.local_cache()
+        if local_cache is not None:
+            local_cache.set(ThirdApiCache.cache_key(api_name, key), value, freshness)
+        return value, False
+
+    @staticmethod
+    def _caching_duration(api_name: str) -> int:
+        settings = get_app_settings()
+        try:
+            return getattr(settings, f"{api_name}_caching_duration")
         except AttributeError:
             logger.error(
                 f"Cannot find caching duration for {api_name}, will use default value"
@@ -67,14 +434,4 @@ class ThirdApiCache:
                 f"or in uppercase {api_name.upper()}_CACHING_DURATION in environment variables"
                 f"to avoid this error in the future"
             )
-            expiration_time = settings.third_api_default_caching_duration
-        try:
-            serialized_value = pickle.dumps(value)
-        except pickle.PicklingError:
-            logger.error(
-                f"Cannot pickle value to Redis for {api_name}:{key}, will not cache it"
-            )
-            return
-        async with RedisPool().get_connection() as conn:
-            await conn.set(name=f"{api_name}:{key}", value=serialized_value)
-            await conn.expire(name=f"{api_name}:{key}", time=expiration_time)
+            return settings.third_api_default_caching_duration
@@ -0,0 +1,23 @@
+import xml.etree.ElementTree as ET
+from typing import Any
+
+from app.services.cache.abstract_cache_codec import AbstractCacheCodec
+from app.services.parsing.parsing_service import ParsingService
+
+
+class XmlCacheCodec(AbstractCacheCodec):
+    """
+    Codec for XML elements, stored as XML text
+    """
+
+    TAG = b"X"
+    VERSION = 1
+
+    def accepts(self, value: Any) -> bool:
+        return isinstance(value, ET.Element)
+
+    def encode(self, value: ET.Element) -> bytes:
+        return ET.tostring(value, encoding="unicode").encode("utf-8")
+
+    async def decode(self, data: bytes) -> ET.Element:
+        return await ParsingService().parse_xml(data.decode("utf-8"))
@@ -8,6 +8,7 @@ from rdflib import SKOS, Graph, term
 from rdflib.term import Node
 
 from app.db.models.concept import Concept as DbConcept
+from app.http_client.http_sessions_pool import HttpSessionsPool
 from app.services.concepts.concept_informations import ConceptInformations
 from app.services.concepts.concept_solver import ConceptSolver
 from app.services.concepts.dereferencing_error import DereferencingError
@@ -28,35 +29,36 @@ class RdfConceptSolver(ConceptSolver, ABC):
         """
         # pylint: disable=duplicate-code
         try:
-            async with aiohttp.ClientSession(
-                timeout=aiohttp.ClientTimeout(total=float(self.timeout))
-            ) as session:
-                async with session.get(concept_informations.url) as response:
-                    if not 200 <= response.status < 300:
-                        raise DereferencingError(
-                            f"Endpoint returned status {response.status}"
-                            f" while dereferencing RDF concept {concept_informations.uri}"
-                            f" at url {concept_informations.url}"
-                        )
-                    xml = (await response.text()).strip()
-                    concept_graph = Graph().parse(data=xml, format="xml")
-                    concept = DbConcept(uri=concept_informations.uri)
-
-                    self._add_labels(
-                        concept=concept,
-                        labels=list(
-                            self._pref_labels(concept_graph, concept_informations.uri)
-                        ),
-                        preferred=True,
-                    )
-                    self._add_labels(
-                        concept=concept,
-                        labels=list(
-                            self._alt_labels(concept_graph, concept_informations.uri)
-                        ),
-                        preferred=False,
+            session = HttpSessionsPool().get_session(concept_informations.url)
+            async with session.get(
+                concept_informations.url,
+                timeout=aiohttp.ClientTimeout(total=float(self.timeout)),
+            ) as response:
+                if not 200 <= response.status < 300:
+                    raise DereferencingError(
+                        f"Endpoint returned status {response.status}"
+                        f" while dereferencing RDF concept {concept_informations.uri}"
+                        f" at url {concept_informations.url}"
                     )
-                    return concept
+                xml = (await response.text()).strip()
+                concept_graph = Graph().parse(data=xml, format="xml")
+                concept = DbConcept(uri=concept_informations.uri)
+
+                self._add_labels(
+                    concept=concept,
+                    labels=list(
+                        self._pref_labels(concept_graph, concept_informations.uri)
+                    ),
+                    preferred=True,
+                )
+                self._add_labels(
+                    concept=concept,
+                    labels=list(
+                        self._alt_labels(concept_graph, concept_informations.uri)
+                    ),
+                    preferred=False,
+                )
+                return concept
         except aiohttp.ClientError as error:
             raise DereferencingError(
                 f"Endpoint failure while dereferencing {concept_informations.uri} "
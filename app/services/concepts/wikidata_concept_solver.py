@@ -8,6 +8,7 @@ from rdflib import Literal
 
 from app.db.models.concept import Concept as DbConcept
 from app.db.models.label import Label as DbLabel
+from app.http_client.http_sessions_pool import HttpSessionsPool
 from app.services.concepts.concept_informations import ConceptInformations
 from app.services.concepts.concept_solver import ConceptSolver
 from app.services.concepts.dereferencing_error import DereferencingError
@@ -25,50 +26,51 @@ class WikidataConceptSolver(ConceptSolver):
         :return: Concept
         """
         try:
-            async with aiohttp.ClientSession(
-                timeout=aiohttp.ClientTimeout(total=float(self.timeout))
-            ) as session:
-                async with session.get(concept_informations.url) as response:
-                    if not 200 <= response.status < 300:
-                        raise DereferencingError(
-                            f"Endpoint returned status {response.status} "
-                            f"while dereferencing Wikidata concept "
-                            f"{concept_informations.uri} "
-                            f"from url {concept_informations.url}"
-                        )
-                    json_response = await response.json()
-
-                    concept_data: json = json_response["entities"].get(
-                        concept_informations.code, None
+            session = HttpSessionsPool().get_session(concept_informations.url)
+            async with session.get(
+                concept_informations.url,
+                timeout=aiohttp.ClientTimeout(total=float(self.timeout)),
+            ) as response:
+                if not 200 <= response.status < 300:
+                    raise DereferencingError(
+                        f"Endpoint returned status {response.status} "
+                        f"while dereferencing Wikidata concept "
+                        f"{concept_informations.uri} "
+                        f"from url {concept_informations.url}"
                     )
-
-                    # If the code is not found, it may be a redirect,
-                    # so we take the only entity in the response
-                    if concept_data is None and len(json_response["entities"]) == 1:
-                        concept_data = list(json_response["entities"].values())[0]
-
-                    concept = DbConcept(uri=concept_informations.uri)
-
-                    self._add_labels(
-                        concept=concept,
-                        labels=[
-                            Literal(pair["value"], lang=pair["language"])
-                            for language_value_pairs in self._alt_labels(
-                                concept_data
-                            ).values()
-                            for pair in language_value_pairs
-                        ],
-                        preferred=False,
-                    )
-                    self._add_labels(
-                        concept=concept,
-                        labels=[
-                            Literal(pair["value"], lang=pair["language"])
-                            for pair in self._pref_labels(concept_data).values()
-                        ],
-                        preferred=True,
-                    )
-                    return concept
+                json_response = await response.json()
+
+                concept_data: json = json_response["entities"].get(
+                    concept_informations.code, None
+                )
+
+                # If the code is not found, it may be a redirect,
+                # so we take the only entity in the response
+                if concept_data is None and len(json_response["entities"]) == 1:
+                    concept_data = list(json_response["entities"].values())[0]
+
+                concept = DbConcept(uri=concept_informations.uri)
+
+                self._add_labels(
+                    concept=concept,
+                    labels=[
+                        Literal(pair["value"], lang=pair["language"])
+                        for language_value_pairs in self._alt_labels(
+                            concept_data
+                        ).values()
+                        for pair in language_value_pairs
+                    ],
+                    preferred=False,
+                )
+                self._add_labels(
+                    concept=concept,
+                    labels=[
+                        Literal(pair["value"], lang=pair["language"])
+                        for pair in self._pref_labels(concept_data).values()
+                    ],
+                    preferred=True,
+                )
+                return concept
 
         except aiohttp.ClientError as error:
             logger.error(
@@ -0,0 +1,98 @@
+import asyncio
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import AsyncIterator, Hashable, Iterable
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import get_app_settings
+
+
+class KeyedLocks:
+    """
+    Singleton registry of asyncio locks by natural key, so that concurrent
+    get-or-create of the same entity by the harvesters of a process are serialized
+    instead of colliding on the database unique constraints.
+    The locks may be extended to all the processes with PostgreSQL advisory locks.
+    """
+
+    _instance = None
+
+    def __new__(cls, *args, **kwargs):
+        if not cls._instance:
+            cls._instance = super().__new__(cls, *args, **kwargs)
+        return cls._instance
+
+    def __init__(self):
+        if not hasattr(self, "locks"):
+            # lock and number of coroutines holding or waiting for it, by key
+            self.locks: dict[tuple[str, Hashable], tuple[asyncio.Lock, int]] = {}
+
+    @asynccontextmanager
+    async def lock(self, namespace: str, key: Hashable) -> AsyncIterator[None]:
+        """
+        Hold the lock of a key
+
+        :param namespace: kind of entity, e.g. "journal"
+        :param key: natural key of the entity
+        :return: None
+        """
+        full_key = (namespace, key)
+        lock, users = self.locks.get(full_key, (None, 0))
+        if lock is None:
+            lock = asyncio.Lock()
+        self.locks[full_key] = (lock, users + 1)
+        try:
+            async with lock:
+                yield
+        finally:
+            lock, users = self.locks[full_key]
+            if users == 1:
+                del self.locks[full_key]
+            else:
+                self.locks[full_key] = (lock, users - 1)
+
+    @asynccontextmanager
+    async def lock_all(
+        self, namespace: str, keys: Iterable[Hashable]
+    ) -> AsyncIterator[None]:
+        """
+        Hold the locks of several keys, acquired in a consistent order
+        so that two coroutines locking overlapping keys cannot deadlock
+
+        :param namespace: kind of entities
+        :param keys: natural keys of the entities
+        :return: None
+        """
+        async with AsyncExitStack() as stack:
+            for key in self._sorted(keys):
+                await stack.enter_async_context(self.lock(namespace, key))
+            yield
+
+    async def advisory_lock(
+        self, session: AsyncSession, namespace: str, keys: Iterable[Hashable]
+    ) -> None:
+        """
+        If enabled, hold PostgreSQL advisory locks on keys until the end of the
+        current transaction of a session, to serialize get-or-create across processes
+
+        :param session: session whose transaction holds the locks
+        :param namespace: kind of entities
+        :param keys: natural keys of the entities
+        :return: None
+        """
+        if not get_app_settings().get_or_create_advisory_locks_enabled:
+            return
+        for key in self._sorted(keys):
+            await session.execute(
+                select(
+                    func.pg_advisory_xact_lock(
+                        func.hashtext(namespace), func.hashtext(repr(key))
+                    )
+                )
+            )
+
+    @staticmethod
+    def _sorted(keys: Iterable[Hashable]) -> list[Hashable]:
+        # keys may contain None values, that cannot be compared
+        return sorted(set(keys), key=repr)
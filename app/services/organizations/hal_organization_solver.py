@@ -2,6 +2,9 @@ import asyncio
 from typing import List
 
 import aiohttp
+from loguru import logger
+
+from app.config import get_app_settings
 from app.services.organizations.organization_data_class import OrganizationInformations
 
 from app.db.models.organization import Organization
@@ -11,6 +14,7 @@ from app.services.organizations import (  # pylint: disable=cyclic-import
     organization_factory,
 )
 from app.services.organizations.organization_solver import OrganizationSolver
+from app.http_client.http_sessions_pool import HttpSessionsPool
 
 
 # pylint: disable=duplicate-code
@@ -20,6 +24,10 @@ class HalOrganizationSolver(OrganizationSolver):
     """
 
     URL = "https://api.archives-ouvertes.fr/ref/structure/?q=docid:{}&wt=json&fl=*"
+    BATCH_URL = (
+        "https://api.archives-ouvertes.fr/ref/structure/"
+        "?q=docid:({})&wt=json&fl=*&rows={}"
+    )
 
     # values could be
     # "idref_s": "idref",
@@ -49,77 +57,122 @@ class HalOrganizationSolver(OrganizationSolver):
         :param organization_information.identifier: id of the organization
         :return: Organization
         """
+        data = await self._query(
+            self.URL.format(organization_information.identifier),
+            organization_information.identifier,
+        )
+        return await self._organization(
+            organization_information.identifier, data["response"]["docs"][0]
+        )
+
+    async def solve_many(self, identifiers: List[str]) -> dict[str, Organization]:
+        """
+        Solves organizations from their ids with a few queries to the HAL referential.
+        Organizations that cannot be solved are missing from the result.
+
+        :param identifiers: ids of the organizations
+        :return: the organizations by id
+        """
+        settings = get_app_settings()
+        batch_size = settings.hal_organizations_batch_size
+        semaphore = asyncio.Semaphore(settings.hal_organizations_parallelism)
+        organizations = {}
+        for batch_organizations in await asyncio.gather(
+            *[
+                self._solve_batch(identifiers[start : start + batch_size], semaphore)
+                for start in range(0, len(identifiers), batch_size)
+            ]
+        ):
+            organizations.update(batch_organizations)
+        return organizations
+
+    async def _solve_batch(
+        self, identifiers: List[str], semaphore: asyncio.Semaphore
+    ) -> dict[str, Organization]:
         try:
-            async with aiohttp.ClientSession(
-                timeout=aiohttp.ClientTimeout(total=float(self.timeout))
-            ) as session:
-                async with session.get(
-                    self.URL.format(organization_information.identifier)
-                ) as response:
-                    if not 200 <= response.status < 300:
-                        raise DereferencingError(
-                            f"Endpoint returned status {response.status}"
-                            f" while dereferencing HAL organization"
-                            f" {organization_information.identifier}"
-                        )
-                    data = await response.json()
-                    name = data["response"]["docs"][0].get("name_s", None)
-                    if not name:
-                        raise DereferencingError(
-                            f"HAL organization {organization_information.identifier}"
-                            " has no name"
-                        )
-                    org = Organization(
-                        source="hal",
-                        source_identifier=organization_information.identifier,
-                        name=name,
-                        type=self.TYPE_MAPPING[data["response"]["docs"][0]["type_s"]],
-                    )
-                    org.identifiers.append(
-                        OrganizationIdentifier(
-                            type="hal", value=organization_information.identifier
-                        )
-                    )
-                    seen = ["hal"]
-                    new_identifiers = []
-                    for key, source in self.IDENTITY_DEEP_SEARCH.items():
-                        if (source not in seen) and (
-                            key in data["response"]["docs"][0]
-                        ):
-                            code = data["response"]["docs"][0][key][0]
-                            (
-                                identifiers,
-                                seen,
-                            ) = await organization_factory.OrganizationFactory.solve_identities(
-                                OrganizationInformations(
-                                    identifier=code, source=source
-                                ),
-                                seen,
-                            )
-                            new_identifiers.extend(identifiers)
-                    for key, source in self.IDENTITY_SAVE.items():
-                        if (source not in seen) and (
-                            key in data["response"]["docs"][0]
-                        ):
-                            code = data["response"]["docs"][0][key][0]
-                            new_identifiers.append(
-                                OrganizationIdentifier(type=source, value=code)
-                            )
-                            seen.append(source)
-                    org.identifiers.extend(new_identifiers)
-                    return org
+            async with semaphore:
+                data = await self._query(
+                    self.BATCH_URL.format(" OR ".join(identifiers), len(identifiers)),
+                    ", ".join(identifiers),
+                )
+            docs = data["response"]["docs"]
+        except DereferencingError as error:
+            logger.warning(f"Failure of HAL organizations bulk query : {error}")
+            return {}
+        except (KeyError, TypeError) as error:
+            logger.warning(
+                f"Unexpected response to HAL organizations bulk query : {error}"
+            )
+            return {}
+        organizations = {}
+        for doc in docs:
+            identifier = str(doc.get("docid"))
+            try:
+                organizations[identifier] = await self._organization(identifier, doc)
+            except (DereferencingError, KeyError) as error:
+                # the organization will be solved individually
+                logger.warning(
+                    f"Unexpected HAL organization {identifier} in bulk query : {error}"
+                )
+        return organizations
 
+    async def _query(self, url: str, identifiers: str) -> dict:
+        try:
+            session = HttpSessionsPool().get_session(url)
+            async with session.get(
+                url,
+                timeout=aiohttp.ClientTimeout(total=float(self.timeout)),
+            ) as response:
+                if not 200 <= response.status < 300:
+                    raise DereferencingError(
+                        f"Endpoint returned status {response.status}"
+                        f" while dereferencing HAL organization"
+                        f" {identifiers}"
+                    )
+                return await response.json()
         except aiohttp.ClientError as error:
             raise DereferencingError(
                 "Endpoint failure while dereferencing HAL"
-                f" organization {organization_information.identifier} with message {error}"
+                f" organization {identifiers} with message {error}"
             ) from error
         except asyncio.TimeoutError as error:
             raise DereferencingError(
                 "Timeout while dereferencing HAL"
-                f" organization {organization_information.identifier} with message {error}"
+                f" organization {identifiers} with message {error}"
             ) from error
 
+    async def _organization(self, identifier: str, doc: dict) -> Organization:
+        name = doc.get("name_s", None)
+        if not name:
+            raise DereferencingError(f"HAL organization {identifier} has no name")
+        org = Organization(
+            source="hal",
+            source_identifier=identifier,
+            name=name,
+            type=self.TYPE_MAPPING[doc["type_s"]],
+        )
+        org.identifiers.append(OrganizationIdentifier(type="hal", value=identifier))
+        seen = ["hal"]
+        new_identifiers = []
+        for key, source in self.IDENTITY_DEEP_SEARCH.items():
+            if (source not in seen) and (key in doc):
+                code = doc[key][0]
+                (
+                    identifiers,
+                    seen,
+                ) = await organization_factory.OrganizationFactory.solve_identities(
+                    OrganizationInformations(identifier=code, source=source),
+                    seen,
+                )
+                new_identifiers.extend(identifiers)
+        for key, source in self.IDENTITY_SAVE.items():
+            if (source not in seen) and (key in doc):
+                code = doc[key][0]
+                new_identifiers.append(OrganizationIdentifier(type=source, value=code))
+                seen.append(source)
+        org.identifiers.extend(new_identifiers)
+        return org
+
     async def solve_identities(
         self, organization_information: OrganizationInformations, seen
     ) -> tuple[List[OrganizationIdentifier], List[str]]:
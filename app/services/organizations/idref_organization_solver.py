@@ -13,6 +13,7 @@ from app.db.models.organization import Organization
 from app.db.models.organization_identifier import OrganizationIdentifier
 from app.services.concepts.dereferencing_error import DereferencingError
 from app.services.organizations.organization_solver import OrganizationSolver
+from app.http_client.http_sessions_pool import HttpSessionsPool
 
 
 # pylint: disable=duplicate-code
@@ -57,50 +58,46 @@ class IdrefOrganizationSolver(OrganizationSolver):
             organization_information.identifier
         )
         try:
-            async with aiohttp.ClientSession(
-                timeout=aiohttp.ClientTimeout(total=float(self.timeout))
-            ) as session:
-                async with session.get(idref_url) as response:
-                    if not 200 <= response.status < 300:
-                        raise DereferencingError(
-                            f"Endpoint returned status {response.status}"
-                            f" while dereferencing {idref_url}"
-                        )
-                    xml = await response.text()
-                    concept_graph = Graph().parse(data=xml, format="xml")
-                    # Search for sameAs identifiers
-                    for uri in concept_graph.objects(
-                        term.URIRef(idref_uri), OWL.sameAs
-                    ):
-                        source, identifier = self._infer_source_and_id_from_uri(uri)
+            session = HttpSessionsPool().get_session(idref_url)
+            async with session.get(
+                idref_url, timeout=aiohttp.ClientTimeout(total=float(self.timeout))
+            ) as response:
+                if not 200 <= response.status < 300:
+                    raise DereferencingError(
+                        f"Endpoint returned status {response.status}"
+                        f" while dereferencing {idref_url}"
+                    )
+                xml = await response.text()
+                concept_graph = Graph().parse(data=xml, format="xml")
+                # Search for sameAs identifiers
+                for uri in concept_graph.objects(term.URIRef(idref_uri), OWL.sameAs):
+                    source, identifier = self._infer_source_and_id_from_uri(uri)
 
-                        if source in seen or (source is None and identifier is None):
-                            continue
-                        try:
-                            if source in self.IDENTITY_DEEP_SEARCH:
-                                (
-                                    identifiers,
-                                    seen,
-                                ) = await organization_factory.OrganizationFactory.solve_identities(
-                                    OrganizationInformations(
-                                        identifier=identifier, source=source
-                                    ),
-                                    seen,
-                                )
-                                new_identifiers.extend(identifiers)
-                            elif source in self.IDENTITY_SAVE:
-                                new_identifiers.append(
-                                    OrganizationIdentifier(
-                                        type=source, value=identifier
-                                    )
-                                )
-                                seen.append(source)
-                        except ValueError:
+                    if source in seen or (source is None and identifier is None):
+                        continue
+                    try:
+                        if source in self.IDENTITY_DEEP_SEARCH:
+                            (
+                                identifiers,
+                                seen,
+                            ) = await organization_factory.OrganizationFactory.solve_identities(
+                                OrganizationInformations(
+                                    identifier=identifier, source=source
+                                ),
+                                seen,
+                            )
+                            new_identifiers.extend(identifiers)
+                        elif source in self.IDENTITY_SAVE:
                             new_identifiers.append(
                                 OrganizationIdentifier(type=source, value=identifier)
                             )
                             seen.append(source)
-                    return new_identifiers, seen
+                    except ValueError:
+                        new_identifiers.append(
+                            OrganizationIdentifier(type=source, value=identifier)
+                        )
+                        seen.append(source)
+                return new_identifiers, seen
 
         # If the request fails, return the new identifiers with only the idref identifier
         except aiohttp.ClientError:
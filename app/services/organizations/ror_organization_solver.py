@@ -7,6 +7,7 @@ from app.db.models.organization import Organization
 from app.db.models.organization_identifier import OrganizationIdentifier
 from app.services.organizations.organization_data_class import OrganizationInformations
 from app.services.organizations.organization_solver import OrganizationSolver
+from app.http_client.http_sessions_pool import HttpSessionsPool
 
 
 # pylint: disable=duplicate-code
@@ -48,31 +49,30 @@ class RorOrganizationSolver(OrganizationSolver):
         ]
         seen.append("ror")
         try:
-            async with aiohttp.ClientSession(
-                timeout=aiohttp.ClientTimeout(total=float(self.timeout))
-            ) as session:
-                async with session.get(
-                    self.URL.format(organization_information.identifier)
-                ) as response:
-                    if not 200 <= response.status < 300:
-                        raise timeout(
-                            f"Endpoint returned status {response.status}"
-                            f" while dereferencing ROR organization"
-                            f" {organization_information.identifier}"
-                        )
-                    data = await response.json()
-                    for identifier, source in self.IDENTITY_SAVE.items():
-                        if identifier in data["external_ids"]:
-                            identifier_value = data["external_ids"][identifier]["all"]
-                            if isinstance(identifier_value, list):
-                                identifier_value = identifier_value[0]
-                            new_identifiers.append(
-                                OrganizationIdentifier(
-                                    type=source,
-                                    value=identifier_value,
-                                )
+            session = HttpSessionsPool().get_session(self.URL)
+            async with session.get(
+                self.URL.format(organization_information.identifier),
+                timeout=aiohttp.ClientTimeout(total=float(self.timeout)),
+            ) as response:
+                if not 200 <= response.status < 300:
+                    raise timeout(
+                        f"Endpoint returned status {response.status}"
+                        f" while dereferencing ROR organization"
+                        f" {organization_information.identifier}"
+                    )
+                data = await response.json()
+                for identifier, source in self.IDENTITY_SAVE.items():
+                    if identifier in data["external_ids"]:
+                        identifier_value = data["external_ids"][identifier]["all"]
+                        if isinstance(identifier_value, list):
+                            identifier_value = identifier_value[0]
+                        new_identifiers.append(
+                            OrganizationIdentifier(
+                                type=source,
+                                value=identifier_value,
                             )
-                            seen.append(source)
+                        )
+                        seen.append(source)
             return new_identifiers, seen
 
         # If the request fails, return the new identifiers with only the ror identifier
@@ -0,0 +1,91 @@
+"""
+Parsing functions run by the parsing service, possibly in worker processes :
+they must stay at module level and only take and return picklable values.
+"""
+
+import xml.etree.ElementTree as ET
+from xml.sax import SAXParseException
+
+from rdflib import BNode, Graph, Literal, URIRef
+from rdflib.exceptions import ParserError
+from rdflib.term import Node
+
+from app.services.parsing.parsing_error import ParsingError
+
+# a RDF term as a tuple of strings : its kind, value, language and datatype
+TermTuple = tuple[str, str, str | None, str | None]
+
+
+def parse_rdf(data: str, output_format: str) -> Graph:
+    """
+    Parse a RDF document
+
+    :param data: the RDF document
+    :param output_format: the RDF serialization format (xml, turtle, etc.)
+    :return: the RDF graph
+    """
+    try:
+        return Graph().parse(data=data, format=output_format)
+    except (ParserError, SAXParseException) as error:
+        raise ParsingError(str(error)) from None
+
+
+def parse_rdf_triples(
+    data: str, output_format: str
+) -> list[tuple[TermTuple, TermTuple, TermTuple]]:
+    """
+    Parse a RDF document into triples of tuples of strings, much faster to pickle
+    than the rdflib graph, to be sent back from a worker process
+
+    :param data: the RDF document
+    :param output_format: the RDF serialization format (xml, turtle, etc.)
+    :return: the triples of the document, to be rebuilt with rdf_graph
+    """
+    return [
+        tuple(_term_tuple(term) for term in triple)
+        for triple in parse_rdf(data, output_format)
+    ]
+
+
+def rdf_graph(triples: list[tuple[TermTuple, TermTuple, TermTuple]]) -> Graph:
+    """
+    Build a RDF graph from the triples returned by parse_rdf_triples
+
+    :param triples: the triples
+    :return: the RDF graph
+    """
+    graph = Graph()
+    for triple in triples:
+        graph.add(tuple(_term(term_tuple) for term_tuple in triple))
+    return graph
+
+
+def parse_xml(data: str) -> ET.Element:
+    """
+    Parse a XML document
+
+    :param data: the XML document
+    :return: the root element
+    """
+    try:
+        return ET.fromstring(data)
+    except ET.ParseError as error:
+        raise ParsingError(str(error)) from None
+
+
+def _term_tuple(term: Node) -> TermTuple:
+    if isinstance(term, Literal):
+        return (
+            "L",
+            str(term),
+            term.language,
+            None if term.datatype is None else str(term.datatype),
+        )
+    return ("B" if isinstance(term, BNode) else "U", str(term), None, None)
+
+
+def _term(term_tuple: TermTuple) -> Node:
+    kind, value, language, datatype = term_tuple
+    if kind == "L":
+        return Literal(value, lang=language, datatype=datatype)
+    return BNode(value) if kind == "B" else URIRef(value)
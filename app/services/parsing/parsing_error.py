@@ -0,0 +1,8 @@
+class ParsingError(Exception):
+    """
+    Exception raised when a RDF or XML document fails to be parsed.
+    """
+
+    def __init__(self, message: str) -> None:
+        """Initialize the exception."""
+        super().__init__(message)
@@ -0,0 +1,115 @@
+import asyncio
+import multiprocessing
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable
+
+from loguru import logger
+from rdflib import Graph
+
+from app.config import get_app_settings
+from app.services.parsing.parsers import (
+    parse_rdf,
+    parse_rdf_triples,
+    parse_xml,
+    rdf_graph,
+)
+from app.services.parsing.parsing_error import ParsingError
+
+
+class ParsingService:
+    """
+    Singleton parsing RDF and XML documents in a pool of worker processes,
+    so that large documents do not block the event loop.
+    Small documents, for which inter-process communication would cost
+    more than parsing, are parsed in the event loop.
+    The pool is replaced if one of its processes dies.
+    """
+
+    _instance = None
+
+    def __new__(cls, *args, **kwargs):
+        if not cls._instance:
+            cls._instance = super().__new__(cls, *args, **kwargs)
+        return cls._instance
+
+    def __init__(self):
+        if not hasattr(self, "executor"):
+            settings = get_app_settings()
+            self.min_length = settings.parsing_offload_min_length
+            self.processes = settings.parsing_processes
+            self.executor: ProcessPoolExecutor | None = None
+            if self.processes > 0:
+                logger.info(
+                    "Instanciating ParsingService Singleton "
+                    f"with {self.processes} processes"
+                )
+                self.executor = self._create_executor()
+
+    async def parse_rdf(self, data: str, output_format: str = "xml") -> Graph:
+        """
+        Parse a RDF document
+
+        :param data: the RDF document
+        :param output_format: the RDF serialization format
+        :return: the RDF graph
+        :raises ParsingError: if the document is not valid
+        """
+        if not self._offloaded(data):
+            return parse_rdf(data, output_format)
+        # rdflib graphs are slow to pickle, only their triples are sent back
+        return rdf_graph(
+            await self._run_in_executor(parse_rdf_triples, data, output_format)
+        )
+
+    async def parse_xml(self, data: str) -> ET.Element:
+        """
+        Parse a XML document
+
+        :param data: the XML document
+        :return: the root element
+        :raises ParsingError: if the document is not valid
+        """
+        if not self._offloaded(data):
+            return parse_xml(data)
+        return await self._run_in_executor(parse_xml, data)
+
+    def shutdown(self) -> None:
+        """
+        Stop the worker processes
+
+        :return: None
+        """
+        if self.executor is not None:
+            self.executor.shutdown(cancel_futures=True)
+            self.executor = None
+
+    def _create_executor(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            max_workers=self.processes,
+            # worker processes must not inherit the event loop, connections, etc.
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+
+    def _offloaded(self, data: str) -> bool:
+        return self.executor is not None and len(data) >= self.min_length
+
+    async def _run_in_executor(
+        self, parser: Callable, *args, retry: bool = True
+    ) -> Any:
+        executor = self.executor
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                executor, parser, *args
+            )
+        except BrokenProcessPool as error:
+            # e.g. a worker process killed for lack of memory :
+            # all the parsings in progress fail with the pool
+            if self.executor is executor:
+                logger.error(f"Parsing process pool broken, replacing it : {error}")
+                executor.shutdown(wait=False, cancel_futures=True)
+                self.executor = self._create_executor()
+            if not retry or self.executor is None:
+                raise ParsingError(f"Parsing process pool broken : {error}") from None
+            return await self._run_in_executor(parser, *args, retry=False)
@@ -106,9 +106,11 @@ class RetrievalService:
             factory_class = self._harvester_factory(
                 harvester_config["module"], harvester_config["class"]
             )
-            self.harvesters |= {
-                f"{harvester_config['name']}": factory_class.harvester()
-            }
+            harvester = factory_class.harvester()
+            harvester.set_conversion_workers(
+                harvester_config.get("conversion_workers", 1)
+            )
+            self.harvesters |= {f"{harvester_config['name']}": harvester}
 
     @staticmethod
     def _harvester_factory(
@@ -79,9 +79,19 @@ class AppSettings(BaseSettings):
     db_pool_size: int = 20
     max_overflow: int = 10
 
+    # write-behind batching of the events of unchanged and deleted references
+    reference_events_batching_enabled: bool = False
+    reference_events_batch_size: int = 500
+    # milliseconds
+    reference_events_flush_interval: int = 1000
+
     scanr_es_host: str = "https://host_name.com/"
     scanr_es_user: str = "johndoe"
     scanr_es_password: str = "pass"
+    # max number of connections kept open to the ScanR Elasticsearch API
+    scanr_es_max_connections: int = 10
+    # time to live of the point in time of the paginated ScanR searches
+    scanr_es_pit_keep_alive: str = "1m"
 
     # when solving SKOS concepts from identifiers, fetch labels in these languages if possible
     concept_languages: list = ["fr", "en"]
@@ -90,11 +100,59 @@ class AppSettings(BaseSettings):
         "WIKIDATA": 30,
         "IDREF": 30,
     }
+    # max number of concepts of a reference dereferenced at the same time
+    concept_dereferencing_parallelism: int = 5
+    # the get-or-create of contributors, concepts, organizations, journals, etc.
+    # are serialized by natural key within each process, and if enabled across
+    # processes with PostgreSQL advisory locks
+    get_or_create_advisory_locks_enabled: bool = False
+    # journals, issues, books, organizations and document types resolved by the
+    # converters are cached for the duration of a retrieval, or of the process if enabled
+    converter_entity_cache_max_entries: int = 10000
+    converter_entity_cache_process_wide: bool = False
+    # seconds
+    converter_entity_cache_ttl: int = 3600
 
     svp_jel_proxy_url: str | None = None
 
     scopus_api_key: str = "None"
     scopus_inst_token: str = "None"
+    # max number of pages of Scopus API results fetched concurrently
+    scopus_api_concurrency: int = 4
+
+    # number of documents per page of HAL API results
+    hal_api_page_size: int = 500
+    # max number of HAL structures solved by a single query to the HAL referential
+    hal_organizations_batch_size: int = 100
+    # max number of queries to the HAL referential sent at the same time
+    hal_organizations_parallelism: int = 4
+
+    # number of works per page of OpenAlex API results (200 at most)
+    open_alex_api_page_size: int = 200
+
+    # number of processes parsing large RDF and XML documents out of the event loop
+    # (0 to parse them in the event loop)
+    parsing_processes: int = 2
+    # documents shorter than this number of characters are parsed in the event loop
+    parsing_offload_min_length: int = 10000
+
+    # shared HTTP sessions to external APIs, with one connection pool per host
+    http_default_limit_per_host: int = 100
+    http_limits_per_host: dict = {}
+    # seconds, can be overridden per request by the clients
+    http_default_timeout: int = 300
+    http_timeouts_per_host: dict = {}
+    http_keepalive_timeout: int = 30
+
+    # max number of concurrent queries to each secondary source of the Idref harvester
+    # Sudoc server does not support parallel querying beyond 5 parallel requests (issue #251)
+    idref_secondary_sources_parallelism: dict = {
+        "SUDOC": 3,
+        "SCIENCE_PLUS": 5,
+        "OPEN_EDITION": 5,
+        "PERSEE": 5,
+    }
+    idref_secondary_sources_default_parallelism: int = 10
 
     idref_sudoc_timeout: int = 10
     idref_science_plus_timeout: int = 10
@@ -109,17 +167,45 @@ class AppSettings(BaseSettings):
     ror_organizations_timeout: int = 7
     scopus_organizations_timeout: int = 5
 
+    # rows per page of the data.idref.fr publications query, None for a single query
+    # (a single query is read whole within its timeout, whatever the number of
+    # publications, whereas pages are only queried as the publications are processed)
+    idref_sparql_page_size: int | None = None
+    # resources described by each DESCRIBE query to the Science+ endpoint
+    science_plus_describe_batch_size: int = 20
+    # documents of the secondary sources of the Idref harvester
+    # written to the cache together, as they are fetched
+    idref_documents_caching_batch_size: int = 10
+    # publications of data.idref.fr whose secondary sources documents
+    # are looked up in the cache together
+    idref_publications_chunk_size: int = 100
+
     third_api_caching_enabled: bool = True
     third_api_default_caching_duration: int = 24 * 3600
+    # per-process LRU cache in front of Redis, for the hot keys
+    third_api_local_caching_enabled: bool = False
+    third_api_local_cache_max_entries: int = 2000
+    # seconds during which a missing or invalid third party resource
+    # is not fetched again (requires the per-process cache)
+    third_api_negative_caching_duration: int = 600
+    # seconds after the caching duration during which a stale value is still served
+    # while it is refreshed in the background
+    third_api_stale_while_revalidate_duration: int = 3 * 24 * 3600
+    # zlib compression level of the cached values (0-9)
+    third_api_cache_compression_level: int = 6
     redis_url: str = "redis://localhost:6379"
     redis_max_connections: int = 1000
 
     sudoc_publications_caching_duration: int = 15 * 24 * 3600
     science_plus_publications_caching_duration: int = 15 * 24 * 3600
+    # journals, issues and contributors of the Science+ publications
+    science_plus_resources_caching_duration: int = 15 * 24 * 3600
     persee_publications_caching_duration: int = 15 * 24 * 3600
     open_edition_publications_caching_duration: int = 15 * 24 * 3600
     idref_concepts_publications_caching_duration: int = 90 * 24 * 3600
     wikidata_concepts_publications_caching_duration: int = 90 * 24 * 3600
+    # ScanR ids of the persons, by orcid or idHal
+    scanr_person_ids_caching_duration: int = 30 * 24 * 3600
 
     institution_name: str = "XYZ University"
 
@@ -15,7 +15,11 @@ from app.api.routes.healthness import router as healthness_router
 from app.config import get_app_settings
 from app.db.session import async_session
 from app.gui.routes.gui import router as gui_router
+from app.harvesters.document_type_registry import DocumentTypeRegistry
+from app.harvesters.scanr.scanr_elasticsearch_pool import ScanRElasticsearchPool
+from app.http_client.http_sessions_pool import HttpSessionsPool
 from app.redis.redis_pool import RedisPool
+from app.services.parsing.parsing_service import ParsingService
 from app.settings.app_env_types import AppEnvTypes
 
 
@@ -65,6 +69,11 @@ class SvpHarvester(FastAPI):
         )
         self.add_exception_handler(ValidationError, http422_error_handler)
         self.add_event_handler("startup", self.check_db_connexion)
+        self.add_event_handler("startup", self.load_document_types)
+        self.add_event_handler("startup", self.open_http_sessions_pool)
+        self.add_event_handler("shutdown", self.close_http_sessions_pool)
+        self.add_event_handler("shutdown", self.close_scanr_elasticsearch_pool)
+        self.add_event_handler("shutdown", self.stop_parsing_processes)
         if settings.third_api_caching_enabled:
             self.add_event_handler("startup", self.check_redis_connexion)
         if settings.amqp_enabled:
@@ -96,6 +105,27 @@ class SvpHarvester(FastAPI):
                 )
                 raise error
 
+    async def load_document_types(self) -> None:
+        """Load the document types in memory at boot time"""
+        await DocumentTypeRegistry().load()
+
+    async def open_http_sessions_pool(self) -> None:
+        """Init the pool of HTTP sessions to external APIs at boot time"""
+        HttpSessionsPool()
+
+    async def close_http_sessions_pool(self) -> None:
+        """Close the HTTP sessions to external APIs before shutdown"""
+        logger.info("Closing HTTP sessions to external APIs")
+        await HttpSessionsPool().close()
+
+    async def close_scanr_elasticsearch_pool(self) -> None:
+        """Close the Elasticsearch client of the ScanR API before shutdown"""
+        await ScanRElasticsearchPool().close()
+
+    async def stop_parsing_processes(self) -> None:
+        """Stop the RDF and XML parsing worker processes before shutdown"""
+        ParsingService().shutdown()
+
     @logger.catch(reraise=True)
     async def check_redis_connexion(self) -> None:
         """
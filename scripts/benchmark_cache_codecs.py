@@ -0,0 +1,91 @@
+"""
+Compare the size and the encoding/decoding latency of the third party API cache entries
+with the cache codecs and with plain pickle, on the RDF and XML documents of tests/data
+"""
+import asyncio
+import glob
+import logging
+import os
+import pickle
+import sys
+import time
+import xml.etree.ElementTree as ET
+
+if os.path.basename(os.getcwd()) != "scripts":
+    print("Please execute this script from the scripts directory")
+    sys.exit(1)
+sys.path.append("..")
+os.environ["APP_ENV"] = "DEV"
+
+from rdflib import Graph  # pylint: disable=wrong-import-position
+
+from app.services.cache.cache_serializer import (  # pylint: disable=wrong-import-position
+    CacheSerializer,
+)
+
+DATA_SETS = {
+    "sudoc_rdf": ("../tests/data/sudoc_rdf/*.rdf", "rdf"),
+    "persee_rdf": ("../tests/data/persee_rdf/*.rdf", "rdf"),
+    "science_plus_rdf": ("../tests/data/science_plus_rdf/*.rdf", "rdf"),
+    "open_edition": ("../tests/data/open_edition/*.xml", "xml"),
+}
+ROUNDS = 20
+
+# some fixtures contain invalid dates on purpose
+logging.getLogger("rdflib.term").setLevel(logging.ERROR)
+
+
+def _load_values(pattern: str, document_type: str) -> list:
+    values = []
+    for path in sorted(glob.glob(pattern)):
+        with open(path, encoding="utf-8") as document:
+            data = document.read()
+        try:
+            if document_type == "rdf":
+                values.append(Graph().parse(data=data, format="xml"))
+            else:
+                values.append(ET.fromstring(data.strip()))
+        except Exception:  # pylint: disable=broad-exception-caught
+            # some fixtures are invalid on purpose
+            continue
+    return values
+
+
+def _timed(function, values: list) -> tuple[list, float]:
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        results = [function(value) for value in values]
+    return results, (time.perf_counter() - start) / ROUNDS / len(values) * 1000
+
+
+async def _timed_async(function, values: list) -> float:
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        for value in values:
+            await function(value)
+    return (time.perf_counter() - start) / ROUNDS / len(values) * 1000
+
+
+async def _benchmark() -> None:
+    serializer = CacheSerializer()
+    print(
+        f"{'data set':>18} {'docs':>5} | {'pickle size':>11} {'dumps':>7} {'loads':>7}"
+        f" | {'codec size':>10} {'dumps':>7} {'loads':>7}"
+    )
+    for name, (pattern, document_type) in DATA_SETS.items():
+        values = _load_values(pattern, document_type)
+        pickled, pickle_dumps = _timed(pickle.dumps, values)
+        _, pickle_loads = _timed(pickle.loads, pickled)
+        encoded, codec_dumps = _timed(serializer.dumps, values)
+        codec_loads = await _timed_async(serializer.loads, encoded)
+        pickle_size = sum(len(data) for data in pickled) / len(values)
+        codec_size = sum(len(data) for data in encoded) / len(values)
+        print(
+            f"{name:>18} {len(values):>5} | {pickle_size:>10.0f}B "
+            f"{pickle_dumps:>5.2f}ms {pickle_loads:>5.2f}ms"
+            f" | {codec_size:>9.0f}B {codec_dumps:>5.2f}ms {codec_loads:>5.2f}ms"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(_benchmark())
@@ -0,0 +1,126 @@
+"""
+Compare the per-contributor lookups of the HAL converter with and without
+the per-document author index, on a synthetic large-collaboration record
+"""
+import os
+import sys
+import time
+
+if os.path.basename(os.getcwd()) != "scripts":
+    print("Please execute this script from the scripts directory")
+    sys.exit(1)
+sys.path.append("..")
+os.environ["APP_ENV"] = "DEV"
+
+# pylint: disable=wrong-import-position, protected-access
+from app.harvesters.hal.hal_references_converter import HalReferencesConverter
+from app.harvesters.hal.hal_tei_interface import HalTEIDecoder
+from app.services.organizations.organization_data_class import OrganizationInformations
+
+AUTHORS_COUNTS = [100, 500, 2000]
+STRUCTURES_BY_AUTHOR = 3
+ROUNDS = 3
+NAMESPACE = {"tei": "http://www.tei-c.org/ns/1.0"}
+
+
+def _record(authors_count: int) -> tuple[str, dict]:
+    authors = "".join(
+        f"<author><persName><forename>First {i}</forename>"
+        f"<surname>Last {i}</surname></persName>"
+        f"<idno type='idhal' notation='string'>author-{i}</idno>"
+        f"<idno type='idhal' notation='numeric'>{i}</idno>"
+        f"<idno type='ORCID'>https://orcid.org/0000-0000-0000-{i:04}</idno>"
+        "</author>"
+        for i in range(1, authors_count + 1)
+    )
+    tei = (
+        "<TEI xmlns='http://www.tei-c.org/ns/1.0'><text><body><listBibl><biblFull>"
+        f"<titleStmt>{authors}</titleStmt>"
+        "</biblFull></listBibl></body></text></TEI>"
+    )
+    payload = {
+        "authIdHasStructure_fs": [
+            f"{i}-{i}_FacetSep_First {i} Last {i}_JoinSep_"
+            f"{i * 10 + j}_FacetSep_Structure {i * 10 + j}"
+            for i in range(1, authors_count + 1)
+            for j in range(STRUCTURES_BY_AUTHOR)
+        ]
+    }
+    return tei, payload
+
+
+def _legacy_identifiers(decoder: HalTEIDecoder, numeric_id_hal: str) -> list:
+    author_elements = decoder.tree.xpath(
+        f"//tei:author[.//tei:idno[@type='idhal'][@notation='numeric' "
+        f"and text()='{numeric_id_hal}']]",
+        namespaces=NAMESPACE,
+    )
+    if not author_elements:
+        return []
+    return [
+        decoder._process_identifier_data(idno.get("type"), idno.text)
+        for idno in author_elements[0].xpath(".//tei:idno", namespaces=NAMESPACE)
+        if idno.get("type") and idno.text
+    ]
+
+
+def _legacy_organizations(payload: dict, id_contributor: str) -> set:
+    organizations = set()
+    for auth_org in payload["authIdHasStructure_fs"]:
+        auth, org = auth_org.split("_JoinSep_")
+        ids, _ = auth.split("_FacetSep_")
+        _, id_hal = ids.split("-")
+        if id_hal != id_contributor:
+            continue
+        org_id, org_name = org.split("_FacetSep_")
+        organizations.add(
+            OrganizationInformations(name=org_name, identifier=org_id, source="hal")
+        )
+    return organizations
+
+
+def _legacy_lookups(tei: str, payload: dict, ids_hal: list[str]) -> list:
+    decoder = HalTEIDecoder(tei_raw_data=tei)
+    return [
+        (
+            _legacy_identifiers(decoder, id_hal),
+            _legacy_organizations(payload, id_hal),
+        )
+        for id_hal in ids_hal
+    ]
+
+
+def _indexed_lookups(tei: str, payload: dict, ids_hal: list[str]) -> list:
+    decoder = HalTEIDecoder(tei_raw_data=tei)
+    organizations = HalReferencesConverter()._organizations_by_contributor(payload)
+    return [
+        (decoder.get_identifiers(id_hal), organizations.get(id_hal, set()))
+        for id_hal in ids_hal
+    ]
+
+
+def _timed(function, *args) -> tuple[list, float]:
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        results = function(*args)
+    return results, (time.perf_counter() - start) / ROUNDS * 1000
+
+
+def _benchmark() -> None:
+    print(f"{'authors':>8} | {'per contributor':>15} | {'author index':>12}")
+    for authors_count in AUTHORS_COUNTS:
+        tei, payload = _record(authors_count)
+        ids_hal = [str(i) for i in range(1, authors_count + 1)]
+        legacy_results, legacy_duration = _timed(_legacy_lookups, tei, payload, ids_hal)
+        indexed_results, indexed_duration = _timed(
+            _indexed_lookups, tei, payload, ids_hal
+        )
+        assert legacy_results == indexed_results
+        print(
+            f"{authors_count:>8} | {legacy_duration:>13.1f}ms"
+            f" | {indexed_duration:>10.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    _benchmark()
@@ -0,0 +1,125 @@
+"""
+Measure the event loop lag caused by the parsing of large RDF/XML documents,
+with parsing in the event loop and with parsing in the worker processes
+of the parsing service.
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+if os.path.basename(os.getcwd()) != "scripts":
+    print("Please execute this script from the scripts directory")
+    sys.exit(1)
+sys.path.append("..")
+os.environ["APP_ENV"] = "DEV"
+
+from app.services.parsing.parsers import (  # pylint: disable=wrong-import-position
+    parse_rdf,
+)
+from app.services.parsing.parsing_service import (  # pylint: disable=wrong-import-position
+    ParsingService,
+)
+
+DEFAULT_DOCUMENT = "../tests/data/sudoc_rdf/thesis.rdf"
+TICK_INTERVAL = 0.001
+
+
+def _parse_args():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--document",
+        help="Path of the RDF/XML document to parse",
+        default=DEFAULT_DOCUMENT,
+        type=str,
+    )
+    parser.add_argument(
+        "--documents",
+        help="Number of documents to parse",
+        default=200,
+        type=int,
+    )
+    parser.add_argument(
+        "--concurrency",
+        help="Number of documents parsed concurrently",
+        default=10,
+        type=int,
+    )
+    return parser.parse_args()
+
+
+async def _monitor_lag(lags: list[float], stop: asyncio.Event) -> None:
+    """
+    Record how late the event loop wakes up a task sleeping for TICK_INTERVAL
+    """
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(TICK_INTERVAL)
+        lags.append(time.perf_counter() - start - TICK_INTERVAL)
+
+
+async def _in_loop_parse(data: str) -> None:
+    parse_rdf(data, "xml")
+    # give the hand back to the event loop, as a resolver would do
+    await asyncio.sleep(0)
+
+
+async def _parsing_service_parse(data: str) -> None:
+    await ParsingService().parse_rdf(data, output_format="xml")
+
+
+async def _run(parse, data: str, documents: int, concurrency: int) -> None:
+    lags: list[float] = []
+    stop = asyncio.Event()
+    monitor = asyncio.create_task(_monitor_lag(lags, stop))
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _bounded_parse():
+        async with semaphore:
+            await parse(data)
+
+    start = time.perf_counter()
+    await asyncio.gather(*[_bounded_parse() for _ in range(documents)])
+    duration = time.perf_counter() - start
+    stop.set()
+    await monitor
+    lags.sort()
+    print(
+        f"{parse.__name__:>24}: {duration:.2f}s total, event loop lag "
+        f"mean {statistics.mean(lags) * 1000:.1f}ms, "
+        f"p99 {lags[int(len(lags) * 0.99)] * 1000:.1f}ms, "
+        f"max {lags[-1] * 1000:.1f}ms"
+    )
+
+
+async def _benchmark(benchmark_args) -> None:
+    with open(benchmark_args.document, encoding="utf-8") as document:
+        data = document.read()
+    print(
+        f"Parsing {benchmark_args.documents} documents of {len(data)} characters, "
+        f"{benchmark_args.concurrency} at a time"
+    )
+    service = ParsingService()
+    if service.executor is None:
+        print("Parsing processes are disabled (PARSING_PROCESSES=0)")
+        sys.exit(1)
+    # spawn the worker processes before measuring
+    service.min_length = 0
+    await _parsing_service_parse(data)
+    await _run(
+        _in_loop_parse, data, benchmark_args.documents, benchmark_args.concurrency
+    )
+    await _run(
+        _parsing_service_parse,
+        data,
+        benchmark_args.documents,
+        benchmark_args.concurrency,
+    )
+    service.shutdown()
+
+
+if __name__ == "__main__":
+    args = _parse_args()
+    asyncio.run(_benchmark(args))
@@ -11,6 +11,8 @@ from starlette.testclient import TestClient
 from loguru import logger
 from app.db.models.concept import Concept as DbConcept
 from app.db.session import engine, Base
+from app.harvesters.document_type_registry import DocumentTypeRegistry
+from app.http_client.http_sessions_pool import HttpSessionsPool
 from app.services.concepts.abes_concept_solver import AbesConceptSolver
 from app.services.concepts.concept_informations import ConceptInformations
 from app.services.concepts.dereferencing_error import DereferencingError
@@ -64,6 +66,8 @@ def fixture_event_loop():
     """Provide an event loop for all tests"""
     loop = asyncio.get_event_loop_policy().new_event_loop()
     yield loop
+    # HTTP sessions are bound to the loop they have been opened in
+    loop.run_until_complete(HttpSessionsPool().close())
     loop.close()
 
 
@@ -80,6 +84,8 @@ async def fixture_async_session() -> AsyncGenerator[AsyncSession, None]:
 
     async with engine.begin() as test_connexion:
         await test_connexion.run_sync(Base.metadata.drop_all)
+    # the document types loaded in memory do not exist anymore
+    DocumentTypeRegistry().reset()
 
     await engine.dispose()
 
@@ -217,6 +223,7 @@ def fixture_fake_scanr_elastic_client_perform_search(
     async def fake_scanr_elastic_client(
         selected_index: str,
         base_size: int = 200,
+        point_in_time: bool = True,
     ):
         if selected_index == ScanRElasticClient.Indexes.PUBLICATIONS:
             for hit in scanr_api_docs_from_publication.get("hits", {}).get("hits", []):
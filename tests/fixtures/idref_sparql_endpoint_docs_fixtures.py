@@ -121,9 +121,11 @@ def fixture_idref_sparql_endpoint_response_for_concept_multilang(_base_path) ->
     )
 
 
-@pytest.fixture(name="idref_sparql_endpoint_response_for_concept_non_preferred_languages")
+@pytest.fixture(
+    name="idref_sparql_endpoint_response_for_concept_non_preferred_languages"
+)
 def fixture_idref_sparql_endpoint_response_for_concept_concept_non_preferred_languages(
-        _base_path
+    _base_path,
 ) -> dict:
     """
     Generate an Idref Sparql endpoint concept response
@@ -139,3 +141,15 @@ def fixture_idref_sparql_endpoint_response_for_concept_concept_non_preferred_lan
 def _idref_sparql_endpoint_json_results_from_file(base_path, file_name) -> dict:
     file_path = f"data/idref_sparql_endpoint/{file_name}.json"
     return _json_data_from_file(base_path, file_path)
+
+
+def _sparql_bindings_stream(results: dict):
+    """
+    Mock of IdrefSparqlClient.stream_bindings yielding the bindings of a SPARQL JSON results document
+    """
+
+    async def stream_bindings(_query: str):
+        for binding in results.get("results", {}).get("bindings", []):
+            yield binding
+
+    return stream_bindings
@@ -27,3 +27,13 @@ def fixture_mock_hal_organization_solver():
     with mock.patch.object(HalOrganizationSolver, "solve") as mock_solve:
         mock_solve.side_effect = fake_hal_organization_solver
         yield mock_solve
+
+
+@pytest.fixture(name="mock_hal_organization_solver_solve_many", autouse=True)
+def fixture_mock_hal_organization_solver_solve_many():
+    """
+    Mock the hal organization bulk solver so that organizations are solved one by one
+    """
+    with mock.patch.object(HalOrganizationSolver, "solve_many") as mock_solve_many:
+        mock_solve_many.return_value = {}
+        yield mock_solve_many
@@ -24,11 +24,12 @@ def fixture_redis_cache_get_mock():
 
 @pytest.fixture(name="redis_cache_set_mock")
 def fixture_redis_cache_set_mock():
-    async def fake_redis_set(name: str, value: bytes):
+    async def fake_redis_set(name: str, value: bytes, ex: int | None = None):
         """
         Fake redis set
         :param name: name
         :param value: value
+        :param ex: expiration time
         :return: None
         """
         pass
@@ -62,3 +63,26 @@ def fixture_redis_cache_mock(
         mock_set.side_effect = redis_cache_set_mock
         mock_expire.side_effect = redis_cache_expire_mock
         yield mock_get, mock_set
+
+
+@pytest.fixture(name="redis_cache_mget_mock", autouse=True)
+def fixture_redis_cache_mget_mock(redis_cache_get_mock):
+    """Redis mget mock, answering as the fake redis get for each key"""
+
+    async def fake_redis_mget(keys: list[str]):
+        return [await redis_cache_get_mock(name=key) for key in keys]
+
+    with mock.patch.object(aioredis.Redis, "mget") as mock_mget:
+        mock_mget.side_effect = fake_redis_mget
+        yield mock_mget
+
+
+@pytest.fixture(name="redis_cache_pipeline_mock", autouse=True)
+def fixture_redis_cache_pipeline_mock():
+    """Redis pipeline mock, to detect the commands sent in bulk"""
+    with mock.patch.object(
+        aioredis.client.Pipeline, "set"
+    ) as mock_pipeline_set, mock.patch.object(
+        aioredis.client.Pipeline, "execute", new_callable=mock.AsyncMock
+    ) as mock_pipeline_execute:
+        yield mock_pipeline_set, mock_pipeline_execute
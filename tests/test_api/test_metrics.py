@@ -10,6 +10,7 @@ from app.db.models.harvesting import Harvesting
 from app.db.models.reference import Reference
 from app.db.models.reference_event import ReferenceEvent
 from app.db.models.title import Title
+from app.services.cache.cache_metrics import CacheMetrics
 
 
 async def test_get_references_by_harvester(
@@ -92,3 +93,35 @@ async def test_get_reference_events_by_day_and_type(
 
     recent_date_str = recent_date.strftime("%d-%m-%Y")
     assert data == {recent_date_str: {"created": 4, "deleted": 2, "updated": 6}}
+
+
+def test_get_third_api_cache_metrics(test_client: TestClient):
+    """
+    Given a few third party API cache operations
+    When I request the cache metrics
+    Then I should get the counters and latency histograms by namespace
+
+    :param test_client:
+    :return:
+    """
+    CacheMetrics().reset()
+    CacheMetrics().record_miss("sudoc_publications")
+    CacheMetrics().observe_latency("sudoc_publications", "get", 0.003)
+    response = test_client.get("/api/v1/metrics/third_api_cache")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["namespaces"]["sudoc_publications"]["misses"] == 1
+    assert data["namespaces"]["sudoc_publications"]["get_latency"]["buckets"] == {
+        "1": 0,
+        "2": 0,
+        "5": 1,
+        "10": 1,
+        "25": 1,
+        "50": 1,
+        "100": 1,
+        "250": 1,
+        "500": 1,
+        "1000": 1,
+        "+Inf": 1,
+    }
+    CacheMetrics().reset()
@@ -3,6 +3,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.daos.concept_dao import ConceptDAO
 from app.db.models.concept import Concept
+from app.db.models.label import Label
 
 
 @pytest.mark.asyncio
@@ -64,3 +65,63 @@ async def test_random_concept_with_exclude_id(async_session: AsyncSession):
     )
 
     assert concept_from_db is None
+
+
+@pytest.mark.asyncio
+async def test_get_concepts_by_labels_and_languages(async_session: AsyncSession):
+    """
+    Given concepts with labels in a language and without language
+    When they are looked up by (label, language) pairs in a single query
+    Then each pair is mapped to its concept and unknown pairs are missing
+    """
+    english = Concept(labels=[Label(value="Trade", language="en")])
+    no_language = Concept(labels=[Label(value="Commerce", language=None)])
+    async_session.add_all([english, no_language])
+    await async_session.commit()
+
+    concepts = await ConceptDAO(async_session).get_concepts_by_labels_and_languages(
+        [("Trade", "en"), ("Commerce", None), ("Trade", "fr"), ("Unknown", None)]
+    )
+
+    assert concepts.keys() == {("Trade", "en"), ("Commerce", None)}
+    assert concepts[("Trade", "en")].id == english.id
+    assert concepts[("Commerce", None)].id == no_language.id
+    assert concepts[("Trade", "en")].labels[0].value == "Trade"
+
+
+@pytest.mark.asyncio
+async def test_insert_missing_concepts_skips_existing_uris(async_session: AsyncSession):
+    """
+    Given a concept already in database
+    When it is inserted again with a new concept
+    Then only the new concept and its labels are inserted
+    """
+    async_session.add(Concept(uri="http://example.com/existing"))
+    await async_session.commit()
+
+    dao = ConceptDAO(async_session)
+    inserted_ids = await dao.insert_missing(
+        [
+            Concept(
+                uri="http://example.com/existing",
+                labels=[Label(value="Existing", language="en")],
+            ),
+            Concept(
+                uri="http://example.com/new",
+                labels=[Label(value="New", language="en")],
+            ),
+        ]
+    )
+    await async_session.commit()
+
+    concepts = {
+        concept.uri: concept
+        for concept in await dao.get_concepts_by_uri(
+            ["http://example.com/existing", "http://example.com/new"]
+        )
+    }
+    assert inserted_ids == [concepts["http://example.com/new"].id]
+    assert not concepts["http://example.com/existing"].labels
+    assert [label.value for label in concepts["http://example.com/new"].labels] == [
+        "New"
+    ]
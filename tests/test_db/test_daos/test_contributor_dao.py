@@ -0,0 +1,42 @@
+import pytest
+
+from app.db.daos.contributor_dao import ContributorDAO
+from app.db.models.contributor import Contributor
+
+
+@pytest.mark.asyncio
+async def test_insert_missing_contributors(async_session):
+    """
+    Test that contributors are inserted in bulk, the existing ones being skipped,
+    and can be retrieved by source identifiers and by names.
+    :param async_session: async session fixture
+    :return: None
+    """
+    async_session.add(
+        Contributor(source="hal", source_identifier="1", name="Existing Author")
+    )
+    await async_session.commit()
+
+    dao = ContributorDAO(async_session)
+    inserted_ids = await dao.insert_missing(
+        [
+            {"source": "hal", "source_identifier": "1", "name": "Existing Author"},
+            {"source": "hal", "source_identifier": "2", "name": "New Author"},
+            {"source": "hal", "source_identifier": None, "name": "Author Without Id"},
+        ]
+    )
+    await async_session.commit()
+    assert len(inserted_ids) == 2
+
+    contributors = await dao.get_by_source_and_identifiers("hal", ["1", "2", "3"])
+    assert sorted(contributor.name for contributor in contributors) == [
+        "Existing Author",
+        "New Author",
+    ]
+    contributors = await dao.get_by_source_and_names(
+        "hal", ["Author Without Id", "New Author"]
+    )
+    assert [contributor.name for contributor in contributors] == ["Author Without Id"]
+    assert contributors[0].name_variants == []
+    contributors = await dao.get_by_ids(inserted_ids)
+    assert len(contributors) == 2
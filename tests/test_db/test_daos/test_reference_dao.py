@@ -277,6 +277,63 @@ async def test_get_references_for_entity_and_harvester_returns_updated_reference
     assert references[0].titles[0].value == "changed_title"
 
 
+@pytest.mark.asyncio
+async def test_get_last_references_for_entity_and_harvester(
+    async_session: AsyncSession,
+    two_completed_harvestings_db_models_for_same_person: List[Harvesting],
+):
+    """
+    GIVEN a reference discovered for an entity by a first harvesting
+        and a newer version of the same reference registered without any event
+        related to this entity (e.g. by a co-author harvesting)
+    WHEN get_last_references_for_entity_and_harvester is called for the entity
+    THEN the newer version of the reference is returned
+    """
+    (
+        harvesting_db_model_1,
+        _,
+    ) = two_completed_harvestings_db_models_for_same_person
+    harvester = harvesting_db_model_1.harvester
+    reference1 = DbReference(
+        source_identifier="source_identifier_1234",
+        harvester=harvester,
+        hash="hash1",
+        version=0,
+        titles=[Title(value="title", language="fr")],
+    )
+    reference2 = DbReference(
+        source_identifier="source_identifier_1234",
+        harvester=harvester,
+        hash="hash2",
+        version=1,
+        titles=[Title(value="changed_title", language="fr")],
+    )
+    unrelated_reference = DbReference(
+        source_identifier="source_identifier_5678",
+        harvester=harvester,
+        hash="hash3",
+        version=0,
+        titles=[Title(value="unrelated title", language="fr")],
+    )
+    reference_event_1 = ReferenceEvent(
+        type=ReferenceEvent.Type.CREATED.value,
+        reference=reference1,
+        harvesting=harvesting_db_model_1,
+    )
+    async_session.add_all(
+        [reference1, reference2, unrelated_reference, reference_event_1]
+    )
+    await async_session.commit()
+    dao = ReferenceDAO(async_session)
+
+    references = await dao.get_last_references_for_entity_and_harvester(
+        entity_id=harvesting_db_model_1.retrieval.entity_id,
+        harvester=harvester,
+    )
+
+    assert references == [reference2]
+
+
 @pytest.mark.asyncio
 async def test_get_complete_reference_by_harvester_source_identifier_version(
     async_session: AsyncSession, harvesting_db_model_for_person_with_idref: Harvesting
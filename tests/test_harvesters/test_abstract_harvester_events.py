@@ -0,0 +1,48 @@
+"""Tests for the reference events written at the end of the harvesting"""
+
+from unittest import mock
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.references.references_recorder import ReferencesRecorder
+from app.harvesters.exceptions.external_endpoint_failure import ExternalEndpointFailure
+from app.harvesters.idref.idref_harvester import IdrefHarvester
+from app.harvesters.idref.idref_references_converter import IdrefReferencesConverter
+from app.harvesters.idref.idref_sparql_client import IdrefSparqlClient
+
+
+async def test_harvester_flushes_events_before_notifying_failure(
+    harvesting_db_model_for_person_with_idref,
+    async_session: AsyncSession,
+):
+    """
+    GIVEN a harvester whose external endpoint fails
+    WHEN the harvester is run
+    THEN the pending reference events are written before the failure is handled
+
+    :param harvesting_db_model_for_person_with_idref: harvesting of a person with idref
+    :param async_session: database session
+    :return: None
+    """
+
+    async def failing_stream_bindings(_query):
+        raise ExternalEndpointFailure("Idref SPARQL endpoint unavailable")
+        yield  # pylint: disable=unreachable
+
+    harvester = IdrefHarvester(converter=IdrefReferencesConverter())
+    async_session.add(harvesting_db_model_for_person_with_idref)
+    await async_session.commit()
+    harvester.set_harvesting_id(harvesting_db_model_for_person_with_idref.id)
+    harvester.set_entity_id(
+        harvesting_db_model_for_person_with_idref.retrieval.entity_id
+    )
+    calls = mock.Mock()
+    with mock.patch.object(
+        IdrefSparqlClient, "stream_bindings", side_effect=failing_stream_bindings
+    ), mock.patch.object(
+        ReferencesRecorder, "flush_events", side_effect=calls.flush_events
+    ), mock.patch.object(
+        IdrefHarvester, "handle_error", side_effect=calls.handle_error
+    ):
+        await harvester.run()
+    assert [call[0] for call in calls.mock_calls] == ["flush_events", "handle_error"]
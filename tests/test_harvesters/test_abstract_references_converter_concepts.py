@@ -0,0 +1,97 @@
+"""Tests for the bulk resolution of the concepts by the references converters."""
+import asyncio
+from unittest import mock
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.daos.concept_dao import ConceptDAO
+from app.db.models.concept import Concept
+from app.db.models.label import Label
+from app.harvesters.hal.hal_references_converter import HalReferencesConverter
+from app.services.concepts.concept_informations import ConceptInformations
+from app.services.concepts.wikidata_concept_solver import WikidataConceptSolver
+
+
+async def _fake_solve(concept_informations: ConceptInformations) -> Concept:
+    return Concept(
+        uri=concept_informations.uri,
+        labels=[Label(value=f"Label of {concept_informations.uri}", language="en")],
+    )
+
+
+async def test_concepts_are_resolved_in_bulk(async_session: AsyncSession):
+    """
+    Given a concept with an uri and a concept with a label already in database
+    When the concepts of a reference with these concepts, new concepts
+    and concepts appearing twice are resolved
+    Then the existing concepts are reused, the missing ones are created once,
+    the new uris are dereferenced once and the concepts are returned in order
+    """
+    async_session.add_all(
+        [
+            Concept(uri="http://www.wikidata.org/entity/Q1"),
+            Concept(labels=[Label(value="Trade", language="en")]),
+        ]
+    )
+    await async_session.commit()
+    concept_informations = [
+        ConceptInformations(uri="http://www.wikidata.org/entity/Q2"),
+        ConceptInformations(label="Trade", language="en"),
+        ConceptInformations(uri="http://www.wikidata.org/entity/Q1"),
+        ConceptInformations(label="New keyword", language="fr"),
+        ConceptInformations(uri="http://www.wikidata.org/entity/Q2"),
+        ConceptInformations(label="Trade", language="en"),
+    ]
+    with mock.patch.object(WikidataConceptSolver, "solve") as mock_solve:
+        mock_solve.side_effect = _fake_solve
+        concepts = await HalReferencesConverter()._get_or_create_concepts(  # pylint: disable=protected-access
+            concept_informations
+        )
+
+    mock_solve.assert_called_once()
+    assert [concept.uri for concept in concepts] == [
+        "http://www.wikidata.org/entity/Q2",
+        None,
+        "http://www.wikidata.org/entity/Q1",
+        None,
+    ]
+    assert concepts[0].dereferenced
+    assert [label.value for label in concepts[0].labels] == [
+        "Label of http://www.wikidata.org/entity/Q2"
+    ]
+    assert [label.value for label in concepts[1].labels] == ["Trade"]
+    assert [label.value for label in concepts[3].labels] == ["New keyword"]
+    assert all(concept.id is not None for concept in concepts)
+    dao = ConceptDAO(async_session)
+    assert (
+        len(await dao.get_concepts_by_uri(["http://www.wikidata.org/entity/Q2"])) == 1
+    )
+    assert (
+        await dao.get_concepts_by_labels_and_languages([("New keyword", "fr")])
+    ).keys() == {("New keyword", "fr")}
+
+
+async def test_concurrent_resolutions_create_a_concept_once(
+    async_session: AsyncSession,
+):
+    """
+    Given several references with the same new keyword
+    When their concepts are resolved concurrently
+    Then a single concept is created and shared by all the references
+    """
+    converter = HalReferencesConverter()
+    results = await asyncio.gather(
+        *[
+            converter._get_or_create_concepts(  # pylint: disable=protected-access
+                [ConceptInformations(label="Shared keyword", language="en")]
+            )
+            for _ in range(5)
+        ]
+    )
+
+    assert len({concepts[0].id for concepts in results}) == 1
+    labels_count = select(func.count()).select_from(  # pylint: disable=not-callable
+        Label
+    )
+    assert await async_session.scalar(labels_count) == 1
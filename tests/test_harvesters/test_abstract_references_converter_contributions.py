@@ -0,0 +1,51 @@
+"""Tests for the bulk resolution of the contributors by the references converters."""
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.daos.contributor_dao import ContributorDAO
+from app.db.models.contributor import Contributor
+from app.harvesters.abstract_references_converter import AbstractReferencesConverter
+from app.harvesters.hal.hal_references_converter import HalReferencesConverter
+
+ContributionInformations = AbstractReferencesConverter.ContributionInformations
+
+
+async def test_contributions_are_resolved_in_bulk(async_session: AsyncSession):
+    """
+    Given a contributor with an identifier already in database
+    When the contributions of a reference with this contributor, new contributors
+    and contributors appearing twice are converted
+    Then the existing contributor is reused with its new name, the missing ones are created once,
+    and the contributions are returned in the same order
+    """
+    async_session.add(Contributor(source="hal", source_identifier="1", name="Old Name"))
+    await async_session.commit()
+    contribution_informations = [
+        ContributionInformations(
+            identifier="1",
+            name="New Name",
+            rank=0,
+            ext_identifiers=[{"type": "orcid", "value": "0000-0002-3053-9512"}],
+        ),
+        ContributionInformations(identifier="2", name="Second Author", rank=1),
+        ContributionInformations(name="Author Without Id", rank=2),
+        ContributionInformations(identifier="2", name="Second Author", rank=3),
+        ContributionInformations(name="Author Without Id", rank=4),
+    ]
+    contributions = [
+        contribution
+        async for contribution in HalReferencesConverter()._contributions(  # pylint: disable=protected-access
+            contribution_informations, "hal"
+        )
+    ]
+    assert [contribution.rank for contribution in contributions] == [0, 1, 2, 3, 4]
+    assert contributions[0].contributor.name == "New Name"
+    assert contributions[0].contributor.name_variants == ["Old Name"]
+    assert [
+        identifier.value for identifier in contributions[0].contributor.identifiers
+    ] == ["https://orcid.org/0000-0002-3053-9512"]
+    assert contributions[1].contributor is contributions[3].contributor
+    assert contributions[2].contributor is contributions[4].contributor
+    assert contributions[2].contributor.source_identifier is None
+    dao = ContributorDAO(async_session)
+    assert len(await dao.get_by_source_and_identifiers("hal", ["1", "2"])) == 2
+    assert len(await dao.get_by_source_and_names("hal", ["Author Without Id"])) == 1
@@ -0,0 +1,54 @@
+"""Tests for the entities cache of the references converters."""
+from unittest import mock
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.daos.journal_dao import JournalDAO
+from app.harvesters.hal.hal_references_converter import HalReferencesConverter
+from app.harvesters.idref.idref_references_converter import IdrefReferencesConverter
+from app.harvesters.idref.idref_harvester import IdrefHarvester
+from app.services.journal.journal_data_class import JournalInformations
+
+
+async def test_journal_is_resolved_once_per_retrieval(async_session: AsyncSession):
+    """
+    Given a converter that has already resolved a journal
+    When the same journal is resolved again
+    Then the cached journal is returned without database query and can be merged
+    """
+    converter = HalReferencesConverter()
+    journal_informations = JournalInformations(
+        source="hal", source_identifier="1", issn=["1234-5678"], titles=["Journal"]
+    )
+    journal = (
+        await converter._get_or_create_journal(  # pylint: disable=protected-access
+            journal_informations
+        )
+    )
+    with mock.patch.object(
+        JournalDAO, "get_journal_by_source_issn_or_eissn_or_issn_l"
+    ) as get_journal:
+        cached_journal = (
+            await converter._get_or_create_journal(  # pylint: disable=protected-access
+                journal_informations
+            )
+        )
+    get_journal.assert_not_called()
+    assert cached_journal is journal
+    merged_journal = await async_session.merge(cached_journal)
+    assert merged_journal.id == journal.id
+    assert merged_journal.titles == ["Journal"]
+
+
+def test_idref_secondary_converters_share_the_entity_cache():
+    """
+    Given an Idref converter
+    When secondary converters are built for several references
+    Then they share the entity cache of the Idref converter
+    """
+    converter = IdrefReferencesConverter()
+    for _ in range(2):
+        converter._build_secondary_converter(  # pylint: disable=protected-access
+            mock.Mock(formatter_name=IdrefHarvester.Formatters.SUDOC_RDF.value)
+        )
+        assert converter.secondary_converter.entity_cache is converter.entity_cache
@@ -0,0 +1,61 @@
+"""Tests for the in-memory registry of the document types."""
+from unittest import mock
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.daos.document_type_dao import DocumentTypeDAO
+from app.db.models.document_type import DocumentType
+from app.harvesters.abstract_document_type_converter import (
+    AbstractDocumentTypeConverter,
+)
+from app.harvesters.document_type_registry import DocumentTypeRegistry
+from app.harvesters.hal.hal_document_type_converter import HalDocumentTypeConverter
+from app.harvesters.scopus.scopus_document_type_converter import (
+    ScopusDocumentTypeConverter,
+)
+
+
+async def test_registry_loads_the_converters_document_types(
+    async_session: AsyncSession,
+):
+    """
+    Given a document type already in database with its own label
+    When the registry is loaded
+    Then the document types of all the converters are inserted, the existing one is kept,
+    and all of them are served without database query
+    """
+    article_uri, _ = HalDocumentTypeConverter.TYPES_MAPPING["ART"]
+    async_session.add(DocumentType(uri=article_uri, label="Existing label"))
+    await async_session.commit()
+
+    registry = DocumentTypeRegistry()
+    await registry.load()
+
+    document_types = await DocumentTypeDAO(async_session).get_all()
+    uris = {document_type.uri for document_type in document_types}
+    assert AbstractDocumentTypeConverter.UNKNOWN_CODE[0] in uris
+    for converter in [HalDocumentTypeConverter, ScopusDocumentTypeConverter]:
+        assert {uri for uri, _ in converter.TYPES_MAPPING.values()} <= uris
+    assert len(registry.document_types) == len(document_types)
+    with mock.patch.object(DocumentTypeDAO, "get_document_type_by_uri") as get:
+        article = await registry.get_or_create(article_uri, "Article")
+    get.assert_not_called()
+    assert article.label == "Existing label"
+
+
+async def test_registry_inserts_unknown_document_types_once(
+    async_session: AsyncSession,
+):
+    """
+    Given a loaded registry
+    When an unknown document type is requested twice
+    Then it is inserted once and the same instance is returned
+    """
+    registry = DocumentTypeRegistry()
+    first = await registry.get_or_create("http://example.com/new_type", "New type")
+    second = await registry.get_or_create("http://example.com/new_type", "New type")
+
+    assert first is second
+    assert first.id is not None
+    merged = await async_session.merge(first)
+    assert merged.label == "New type"
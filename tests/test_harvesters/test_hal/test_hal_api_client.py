@@ -0,0 +1,85 @@
+"""Tests for the HAL API client."""
+from unittest import mock
+from urllib.parse import parse_qs, urlsplit
+
+import aiohttp
+import pytest
+
+from app.harvesters.hal.hal_api_client import HalApiClient
+from app.harvesters.hal.hal_api_query_builder import HalApiQueryBuilder
+
+
+def _page(doc_ids: list[str], next_cursor_mark: str) -> dict:
+    return {
+        "response": {"docs": [{"halId_s": doc_id} for doc_id in doc_ids]},
+        "nextCursorMark": next_cursor_mark,
+    }
+
+
+@pytest.fixture(name="hal_api_paginated_mock")
+def fixture_hal_api_paginated_mock():
+    """Hal API mock returning 3 pages of results, depending on the cursor mark"""
+    pages = {
+        "*": _page(["hal-1", "hal-2"], "cursor_1"),
+        "cursor_1": _page(["hal-3", "hal-4"], "cursor_2"),
+        "cursor_2": _page(["hal-5"], "cursor_3"),
+    }
+
+    def get(url: str):
+        cursor_mark = parse_qs(urlsplit(url).query)["cursorMark"][0]
+        response = mock.MagicMock()
+        response.__aenter__.return_value.status = 200
+        response.__aenter__.return_value.json = mock.AsyncMock(
+            return_value=pages[cursor_mark]
+        )
+        return response
+
+    with mock.patch.object(aiohttp.ClientSession, "get") as aiohttp_client_session_get:
+        aiohttp_client_session_get.side_effect = get
+        yield aiohttp_client_session_get
+
+
+@pytest.mark.asyncio
+async def test_hal_api_client_follows_cursor_marks(hal_api_paginated_mock):
+    """
+    GIVEN a HAL API returning results on several pages
+    WHEN the client fetches the results with a page size of 2
+    THEN all the pages are requested following the cursor marks
+        and all the documents are returned in order
+    """
+    builder = HalApiQueryBuilder()
+    builder.set_query(HalApiQueryBuilder.QueryParameters.AUTH_ID_HAL_I, "123456")
+    builder.set_rows(2)
+
+    docs = [doc async for doc in HalApiClient().fetch(builder)]
+
+    assert [doc["halId_s"] for doc in docs] == [
+        "hal-1",
+        "hal-2",
+        "hal-3",
+        "hal-4",
+        "hal-5",
+    ]
+    # the last page is incomplete, so no further page is requested
+    assert hal_api_paginated_mock.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_hal_api_client_fetches_pages(hal_api_paginated_mock):
+    """
+    GIVEN a HAL API returning results on several pages
+    WHEN the client fetches the pages of results with a page size of 2
+    THEN the documents are returned page by page
+    """
+    builder = HalApiQueryBuilder()
+    builder.set_query(HalApiQueryBuilder.QueryParameters.AUTH_ID_HAL_I, "123456")
+    builder.set_rows(2)
+
+    pages = [docs async for docs in HalApiClient().fetch_pages(builder)]
+
+    assert [[doc["halId_s"] for doc in docs] for docs in pages] == [
+        ["hal-1", "hal-2"],
+        ["hal-3", "hal-4"],
+        ["hal-5"],
+    ]
+    assert hal_api_paginated_mock.call_count == 3
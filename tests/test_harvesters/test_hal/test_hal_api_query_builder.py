@@ -54,7 +54,8 @@ def test_build_query_with_idhal_i(hal_query_builder):
         "fq": ["docType_s:(ART OR OUV OR COUV)"],
         "q": [f"authIdHal_i:{test_idhal_i}"],
         "rows": ["1000"],
-        "sort": ["test_key_parameter dsc"],
+        "sort": ["test_key_parameter dsc,docid asc"],
+        "cursorMark": ["*"],
     }
 
     assert result_dict == expected_result
@@ -82,7 +83,8 @@ def test_build_query_with_orcid_id(hal_query_builder):
         "fq": ["docType_s:(ART OR OUV OR COUV)"],
         "q": [f'authORCIDIdExt_id:"{orcid}"'],
         "rows": ["1000"],
-        "sort": ["test_key_parameter dsc"],
+        "sort": ["test_key_parameter dsc,docid asc"],
+        "cursorMark": ["*"],
     }
 
     assert result_dict == expected_result
@@ -106,3 +108,28 @@ def test_build_query__without_set_query_set(hal_query_builder):
     """Test if the build function raise an error if the set_query is not set"""
     with pytest.raises(AssertionError):
         hal_query_builder.build()
+
+
+def test_build_query_with_cursor_mark_and_rows(hal_query_builder):
+    """
+    GIVEN a HalApiQueryBuilder instance
+    WHEN the cursor mark and the number of rows are set
+    THEN the query contains the cursor mark and the number of rows
+        and building it twice returns the same query
+
+    :param hal_query_builder:
+    :return:
+    """
+    orcid = "0000-0002-1825-0097"
+    hal_query_builder.set_query(
+        hal_query_builder.QueryParameters.AUTH_ORCID_ID_EXT_ID, orcid
+    )
+    hal_query_builder.set_rows(200)
+    hal_query_builder.set_cursor_mark("AoEpaGFsLTAxMjM0NTY3")
+
+    result_dict = parse_qs(hal_query_builder.build())
+
+    assert result_dict["cursorMark"] == ["AoEpaGFsLTAxMjM0NTY3"]
+    assert result_dict["rows"] == ["200"]
+    assert parse_qs(hal_query_builder.build()) == result_dict
+    assert result_dict["q"] == [f'authORCIDIdExt_id:"{orcid}"']
@@ -321,7 +321,14 @@ async def test_hal_harvester_register_document_type_in_db(
     hal_harvester.set_entity_id(hal_harvesting_db_model_id_hal_i.retrieval.entity_id)
     await hal_harvester.run()
     hal_api_client_mock.assert_called_once()
-    stmt = select(DocumentType.uri)
+    # all the document types of the converters are preloaded,
+    # only one of them is used by the harvested references
+    stmt = (
+        select(DocumentType.uri)
+        .select_from(Reference)
+        .join(Reference.document_type)
+        .distinct()
+    )
     result = await async_session.execute(stmt)
     results = list(result)
     assert len(results) == 1
@@ -389,3 +396,57 @@ async def test_harvester_version_number_increased(
         assert reference_event.enhanced is True
         assert reference2.version == reference1.version + 1
         assert reference2.titles[0].value == reference1.titles[0].value
+
+
+@pytest.fixture(name="hal_api_client_mock_with_contributors")
+def fixture_hal_api_client_mock_with_contributors(
+    hal_api_docs_with_contributors_version_1: dict,
+):
+    """Hal api client mock returning several documents with common contributors"""
+    with mock.patch.object(aiohttp.ClientSession, "get") as aiohttp_client_session_get:
+        aiohttp_client_session_get.return_value.__aenter__.return_value.status = 200
+        aiohttp_client_session_get.return_value.__aenter__.return_value.json.return_value = (
+            hal_api_docs_with_contributors_version_1
+        )
+        yield aiohttp_client_session_get
+
+
+@pytest.mark.asyncio
+async def test_hal_harvester_with_concurrent_conversion_registers_all_docs(
+    hal_harvester: HalHarvester,
+    hal_harvesting_db_model_id_hal_i,
+    hal_api_client_mock_with_contributors,
+    hal_api_docs_with_contributors_version_1: dict,
+    async_session: AsyncSession,
+):
+    """
+    GIVEN a hal harvester configured with several conversion workers
+    WHEN the harvester is run on documents sharing contributors
+    THEN each document is registered once with a "created" event
+        and the harvesting is completed
+    """
+    async_session.add(hal_harvesting_db_model_id_hal_i)
+    await async_session.commit()
+    hal_harvester.set_harvesting_id(hal_harvesting_db_model_id_hal_i.id)
+    hal_harvester.set_entity_id(hal_harvesting_db_model_id_hal_i.retrieval.entity_id)
+    hal_harvester.set_conversion_workers(3)
+    await hal_harvester.run()
+    hal_api_client_mock_with_contributors.assert_called_once()
+    stmt = (
+        select(Reference, ReferenceEvent)
+        .join(ReferenceEvent)
+        .join(Harvesting)
+        .filter(Harvesting.id == hal_harvesting_db_model_id_hal_i.id)
+    )
+    results = list((await async_session.execute(stmt)).unique())
+    expected_identifiers = {
+        doc["halId_s"]
+        for doc in hal_api_docs_with_contributors_version_1["response"]["docs"]
+    }
+    assert {reference.source_identifier for reference, _ in results} == (
+        expected_identifiers
+    )
+    assert len(results) == len(expected_identifiers)
+    assert all(event.type == ReferenceEvent.Type.CREATED.value for _, event in results)
+    harvesting = await hal_harvester.get_harvesting(refresh=True)
+    assert harvesting.state == Harvesting.State.COMPLETED.value
@@ -4,6 +4,7 @@ import pytest
 from semver import VersionInfo
 
 from app.db.models.contribution import Contribution
+from app.db.models.organization import Organization
 from app.harvesters.hal.hal_references_converter import HalReferencesConverter
 from app.harvesters.json_harvester_raw_result import JsonHarvesterRawResult
 
@@ -243,3 +244,46 @@ async def test_publication_with_files(hal_api_docs_for_researcher_with_uris: dic
     assert reference.manifestations[0].download_url == doc["fileMain_s"]
     assert len(reference.manifestations[0].additional_files) == 1
     assert reference.manifestations[0].additional_files[0] == doc["files_s"][1]
+
+
+async def test_convert_with_prefetched_organizations(
+    hal_api_cleaned_response,
+    mock_hal_organization_solver,
+    mock_hal_organization_solver_solve_many,
+):
+    """
+    GIVEN a HAL document whose author has 7 structures
+    WHEN the structures are prefetched before the conversion
+    THEN they are dereferenced with a single bulk query
+        and the structures are not dereferenced one by one
+    """
+    doc = hal_api_cleaned_response[0]
+    mock_hal_organization_solver_solve_many.side_effect = lambda identifiers: {
+        identifier: Organization(
+            source="hal",
+            source_identifier=identifier,
+            name=f"Prefetched organization {identifier}",
+        )
+        for identifier in identifiers
+    }
+    converter_under_tests = HalReferencesConverter()
+    await converter_under_tests.prefetch_organizations([doc])
+    result = JsonHarvesterRawResult(
+        source_identifier=doc["docid"], payload=doc, formatter_name="HAL"
+    )
+    test_reference = converter_under_tests.build(
+        raw_data=result, harvester_version=VersionInfo.parse("0.0.0")
+    )
+    await converter_under_tests.convert(raw_data=result, new_ref=test_reference)
+
+    mock_hal_organization_solver_solve_many.assert_called_once()
+    assert sorted(mock_hal_organization_solver_solve_many.call_args.args[0]) == sorted(
+        ["140228", "7550", "99539", "110691", "564132", "300301", "441569"]
+    )
+    mock_hal_organization_solver.assert_not_called()
+    affiliations = test_reference.contributions[0].affiliations
+    assert len(affiliations) == 7
+    assert all(
+        affiliation.name == f"Prefetched organization {affiliation.source_identifier}"
+        for affiliation in affiliations
+    )
@@ -0,0 +1,56 @@
+from app.harvesters.hal.hal_tei_interface import HalTEIDecoder
+
+NAMESPACE = {"tei": "http://www.tei-c.org/ns/1.0"}
+
+
+def _identifiers_by_xpath(decoder: HalTEIDecoder, numeric_id_hal: str) -> list:
+    author = decoder.tree.xpath(
+        f"//tei:author[.//tei:idno[@type='idhal'][@notation='numeric' "
+        f"and text()='{numeric_id_hal}']]",
+        namespaces=NAMESPACE,
+    )[0]
+    return [
+        decoder._process_identifier_data(  # pylint: disable=protected-access
+            idno.get("type"), idno.text
+        )
+        for idno in author.xpath(".//tei:idno", namespaces=NAMESPACE)
+        if idno.get("type") and idno.text
+    ]
+
+
+def test_get_identifiers_from_author_index(hal_api_docs_with_contributor_identifiers):
+    """
+    GIVEN the TEI of a HAL document with several identified authors
+    WHEN the identifiers of each author are requested
+    THEN they are the same as the identifiers of the author found by XPath
+    """
+    doc = hal_api_docs_with_contributor_identifiers["response"]["docs"][0]
+    decoder = HalTEIDecoder(tei_raw_data=doc["label_xml"])
+    numeric_ids_hal = {
+        idno.text
+        for idno in decoder.tree.xpath(
+            "//tei:author//tei:idno[@type='idhal'][@notation='numeric']",
+            namespaces=NAMESPACE,
+        )
+    }
+
+    assert "1288873" in numeric_ids_hal
+    for numeric_id_hal in numeric_ids_hal:
+        assert decoder.get_identifiers(numeric_id_hal) == _identifiers_by_xpath(
+            decoder, numeric_id_hal
+        )
+    assert {"type": "orcid", "value": "https://orcid.org/0000-0002-3053-9512"} in (
+        decoder.get_identifiers("1288873")
+    )
+    assert not decoder.get_identifiers("0")
+
+
+def test_get_identifiers_from_invalid_tei():
+    """
+    GIVEN an invalid TEI document
+    WHEN the identifiers of an author are requested
+    THEN no identifier is returned
+    """
+    decoder = HalTEIDecoder(tei_raw_data="<TEI><unclosed></TEI>")
+
+    assert not decoder.get_identifiers("1288873")
@@ -49,3 +49,21 @@ def test_build_query_for_person_with_orcid():
     query = idref_query_builder.build()
     assert "?pub ?role ?pers ." in query
     assert f"?pers vivo:orcidId \"{orcid}\" ." in query
+
+
+def test_build_paginated_query_for_person():
+    """
+    GIVEN a IdrefSparqlQueryBuilder instance for a person
+    WHEN a page is set
+    THEN the rows are totally ordered, by publication first, and limited to the page
+
+    :return: None
+    """
+    idref_query_builder = IdrefSparqlQueryBuilder()
+    idref_query_builder.set_subject_type(IdrefSparqlQueryBuilder.SubjectType.PERSON)
+    idref_query_builder.set_idref_id("test_idref_id")
+    assert idref_query_builder.build().endswith("ORDER BY ?pub\nLIMIT 10000")
+    idref_query_builder.set_page(limit=500, offset=1000)
+    query = idref_query_builder.build()
+    assert "ORDER BY ?pub ?role ?type ?title" in query
+    assert query.endswith("LIMIT 500\nOFFSET 1000")
@@ -0,0 +1,95 @@
+"""Tests for the processing of the data.idref.fr publications as they are received"""
+
+import asyncio
+
+import pytest
+
+from app.harvesters.exceptions.external_endpoint_failure import ExternalEndpointFailure
+from app.harvesters.idref.idref_harvester import IdrefHarvester
+from app.harvesters.idref.idref_references_converter import IdrefReferencesConverter
+
+
+def _doc(index: int, source: str = "IDREF") -> dict:
+    return {"uri": f"http://www.idref.fr/{index}/id", "secondary_source": source}
+
+
+async def test_publications_chunks_gather_received_publications():
+    """
+    GIVEN publications received in two bursts
+    WHEN they are grouped into chunks of 2 publications at most
+    THEN each chunk is yielded as soon as its publications are received,
+        without waiting for the end of the query
+
+    :return: None
+    """
+    second_burst = asyncio.Event()
+
+    async def publications(_before_next_page):
+        for index in range(3):
+            yield _doc(index)
+        await second_burst.wait()
+        yield _doc(3)
+
+    harvester = IdrefHarvester(converter=IdrefReferencesConverter())
+    chunks = harvester._publications_chunks(  # pylint: disable=protected-access
+        publications, 2
+    )
+    assert await anext(chunks) == [_doc(0), _doc(1)]
+    assert await anext(chunks) == [_doc(2)]
+    second_burst.set()
+    assert await anext(chunks) == [_doc(3)]
+    with pytest.raises(StopAsyncIteration):
+        await anext(chunks)
+
+
+async def test_publications_chunks_raise_query_errors_after_received_publications():
+    """
+    GIVEN a SPARQL query that fails after a publication
+    WHEN the publications are grouped into chunks
+    THEN the received publication is yielded, then the error is raised
+
+    :return: None
+    """
+
+    async def publications(_before_next_page):
+        yield _doc(0)
+        raise ExternalEndpointFailure("Idref SPARQL endpoint unavailable")
+
+    harvester = IdrefHarvester(converter=IdrefReferencesConverter())
+    received = []
+    with pytest.raises(ExternalEndpointFailure):
+        async for chunk in harvester._publications_chunks(  # pylint: disable=protected-access
+            publications, 10
+        ):
+            received.extend(chunk)
+    assert received == [_doc(0)]
+
+
+async def test_publications_chunks_bound_the_pages_read_ahead():
+    """
+    GIVEN a query paginated by 4 publications, returning 20 publications
+    WHEN they are grouped into chunks of 2 publications
+        and only the first chunk is processed
+    THEN the next pages are only queried while less than 2 chunks are waiting
+
+    :return: None
+    """
+    read = []
+
+    async def publications(before_next_page):
+        for page in range(5):
+            for index in range(4):
+                read.append(page * 4 + index)
+                yield _doc(page * 4 + index)
+            await before_next_page()
+
+    harvester = IdrefHarvester(converter=IdrefReferencesConverter())
+    chunks = harvester._publications_chunks(  # pylint: disable=protected-access
+        publications, 2
+    )
+    assert await anext(chunks) == [_doc(0), _doc(1)]
+    await asyncio.sleep(0.01)
+    # the first page, then the second one once the first chunk was taken
+    assert len(read) == 8
+    received = [doc async for chunk in chunks for doc in chunk]
+    assert received == [_doc(index) for index in range(2, 20)]
@@ -1,13 +1,14 @@
 import datetime
 from unittest import mock
 
-import aiosparql.client
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.harvesters.idref.idref_harvester import IdrefHarvester
 from app.harvesters.idref.idref_references_converter import IdrefReferencesConverter
+from app.harvesters.idref.idref_sparql_client import IdrefSparqlClient
 from app.models.references import Reference
+from tests.fixtures.idref_sparql_endpoint_docs_fixtures import _sparql_bindings_stream
 
 
 @pytest.fixture(name="idref_sparql_endpoint_client_mock_with_idref_pubs")
@@ -16,12 +17,13 @@ def fixture_idref_sparql_endpoint_client_mock_with_idref_pubs(
 ):
     """Retrieval service mock to detect run method calls."""
     with mock.patch.object(
-        aiosparql.client.SPARQLClient, "query"
-    ) as aiosparql_client_query:
-        aiosparql_client_query.return_value = (
+        IdrefSparqlClient,
+        "stream_bindings",
+        side_effect=_sparql_bindings_stream(
             idref_sparql_endpoint_results_with_idref_pubs
-        )
-        yield aiosparql_client_query
+        ),
+    ) as stream_bindings_mock:
+        yield stream_bindings_mock
 
 
 @pytest.fixture(name="idref_sparql_endpoint_client_mock_with_sudoc_pub")
@@ -30,12 +32,13 @@ def fixture_idref_sparql_endpoint_client_mock_with_sudoc_pub(
 ):
     """Retrieval service mock to detect run method calls."""
     with mock.patch.object(
-        aiosparql.client.SPARQLClient, "query"
-    ) as aiosparql_client_query:
-        aiosparql_client_query.return_value = (
+        IdrefSparqlClient,
+        "stream_bindings",
+        side_effect=_sparql_bindings_stream(
             idref_sparql_endpoint_results_with_sudoc_pub
-        )
-        yield aiosparql_client_query
+        ),
+    ) as stream_bindings_mock:
+        yield stream_bindings_mock
 
 
 @pytest.mark.integration
@@ -0,0 +1,140 @@
+"""Tests for the data.idref.fr SPARQL client"""
+
+from unittest import mock
+
+from app.harvesters.idref.idref_sparql_client import IdrefSparqlClient
+from app.harvesters.idref.idref_sparql_query_builder import IdrefSparqlQueryBuilder
+
+AUTHOR_ROLE = "http://id.loc.gov/vocabulary/relators/aut"
+EDITOR_ROLE = "http://id.loc.gov/vocabulary/relators/edt"
+
+
+def _row(pub: str, title: str, contributor_role: str = AUTHOR_ROLE) -> dict:
+    return {
+        "pub": {"type": "uri", "value": pub},
+        "role": {"type": "uri", "value": AUTHOR_ROLE},
+        "title": {"type": "literal", "value": title},
+        "contributor": {"type": "uri", "value": "http://www.idref.fr/1/id"},
+        "contributorName": {"type": "literal", "value": "Doe, John"},
+        "contributorRole": {"type": "uri", "value": contributor_role},
+    }
+
+
+def _builder() -> IdrefSparqlQueryBuilder:
+    return (
+        IdrefSparqlQueryBuilder()
+        .set_subject_type(IdrefSparqlQueryBuilder.SubjectType.PERSON)
+        .set_idref_id("1")
+    )
+
+
+async def test_fetch_publications_aggregates_rows_of_each_publication(
+    idref_sparql_endpoint_results_with_idref_pubs: dict,
+):
+    """
+    GIVEN the rows of the person query for a publication
+    WHEN the publications are fetched
+    THEN one publication is yielded with the data of all its rows
+
+    :param idref_sparql_endpoint_results_with_idref_pubs: SPARQL JSON results
+    :return: None
+    """
+    bindings = idref_sparql_endpoint_results_with_idref_pubs["results"]["bindings"]
+
+    async def stream_bindings(_query):
+        for binding in bindings:
+            yield binding
+
+    with mock.patch.object(
+        IdrefSparqlClient, "stream_bindings", side_effect=stream_bindings
+    ):
+        publications = [
+            publication
+            async for publication in IdrefSparqlClient().fetch_publications(_builder())
+        ]
+    assert len(publications) == 1
+    assert publications[0]["uri"] == "http://www.idref.fr/263276112/id"
+    assert publications[0]["secondary_source"] == "IDREF"
+    assert set(publications[0]["title"]) == {
+        binding.get("title", {}).get("value", "") for binding in bindings
+    }
+
+
+async def test_fetch_publications_yields_publications_as_rows_are_received():
+    """
+    GIVEN rows ordered by publication
+    WHEN the publications are fetched
+    THEN each publication is yielded before the rows of the next ones are read
+
+    :return: None
+    """
+    rows_read = []
+
+    async def stream_bindings(_query):
+        for row in [
+            _row("http://www.sudoc.fr/1", "a"),
+            _row("http://www.sudoc.fr/1", "b"),
+            _row("http://www.sudoc.fr/2", "c"),
+        ]:
+            rows_read.append(row)
+            yield row
+
+    with mock.patch.object(
+        IdrefSparqlClient, "stream_bindings", side_effect=stream_bindings
+    ):
+        publications = IdrefSparqlClient().fetch_publications(_builder())
+        first_publication = await anext(publications)
+        assert first_publication["title"] == ["a", "b"]
+        assert len(rows_read) == 3
+        second_publication = await anext(publications)
+        assert second_publication["title"] == ["c"]
+
+
+async def test_fetch_publications_merges_publications_split_across_pages():
+    """
+    GIVEN a paginated person query with a publication split across two pages
+    WHEN the publications are fetched
+    THEN the pages are queried until a page is not full
+    AND the split publication is yielded once with the rows of both pages
+    AND the function to await between pages is awaited before each next page
+
+    :return: None
+    """
+    pages = {
+        0: [_row("http://www.sudoc.fr/1", "a"), _row("http://www.sudoc.fr/2", "b")],
+        2: [_row("http://www.sudoc.fr/2", "c"), _row("http://www.sudoc.fr/3", "d")],
+        4: [_row("http://www.sudoc.fr/3", "e", contributor_role=EDITOR_ROLE)],
+    }
+    queries = []
+    before_next_page = mock.AsyncMock()
+
+    async def stream_bindings(query):
+        queries.append(query)
+        assert before_next_page.await_count == len(queries) - 1
+        offset = int(query.rsplit("OFFSET ", 1)[1])
+        for row in pages[offset]:
+            yield row
+
+    with mock.patch.object(
+        IdrefSparqlClient, "stream_bindings", side_effect=stream_bindings
+    ):
+        publications = [
+            publication
+            async for publication in IdrefSparqlClient().fetch_publications(
+                _builder(), page_size=2, before_next_page=before_next_page
+            )
+        ]
+    assert len(queries) == 3
+    assert before_next_page.await_count == 2
+    assert all("LIMIT 2\n" in query for query in queries)
+    assert [publication["uri"] for publication in publications] == [
+        "http://www.sudoc.fr/1",
+        "http://www.sudoc.fr/2",
+        "http://www.sudoc.fr/3",
+    ]
+    assert publications[1]["title"] == ["b", "c"]
+    assert publications[2]["title"] == ["d", "e"]
+    assert publications[2]["contributors"]["http://www.idref.fr/1/id"]["roles"] == [
+        AUTHOR_ROLE,
+        EDITOR_ROLE,
+    ]
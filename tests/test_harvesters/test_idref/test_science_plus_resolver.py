@@ -0,0 +1,203 @@
+"""Tests for the Science+ SPARQL endpoint resolver"""
+
+import asyncio
+from unittest import mock
+
+from rdflib import BNode, DCTERMS, Graph, Literal, URIRef
+
+from app.config import get_app_settings
+from app.harvesters.exceptions.external_endpoint_failure import ExternalEndpointFailure
+from app.harvesters.idref.idref_harvester import IdrefHarvester
+from app.harvesters.idref.idref_references_converter import IdrefReferencesConverter
+from app.harvesters.idref.rdf_resolver import RdfResolver
+from app.harvesters.idref.science_plus_resolver import SciencePlusResolver
+from app.services.cache.third_api_cache import ThirdApiCache
+
+JOURNAL_URI = "http://hub.abes.fr/springer/periodical/10571/w"
+ISSUE_URI = "http://hub.abes.fr/springer/periodical/10571/1992/volume_12/issue_1/w"
+ARTICLE_URI = (
+    "http://hub.abes.fr/cairn/periodical/autr/2008/issue_autr045/"
+    "D33AF39D3B7834E0E053120B220A2036/w"
+)
+
+
+def test_describe_query_uri_for_one_resource():
+    """
+    GIVEN a single resource
+    WHEN the DESCRIBE query URI is built
+    THEN it is the URI of the DESCRIBE query of the resource alone
+
+    :return: None
+    """
+    assert SciencePlusResolver.describe_query_uri([JOURNAL_URI]) == (
+        "https://scienceplus.abes.fr/sparql?query=define+sql%3Adescribe-mode+%22CBD%22"
+        "++DESCRIBE+%3Chttp%3A%2F%2Fhub.abes.fr%2Fspringer%2Fperiodical%2F10571%2Fw%3E"
+        "&output=application%2Frdf%2Bxml"
+    )
+
+
+async def test_fetch_many_splits_batched_descriptions_by_resource(
+    science_plus_rdf_result_for_journal: Graph,
+    science_plus_rdf_result_for_issue: Graph,
+):
+    """
+    GIVEN three resources and DESCRIBE queries of two resources at most
+    WHEN they are fetched
+    THEN two queries are sent and the description of each resource
+        contains its triples and the ones of its blank nodes only
+
+    :param science_plus_rdf_result_for_journal: description of the journal
+    :param science_plus_rdf_result_for_issue: description of the issue
+    :return: None
+    """
+    address = BNode()
+    batch_graph = (
+        science_plus_rdf_result_for_journal + science_plus_rdf_result_for_issue
+    )
+    batch_graph.add((URIRef(JOURNAL_URI), DCTERMS.publisher, address))
+    batch_graph.add((address, DCTERMS.title, Literal("Springer")))
+    settings = get_app_settings()
+    with mock.patch.object(
+        RdfResolver, "fetch", return_value=batch_graph
+    ) as fetch_mock, mock.patch.object(settings, "science_plus_describe_batch_size", 2):
+        descriptions = await SciencePlusResolver().fetch_many(
+            [JOURNAL_URI, ISSUE_URI, ARTICLE_URI, JOURNAL_URI]
+        )
+    assert fetch_mock.call_count == 2
+    assert fetch_mock.call_args_list[0].args[0] == (
+        SciencePlusResolver.describe_query_uri([JOURNAL_URI, ISSUE_URI])
+    )
+    assert set(descriptions) == {JOURNAL_URI, ISSUE_URI, ARTICLE_URI}
+    assert (
+        len(descriptions[JOURNAL_URI]) == len(science_plus_rdf_result_for_journal) + 2
+    )
+    assert (address, DCTERMS.title, Literal("Springer")) in descriptions[JOURNAL_URI]
+    assert set(descriptions[ISSUE_URI]) == set(science_plus_rdf_result_for_issue)
+    assert len(descriptions[ARTICLE_URI]) == 0
+
+
+async def test_fetch_many_skips_failed_batches(
+    science_plus_rdf_result_for_journal: Graph,
+):
+    """
+    GIVEN two DESCRIBE queries, one of which fails
+    WHEN the resources are fetched
+    THEN only the resources of the successful query are returned
+
+    :param science_plus_rdf_result_for_journal: description of the journal
+    :return: None
+    """
+    settings = get_app_settings()
+    with mock.patch.object(
+        RdfResolver,
+        "fetch",
+        side_effect=[science_plus_rdf_result_for_journal, ExternalEndpointFailure("")],
+    ), mock.patch.object(settings, "science_plus_describe_batch_size", 1):
+        descriptions = await SciencePlusResolver().fetch_many([JOURNAL_URI, ISSUE_URI])
+    assert list(descriptions) == [JOURNAL_URI]
+
+
+async def test_fetch_many_with_bounded_parallelism(
+    science_plus_rdf_result_for_journal: Graph,
+):
+    """
+    GIVEN 6 resources, DESCRIBE queries of one resource
+        and 2 parallel Science+ queries at most
+    WHEN the resources are fetched
+    THEN no more than 2 queries are sent at the same time
+
+    :param science_plus_rdf_result_for_journal: description of the journal
+    :return: None
+    """
+    running = 0
+    max_running = 0
+
+    async def fetch(*_args, **_kwargs) -> Graph:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return science_plus_rdf_result_for_journal
+
+    settings = get_app_settings()
+    with mock.patch.object(RdfResolver, "fetch", side_effect=fetch), mock.patch.object(
+        settings, "science_plus_describe_batch_size", 1
+    ), mock.patch.dict(
+        settings.idref_secondary_sources_parallelism, {"SCIENCE_PLUS": 2}
+    ):
+        descriptions = await SciencePlusResolver().fetch_many(
+            [f"{JOURNAL_URI}{index}" for index in range(6)]
+        )
+    assert len(descriptions) == 6
+    assert max_running == 2
+
+
+async def test_describe_many_fetches_and_caches_missing_resources(
+    science_plus_rdf_result_for_journal: Graph,
+    science_plus_rdf_result_for_issue: Graph,
+):
+    """
+    GIVEN a cached resource and a resource missing from the cache
+    WHEN they are described
+    THEN only the missing resource is fetched, then cached
+
+    :param science_plus_rdf_result_for_journal: description of the journal
+    :param science_plus_rdf_result_for_issue: description of the issue
+    :return: None
+    """
+    with mock.patch.object(
+        ThirdApiCache,
+        "get_many",
+        return_value={JOURNAL_URI: science_plus_rdf_result_for_journal},
+    ), mock.patch.object(ThirdApiCache, "set_many") as set_many_mock, mock.patch.object(
+        RdfResolver, "fetch", return_value=science_plus_rdf_result_for_issue
+    ) as fetch_mock:
+        descriptions = await SciencePlusResolver().describe_many(
+            [JOURNAL_URI, ISSUE_URI]
+        )
+    fetch_mock.assert_called_once_with(
+        SciencePlusResolver.describe_query_uri([ISSUE_URI]), output_format="xml"
+    )
+    set_many_mock.assert_called_once_with(
+        SciencePlusResolver.RESOURCES_API_NAME,
+        {ISSUE_URI: descriptions[ISSUE_URI]},
+    )
+    assert descriptions[JOURNAL_URI] is science_plus_rdf_result_for_journal
+
+
+async def test_harvester_prefetches_science_plus_documents_in_batches(
+    science_plus_rdf_graph_for_doc: Graph,
+):
+    """
+    GIVEN Science+ publications, one of which is cached
+    WHEN the Science+ documents are prefetched by the harvester
+    THEN the publications missing from the cache are fetched in one call
+        and their related resources are described in one call
+
+    :param science_plus_rdf_graph_for_doc: description of a publication
+    :return: None
+    """
+    cached_uri = "http://hub.abes.fr/cairn/periodical/autr/2008/issue_autr045/CACHED"
+    docs = [
+        {"uri": ARTICLE_URI, "secondary_source": "SCIENCE_PLUS"},
+        {"uri": cached_uri, "secondary_source": "SCIENCE_PLUS"},
+        {"uri": "http://www.sudoc.fr/193726130/id", "secondary_source": "SUDOC"},
+    ]
+    harvester = IdrefHarvester(converter=IdrefReferencesConverter())
+    cached_key = harvester._cache_key(docs[1])  # pylint: disable=protected-access
+    harvester.documents_cache = {cached_key: Graph()}
+    with mock.patch.object(
+        SciencePlusResolver,
+        "fetch_many",
+        return_value={ARTICLE_URI: science_plus_rdf_graph_for_doc},
+    ) as fetch_many_mock, mock.patch.object(
+        SciencePlusResolver, "describe_many"
+    ) as describe_many_mock:
+        await harvester._prefetch_science_plus_documents(  # pylint: disable=protected-access
+            docs
+        )
+    fetch_many_mock.assert_called_once_with([ARTICLE_URI])
+    article_key = harvester._cache_key(docs[0])  # pylint: disable=protected-access
+    assert harvester.documents_cache[article_key] is science_plus_rdf_graph_for_doc
+    describe_many_mock.assert_called_once_with([JOURNAL_URI, ISSUE_URI])
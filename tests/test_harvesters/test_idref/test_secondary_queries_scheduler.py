@@ -0,0 +1,61 @@
+"""Tests for the Idref secondary queries scheduler."""
+import asyncio
+
+from app.harvesters.idref.secondary_queries_scheduler import (
+    SecondaryQueriesScheduler,
+)
+
+
+async def _query(result: str, release: asyncio.Event, started: list[str]) -> str:
+    started.append(result)
+    await release.wait()
+    return result
+
+
+async def test_scheduler_limits_concurrent_queries_by_source():
+    """
+    Given a scheduler with a window of 2 queries for SUDOC
+    When 3 SUDOC queries and 1 PERSEE query are submitted
+    Then only 2 SUDOC queries are started, and the last one is started
+    as soon as one of them completes
+    """
+    scheduler = SecondaryQueriesScheduler(limits={"SUDOC": 2}, default_limit=5)
+    sudoc_release = asyncio.Event()
+    persee_release = asyncio.Event()
+    started = []
+    for i in range(3):
+        scheduler.submit("SUDOC", _query(f"sudoc_{i}", sudoc_release, started))
+    scheduler.submit("PERSEE", _query("persee", persee_release, started))
+    await asyncio.sleep(0)
+    assert sorted(started) == ["persee", "sudoc_0", "sudoc_1"]
+
+    sudoc_release.set()
+    done_queries = await scheduler.wait()
+    assert {query.result() for query in done_queries} == {"sudoc_0", "sudoc_1"}
+    await asyncio.sleep(0)
+    assert "sudoc_2" in started
+    persee_release.set()
+    results = []
+    while scheduler.pending:
+        results.extend(query.result() for query in await scheduler.wait())
+    assert sorted(results) == ["persee", "sudoc_2"]
+
+
+async def test_scheduler_does_not_wait_for_slow_source():
+    """
+    Given a slow SUDOC query running in the scheduler
+    When a PERSEE query completes
+    Then its result is available without waiting for the SUDOC query
+    """
+    scheduler = SecondaryQueriesScheduler(limits={"SUDOC": 3}, default_limit=5)
+    sudoc_release = asyncio.Event()
+    persee_release = asyncio.Event()
+    started = []
+    scheduler.submit("SUDOC", _query("sudoc", sudoc_release, started))
+    scheduler.submit("PERSEE", _query("persee", persee_release, started))
+    persee_release.set()
+    done_queries = await scheduler.wait()
+    assert [query.result() for query in done_queries] == ["persee"]
+    assert scheduler.pending
+    scheduler.cancel()
+    assert not scheduler.pending
@@ -0,0 +1,81 @@
+"""Tests for the incremental reader of SPARQL JSON results"""
+
+import json
+
+import pytest
+
+from app.harvesters.exceptions.unexpected_format_exception import (
+    UnexpectedFormatException,
+)
+from app.harvesters.idref.sparql_json_bindings_reader import SparqlJsonBindingsReader
+
+
+async def _chunks(data: bytes, size: int):
+    for start in range(0, len(data), size):
+        yield data[start : start + size]
+
+
+async def _read(data: bytes, size: int) -> list[dict]:
+    return [
+        binding
+        async for binding in SparqlJsonBindingsReader().read(_chunks(data, size))
+    ]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 64, 100000])
+async def test_reader_yields_bindings_whatever_the_chunks(
+    idref_sparql_endpoint_results_with_idref_pubs: dict, chunk_size: int
+):
+    """
+    GIVEN a SPARQL JSON results document with non ascii characters
+    WHEN it is read by chunks of any size
+    THEN the bindings are the ones of the whole document, in the same order
+
+    :param idref_sparql_endpoint_results_with_idref_pubs: SPARQL JSON results
+    :param chunk_size: size of the chunks
+    :return: None
+    """
+    bindings = idref_sparql_endpoint_results_with_idref_pubs["results"]["bindings"]
+    bindings.append(
+        {
+            "pub": {"type": "uri", "value": "http://www.sudoc.fr/1"},
+            "title": {"type": "literal", "value": "Économie et société, « 1 ]}"},
+        }
+    )
+    data = json.dumps(
+        idref_sparql_endpoint_results_with_idref_pubs, ensure_ascii=False, indent=2
+    ).encode("utf-8")
+    assert await _read(data, chunk_size) == bindings
+
+
+async def test_reader_yields_no_binding_for_empty_results():
+    """
+    GIVEN a SPARQL JSON results document without bindings
+    WHEN it is read
+    THEN no binding is yielded
+
+    :return: None
+    """
+    data = b'{"head": {"vars": ["pub"]}, "results": {"bindings": [ ]}}'
+    assert await _read(data, 3) == []
+
+
+async def test_reader_raises_for_truncated_results():
+    """
+    GIVEN a truncated SPARQL JSON results document
+    WHEN it is read
+    THEN the complete bindings are yielded and an UnexpectedFormatException is raised
+
+    :return: None
+    """
+    data = (
+        b'{"head": {"vars": ["pub"]}, "results": {"bindings": '
+        b'[{"pub": {"type": "uri", "value": "http://www.sudoc.fr/1"}}, '
+        b'{"pub": {"type": "uri", "val'
+    )
+    reader = SparqlJsonBindingsReader()
+    bindings = []
+    with pytest.raises(UnexpectedFormatException):
+        async for binding in reader.read(_chunks(data, 10)):
+            bindings.append(binding)
+    assert bindings == [{"pub": {"type": "uri", "value": "http://www.sudoc.fr/1"}}]
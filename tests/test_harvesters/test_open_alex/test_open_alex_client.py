@@ -0,0 +1,85 @@
+"""Tests for the OpenAlex API client."""
+from unittest import mock
+from urllib.parse import parse_qs, urlsplit
+
+import aiohttp
+import pytest
+
+from app.harvesters.exceptions.external_endpoint_failure import ExternalEndpointFailure
+from app.harvesters.open_alex.open_alex_api_query_builder import OpenAlexQueryBuilder
+from app.harvesters.open_alex.open_alex_client import OpenAlexClient
+
+
+def _page(work_ids: list[str], next_cursor: str | None) -> dict:
+    return {
+        "meta": {"count": 5, "per_page": 2, "next_cursor": next_cursor},
+        "results": [{"id": work_id} for work_id in work_ids],
+    }
+
+
+def _response(status: int, json_response: dict) -> mock.MagicMock:
+    response = mock.MagicMock()
+    response.__aenter__.return_value.status = status
+    response.__aenter__.return_value.json = mock.AsyncMock(return_value=json_response)
+    return response
+
+
+@pytest.fixture(name="open_alex_builder")
+def fixture_open_alex_builder() -> OpenAlexQueryBuilder:
+    """OpenAlex query builder for a person with an ORCID"""
+    builder = OpenAlexQueryBuilder()
+    builder.set_subject_type(OpenAlexQueryBuilder.SubjectType.PERSON)
+    builder.set_query(
+        OpenAlexQueryBuilder.QueryParameters.AUTH_ORCID, "0000-0002-1825-0097"
+    )
+    builder.set_per_page(2)
+    return builder
+
+
+@pytest.fixture(name="open_alex_api_paginated_mock")
+def fixture_open_alex_api_paginated_mock():
+    """OpenAlex API mock returning 3 pages of results, depending on the cursor"""
+    pages = {
+        "*": _page(["W1", "W2"], "cursor_1"),
+        "cursor_1": _page(["W3", "W4"], "cursor_2"),
+        "cursor_2": _page(["W5"], "cursor_3"),
+        "cursor_3": _page([], None),
+    }
+
+    def get(url: str):
+        cursor = parse_qs(urlsplit(url).query)["cursor"][0]
+        return _response(200, pages[cursor])
+
+    with mock.patch.object(aiohttp.ClientSession, "get") as aiohttp_client_session_get:
+        aiohttp_client_session_get.side_effect = get
+        yield aiohttp_client_session_get
+
+
+@pytest.mark.asyncio
+async def test_open_alex_client_follows_cursors(
+    open_alex_builder, open_alex_api_paginated_mock
+):
+    """
+    GIVEN an OpenAlex API returning results on several pages
+    WHEN the client fetches the results
+    THEN all the pages are requested following the cursors
+        and all the works are returned in order
+    """
+    works = [work async for work in OpenAlexClient().fetch(open_alex_builder)]
+
+    assert [work["id"] for work in works] == ["W1", "W2", "W3", "W4", "W5"]
+    # the empty page has no next cursor, so no further page is requested
+    assert open_alex_api_paginated_mock.call_count == 4
+
+
+@pytest.mark.asyncio
+async def test_open_alex_client_with_error_code(open_alex_builder):
+    """
+    GIVEN an OpenAlex API returning an error code
+    WHEN the client fetches the results
+    THEN an ExternalEndpointFailure is raised
+    """
+    with mock.patch.object(aiohttp.ClientSession, "get") as aiohttp_client_session_get:
+        aiohttp_client_session_get.return_value = _response(503, {})
+        with pytest.raises(ExternalEndpointFailure):
+            _ = [work async for work in OpenAlexClient().fetch(open_alex_builder)]
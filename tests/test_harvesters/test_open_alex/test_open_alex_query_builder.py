@@ -89,3 +89,29 @@ def test_build_query_without_set_query(open_alex_query_builder):
     """Test if the build function raise an error if the query is not set"""
     with pytest.raises(AssertionError):
         open_alex_query_builder.build()
+
+
+def test_build_query_with_paging_and_select(open_alex_query_builder):
+    """
+    GIVEN a OpenAlexQueryBuilder instance
+    WHEN the cursor, the page size and the selected fields are set
+    THEN the query contains the cursor, per_page and select parameters
+    """
+    test_orcid = "0000-0002-1825-0097"
+
+    open_alex_query_builder.set_query(
+        open_alex_query_builder.QueryParameters.AUTH_ORCID, test_orcid
+    )
+    open_alex_query_builder.set_subject_type(open_alex_query_builder.SubjectType.PERSON)
+    open_alex_query_builder.set_cursor(OpenAlexQueryBuilder.INITIAL_CURSOR)
+    open_alex_query_builder.set_per_page(200)
+    open_alex_query_builder.set_select(["id", "title"])
+
+    result_dict = parse_qs(open_alex_query_builder.build())
+
+    assert result_dict == {
+        "filter": [f"author.orcid:{test_orcid}"],
+        "cursor": ["*"],
+        "per_page": ["200"],
+        "select": ["id,title"],
+    }
@@ -307,3 +307,66 @@ async def test_convert_work_with_hal_locations(
         identifier.value == "hal-01655811" and identifier.type == "hal"
         for identifier in test_reference.identifiers
     )
+
+
+@pytest.mark.asyncio
+async def test_convert_work_with_selected_fields(open_alex_api_work: dict):
+    """
+    GIVEN an OpenAlex work restricted to the fields selected by the converter
+    WHEN the work is converted and hashed
+    THEN the reference and the hash are the same as for the complete work
+    """
+    converter_under_tests = OpenAlexReferencesConverter()
+    version = VersionInfo.parse("0.0.0")
+    selected_work = {
+        field: value
+        for field, value in open_alex_api_work.items()
+        if field in converter_under_tests.selected_fields(version)
+    }
+    references = []
+    hashes = []
+    for work in [open_alex_api_work, selected_work]:
+        result = JsonHarvesterRawResult(
+            source_identifier=work["id"], payload=work, formatter_name="OPEN_ALEX"
+        )
+        reference = converter_under_tests.build(
+            raw_data=result, harvester_version=version
+        )
+        await converter_under_tests.convert(raw_data=result, new_ref=reference)
+        references.append(reference)
+        hashes.append(converter_under_tests.compute_hash(result, version))
+
+    complete_reference, selected_reference = references[0], references[1]
+    assert len(selected_work) < len(open_alex_api_work)
+    assert hashes[0] == hashes[1]
+    for attribute in ["page", "issued", "created"]:
+        assert getattr(selected_reference, attribute) == getattr(
+            complete_reference, attribute
+        )
+    assert [title.value for title in selected_reference.titles] == [
+        title.value for title in complete_reference.titles
+    ]
+    assert [abstract.value for abstract in selected_reference.abstracts] == [
+        abstract.value for abstract in complete_reference.abstracts
+    ]
+    assert [
+        (identifier.type, identifier.value)
+        for identifier in selected_reference.identifiers
+    ] == [
+        (identifier.type, identifier.value)
+        for identifier in complete_reference.identifiers
+    ]
+    assert [
+        manifestation.page for manifestation in selected_reference.manifestations
+    ] == [manifestation.page for manifestation in complete_reference.manifestations]
+    assert [
+        contribution.contributor.name
+        for contribution in selected_reference.contributions
+    ] == [
+        contribution.contributor.name
+        for contribution in complete_reference.contributions
+    ]
+    assert [subject.id for subject in selected_reference.subjects] == [
+        subject.id for subject in complete_reference.subjects
+    ]
+    assert selected_reference.issue.id == complete_reference.issue.id
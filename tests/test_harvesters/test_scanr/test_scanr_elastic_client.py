@@ -0,0 +1,157 @@
+from contextlib import aclosing
+from unittest import mock
+
+import pytest
+from elasticsearch import AsyncElasticsearch
+from elasticsearch.exceptions import AuthorizationException
+
+from app.harvesters.scanr.scanr_elastic_client import ScanRElasticClient
+from app.harvesters.scanr.scanr_elasticsearch_pool import ScanRElasticsearchPool
+
+
+@pytest.fixture(name="mock_scanr_elastic_client")
+def fixture_mock_scanr_elastic_client():
+    """
+    Override the autouse mock of the search, which is under test here
+    """
+    yield None
+
+
+def _hits(start: int, count: int) -> dict:
+    return {
+        "pit_id": f"pit_{start}",
+        "hits": {
+            "total": {"value": 5},
+            "hits": [
+                {"_source": {"id": f"doc{index}"}, "sort": [index]}
+                for index in range(start, start + count)
+            ],
+        },
+    }
+
+
+@pytest.fixture(name="elasticsearch_mock")
+def fixture_elasticsearch_mock():
+    """Elasticsearch mock returning 5 hits"""
+
+    async def search(body: dict, size: int, **kwargs):
+        start = kwargs.get("from_", body.get("search_after", [-1])[0] + 1)
+        return _hits(start, min(size, 5 - start))
+
+    with mock.patch.object(
+        AsyncElasticsearch, "search", new=mock.AsyncMock(side_effect=search)
+    ) as search_mock, mock.patch.object(
+        AsyncElasticsearch,
+        "open_point_in_time",
+        new=mock.AsyncMock(return_value={"id": "pit_initial"}),
+    ) as open_mock, mock.patch.object(
+        AsyncElasticsearch, "close_point_in_time", new=mock.AsyncMock()
+    ) as close_mock:
+        yield search_mock, open_mock, close_mock
+
+
+async def _search() -> list[dict]:
+    async with ScanRElasticClient() as client:
+        client.set_query({"query": {"match_all": {}}})
+        return [
+            doc
+            async for doc in client.perform_search(
+                client.Indexes.PUBLICATIONS, base_size=2
+            )
+        ]
+
+
+async def test_perform_search_with_point_in_time(elasticsearch_mock):
+    """
+    GIVEN a ScanR index with 5 matching documents
+    WHEN the documents are searched with pages of 2 documents
+    THEN the pages are requested through a point in time with search_after
+        and the point in time is closed
+    """
+    search_mock, open_mock, close_mock = elasticsearch_mock
+
+    docs = await _search()
+
+    assert [doc["_source"]["id"] for doc in docs] == [f"doc{i}" for i in range(5)]
+    open_mock.assert_called_once()
+    assert search_mock.call_count == 3
+    bodies = [call.kwargs["body"] for call in search_mock.call_args_list]
+    assert [body.get("search_after") for body in bodies] == [None, [1], [3]]
+    assert [body["pit"]["id"] for body in bodies] == ["pit_initial", "pit_0", "pit_2"]
+    assert all("index" not in call.kwargs for call in search_mock.call_args_list)
+    close_mock.assert_called_once_with(body={"id": "pit_4"})
+
+
+async def test_perform_search_without_point_in_time(elasticsearch_mock):
+    """
+    GIVEN a ScanR index on which a point in time cannot be opened
+    WHEN the documents are searched with pages of 2 documents
+    THEN the pages are requested with offsets
+    """
+    search_mock, open_mock, close_mock = elasticsearch_mock
+    open_mock.side_effect = AuthorizationException(403, "forbidden")
+
+    docs = await _search()
+
+    assert [doc["_source"]["id"] for doc in docs] == [f"doc{i}" for i in range(5)]
+    assert [call.kwargs["from_"] for call in search_mock.call_args_list] == [0, 2, 4]
+    close_mock.assert_not_called()
+
+
+async def test_elasticsearch_client_is_shared():
+    """
+    GIVEN the ScanR Elasticsearch pool
+    WHEN two ScanR clients are opened on the same event loop
+    THEN they share the same Elasticsearch client, which is not closed on exit
+    """
+    async with ScanRElasticClient() as first_client:
+        first_elastic = first_client.elastic
+    async with ScanRElasticClient() as second_client:
+        assert second_client.elastic is first_elastic
+    await ScanRElasticsearchPool().close()
+
+
+async def test_perform_search_closes_point_in_time_when_stopped_early(
+    elasticsearch_mock,
+):
+    """
+    GIVEN a ScanR index with 5 matching documents
+    WHEN the search is stopped after the first document and closed
+        within the client context
+    THEN the point in time is closed
+    """
+    _, open_mock, close_mock = elasticsearch_mock
+
+    async with ScanRElasticClient() as client:
+        client.set_query({"query": {"match_all": {}}})
+        async with aclosing(
+            client.perform_search(client.Indexes.PUBLICATIONS, base_size=2)
+        ) as docs:
+            async for _ in docs:
+                break
+
+    open_mock.assert_called_once()
+    close_mock.assert_called_once_with(body={"id": "pit_0"})
+
+
+async def test_perform_search_without_requested_point_in_time(elasticsearch_mock):
+    """
+    GIVEN a ScanR index with 5 matching documents
+    WHEN the first document is looked up without point in time
+    THEN no point in time is opened and the document is searched with offsets
+    """
+    search_mock, open_mock, close_mock = elasticsearch_mock
+
+    async with ScanRElasticClient() as client:
+        client.set_query({"query": {"match_all": {}}})
+        async with aclosing(
+            client.perform_search(
+                client.Indexes.PERSONS, base_size=1, point_in_time=False
+            )
+        ) as docs:
+            doc = await anext(docs)
+
+    assert doc["_source"]["id"] == "doc0"
+    open_mock.assert_not_called()
+    close_mock.assert_not_called()
+    assert search_mock.call_args.kwargs["from_"] == 0
@@ -1,11 +1,19 @@
 from unittest import mock
+
+import aioredis
 from elasticsearch import AsyncElasticsearch
 import pytest
 from fastapi.testclient import TestClient
 
+from app.config import get_app_settings
+
+from app.harvesters.scanr.scanr_api_query_builder import (
+    ScanRApiQueryBuilder as QueryBuilder,
+)
 from app.harvesters.scanr.scanr_harvester import ScanrHarvester
 from app.harvesters.scanr.scanr_references_converter import ScanrReferencesConverter
 from app.models.people import Person
+from app.services.cache.third_api_cache import ThirdApiCache
 
 REFERENCES_RETRIEVAL_API_PATH = "/api/v1/references/retrieval"
 
@@ -124,3 +132,59 @@ async def test_fetch_references_async_with_orcid(
             reference_event["type"] == "created"
             for reference_event in json_response["harvestings"][0]["reference_events"]
         )
+
+
+async def test_scanr_person_id_is_cached(mock_scanr_elastic_client):
+    """
+    GIVEN a person identified by an ORCID in the ScanR persons index
+    WHEN the ScanR id of the person is searched twice
+    THEN the persons index is queried once and the id is served from the cache
+    """
+    cache = {}
+
+    async def cache_get(api_name: str, key: str):
+        return cache.get((api_name, key))
+
+    async def cache_set(api_name: str, key: str, value: str):
+        cache[(api_name, key)] = value
+
+    with mock.patch.object(
+        ThirdApiCache, "get", new=mock.AsyncMock(side_effect=cache_get)
+    ), mock.patch.object(
+        ThirdApiCache, "set", new=mock.AsyncMock(side_effect=cache_set)
+    ):
+        # pylint: disable=protected-access
+        scanr_ids = [
+            await ScanrHarvester._get_entity_scanr_id(
+                QueryBuilder.QueryParameters.AUTH_ORCID, "0000-0002-1825-0097"
+            )
+            for _ in range(2)
+        ]
+
+    assert scanr_ids[0] is not None
+    assert scanr_ids[0] == scanr_ids[1]
+    mock_scanr_elastic_client.assert_called_once()
+    assert cache == {("scanr_person_ids", "orcid:0000-0002-1825-0097"): scanr_ids[0]}
+
+
+async def test_scanr_person_id_is_found_when_redis_is_unavailable(
+    mock_scanr_elastic_client, redis_cache_mock
+):
+    """
+    GIVEN a person identified by an ORCID in the ScanR persons index
+    WHEN the ScanR id of the person is searched while Redis cannot be reached
+    THEN the id is returned without being cached
+    """
+    settings = get_app_settings()
+    redis_cache_get, redis_cache_set = redis_cache_mock
+    redis_cache_get.side_effect = aioredis.exceptions.ConnectionError("unavailable")
+    redis_cache_set.side_effect = aioredis.exceptions.ConnectionError("unavailable")
+    with mock.patch.object(settings, "third_api_caching_enabled", True):
+        # pylint: disable=protected-access
+        scanr_id = await ScanrHarvester._get_entity_scanr_id(
+            QueryBuilder.QueryParameters.AUTH_ORCID, "0000-0002-1825-0097"
+        )
+
+    assert scanr_id is not None
+    mock_scanr_elastic_client.assert_called_once()
+    redis_cache_set.assert_called_once()
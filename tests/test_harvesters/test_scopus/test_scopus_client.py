@@ -0,0 +1,149 @@
+"""Tests for the Scopus API client."""
+from unittest import mock
+from urllib.parse import parse_qs, urlsplit
+
+import aiohttp
+import pytest
+
+from app.harvesters.exceptions.external_endpoint_failure import ExternalEndpointFailure
+from app.harvesters.exceptions.unexpected_format_exception import (
+    UnexpectedFormatException,
+)
+from app.harvesters.scopus.scopus_client import ScopusClient
+
+
+def _page(total_results: int, start: int, count: int) -> bytes:
+    entries = "".join(
+        f"<entry><dc:identifier>SCOPUS_ID:{start + index}</dc:identifier></entry>"
+        for index in range(count)
+    )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<search-results xmlns="http://www.w3.org/2005/Atom"'
+        ' xmlns:dc="http://purl.org/dc/elements/1.1/"'
+        ' xmlns:opensearch="http://a9.com/-/spec/opensearch/1.1/">'
+        f"<opensearch:totalResults>{total_results}</opensearch:totalResults>"
+        f"<opensearch:startIndex>{start}</opensearch:startIndex>"
+        f"{entries}</search-results>"
+    ).encode("utf-8")
+
+
+def _response(status: int, data: bytes, headers: dict) -> mock.MagicMock:
+    async def iter_chunked(size: int):
+        # small chunks, to split the entries between several chunks
+        for start in range(0, len(data), min(size, 50)):
+            yield data[start : start + 50]
+
+    response = mock.MagicMock()
+    response.__aenter__.return_value.status = status
+    response.__aenter__.return_value.headers = headers
+    response.__aenter__.return_value.content.iter_chunked = iter_chunked
+    return response
+
+
+def _identifiers(entries: list) -> list[int]:
+    return [
+        int(entry.find("dc:identifier", ScopusClient.NAMESPACE).text.split(":")[-1])
+        for entry in entries
+    ]
+
+
+@pytest.fixture(name="scopus_api_paginated_mock")
+def fixture_scopus_api_paginated_mock():
+    """Scopus API mock returning 60 results on pages of 25 results"""
+
+    def get(url: str, **_kwargs):
+        start = int(parse_qs(urlsplit(url).query)["start"][0])
+        return _response(
+            200,
+            _page(60, start, min(25, 60 - start)),
+            {"X-RateLimit-Remaining": "100"},
+        )
+
+    with mock.patch.object(aiohttp.ClientSession, "get") as aiohttp_client_session_get:
+        aiohttp_client_session_get.side_effect = get
+        yield aiohttp_client_session_get
+
+
+@pytest.mark.asyncio
+async def test_scopus_client_fetches_all_pages(scopus_api_paginated_mock):
+    """
+    GIVEN a Scopus API returning 60 results
+    WHEN the client fetches the results
+    THEN the 3 pages are requested and all the entries are returned in order
+    """
+    entries = [entry async for entry in ScopusClient().fetch("query=AU-ID(1)")]
+
+    assert _identifiers(entries) == list(range(60))
+    assert scopus_api_paginated_mock.call_count == 3
+    starts = sorted(
+        int(parse_qs(urlsplit(call.args[0]).query)["start"][0])
+        for call in scopus_api_paginated_mock.call_args_list
+    )
+    assert starts == [0, 25, 50]
+
+
+@pytest.mark.asyncio
+async def test_scopus_client_with_insufficient_quota(scopus_api_paginated_mock):
+    """
+    GIVEN a Scopus API returning 60 results with only 1 request left in the quota
+    WHEN the client fetches the results
+    THEN the entries of the first page and of the page allowed by the quota
+        are yielded, then an ExternalEndpointFailure is raised
+        without requesting the last page
+    """
+    get = scopus_api_paginated_mock.side_effect
+
+    def get_with_low_quota(url: str, **kwargs):
+        response = get(url, **kwargs)
+        response.__aenter__.return_value.headers = {"X-RateLimit-Remaining": "1"}
+        return response
+
+    scopus_api_paginated_mock.side_effect = get_with_low_quota
+    entries = []
+    with pytest.raises(ExternalEndpointFailure, match="quota exceeded"):
+        async for entry in ScopusClient().fetch("query=AU-ID(1)"):
+            entries.append(entry)
+
+    assert _identifiers(entries) == list(range(50))
+    assert scopus_api_paginated_mock.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_scopus_client_with_exhausted_quota(scopus_api_paginated_mock):
+    """
+    GIVEN a Scopus API returning 60 results with no request left in the quota
+    WHEN the client fetches the results
+    THEN the entries of the first page are yielded,
+        then an ExternalEndpointFailure is raised
+    """
+    get = scopus_api_paginated_mock.side_effect
+
+    def get_with_exhausted_quota(url: str, **kwargs):
+        response = get(url, **kwargs)
+        response.__aenter__.return_value.headers = {"X-RateLimit-Remaining": "0"}
+        return response
+
+    scopus_api_paginated_mock.side_effect = get_with_exhausted_quota
+    entries = []
+    with pytest.raises(ExternalEndpointFailure, match="quota exceeded"):
+        async for entry in ScopusClient().fetch("query=AU-ID(1)"):
+            entries.append(entry)
+
+    assert _identifiers(entries) == list(range(25))
+    scopus_api_paginated_mock.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_scopus_client_with_invalid_xml():
+    """
+    GIVEN a Scopus API returning an invalid XML document
+    WHEN the client fetches the results
+    THEN an UnexpectedFormatException is raised
+    """
+    with mock.patch.object(aiohttp.ClientSession, "get") as aiohttp_client_session_get:
+        aiohttp_client_session_get.return_value = _response(
+            200, b"<search-results><entry></search-results>", {}
+        )
+        with pytest.raises(UnexpectedFormatException):
+            _ = [entry async for entry in ScopusClient().fetch("query=AU-ID(1)")]
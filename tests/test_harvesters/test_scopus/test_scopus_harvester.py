@@ -13,11 +13,16 @@ from app.harvesters.scopus.scopus_references_converter import ScopusReferencesCo
 def fixture_scopus_client_mock(scopus_xml_doc):
     """Retrieval service mock to detect run method calls"""
 
+    async def iter_chunked(size: int):
+        data = scopus_xml_doc.encode("utf-8")
+        for start in range(0, len(data), size):
+            yield data[start : start + size]
+
     with mock.patch.object(aiohttp.ClientSession, "get") as aiohttp_client_session_get:
-        aiohttp_client_session_get.return_value.__aenter__.return_value.status = 200
-        aiohttp_client_session_get.return_value.__aenter__.return_value.text.return_value = (
-            scopus_xml_doc
-        )
+        response = aiohttp_client_session_get.return_value.__aenter__.return_value
+        response.status = 200
+        response.headers = {}
+        response.content.iter_chunked = iter_chunked
         yield aiohttp_client_session_get
 
 
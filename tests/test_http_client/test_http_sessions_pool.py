@@ -0,0 +1,67 @@
+"""Tests for the HTTP sessions pool."""
+
+from unittest import mock
+
+from app.config import get_app_settings
+from app.http_client.http_sessions_pool import HttpSessionsPool
+
+
+def test_http_sessions_pool_singleton():
+    """
+    Test that HttpSessionsPool is a singleton
+    """
+
+    pool1 = HttpSessionsPool()
+    pool2 = HttpSessionsPool()
+    assert pool1 is pool2
+
+
+async def test_http_sessions_pool_shares_session_by_host():
+    """
+    Given the HTTP sessions pool
+    When sessions are requested for URLs of the same host and of another host
+    Then the same session is returned for the same host and another one for the other host
+    """
+    pool = HttpSessionsPool()
+    session1 = pool.get_session("https://api.archives-ouvertes.fr/search/?q=foo")
+    session2 = pool.get_session("https://api.archives-ouvertes.fr/ref/structure")
+    session3 = pool.get_session("https://api.openalex.org/works")
+    assert session1 is session2
+    assert session1 is not session3
+    assert pool.get_connector("https://api.openalex.org/works") is session3.connector
+
+
+async def test_http_sessions_pool_limits_and_stats():
+    """
+    Given a connection limit configured for a host
+    When a session is requested for this host
+    Then the connector of the session is limited accordingly and reported in the stats
+    """
+    settings = get_app_settings()
+    with mock.patch.object(
+        settings, "http_limits_per_host", {"api.ror.org": 3}
+    ), mock.patch.object(settings, "http_timeouts_per_host", {"api.ror.org": 12}):
+        pool = HttpSessionsPool()
+        session = pool.get_session("https://api.ror.org/organizations/123")
+    assert session.connector.limit_per_host == 3
+    stats = pool.stats()
+    assert stats["api.ror.org"] == {
+        "limit_per_host": 3,
+        "acquired": 0,
+        "idle": 0,
+        "timeout": 12,
+    }
+
+
+async def test_http_sessions_pool_close():
+    """
+    Given an open session in the HTTP sessions pool
+    When the pool is closed
+    Then the session is closed and a new one is opened on next request
+    """
+    pool = HttpSessionsPool()
+    session = pool.get_session("https://www.idref.fr/123.rdf")
+    await pool.close()
+    assert session.closed
+    assert pool.stats() == {}
+    assert pool.get_session("https://www.idref.fr/123.rdf") is not session
@@ -0,0 +1,83 @@
+"""Tests for the prefetching of the pages of paginated APIs"""
+
+import asyncio
+
+from app.harvesters.exceptions.external_endpoint_failure import ExternalEndpointFailure
+from app.http_client.prefetched_pages import prefetched_pages
+
+
+async def test_prefetched_pages_requests_next_page_before_yielding():
+    """
+    GIVEN a paginated API of three pages
+    WHEN the pages are iterated
+    THEN each page is requested before the previous one is processed
+        and the iteration stops after the last page
+
+    :return: None
+    """
+    requested = []
+
+    async def fetch_page(number: int) -> int:
+        requested.append(number)
+        return number
+
+    def next_page(page: int):
+        return fetch_page(page + 1) if page < 3 else None
+
+    pages = []
+    async for page in prefetched_pages(fetch_page(1), next_page):
+        await asyncio.sleep(0)
+        # the next page has been requested while this one is processed
+        assert requested[-1] == min(page + 1, 3)
+        pages.append(page)
+    assert pages == [1, 2, 3]
+
+
+async def test_prefetched_pages_cancels_pending_page_when_stopped_early():
+    """
+    GIVEN a paginated API
+    WHEN the iteration stops after the first page
+    THEN the request of the next page is cancelled
+
+    :return: None
+    """
+    next_page_request = asyncio.Event()
+    cancelled = asyncio.Event()
+
+    async def fetch_page(number: int) -> int:
+        if number > 1:
+            next_page_request.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+        return number
+
+    pages = prefetched_pages(fetch_page(1), lambda page: fetch_page(page + 1))
+    assert await anext(pages) == 1
+    await next_page_request.wait()
+    await pages.aclose()
+    assert cancelled.is_set()
+    assert asyncio.all_tasks() == {asyncio.current_task()}
+
+
+async def test_prefetched_pages_ignores_failure_of_pending_page_when_stopped_early():
+    """
+    GIVEN a paginated API whose second page request fails
+    WHEN the iteration stops after the first page, once the request has failed
+    THEN the iteration is closed without error and no task remains
+
+    :return: None
+    """
+
+    async def fetch_page(number: int) -> int:
+        if number > 1:
+            raise ExternalEndpointFailure("Page unavailable")
+        return number
+
+    pages = prefetched_pages(fetch_page(1), lambda page: fetch_page(page + 1))
+    assert await anext(pages) == 1
+    await asyncio.sleep(0)
+    await pages.aclose()
+    assert asyncio.all_tasks() == {asyncio.current_task()}
@@ -0,0 +1,71 @@
+"""Tests for the metrics of the third party API cache."""
+import pytest
+
+from app.config import get_app_settings
+from app.services.cache.cache_metrics import CacheMetrics
+from app.services.cache.third_api_cache import ThirdApiCache
+
+
+@pytest.fixture(name="cache_metrics")
+def fixture_cache_metrics():
+    """Cache metrics, reset before and after the test"""
+    CacheMetrics().reset()
+    yield CacheMetrics()
+    CacheMetrics().reset()
+
+
+def test_cache_metrics_latency_histogram(cache_metrics: CacheMetrics):
+    """
+    Given a few Redis operations latencies
+    When they are recorded
+    Then the histogram buckets count cumulatively the operations below their bound
+    """
+    for duration in [0.0005, 0.003, 0.003, 2]:
+        cache_metrics.observe_latency("sudoc_publications", "get", duration)
+    histogram = cache_metrics.stats()["sudoc_publications"]["get_latency"]
+    assert histogram["count"] == 4
+    assert histogram["sum_ms"] == 2006.5
+    assert histogram["buckets"]["1"] == 1
+    assert histogram["buckets"]["2"] == 1
+    assert histogram["buckets"]["5"] == 3
+    assert histogram["buckets"]["1000"] == 3
+    assert histogram["buckets"]["+Inf"] == 4
+
+
+async def test_third_party_cache_records_hits_and_misses(
+    cache_metrics: CacheMetrics,
+):
+    """
+    Given a cached value and a missing one
+    When both are requested from ThirdApiCache
+    Then a hit with the size of the value and a miss are recorded for the namespace
+    """
+    settings = get_app_settings()
+    settings.third_api_caching_enabled = True
+    await ThirdApiCache.get("sudoc_publications", "https://www.sudoc.fr/070266875.rdf")
+    await ThirdApiCache.get("sudoc_publications", "https://www.sudoc.fr/123456789.rdf")
+    stats = cache_metrics.stats()["sudoc_publications"]
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["errors"] == 0
+    assert stats["bytes_read"] > 10000
+    assert stats["get_latency"]["count"] == 2
+
+
+async def test_third_party_cache_records_writes(
+    cache_metrics: CacheMetrics,
+    redis_cache_pipeline_mock,  # pylint: disable=unused-argument
+):
+    """
+    Given values to cache
+    When they are stored in bulk
+    Then the written bytes and the latency of the pipeline are recorded
+    """
+    settings = get_app_settings()
+    settings.third_api_caching_enabled = True
+    await ThirdApiCache.set_many(
+        "open_edition_publications", {"W1": {"id": "W1"}, "W2": {"id": "W2"}}
+    )
+    stats = cache_metrics.stats()["open_edition_publications"]
+    assert stats["bytes_written"] > 0
+    assert stats["set_latency"]["count"] == 1
@@ -0,0 +1,131 @@
+"""Tests for the serializer of the third party API cache values."""
+import pickle
+from pathlib import Path
+import xml.etree.ElementTree as ET
+
+import pytest
+from rdflib import Graph, URIRef
+from rdflib.compare import isomorphic
+
+from app.services.cache.cache_codec_error import CacheCodecError
+from app.services.cache.cache_serializer import CacheSerializer
+from app.services.cache.rdf_graph_cache_codec import RdfGraphCacheCodec
+
+
+async def test_serialize_rdf_graph(sudoc_rdf_graph_for_doc: Graph):
+    """
+    Given a rdflib graph
+    When it is serialized and deserialized
+    Then the same graph is returned, from a compressed entry smaller than the pickled graph
+    """
+    data = CacheSerializer().dumps(sudoc_rdf_graph_for_doc)
+    assert data[:2] == b"G\x01"
+    assert len(data) < len(pickle.dumps(sudoc_rdf_graph_for_doc)) / 3
+    graph = await CacheSerializer().loads(data)
+    assert isomorphic(graph, sudoc_rdf_graph_for_doc)
+
+
+async def test_serialize_xml_element(open_edition_et_xml_for_doc: ET.Element):
+    """
+    Given a XML element
+    When it is serialized and deserialized
+    Then an equivalent XML element is returned
+    """
+    data = CacheSerializer().dumps(open_edition_et_xml_for_doc)
+    assert data[:2] == b"X\x01"
+    element = await CacheSerializer().loads(data)
+    assert element.tag == open_edition_et_xml_for_doc.tag
+    assert [child.text for child in element.iter()] == [
+        child.text for child in open_edition_et_xml_for_doc.iter()
+    ]
+
+
+async def test_serialize_json_and_other_values():
+    """
+    Given a JSON-like value and a value that is not JSON serializable
+    When they are serialized and deserialized
+    Then the JSON-like value is stored as JSON and the other one is pickled
+    """
+    json_value = {"uri": "http://www.idref.fr/123456789/id", "labels": ["a", "é"]}
+    data = CacheSerializer().dumps(json_value)
+    assert data[:2] == b"J\x01"
+    assert await CacheSerializer().loads(data) == json_value
+
+    other_value = {"labels": {"a", "b"}}
+    data = CacheSerializer().dumps(other_value)
+    assert data[:2] == b"P\x01"
+    assert await CacheSerializer().loads(data) == other_value
+
+
+async def test_deserialize_legacy_pickled_entry(sudoc_rdf_graph_for_doc: Graph):
+    """
+    Given a cache entry pickled before the introduction of the codecs
+    When it is deserialized
+    Then the pickled value is returned
+    """
+    graph = await CacheSerializer().loads(pickle.dumps(sudoc_rdf_graph_for_doc))
+    assert isomorphic(graph, sudoc_rdf_graph_for_doc)
+
+
+async def test_deserialize_outdated_or_invalid_entry(sudoc_rdf_graph_for_doc: Graph):
+    """
+    Given a cache entry encoded with another version of its codec, or corrupted
+    When it is deserialized
+    Then a CacheCodecError is raised
+    """
+    data = CacheSerializer().dumps(sudoc_rdf_graph_for_doc)
+    outdated_data = RdfGraphCacheCodec.TAG + bytes([0]) + data[2:]
+    with pytest.raises(CacheCodecError):
+        await CacheSerializer().loads(outdated_data)
+    with pytest.raises(CacheCodecError):
+        await CacheSerializer().loads(data[:2] + b"corrupted")
+    with pytest.raises(CacheCodecError):
+        await CacheSerializer().loads(b"Z\x01" + data[2:])
+
+
+async def test_serialize_rdf_graph_with_relative_iri():
+    """
+    Given a rdflib graph with a relative IRI, that N-Triples cannot represent
+    When it is serialized and deserialized
+    Then it is stored as N-Triples and the same graph is returned
+    """
+    graph = Graph()
+    graph.add(
+        (
+            URIRef("http://www.sudoc.fr/123456789/id"),
+            URIRef("http://purl.org/dc/terms/language"),
+            URIRef("eng"),
+        )
+    )
+    data = CacheSerializer().dumps(graph)
+    assert data[:2] == b"G\x01"
+    assert isomorphic(await CacheSerializer().loads(data), graph)
+
+
+async def test_serialize_sudoc_rdf_graphs(_base_path):
+    """
+    Given the graphs of the Sudoc RDF test documents, some with relative IRIs
+    When they are serialized and deserialized
+    Then none of them is pickled and the same graphs are returned
+    """
+    for path in sorted((Path(_base_path) / "data" / "sudoc_rdf").glob("*.rdf")):
+        graph = Graph().parse(data=path.read_text(encoding="utf-8"), format="xml")
+        data = CacheSerializer().dumps(graph)
+        assert data[:2] == b"G\x01", path.name
+        assert isomorphic(await CacheSerializer().loads(data), graph), path.name
+
+
+async def test_serialize_entry_with_freshness_stamp():
+    """
+    Given a value and the time until which it is fresh
+    When it is serialized and deserialized as an entry
+    Then the value and the freshness limit are returned
+    """
+    data = CacheSerializer().dumps({"id": "W1"}, fresh_until=1700000000.5)
+    assert data[:1] == b"S"
+    assert await CacheSerializer().loads_entry(data) == ({"id": "W1"}, 1700000000)
+    assert await CacheSerializer().loads(data) == {"id": "W1"}
+    assert await CacheSerializer().loads_entry(CacheSerializer().dumps("a")) == (
+        "a",
+        None,
+    )
@@ -0,0 +1,35 @@
+"""Tests for the cache of the entities resolved by the references converters."""
+from unittest import mock
+
+from app.config import get_app_settings
+from app.services.cache.entity_cache import EntityCache
+
+
+def test_entity_cache_get_and_set():
+    """
+    Given an entity cache
+    When entities are cached by namespace and natural key
+    Then they are found with the same namespace and key only
+    """
+    cache = EntityCache(max_entries=10, ttl=60)
+    entity = object()
+    cache.set("journal", ("hal", "1234-5678"), entity)
+    cache.set("journal", ("hal", "missing"), None)
+
+    assert cache.get("journal", ("hal", "1234-5678")) is entity
+    assert cache.get("issue", ("hal", "1234-5678")) is None
+    assert cache.get("journal", ("hal", "missing")) is None
+    assert cache.stats() == {"entries": 1, "hits": 1, "misses": 2}
+
+
+def test_entity_cache_scope():
+    """
+    Given the process-wide entity cache disabled then enabled
+    When caches are requested for converters
+    Then a new cache is returned for each retrieval, or the same one for the process
+    """
+    assert EntityCache.for_converter() is not EntityCache.for_converter()
+    with mock.patch.object(
+        get_app_settings(), "converter_entity_cache_process_wide", True
+    ), mock.patch.object(EntityCache, "_process_instance", None):
+        assert EntityCache.for_converter() is EntityCache.for_converter()
@@ -0,0 +1,37 @@
+"""Tests for the per-process LRU cache."""
+from unittest import mock
+
+from app.services.cache.local_lru_cache import LocalLruCache
+
+
+def test_local_lru_cache_evicts_least_recently_used_entries():
+    """
+    Given a local cache of 2 entries
+    When a third entry is added after the first one has been read
+    Then the second entry is evicted
+    """
+    cache = LocalLruCache(max_entries=2)
+    cache.set("a", 1, ttl=60)
+    cache.set("b", 2, ttl=60)
+    assert cache.get("a") == (True, 1)
+    cache.set("c", 3, ttl=60)
+    assert cache.get("b") == (False, None)
+    assert cache.get("a") == (True, 1)
+    assert cache.get("c") == (True, 3)
+    assert cache.stats() == {"entries": 2, "hits": 3, "misses": 1}
+
+
+def test_local_lru_cache_expires_entries():
+    """
+    Given an entry in the local cache
+    When its time to live has elapsed
+    Then it is not returned anymore
+    """
+    cache = LocalLruCache(max_entries=2)
+    with mock.patch("time.monotonic", return_value=1000):
+        cache.set("a", 1, ttl=60)
+    with mock.patch("time.monotonic", return_value=1059):
+        assert cache.get("a") == (True, 1)
+    with mock.patch("time.monotonic", return_value=1060):
+        assert cache.get("a") == (False, None)
+    assert cache.stats() == {"entries": 0, "hits": 1, "misses": 1}
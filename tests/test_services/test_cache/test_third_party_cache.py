@@ -1,18 +1,24 @@
 """Tests for the Person model."""
-
-import pickle
+import asyncio
+import time
 from unittest import mock
 
-import aiosparql
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import get_app_settings
 from app.db.models.reference import Reference
 from app.db.references.references_recorder import ReferencesRecorder
+from app.harvesters.exceptions.external_resource_not_found import (
+    ExternalResourceNotFound,
+)
 from app.harvesters.idref.idref_harvester import IdrefHarvester
 from app.harvesters.idref.idref_references_converter import IdrefReferencesConverter
+from app.harvesters.idref.idref_sparql_client import IdrefSparqlClient
+from app.harvesters.idref.rdf_resolver import RdfResolver
+from app.services.cache.cache_serializer import CacheSerializer
 from app.services.cache.third_api_cache import ThirdApiCache
+from tests.fixtures.idref_sparql_endpoint_docs_fixtures import _sparql_bindings_stream
 
 
 @pytest.fixture(name="idref_sparql_endpoint_client_mock_with_sudoc_cached_pub")
@@ -21,12 +27,13 @@ def fixture_idref_sparql_endpoint_client_mock_with_sudoc_cached(
 ):
     """Retrieval service mock to detect run method calls."""
     with mock.patch.object(
-        aiosparql.client.SPARQLClient, "query"
-    ) as aiosparql_client_query:
-        aiosparql_client_query.return_value = (
+        IdrefSparqlClient,
+        "stream_bindings",
+        side_effect=_sparql_bindings_stream(
             idref_sparql_endpoint_results_with_sudoc_cached_pub
-        )
-        yield aiosparql_client_query
+        ),
+    ) as stream_bindings_mock:
+        yield stream_bindings_mock
 
 
 @pytest.fixture(name="idref_sparql_endpoint_client_mock_with_sudoc_not_cached_pub")
@@ -35,12 +42,13 @@ def fixture_idref_sparql_endpoint_client_mock_with_sudoc_not_cached_pub(
 ):
     """Retrieval service mock to detect run method calls."""
     with mock.patch.object(
-        aiosparql.client.SPARQLClient, "query"
-    ) as aiosparql_client_query:
-        aiosparql_client_query.return_value = (
+        IdrefSparqlClient,
+        "stream_bindings",
+        side_effect=_sparql_bindings_stream(
             idref_sparql_endpoint_results_with_sudoc_pub
-        )
-        yield aiosparql_client_query
+        ),
+    ) as stream_bindings_mock:
+        yield stream_bindings_mock
 
 
 async def test_third_party_cache():
@@ -113,21 +121,23 @@ async def test_idref_harvester_puts_sudoc_reponse_in_cache(
     harvesting_db_model_for_person_with_idref,
     reference_recorder_register_mock,
     rdf_resolver_mock,  # pylint: disable=unused-argument
-    redis_cache_mock,  # pylint: disable=unused-argument
+    redis_cache_mget_mock,
+    redis_cache_pipeline_mock,
     idref_sparql_endpoint_client_mock_with_sudoc_not_cached_pub,  # pylint: disable=unused-argument
     async_session: AsyncSession,
 ):
     """
     GIVEN an Idref harvester that finds a sudoc publication whose URI is not in cache
     WHEN the harvester runs
-    THEN the get method of ThirdApiCache is called and returns None,
+    THEN the sudoc publications are retrieved in bulk from the cache and not found,
     the Sudoc RDF endpoint is called and returns a graph,
-    the set method of ThirdApiCache is called with the URI and the graph
+    the graph is stored in bulk in the cache with the URI as key
 
     :param harvesting_db_model_for_person_with_idref:
     :param reference_recorder_register_mock:
     :param rdf_resolver_mock:
-    :param redis_cache_mock:
+    :param redis_cache_mget_mock:
+    :param redis_cache_pipeline_mock:
     :param idref_sparql_endpoint_client_mock_with_sudoc_not_cached_pub:
     :param async_session:
     :return:
@@ -147,13 +157,21 @@ async def test_idref_harvester_puts_sudoc_reponse_in_cache(
     idref_sparql_endpoint_client_mock_with_sudoc_not_cached_pub.assert_called_once()
     rdf_resolver_mock.assert_called()
     reference_recorder_register_mock.assert_called_once()
-    redis_cache_get, redis_cache_set = redis_cache_mock
-    redis_cache_get.assert_called_once()
-    redis_cache_set.assert_called_once()
-    _, arg = redis_cache_set.call_args
+    redis_cache_mget_mock.assert_called_once_with(
+        ["sudoc_publications:https://www.sudoc.fr/193726130.rdf"]
+    )
+    pipeline_set, pipeline_execute = redis_cache_pipeline_mock
+    pipeline_set.assert_called_once()
+    pipeline_execute.assert_awaited_once()
+    _, arg = pipeline_set.call_args
     assert arg["name"] == "sudoc_publications:https://www.sudoc.fr/193726130.rdf"
-    cached_value = arg["value"]
-    graph_from_cache = pickle.loads(cached_value)
+    assert (
+        arg["ex"]
+        == settings.sudoc_publications_caching_duration
+        + settings.third_api_stale_while_revalidate_duration
+    )
+    graph_from_cache, fresh_until = await CacheSerializer().loads_entry(arg["value"])
+    assert fresh_until > time.time()
     assert len(list(graph_from_cache.subjects())) == 48
     _, arg = reference_recorder_register_mock.call_args
     reference: Reference = arg["new_ref"]
@@ -162,3 +180,326 @@ async def test_idref_harvester_puts_sudoc_reponse_in_cache(
         reference.titles[0].value
         == "Agriculture des métropoles  : voie d'avenir ou cache-misère ?"
     )
+
+
+async def test_third_party_cache_get_many(redis_cache_mget_mock):
+    """
+    Given a cached value and a missing one
+    When both values are requested with get_many
+    Then Redis is queried once and only the cached value is returned
+    """
+    settings = get_app_settings()
+    settings.third_api_caching_enabled = True
+    cached_key = "https://www.sudoc.fr/070266875.rdf"
+    missing_key = "https://www.sudoc.fr/123456789.rdf"
+    values = await ThirdApiCache.get_many(
+        "sudoc_publications", [cached_key, missing_key, cached_key]
+    )
+    redis_cache_mget_mock.assert_called_once_with(
+        [f"sudoc_publications:{cached_key}", f"sudoc_publications:{missing_key}"]
+    )
+    assert list(values) == [cached_key]
+    assert len(list(values[cached_key].subjects())) == 57
+
+
+async def test_third_party_cache_set_many(redis_cache_pipeline_mock):
+    """
+    Given several values to cache
+    When they are stored with set_many
+    Then they are sent to Redis in a single pipeline with their expiration time
+    """
+    settings = get_app_settings()
+    settings.third_api_caching_enabled = True
+    pipeline_set, pipeline_execute = redis_cache_pipeline_mock
+    await ThirdApiCache.set_many(
+        "open_edition_publications", {"W1": {"id": "W1"}, "W2": {"id": "W2"}}
+    )
+    assert [call.kwargs["name"] for call in pipeline_set.call_args_list] == [
+        "open_edition_publications:W1",
+        "open_edition_publications:W2",
+    ]
+    assert [
+        (await CacheSerializer().loads(call.kwargs["value"]))["id"]
+        for call in pipeline_set.call_args_list
+    ] == ["W1", "W2"]
+    pipeline_execute.assert_awaited_once()
+
+
+@pytest.fixture(name="local_cache_enabled")
+def fixture_local_cache_enabled():
+    """Enable the per-process cache, emptied after the test"""
+    settings = get_app_settings()
+    with mock.patch.object(settings, "third_api_local_caching_enabled", True):
+        yield
+    ThirdApiCache._local_cache = None  # pylint: disable=protected-access
+
+
+async def test_third_party_cache_serves_hot_keys_from_local_cache(
+    local_cache_enabled,  # pylint: disable=unused-argument
+    redis_cache_mock,
+):
+    """
+    Given the per-process cache enabled
+    When the same value is requested twice from ThirdApiCache
+    Then Redis is only queried once and the same value is returned
+    """
+    settings = get_app_settings()
+    settings.third_api_caching_enabled = True
+    redis_cache_get, _ = redis_cache_mock
+    key = "https://www.sudoc.fr/070266875.rdf"
+    value = await ThirdApiCache.get(api_name="sudoc_publications", key=key)
+    assert value is not None
+    assert await ThirdApiCache.get(api_name="sudoc_publications", key=key) is value
+    redis_cache_get.assert_called_once()
+    assert ThirdApiCache.local_cache().stats() == {
+        "entries": 1,
+        "hits": 1,
+        "misses": 1,
+    }
+
+
+async def test_third_party_cache_remembers_failures(
+    local_cache_enabled,  # pylint: disable=unused-argument
+    redis_cache_mock,
+):
+    """
+    Given the per-process cache enabled
+    When a failure is recorded for a key
+    Then the failure is returned by get and get_many when the key is requested,
+        without querying Redis
+    """
+    redis_cache_get, _ = redis_cache_mock
+    key = "https://www.sudoc.fr/123456789.rdf"
+    ThirdApiCache.set_failure(
+        "sudoc_publications", key, ExternalResourceNotFound(f"{key} not found")
+    )
+    failures = [
+        await ThirdApiCache.get(api_name="sudoc_publications", key=key),
+        (await ThirdApiCache.get_many("sudoc_publications", [key]))[key],
+    ]
+    for failure in failures:
+        assert isinstance(failure, ThirdApiCache.CachedFailure)
+        with pytest.raises(ExternalResourceNotFound, match="not found"):
+            raise failure.error()
+    redis_cache_get.assert_not_called()
+
+
+async def test_third_party_cache_serves_stale_value_and_refreshes_it(
+    redis_cache_mget_mock,
+    redis_cache_mock,
+):
+    """
+    Given a stale value in the cache
+    When it is looked up several times and refreshed at each lookup
+    Then the stale value is returned and fetched again only once in the background
+    """
+    settings = get_app_settings()
+    settings.third_api_caching_enabled = True
+    _, redis_cache_set = redis_cache_mock
+    key = "https://journals.openedition.org/stale"
+    stale_entry = CacheSerializer().dumps({"id": "stale"}, fresh_until=time.time() - 1)
+
+    async def fake_redis_mget(keys: list[str]):
+        return [stale_entry for _ in keys]
+
+    redis_cache_mget_mock.side_effect = fake_redis_mget
+    fetch = mock.AsyncMock(return_value={"id": "fresh"})
+    for _ in range(3):
+        entries = await ThirdApiCache.lookup_many("open_edition_publications", [key])
+        assert entries == {key: ({"id": "stale"}, True)}
+        ThirdApiCache.refresh("open_edition_publications", key, fetch)
+    await asyncio.sleep(0.01)
+    fetch.assert_awaited_once()
+    redis_cache_set.assert_called_once()
+    _, arg = redis_cache_set.call_args
+    assert await CacheSerializer().loads(arg["value"]) == {"id": "fresh"}
+
+
+async def test_third_party_cache_get_refreshes_stale_value(redis_cache_mock):
+    """
+    Given a stale value in the cache
+    When it is requested with get, with and without a way to fetch it
+    Then it is served and refreshed in the background if it can be fetched,
+        and treated as missing otherwise
+    """
+    settings = get_app_settings()
+    settings.third_api_caching_enabled = True
+    redis_cache_get, redis_cache_set = redis_cache_mock
+    key = "https://journals.openedition.org/stale"
+    stale_entry = CacheSerializer().dumps({"id": "stale"}, fresh_until=time.time() - 1)
+
+    async def fake_redis_get(name: str):  # pylint: disable=unused-argument
+        return stale_entry
+
+    redis_cache_get.side_effect = fake_redis_get
+    fetch = mock.AsyncMock(return_value={"id": "fresh"})
+
+    assert await ThirdApiCache.get("open_edition_publications", key) is None
+    assert await ThirdApiCache.get("open_edition_publications", key, fetch) == {
+        "id": "stale"
+    }
+    await asyncio.sleep(0.01)
+    fetch.assert_awaited_once()
+    _, arg = redis_cache_set.call_args
+    assert await CacheSerializer().loads(arg["value"]) == {"id": "fresh"}
+
+
+async def test_third_party_cache_get_many_skips_stale_values(redis_cache_mget_mock):
+    """
+    Given a stale value in the cache
+    When it is requested with get_many
+    Then it is treated as missing, to be fetched again by the caller
+    """
+    settings = get_app_settings()
+    settings.third_api_caching_enabled = True
+    stale_entry = CacheSerializer().dumps({"id": "stale"}, fresh_until=time.time() - 1)
+
+    async def fake_redis_mget(keys: list[str]):
+        return [stale_entry for _ in keys]
+
+    redis_cache_mget_mock.side_effect = fake_redis_mget
+    assert (
+        await ThirdApiCache.get_many(
+            "open_edition_publications", ["https://journals.openedition.org/stale"]
+        )
+        == {}
+    )
+
+
+async def test_third_party_cache_coalesces_concurrent_fetches():
+    """
+    Given several concurrent fetches of the same value
+    When they are run through ThirdApiCache.coalesce
+    Then the value is fetched only once and shared with all the callers
+    """
+
+    async def slow_fetch():
+        await asyncio.sleep(0.01)
+        return {"id": "W1"}
+
+    fetch = mock.AsyncMock(side_effect=slow_fetch)
+    values = await asyncio.gather(
+        *[
+            ThirdApiCache.coalesce("open_edition_publications", "W1", fetch)
+            for _ in range(5)
+        ]
+    )
+    assert values == [{"id": "W1"}] * 5
+    fetch.assert_called_once()
+
+
+async def test_idref_harvester_reads_and_writes_persee_documents_with_same_key(
+    persee_rdf_graph_for_doc,
+):
+    """
+    Given a Persée publication from the Idref SPARQL endpoint
+    When its document is fetched and then requested again by the harvester
+    Then it is cached and read under the same key, and fetched only once
+    """
+    harvester = IdrefHarvester(converter=IdrefReferencesConverter())
+    doc = {
+        "uri": "http://data.persee.fr/doc/hista_0992-2059_1998_num_42_1_2826#Web",
+        "secondary_source": "PERSEE",
+    }
+    with mock.patch.object(RdfResolver, "fetch") as rdf_resolver_fetch:
+        rdf_resolver_fetch.return_value = persee_rdf_graph_for_doc
+        for _ in range(2):
+            await harvester._query_publication_from_persee_endpoint(  # pylint: disable=protected-access
+                doc
+            )
+    rdf_resolver_fetch.assert_called_once()
+    assert harvester.documents_to_cache == {
+        "persee_publications": {
+            "https://data.persee.fr/doc/hista_0992-2059_1998_num_42_1_2826": persee_rdf_graph_for_doc
+        }
+    }
+    assert harvester._cache_key(doc) == (  # pylint: disable=protected-access
+        "persee_publications",
+        "https://data.persee.fr/doc/hista_0992-2059_1998_num_42_1_2826",
+    )
+
+
+async def test_idref_harvester_forgets_prefetched_documents_once_used(
+    persee_rdf_graph_for_doc,
+):
+    """
+    Given a Persée document prefetched from the cache by the harvester
+    When the publication is queried
+    Then the prefetched document is used without fetching it, and forgotten
+    """
+    harvester = IdrefHarvester(converter=IdrefReferencesConverter())
+    doc = {
+        "uri": "http://data.persee.fr/doc/hista_0992-2059_1998_num_42_1_2826#Web",
+        "secondary_source": "PERSEE",
+    }
+    cache_key = harvester._cache_key(doc)  # pylint: disable=protected-access
+    harvester.documents_cache = {cache_key: persee_rdf_graph_for_doc}
+    with mock.patch.object(RdfResolver, "fetch") as rdf_resolver_fetch:
+        result = await harvester._query_publication_from_persee_endpoint(  # pylint: disable=protected-access
+            doc
+        )
+    rdf_resolver_fetch.assert_not_called()
+    assert result.payload is persee_rdf_graph_for_doc
+    assert not harvester.documents_cache
+    assert not harvester.documents_to_cache
+
+
+async def test_idref_harvester_writes_fetched_documents_by_batches(
+    persee_rdf_graph_for_doc,
+):
+    """
+    Given Persée publications from the Idref SPARQL endpoint
+    When their documents are fetched by the harvester
+    Then they are written to the cache as soon as a batch is complete
+    """
+    harvester = IdrefHarvester(converter=IdrefReferencesConverter())
+    docs = [
+        {
+            "uri": f"http://data.persee.fr/doc/hista_0992-2059_1998_num_42_1_282{index}#Web",
+            "secondary_source": "PERSEE",
+        }
+        for index in range(3)
+    ]
+    settings = get_app_settings()
+    with mock.patch.object(
+        RdfResolver, "fetch", return_value=persee_rdf_graph_for_doc
+    ), mock.patch.object(ThirdApiCache, "set_many") as set_many_mock, mock.patch.object(
+        settings, "idref_documents_caching_batch_size", 2
+    ):
+        for doc in docs:
+            await harvester._query_publication_from_persee_endpoint(  # pylint: disable=protected-access
+                doc
+            )
+    set_many_mock.assert_called_once()
+    api_name, values = set_many_mock.call_args.args
+    assert api_name == "persee_publications"
+    assert len(values) == 2
+    assert len(harvester.documents_to_cache["persee_publications"]) == 1
+
+
+async def test_idref_harvester_caches_fetched_documents_when_stopped_early(
+    harvesting_db_model_for_person_with_idref,
+    rdf_resolver_mock,  # pylint: disable=unused-argument
+    idref_sparql_endpoint_client_mock_with_sudoc_not_cached_pub,  # pylint: disable=unused-argument
+    async_session: AsyncSession,
+):
+    """
+    Given an Idref harvester that fetches a sudoc publication missing from the cache
+    When the harvesting is stopped after the first result
+    Then the fetched document is written to the cache
+    """
+    harvester = IdrefHarvester(converter=IdrefReferencesConverter())
+    async_session.add(harvesting_db_model_for_person_with_idref)
+    await async_session.commit()
+    harvester.set_harvesting_id(harvesting_db_model_for_person_with_idref.id)
+    harvester.set_entity_id(
+        harvesting_db_model_for_person_with_idref.retrieval.entity_id
+    )
+    with mock.patch.object(ThirdApiCache, "set_many") as set_many_mock:
+        results = harvester.fetch_results()
+        assert await anext(results) is not None
+        await results.aclose()
+    set_many_mock.assert_called_once()
+    api_name, values = set_many_mock.call_args.args
+    assert api_name == "sudoc_publications"
+    assert list(values) == ["https://www.sudoc.fr/193726130.rdf"]
@@ -86,7 +86,10 @@ async def test_idref_concept_solver_calls_url_from_uri(
         solver = IdRefConceptSolver()
         solver.complete_information(concept_informations)
         await solver.solve(concept_informations)
-        mock_get.assert_called_once_with("https://www.idref.fr/082303363.rdf")
+        mock_get.assert_called_once_with(
+            "https://www.idref.fr/082303363.rdf",
+            timeout=aiohttp.ClientTimeout(total=10.0),
+        )
 
 
 @pytest.mark.asyncio
@@ -111,7 +114,10 @@ async def test_idref_concept_solver_calls_url_from_numeric_id(
         solver = IdRefConceptSolver()
         solver.complete_information(concept_informations)
         await solver.solve(concept_informations)
-        mock_get.assert_called_once_with("https://www.idref.fr/082303363.rdf")
+        mock_get.assert_called_once_with(
+            "https://www.idref.fr/082303363.rdf",
+            timeout=aiohttp.ClientTimeout(total=10.0),
+        )
 
 
 @pytest.mark.asyncio
@@ -151,7 +157,7 @@ async def test_idref_concept_solver_returns_db_concept(idref_concept_http_client
     solver.complete_information(concept_informations)
     result = await solver.solve(concept_informations)
     idref_concept_http_client_mock.assert_called_once_with(
-        "https://www.idref.fr/082303363.rdf"
+        "https://www.idref.fr/082303363.rdf", timeout=aiohttp.ClientTimeout(total=10.0)
     )
     assert result is not None
     assert isinstance(result, DbConcept)
@@ -180,7 +186,7 @@ async def test_idref_concept_solver_returns_concepts_in_preferred_language(
     solver.complete_information(concept_informations)
     result = await IdRefConceptSolver().solve(concept_informations)
     idref_multilang_concept_http_client_mock.assert_called_once_with(
-        "https://www.idref.fr/123456789.rdf"
+        "https://www.idref.fr/123456789.rdf", timeout=aiohttp.ClientTimeout(total=10.0)
     )
     assert len(result.labels) == 5
     # 3 preflabels, one in french, one in english, one in unspecified language
@@ -281,7 +287,7 @@ async def test_idref_concept_solver_returns_concepts_without_language(
     solver.complete_information(concept_informations)
     result = await solver.solve(concept_informations)
     idref_nolang_concept_http_client_mock.assert_called_once_with(
-        "https://www.idref.fr/123456789.rdf"
+        "https://www.idref.fr/123456789.rdf", timeout=aiohttp.ClientTimeout(total=10.0)
     )
     assert len(result.labels) == 2
     assert len([label for label in result.labels if label.preferred]) == 1
@@ -336,7 +342,7 @@ async def test_idref_concept_solver_returns_concepts_in_non_preferred_languages(
     solver.complete_information(concept_informations)
     result = await solver.solve(concept_informations)
     idref_non_preferred_lang_concept_http_client_mock.assert_called_once_with(
-        "https://www.idref.fr/123456789.rdf"
+        "https://www.idref.fr/123456789.rdf", timeout=aiohttp.ClientTimeout(total=10.0)
     )
     assert len(result.labels) == 1
     assert len([label for label in result.labels if label.preferred]) == 1
@@ -0,0 +1,91 @@
+"""Tests for the keyed locks of the get-or-create operations."""
+import asyncio
+from unittest import mock
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import get_app_settings
+from app.services.locks.keyed_locks import KeyedLocks
+
+
+async def test_keyed_locks_serialize_the_same_key():
+    """
+    Given coroutines locking the same key and another key
+    When they run concurrently
+    Then the holders of the same key never overlap, the other key is not blocked
+    and the locks are released from the registry
+    """
+    locks = KeyedLocks()
+    holders = []
+    max_holders = 0
+
+    async def hold(key: str) -> None:
+        nonlocal max_holders
+        async with locks.lock("journal", key):
+            holders.append(key)
+            max_holders = max(max_holders, holders.count("same"))
+            await asyncio.sleep(0.01)
+            holders.remove(key)
+
+    other = asyncio.create_task(hold("other"))
+    await asyncio.sleep(0)
+    await asyncio.wait_for(
+        asyncio.gather(*[hold("same") for _ in range(5)], other), timeout=1
+    )
+
+    assert max_holders == 1
+    assert not locks.locks
+
+
+async def test_keyed_locks_lock_all_does_not_deadlock():
+    """
+    Given two coroutines locking overlapping keys given in a different order
+    When they run concurrently
+    Then both complete
+    """
+    locks = KeyedLocks()
+
+    async def hold(keys: list) -> None:
+        async with locks.lock_all("concept", keys):
+            await asyncio.sleep(0.01)
+
+    await asyncio.wait_for(
+        asyncio.gather(hold(["a", ("b", None), "c"]), hold(["c", "a", ("b", None)])),
+        timeout=1,
+    )
+    assert not locks.locks
+
+
+async def test_advisory_locks_are_held_until_the_end_of_the_transaction(
+    async_session: AsyncSession,
+):
+    """
+    Given advisory locks enabled
+    When keys are locked in a transaction
+    Then PostgreSQL advisory locks are held until the end of the transaction
+    """
+
+    async def advisory_locks_count() -> int:
+        return await async_session.scalar(
+            text("SELECT count(*) FROM pg_locks WHERE locktype = 'advisory'")
+        )
+
+    with mock.patch.object(
+        get_app_settings(), "get_or_create_advisory_locks_enabled", True
+    ):
+        await KeyedLocks().advisory_lock(async_session, "book", ["a", "b", "a"])
+        assert await advisory_locks_count() == 2
+        await async_session.commit()
+    assert await advisory_locks_count() == 0
+
+
+async def test_advisory_locks_are_disabled_by_default():
+    """
+    Given advisory locks disabled
+    When keys are locked
+    Then no query is sent to the database
+    """
+    session = mock.AsyncMock()
+    await KeyedLocks().advisory_lock(session, "book", ["a"])
+    session.execute.assert_not_called()
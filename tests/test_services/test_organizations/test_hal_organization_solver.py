@@ -0,0 +1,146 @@
+import asyncio
+from unittest import mock
+from urllib.parse import parse_qs, urlsplit
+
+import aiohttp
+import pytest
+
+from app.services.organizations.hal_organization_solver import HalOrganizationSolver
+
+
+@pytest.fixture(name="mock_hal_organization_solver_solve_many")
+def fixture_mock_hal_organization_solver_solve_many():
+    """
+    Override the autouse mock of the bulk solver, which is under test here
+    """
+    yield None
+
+
+def _structure(docid: int, name: str) -> dict:
+    return {
+        "docid": docid,
+        "name_s": name,
+        "type_s": "laboratory",
+        "rnsr_s": [f"rnsr_{docid}"],
+    }
+
+
+@pytest.fixture(name="hal_structure_referential_mock")
+def fixture_hal_structure_referential_mock():
+    """HAL structure referential mock returning the requested structures"""
+    structures = {
+        "1": _structure(1, "Laboratory 1"),
+        "2": _structure(2, "Laboratory 2"),
+        "3": {"docid": 3, "type_s": "laboratory"},
+    }
+
+    def get(url: str, **_kwargs):
+        query = parse_qs(urlsplit(url).query)["q"][0]
+        identifiers = query.removeprefix("docid:(").removesuffix(")").split(" OR ")
+        response = mock.MagicMock()
+        response.__aenter__.return_value.status = 200
+        response.__aenter__.return_value.json = mock.AsyncMock(
+            return_value={
+                "response": {
+                    "docs": [
+                        structures[identifier]
+                        for identifier in identifiers
+                        if identifier in structures
+                    ]
+                }
+            }
+        )
+        return response
+
+    with mock.patch.object(aiohttp.ClientSession, "get") as aiohttp_client_session_get:
+        aiohttp_client_session_get.side_effect = get
+        yield aiohttp_client_session_get
+
+
+async def test_solve_many_with_batches(hal_structure_referential_mock):
+    """
+    GIVEN a HAL structure referential
+    WHEN 4 structures are solved with batches of 2 structures
+    THEN 2 queries are sent and the valid structures are returned by id
+    """
+    with mock.patch(
+        "app.services.organizations.hal_organization_solver.get_app_settings"
+    ) as get_app_settings:
+        get_app_settings.return_value.hal_organizations_batch_size = 2
+        get_app_settings.return_value.hal_organizations_parallelism = 4
+        organizations = await HalOrganizationSolver().solve_many(["1", "2", "3", "4"])
+
+    assert hal_structure_referential_mock.call_count == 2
+    assert (
+        "q=docid:(1 OR 2)" in hal_structure_referential_mock.call_args_list[0].args[0]
+    )
+    # structure 3 has no name and structure 4 is unknown
+    assert sorted(organizations) == ["1", "2"]
+    assert organizations["1"].name == "Laboratory 1"
+    assert organizations["1"].source_identifier == "1"
+    assert organizations["1"].type == "laboratory"
+    assert {
+        (identifier.type, identifier.value)
+        for identifier in organizations["1"].identifiers
+    } == {("hal", "1"), ("rnsr", "rnsr_1")}
+
+
+async def test_solve_many_with_failing_batch():
+    """
+    GIVEN a HAL structure referential that fails
+    WHEN structures are solved in bulk
+    THEN no structure is returned, so that they can be solved one by one
+    """
+    with mock.patch.object(aiohttp.ClientSession, "get") as aiohttp_client_session_get:
+        aiohttp_client_session_get.side_effect = aiohttp.ClientError("failure")
+        organizations = await HalOrganizationSolver().solve_many(["1", "2"])
+
+    assert not organizations
+
+
+async def test_solve_many_with_unexpected_response():
+    """
+    GIVEN a HAL structure referential answering without structures list
+    WHEN structures are solved in bulk
+    THEN no structure is returned, so that they can be solved one by one
+    """
+    with mock.patch.object(aiohttp.ClientSession, "get") as aiohttp_client_session_get:
+        response = mock.MagicMock()
+        response.__aenter__.return_value.status = 200
+        response.__aenter__.return_value.json = mock.AsyncMock(
+            return_value={"error": {"msg": "undefined field docid"}}
+        )
+        aiohttp_client_session_get.return_value = response
+        organizations = await HalOrganizationSolver().solve_many(["1", "2"])
+
+    assert not organizations
+
+
+async def test_solve_many_with_bounded_parallelism():
+    """
+    GIVEN a HAL structure referential
+    WHEN 6 structures are solved with batches of 1 structure
+        and at most 2 queries at the same time
+    THEN no more than 2 queries are sent at the same time
+    """
+    running = 0
+    max_running = 0
+
+    async def query(_solver, _url: str, _identifiers: str) -> dict:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return {"response": {"docs": []}}
+
+    with mock.patch(
+        "app.services.organizations.hal_organization_solver.get_app_settings"
+    ) as get_app_settings, mock.patch.object(
+        HalOrganizationSolver, "_query", new=query
+    ):
+        get_app_settings.return_value.hal_organizations_batch_size = 1
+        get_app_settings.return_value.hal_organizations_parallelism = 2
+        await HalOrganizationSolver().solve_many([str(i) for i in range(6)])
+
+    assert max_running == 2
@@ -0,0 +1,97 @@
+"""Tests for the RDF and XML parsing service."""
+import os
+from unittest import mock
+
+import pytest
+import rdflib
+from rdflib import Graph
+from rdflib.compare import isomorphic
+
+from app.services.parsing.parsing_error import ParsingError
+from app.services.parsing.parsers import parse_rdf
+from app.services.parsing.parsing_service import ParsingService
+
+RDF_DOCUMENT = """<?xml version="1.0" encoding="utf-8"?>
+<rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#"
+         xmlns:dc="http://purl.org/dc/elements/1.1/">
+  <rdf:Description rdf:about="http://www.sudoc.fr/123456789/id">
+    <dc:title>Fake scientific article</dc:title>
+    <dc:title xml:lang="fr">Faux article scientifique</dc:title>
+    <dc:date rdf:datatype="http://www.w3.org/2001/XMLSchema#gYear">2024</dc:date>
+    <dc:language rdf:resource="fre"/>
+    <dc:creator>
+      <rdf:Description>
+        <dc:title>Fake author</dc:title>
+      </rdf:Description>
+    </dc:creator>
+  </rdf:Description>
+</rdf:RDF>
+"""
+
+
+@pytest.fixture(name="offloaded_parsing", params=[False, True])
+def fixture_offloaded_parsing(request):
+    """Run the test with parsing in the event loop and in the worker processes"""
+    service = ParsingService()
+    if request.param and service.executor is None:
+        pytest.skip("Parsing processes are disabled")
+    min_length = 0 if request.param else len(RDF_DOCUMENT) + 1
+    with mock.patch.object(service, "min_length", min_length):
+        yield request.param
+
+
+async def test_parse_rdf(offloaded_parsing):  # pylint: disable=unused-argument
+    """
+    Given a RDF/XML document
+    When it is parsed by the parsing service
+    Then a graph with the document triples is returned
+    """
+    graph = await ParsingService().parse_rdf(RDF_DOCUMENT)
+    assert isinstance(graph, Graph)
+    titles = graph.objects(
+        rdflib.URIRef("http://www.sudoc.fr/123456789/id"), rdflib.DC.title
+    )
+    assert "Fake scientific article" in [str(title) for title in titles]
+    assert isomorphic(graph, parse_rdf(RDF_DOCUMENT, "xml"))
+
+
+async def test_parse_xml(offloaded_parsing):  # pylint: disable=unused-argument
+    """
+    Given a XML document
+    When it is parsed by the parsing service
+    Then the root element of the document is returned
+    """
+    root = await ParsingService().parse_xml(RDF_DOCUMENT.strip())
+    assert root.tag == "{http://www.w3.org/1999/02/22-rdf-syntax-ns#}RDF"
+
+
+async def test_parse_invalid_document(
+    offloaded_parsing,
+):  # pylint: disable=unused-argument
+    """
+    Given an invalid XML document
+    When it is parsed by the parsing service
+    Then a ParsingError is raised
+    """
+    with pytest.raises(ParsingError):
+        await ParsingService().parse_rdf(RDF_DOCUMENT[:-20] + "x" * 20)
+    with pytest.raises(ParsingError):
+        await ParsingService().parse_xml(RDF_DOCUMENT.strip()[:-20] + "x" * 20)
+
+
+async def test_parsing_process_pool_is_replaced_when_broken():
+    """
+    Given the parsing processes enabled
+    When a worker process dies during a parsing
+    Then a ParsingError is raised and the next documents are parsed by a new pool
+    """
+    service = ParsingService()
+    if service.executor is None:
+        pytest.skip("Parsing processes are disabled")
+    broken_executor = service.executor
+    with pytest.raises(ParsingError):
+        await service._run_in_executor(os._exit, 1)  # pylint: disable=protected-access
+    assert service.executor is not broken_executor
+    with mock.patch.object(service, "min_length", 0):
+        graph = await service.parse_rdf(RDF_DOCUMENT)
+    assert isomorphic(graph, parse_rdf(RDF_DOCUMENT, "xml"))
@@ -0,0 +1,113 @@
+"""Test the reference events batch writer."""
+import asyncio
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.daos.reference_event_dao import ReferenceEventDAO
+from app.db.models.harvesting import Harvesting
+from app.db.models.reference import Reference as DbReference
+from app.db.models.reference_event import ReferenceEvent
+from app.db.models.title import Title
+from app.db.references.reference_events_batch_writer import (
+    ReferenceEventsBatchWriter,
+)
+
+
+async def _recorded_references(
+    async_session: AsyncSession, harvester: str, count: int
+) -> list[DbReference]:
+    references = [
+        DbReference(
+            source_identifier=f"source_identifier_{index}",
+            harvester=harvester,
+            hash=f"hash{index}",
+            titles=[Title(value=f"title {index}", language="fr")],
+            version=0,
+        )
+        for index in range(count)
+    ]
+    async_session.add_all(references)
+    await async_session.commit()
+    return references
+
+
+@pytest.mark.asyncio
+async def test_batch_writer_writes_events_by_batches(
+    async_session: AsyncSession, harvesting_db_model_for_person_with_idref: Harvesting
+):
+    """
+    GIVEN a batch writer with a batch size of 2
+    WHEN 3 events related to recorded references are added and the writer is closed
+    THEN the events are written in 2 batches and notified with their database id
+    :param async_session:
+    :param harvesting_db_model_for_person_with_idref:
+    :return:
+    """
+    async_session.add(harvesting_db_model_for_person_with_idref)
+    await async_session.commit()
+    references = await _recorded_references(
+        async_session, harvesting_db_model_for_person_with_idref.harvester, 3
+    )
+    flushed_batches = []
+
+    async def on_flush(reference_events: list[ReferenceEvent]):
+        flushed_batches.append(reference_events)
+
+    writer = ReferenceEventsBatchWriter(
+        harvesting_id=harvesting_db_model_for_person_with_idref.id,
+        on_flush=on_flush,
+        batch_size=2,
+        flush_interval=60000,
+    )
+    for reference in references:
+        await writer.add(reference, ReferenceEvent.Type.UNCHANGED)
+    assert [len(batch) for batch in flushed_batches] == [2]
+    await writer.close()
+    assert [len(batch) for batch in flushed_batches] == [2, 1]
+    reference_events = [event for batch in flushed_batches for event in batch]
+    for reference, reference_event in zip(references, reference_events):
+        assert reference_event.id is not None
+        db_reference_event = await ReferenceEventDAO(
+            async_session
+        ).get_reference_event_by_id(reference_event.id)
+        assert db_reference_event.reference_id == reference.id
+        assert db_reference_event.type == ReferenceEvent.Type.UNCHANGED.value
+        assert (
+            db_reference_event.harvesting_id
+            == harvesting_db_model_for_person_with_idref.id
+        )
+
+
+@pytest.mark.asyncio
+async def test_batch_writer_flushes_events_periodically(
+    async_session: AsyncSession, harvesting_db_model_for_person_with_idref: Harvesting
+):
+    """
+    GIVEN a batch writer with a large batch size and a short flush interval
+    WHEN an event is added
+    THEN the event is written and notified once the flush interval has elapsed
+    :param async_session:
+    :param harvesting_db_model_for_person_with_idref:
+    :return:
+    """
+    async_session.add(harvesting_db_model_for_person_with_idref)
+    await async_session.commit()
+    (reference,) = await _recorded_references(
+        async_session, harvesting_db_model_for_person_with_idref.harvester, 1
+    )
+    flushed = asyncio.Event()
+
+    async def on_flush(_: list[ReferenceEvent]):
+        flushed.set()
+
+    writer = ReferenceEventsBatchWriter(
+        harvesting_id=harvesting_db_model_for_person_with_idref.id,
+        on_flush=on_flush,
+        batch_size=100,
+        flush_interval=10,
+    )
+    await writer.add(reference, ReferenceEvent.Type.DELETED)
+    await asyncio.wait_for(flushed.wait(), timeout=5)
+    assert not writer.pending_events
+    await writer.close()
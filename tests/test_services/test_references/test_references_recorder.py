@@ -1,7 +1,11 @@
 """Test the entity resolution API."""
+from unittest import mock
+
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.db.daos.reference_dao import ReferenceDAO
+from app.db.daos.reference_event_dao import ReferenceEventDAO
 from app.db.models.harvesting import Harvesting
 from app.db.models.reference import Reference as DbReference
 from app.db.models.reference_event import ReferenceEvent
@@ -213,3 +217,97 @@ async def test_reference_recorder_creates_event_for_updated_enhanced_reference(
     assert reference_event.harvesting_id == harvesting_3.id
     assert reference_event.type == ReferenceEvent.Type.UPDATED.value
     assert reference_event.enhanced is True
+
+
+@pytest.mark.asyncio
+async def test_reference_recorder_uses_references_index(
+    async_session: AsyncSession,
+    two_completed_harvestings_db_models_for_same_person: list[Harvesting],
+):
+    """
+    GIVEN a reference previously discovered for an entity
+    WHEN the references index is loaded for the entity
+    THEN the existence of the reference is checked without querying the database
+        and the database is queried only for unknown references
+    :param async_session:
+    :param two_completed_harvestings_db_models_for_same_person:
+    :return:
+    """
+    (harvesting_1, harvesting_2) = two_completed_harvestings_db_models_for_same_person
+    harvester = harvesting_1.harvester
+    reference = DbReference(
+        source_identifier="source_identifier_1234",
+        harvester=harvester,
+        hash="hash1",
+        titles=[Title(value="title", language="fr")],
+        version=0,
+    )
+    async_session.add_all(
+        [
+            reference,
+            ReferenceEvent(
+                type=ReferenceEvent.Type.CREATED.value,
+                reference=reference,
+                harvesting=harvesting_1,
+            ),
+        ]
+    )
+    await async_session.commit()
+    references_recorder = ReferencesRecorder(harvesting=harvesting_2)
+    await references_recorder.load_references_index(
+        entity_id=harvesting_1.retrieval.entity_id
+    )
+    with mock.patch.object(
+        ReferenceDAO,
+        "get_last_reference_by_source_identifier",
+        return_value=None,
+    ) as mock_get_last_reference:
+        old_reference = await references_recorder.exists(
+            DbReference(source_identifier="source_identifier_1234", harvester=harvester)
+        )
+        assert old_reference.id == reference.id
+        mock_get_last_reference.assert_not_called()
+        unknown_reference = await references_recorder.exists(
+            DbReference(source_identifier="source_identifier_5678", harvester=harvester)
+        )
+        assert unknown_reference is None
+        mock_get_last_reference.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_reference_recorder_does_not_write_reference_without_event(
+    async_session: AsyncSession, harvesting_db_model_for_person_with_idref: Harvesting
+):
+    """
+    GIVEN a currently running harvesting
+    WHEN a new reference is registered but the creation of its event fails
+    THEN the reference is not written in the database either
+    :param async_session:
+    :param harvesting_db_model_for_person_with_idref:
+    :return:
+    """
+    async_session.add(harvesting_db_model_for_person_with_idref)
+    await async_session.commit()
+    harvester = harvesting_db_model_for_person_with_idref.harvester
+    reference = DbReference(
+        source_identifier="source_identifier_1234",
+        harvester=harvester,
+        hash="hash1",
+        titles=[Title(value="title", language="fr")],
+    )
+    references_recorder = ReferencesRecorder(
+        harvesting=harvesting_db_model_for_person_with_idref
+    )
+    with mock.patch.object(
+        ReferenceEventDAO,
+        "create_reference_event",
+        side_effect=ConnectionError("Event creation failure"),
+    ):
+        with pytest.raises(ConnectionError):
+            await references_recorder.register_creation(new_ref=reference)
+    assert (
+        await ReferenceDAO(async_session).get_last_reference_by_source_identifier(
+            "source_identifier_1234", harvester
+        )
+    ) is None
+    assert references_recorder.get_indexed_reference(reference) is None